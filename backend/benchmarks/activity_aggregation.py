@@ -0,0 +1,123 @@
+"""Benchmark of the aggregation read paths over a large activity store.
+
+Fills an InMemoryActivityRepository with synthetic activities spread
+over many owners and a year, then times the reads behind the footprint
+endpoints and the percentile index rebuild: one owner's date range
+(bisected from the owner's index), a monthly summary through
+GetFootprintSummaryUseCase, and per-owner totals across everyone.
+
+Usage (from backend/):
+    python benchmarks/activity_aggregation.py [--rows 1000000] [--owners 10000]
+"""
+
+import argparse
+import asyncio
+import random
+import sys
+import time
+from collections.abc import Awaitable, Callable
+from datetime import UTC, date, datetime, timedelta
+from pathlib import Path
+from uuid import UUID
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from domain.entities.activity import Activity
+from domain.services.aggregation_service import AggregationService
+from domain.use_cases.get_footprint_summary import (
+    GetFootprintSummaryInput,
+    GetFootprintSummaryUseCase,
+)
+from infrastructure.repositories import InMemoryActivityRepository
+
+START_DATE = date(2024, 1, 1)
+TYPES = [
+    ("transport", "car_petrol", 0.17099),
+    ("transport", "bus", 0.08291),
+    ("energy", "electricity", 0.20705),
+    ("food", "beef", 27.0),
+]
+BATCH = 50_000
+
+
+def synthetic_activities(rows: int, owners: int, seed: int = 42) -> list[Activity]:
+    """Create activities of anonymous owners spread over one year."""
+    rng = random.Random(seed)
+    created_at = datetime.now(UTC)
+    activities = []
+    for _ in range(rows):
+        category, activity_type, factor = rng.choice(TYPES)
+        value = rng.randint(1, 100_000) / 1000
+        activities.append(
+            Activity(
+                id=UUID(int=rng.getrandbits(128), version=4),
+                category=category,
+                type=activity_type,
+                value=value,
+                co2e_kg=round(value * factor, 2),
+                date=START_DATE + timedelta(days=rng.randrange(366)),
+                notes=None,
+                metadata=None,
+                user_id=None,
+                session_id=f"session-{rng.randrange(owners)}",
+                created_at=created_at,
+            )
+        )
+    return activities
+
+
+async def timed(repeat: int, call: Callable[[int], Awaitable[object]]) -> float:
+    """Average latency of a call in milliseconds."""
+    start = time.perf_counter()
+    for i in range(repeat):
+        await call(i)
+    return (time.perf_counter() - start) / repeat * 1000
+
+
+async def main(rows: int, owners: int, repeat: int) -> None:
+    """Load the store and print timings."""
+    activities = synthetic_activities(rows, owners)
+    repo = InMemoryActivityRepository()
+    start = time.perf_counter()
+    for i in range(0, rows, BATCH):
+        await repo.save_many(activities[i : i + BATCH])
+    load = time.perf_counter() - start
+    print(f"activities: {len(repo)} over {owners} owners")
+    print(f"  load ({BATCH} per save_many):  {rows / load / 1e3:8.1f} k rows/s")
+
+    summary = GetFootprintSummaryUseCase(repo, AggregationService())
+    month_end = START_DATE + timedelta(days=30)
+    year_end = START_DATE + timedelta(days=365)
+
+    def session(i: int) -> str:
+        return f"session-{i % owners}"
+
+    owner_year = await timed(
+        repeat,
+        lambda i: repo.list_by_date_range(None, session(i), START_DATE, year_end),
+    )
+    owner_month = await timed(
+        repeat,
+        lambda i: summary.execute(
+            GetFootprintSummaryInput(
+                user_id=None,
+                session_id=session(i),
+                start_date=START_DATE,
+                end_date=month_end,
+            )
+        ),
+    )
+    totals = await timed(1, lambda _: repo.list_owner_totals(START_DATE, year_end))
+
+    print(f"  owner's year (list_by_date_range): {owner_year:8.3f} ms")
+    print(f"  owner's month summary:             {owner_month:8.3f} ms")
+    print(f"  owner totals over a year:          {totals:8.1f} ms")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--owners", type=int, default=10_000)
+    parser.add_argument("--repeat", type=int, default=1000)
+    args = parser.parse_args()
+    asyncio.run(main(args.rows, args.owners, args.repeat))
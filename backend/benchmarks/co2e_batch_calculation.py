@@ -0,0 +1,98 @@
+"""Microbenchmark of batch CO2e calculation throughput.
+
+Compares calling CalculationService.calculate_co2e once per activity
+against one calculate_co2e_many call per batch, for a shared factor and
+for one factor per activity, and checks that both give the same values.
+
+Usage (from backend/):
+    python benchmarks/co2e_batch_calculation.py [--size 100000] [--repeat 5]
+"""
+
+import argparse
+import random
+import sys
+import time
+from collections.abc import Callable
+from datetime import UTC, datetime
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from domain.entities.emission_factor import EmissionFactor
+from domain.services.calculation_service import CalculationService
+
+FACTOR_VALUES = [0.17099, 0.15059, 0.08291, 0.03594, 0.20705, 0.18293, 27.0, 0.5]
+
+
+def make_factor(value: float) -> EmissionFactor:
+    """Create an emission factor with the given value."""
+    return EmissionFactor(
+        id=1,
+        category="transport",
+        type="car_petrol",
+        factor=value,
+        unit="km",
+        source="DEFRA 2023",
+        notes=None,
+        created_at=datetime.now(UTC),
+    )
+
+
+def best_of(repeat: int, run: Callable[[], list[float]]) -> tuple[float, list[float]]:
+    """Return the fastest of several runs in seconds, and its result."""
+    best = float("inf")
+    result: list[float] = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = run()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def report(label: str, size: int, scalar: float, batch: float) -> None:
+    """Print throughput of both paths."""
+    print(f"{label}:")
+    print(f"  scalar loop: {size / scalar / 1e6:8.2f} M activities/s")
+    print(
+        f"  batch:       {size / batch / 1e6:8.2f} M activities/s"
+        f"  ({scalar / batch:.1f}x)"
+    )
+
+
+def main(size: int, repeat: int) -> None:
+    """Run the benchmark and print a summary."""
+    rng = random.Random(42)
+    service = CalculationService()
+    values = [rng.randint(0, 500_000) / 1000 for _ in range(size)]
+    shared = make_factor(0.17099)
+    factors = [make_factor(rng.choice(FACTOR_VALUES)) for _ in range(size)]
+
+    scalar, expected = best_of(
+        repeat, lambda: [service.calculate_co2e(v, shared) for v in values]
+    )
+    batch, result = best_of(repeat, lambda: service.calculate_co2e_many(values, shared))
+    if result != expected:
+        raise SystemExit("batch results differ from the scalar path")
+    print(f"activities per batch: {size}")
+    report("shared factor", size, scalar, batch)
+
+    scalar, expected = best_of(
+        repeat,
+        lambda: [
+            service.calculate_co2e(v, f) for v, f in zip(values, factors, strict=True)
+        ],
+    )
+    batch, result = best_of(
+        repeat, lambda: service.calculate_co2e_many(values, factors)
+    )
+    if result != expected:
+        raise SystemExit("batch results differ from the scalar path")
+    report("factor per activity", size, scalar, batch)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--size", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    main(args.size, args.repeat)
@@ -0,0 +1,108 @@
+"""Microbenchmark of per-request dependency resolution overhead.
+
+Compares resolving a use case from the application container against
+building the repository/service/use case graph on every request, as
+the dependency factories used to. Both probe routes return an empty
+body, so the difference is dependency resolution cost.
+
+Usage (from backend/):
+    python benchmarks/dependency_resolution.py [--requests 5000]
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+from pathlib import Path
+from unittest.mock import MagicMock
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+os.environ.setdefault("SUPABASE_URL", "https://bench.supabase.co")
+os.environ.setdefault("SUPABASE_PUBLISHABLE_KEY", "bench-key")
+
+from fastapi import Depends
+from httpx import ASGITransport, AsyncClient
+from supabase import Client
+
+from api.dependencies.database import get_supabase
+from api.dependencies.use_cases import get_footprint_summary_use_case
+from api.main import create_app
+from domain.services.aggregation_service import AggregationService
+from domain.use_cases.get_footprint_summary import (
+    GetFootprintSummaryUseCase,
+)
+from infrastructure.repositories.supabase_activity_repository import (
+    SupabaseActivityRepository,
+)
+
+
+def build_per_request(
+    client: Client = Depends(get_supabase),
+) -> GetFootprintSummaryUseCase:
+    """Build the object graph per request (previous factory style)."""
+    return GetFootprintSummaryUseCase(
+        activity_repo=SupabaseActivityRepository(client),
+        aggregation_service=AggregationService(),
+    )
+
+
+async def measure(client: AsyncClient, path: str, requests: int) -> float:
+    """Return mean microseconds per request for a path."""
+    for _ in range(min(200, requests)):
+        await client.get(path)
+
+    start = time.perf_counter()
+    for _ in range(requests):
+        await client.get(path)
+    return (time.perf_counter() - start) / requests * 1e6
+
+
+async def main(requests: int) -> None:
+    """Run the benchmark and print a summary."""
+    app = create_app()
+    mock_client = MagicMock()
+
+    async def get_mock_supabase() -> Client:
+        return mock_client
+
+    app.dependency_overrides[get_supabase] = get_mock_supabase
+
+    @app.get("/__bench/container")
+    async def via_container(
+        use_case: GetFootprintSummaryUseCase = Depends(get_footprint_summary_use_case),
+    ) -> dict:
+        return {}
+
+    @app.get("/__bench/per-request")
+    async def via_per_request(
+        use_case: GetFootprintSummaryUseCase = Depends(build_per_request),
+    ) -> dict:
+        return {}
+
+    @app.get("/__bench/baseline")
+    async def baseline() -> dict:
+        return {}
+
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://bench") as client:
+        base = await measure(client, "/__bench/baseline", requests)
+        per_request = await measure(client, "/__bench/per-request", requests)
+        container = await measure(client, "/__bench/container", requests)
+
+    print(f"requests per variant: {requests}")
+    print(f"no dependencies:      {base:8.1f} us/request")
+    print(
+        f"per-request graph:    {per_request:8.1f} us/request"
+        f"  (+{per_request - base:.1f} us)"
+    )
+    print(
+        f"container lookup:     {container:8.1f} us/request"
+        f"  (+{container - base:.1f} us)"
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=5000)
+    asyncio.run(main(parser.parse_args().requests))
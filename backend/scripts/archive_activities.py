@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+Move activities older than the archival horizon into the Parquet archive.
+
+Most reads cover the last months, yet the activities table keeps every
+row ever logged. This moves activities dated before today minus
+ACTIVITY_ARCHIVE_HORIZON_DAYS into per-owner Parquet files under
+ACTIVITY_ARCHIVE_URI (local path or object storage) and keeps their
+monthly CO2e per owner and category in activity_rollups, over a direct
+connection (DATABASE_URL). With the archive configured, the API reads
+archived activities back for old date ranges and exports.
+
+Each owner is moved in its own transaction, so the job can be stopped
+and rerun at any time. Run it daily or weekly. Requires
+CACHE_BACKEND=redis: cached footprints of each archived owner are
+invalidated through the cache shared with the API.
+
+Usage:
+    python -m backend.scripts.archive_activities [--horizon-days 365] [--dry-run]
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+from datetime import date, timedelta
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from api.dependencies.container import AppContainer
+from infrastructure.archive import (
+    ArchivalReport,
+    ParquetActivityArchive,
+    PostgresActivityArchiver,
+    batch_name,
+)
+from infrastructure.config.postgres import PostgresPool
+from infrastructure.config.settings import get_settings
+
+
+async def archive(
+    dsn: str | None = None,
+    archive_uri: str | None = None,
+    horizon_days: int | None = None,
+    dry_run: bool = False,
+) -> ArchivalReport:
+    """Archive the activities past the horizon.
+
+    Args:
+        dsn: Postgres DSN (default: DATABASE_URL from settings)
+        archive_uri: Archive location (default: ACTIVITY_ARCHIVE_URI)
+        horizon_days: Age in days to keep in Postgres (default: from settings)
+        dry_run: Only count the owners that would be archived
+
+    Returns:
+        Owners and activities archived (owners to archive on a dry run)
+
+    Raises:
+        ValueError: If the database, the archive or a shared cache is not
+            configured
+    """
+    settings = get_settings()
+    dsn = dsn or settings.database_url
+    archive_uri = archive_uri or settings.activity_archive_uri
+    if not dsn:
+        raise ValueError("DATABASE_URL must be set to archive activities")
+    if not archive_uri:
+        raise ValueError("ACTIVITY_ARCHIVE_URI must be set to archive activities")
+    if horizon_days is None:
+        horizon_days = settings.activity_archive_horizon_days
+    before = date.today() - timedelta(days=horizon_days)
+
+    container = AppContainer(settings)
+    pool = PostgresPool(dsn)
+    try:
+        if dry_run:
+            archiver = PostgresActivityArchiver(
+                pool, ParquetActivityArchive(archive_uri)
+            )
+            owners = await archiver.list_owners(before)
+            return ArchivalReport(owners=len(owners), activities=0)
+        archiver = PostgresActivityArchiver(
+            pool,
+            ParquetActivityArchive(archive_uri),
+            container.shared_footprint_cache(),
+        )
+        print(f"Archiving activities dated before {before}...")
+        return await archiver.archive_before(before, batch_name(before))
+    finally:
+        await pool.close()
+        await container.aclose()
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Parse arguments and run the archival."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "--horizon-days",
+        type=int,
+        help="Age in days to keep in Postgres (default: ACTIVITY_ARCHIVE_HORIZON_DAYS)",
+    )
+    parser.add_argument(
+        "--dry-run", action="store_true", help="Count the owners without archiving"
+    )
+    args = parser.parse_args(argv)
+
+    try:
+        report = asyncio.run(
+            archive(horizon_days=args.horizon_days, dry_run=args.dry_run)
+        )
+    except Exception as e:  # noqa: BLE001 - reported, any failure aborts
+        print(f"\n❌ Error archiving activities: {e}")
+        sys.exit(1)
+
+    if args.dry_run:
+        print(f"{report.owners} owners have activities to archive")
+    else:
+        print(f"\n✅ Archived {report.activities} activities of {report.owners} owners")
+
+
+if __name__ == "__main__":
+    main()
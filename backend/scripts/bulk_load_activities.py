@@ -0,0 +1,239 @@
+#!/usr/bin/env python3
+"""
+Bulk load historical activities from a CSV file straight into Postgres.
+
+Meant for backfills too large for PostgREST inserts. The file is read in
+chunks; worker processes validate each chunk and calculate its CO2e in
+one vectorized call, and the main process streams the results into the
+activities table with COPY FROM STDIN over a direct connection
+(DATABASE_URL). The whole load is one transaction: if it fails, nothing
+is kept and it can simply be rerun. Requires CACHE_BACKEND=redis: cached
+footprints of every owner loaded are invalidated through the cache
+shared with the API once the load is committed.
+
+CSV columns: date, type, value, and optionally category, notes, user_id
+and session_id. Rows without owner columns belong to --user-id or
+--session-id. Invalid rows are skipped and reported by line number.
+
+Usage:
+    python -m backend.scripts.bulk_load_activities history.csv \\
+        --session-id tenant-42
+    python -m backend.scripts.bulk_load_activities history.csv \\
+        --user-id 5f0c... --workers 8 --defer-indexes
+"""
+
+import argparse
+import asyncio
+import contextlib
+import csv
+import os
+import sys
+from collections import deque
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor
+from uuid import UUID
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from api.dependencies.container import AppContainer
+from domain.entities.emission_factor import EmissionFactor
+from domain.ports.footprint_cache import FootprintCache
+from domain.services.calculation_service import CalculationService
+from domain.services.emission_factor_index import EmissionFactorIndex
+from domain.services.owner_key import owner_key
+from domain.use_cases.import_activities import (
+    REQUIRED_FIELDS,
+    ImportReport,
+    ImportRow,
+)
+from infrastructure.config.postgres import connect_postgres
+from infrastructure.config.settings import get_settings
+from infrastructure.ingestion.postgres_copy_loader import (
+    PostgresCopyLoader,
+    PreparedChunk,
+    prepare_copy_records,
+)
+
+MAX_REPORTED_REJECTIONS = 20
+
+# Catalog of each worker process, set once by init_worker()
+_factor_index: EmissionFactorIndex | None = None
+
+
+def init_worker(factors: list[EmissionFactor]) -> None:
+    """Index the emission factor catalog in a worker process."""
+    global _factor_index
+    _factor_index = EmissionFactorIndex(factors)
+
+
+def prepare_chunk(
+    rows: list[ImportRow], user_id: UUID | None, session_id: str | None
+) -> PreparedChunk:
+    """Validate one chunk and calculate its CO2e (worker entry point)."""
+    if _factor_index is None:
+        raise RuntimeError("Worker was not initialized with emission factors")
+    return prepare_copy_records(
+        rows, _factor_index, CalculationService(), user_id, session_id
+    )
+
+
+def read_chunks(path: str, chunk_size: int) -> Iterator[list[ImportRow]]:
+    """Read CSV records in chunks.
+
+    Raises:
+        ValueError: If the header lacks a required column
+    """
+    with open(path, encoding="utf-8-sig", newline="") as f:
+        reader = csv.DictReader(f)
+        header = {name.strip().lower() for name in reader.fieldnames or []}
+        missing = [name for name in REQUIRED_FIELDS if name not in header]
+        if missing:
+            raise ValueError(f"CSV header must include: {', '.join(missing)}")
+
+        chunk: list[ImportRow] = []
+        for record in reader:
+            chunk.append(ImportRow(line=reader.line_num, fields=record))
+            if len(chunk) >= chunk_size:
+                yield chunk
+                chunk = []
+        if chunk:
+            yield chunk
+
+
+def _record(
+    report: ImportReport, owners: set[str], chunk: PreparedChunk, copied: int
+) -> None:
+    """Add one written chunk to the report and its owners to the set."""
+    owners.update(owner_key(record[1], record[2]) for record in chunk.records)
+    report.imported += copied
+    report.rejected += len(chunk.rejected)
+    room = MAX_REPORTED_REJECTIONS - len(report.rejected_rows)
+    report.rejected_rows.extend(chunk.rejected[: max(room, 0)])
+
+
+async def bulk_load(
+    path: str,
+    user_id: UUID | None = None,
+    session_id: str | None = None,
+    workers: int = 1,
+    chunk_size: int = 10000,
+    defer_indexes: bool = False,
+    dsn: str | None = None,
+    footprint_cache: FootprintCache | None = None,
+) -> ImportReport:
+    """Load a CSV file into the activities table.
+
+    Args:
+        path: CSV file to load
+        user_id: Owner of rows without owner columns
+        session_id: Session of rows without owner columns
+        workers: Processes validating and calculating chunks
+        chunk_size: Rows per chunk (and per COPY)
+        defer_indexes: Drop secondary indexes during the load and rebuild
+            them once at the end
+        dsn: Postgres DSN (default: DATABASE_URL from settings)
+        footprint_cache: Cache whose entries of loaded owners are invalidated
+
+    Returns:
+        Counts of loaded and rejected rows
+    """
+    report = ImportReport()
+    owners: set[str] = set()
+    conn = await connect_postgres(dsn)
+    try:
+        loader = PostgresCopyLoader(conn)
+        factors = await loader.load_emission_factors()
+        loop = asyncio.get_running_loop()
+
+        async with (
+            conn.transaction(),
+            loader.deferred_indexes() if defer_indexes else contextlib.nullcontext(),
+        ):
+            with ProcessPoolExecutor(
+                max_workers=workers, initializer=init_worker, initargs=(factors,)
+            ) as pool:
+                # Keep every worker busy while the previous chunk is copied,
+                # without reading the whole file ahead
+                pending: deque[asyncio.Future[PreparedChunk]] = deque()
+                for rows in read_chunks(path, chunk_size):
+                    pending.append(
+                        loop.run_in_executor(
+                            pool, prepare_chunk, rows, user_id, session_id
+                        )
+                    )
+                    if len(pending) > 2 * workers:
+                        chunk = await pending.popleft()
+                        _record(report, owners, chunk, await loader.copy(chunk.records))
+                while pending:
+                    chunk = await pending.popleft()
+                    _record(report, owners, chunk, await loader.copy(chunk.records))
+
+        await loader.analyze()
+    finally:
+        await conn.close()
+    if footprint_cache is not None:
+        for owner in owners:
+            await footprint_cache.invalidate(owner)
+    return report
+
+
+async def _load(args: argparse.Namespace) -> ImportReport:
+    """Run the load of the command line, invalidating through the shared cache."""
+    container = AppContainer(get_settings())
+    try:
+        return await bulk_load(
+            args.path,
+            user_id=args.user_id,
+            session_id=args.session_id,
+            workers=args.workers,
+            chunk_size=args.chunk_size,
+            defer_indexes=args.defer_indexes,
+            footprint_cache=container.shared_footprint_cache(),
+        )
+    finally:
+        await container.aclose()
+
+
+def _print_report(report: ImportReport) -> None:
+    """Print the outcome of a load."""
+    for row in report.rejected_rows:
+        print(f"  ✗ line {row.line}: {row.reason}")
+    if report.rejected > len(report.rejected_rows):
+        print(f"  … {report.rejected - len(report.rejected_rows)} more rejected")
+    print(f"\n✅ Loaded {report.imported} activities, rejected {report.rejected}")
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Parse arguments and run the load."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("path", help="CSV file to load")
+    parser.add_argument("--user-id", type=UUID, help="Owner of rows without one")
+    parser.add_argument("--session-id", help="Session of rows without an owner")
+    parser.add_argument(
+        "--workers", type=int, default=os.cpu_count() or 1, help="Worker processes"
+    )
+    parser.add_argument(
+        "--chunk-size", type=int, default=10000, help="Rows per chunk and COPY"
+    )
+    parser.add_argument(
+        "--defer-indexes",
+        action="store_true",
+        help="Drop secondary indexes during the load and rebuild them after",
+    )
+    args = parser.parse_args(argv)
+
+    if args.workers < 1:
+        parser.error("--workers must be at least 1")
+    if args.chunk_size < 1:
+        parser.error("--chunk-size must be at least 1")
+
+    try:
+        report = asyncio.run(_load(args))
+    except Exception as e:  # noqa: BLE001 - reported, any failure aborts
+        print(f"\n❌ Error loading activities: {e}")
+        sys.exit(1)
+    _print_report(report)
+
+
+if __name__ == "__main__":
+    main()
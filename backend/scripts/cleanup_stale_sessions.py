@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""
+Reclaim the activities of anonymous sessions idle past the session TTL.
+
+Anonymous visitors log activities under a session ID that is only
+migrated to a user when they sign up. Sessions never migrated pile up
+in the activities table and its indexes. This removes the activities of
+sessions without new or edited activities for SESSION_TTL_DAYS, over a
+direct connection (DATABASE_URL): deleted or, with
+SESSION_CLEANUP_MODE=archive (or --archive), moved to the activity
+archive when older than ACTIVITY_ARCHIVE_HORIZON_DAYS and deleted
+otherwise.
+
+Sessions are processed in batches of SESSION_CLEANUP_BATCH_SIZE, each in
+its own transaction, at most SESSION_CLEANUP_MAX_ROWS_PER_SECOND
+activities per second, so the job can be stopped and rerun at any time.
+Run it daily. Requires CACHE_BACKEND=redis: cached footprints of each
+reclaimed session are invalidated through the cache shared with the API.
+
+Usage:
+    python -m backend.scripts.cleanup_stale_sessions [--ttl-days 90] [--archive]
+        [--dry-run]
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from api.dependencies.container import AppContainer
+from domain.ports.session_cleaner import SessionCleanupReport
+from infrastructure.archive import (
+    ParquetActivityArchive,
+    PostgresActivityArchiver,
+)
+from infrastructure.config.postgres import PostgresPool
+from infrastructure.config.settings import get_settings
+from infrastructure.maintenance import PostgresSessionCleaner
+
+
+async def cleanup(
+    dsn: str | None = None,
+    ttl_days: int | None = None,
+    archive: bool | None = None,
+    max_rows_per_second: int | None = None,
+    dry_run: bool = False,
+) -> SessionCleanupReport:
+    """Reclaim the activities of stale anonymous sessions.
+
+    Args:
+        dsn: Postgres DSN (default: DATABASE_URL from settings)
+        ttl_days: Idle days after which a session is stale (default: from settings)
+        archive: Archive instead of deleting (default: SESSION_CLEANUP_MODE)
+        max_rows_per_second: Rate limit, 0 for none (default: from settings)
+        dry_run: Only count the stale sessions and their activities
+
+    Returns:
+        Sessions and activities reclaimed (found, on a dry run)
+
+    Raises:
+        ValueError: If the database, the archive or a shared cache is not
+            configured
+    """
+    settings = get_settings()
+    dsn = dsn or settings.database_url
+    if not dsn:
+        raise ValueError("DATABASE_URL must be set to clean up sessions")
+    if ttl_days is None:
+        ttl_days = settings.session_ttl_days
+    if archive is None:
+        archive = settings.session_cleanup_mode == "archive"
+    if max_rows_per_second is None:
+        max_rows_per_second = settings.session_cleanup_max_rows_per_second
+
+    container = AppContainer(settings)
+    pool = PostgresPool(dsn)
+    try:
+        footprint_cache = None if dry_run else container.shared_footprint_cache()
+        archiver = None
+        if archive:
+            if not settings.activity_archive_uri:
+                raise ValueError("ACTIVITY_ARCHIVE_URI must be set to archive sessions")
+            archiver = PostgresActivityArchiver(
+                pool, ParquetActivityArchive(settings.activity_archive_uri)
+            )
+        cleaner = PostgresSessionCleaner(
+            pool,
+            ttl_days=ttl_days,
+            batch_size=settings.session_cleanup_batch_size,
+            max_rows_per_second=max_rows_per_second,
+            archiver=archiver,
+            archive_horizon_days=settings.activity_archive_horizon_days,
+            footprint_cache=footprint_cache,
+        )
+        return await cleaner.run(dry_run=dry_run)
+    finally:
+        await pool.close()
+        await container.aclose()
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Parse arguments and run the cleanup."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "--ttl-days",
+        type=int,
+        help="Idle days after which a session is stale (default: SESSION_TTL_DAYS)",
+    )
+    parser.add_argument(
+        "--archive",
+        action="store_true",
+        default=None,
+        help="Archive the activities instead of deleting them",
+    )
+    parser.add_argument(
+        "--max-rows-per-second",
+        type=int,
+        help="Activities reclaimed per second at most, 0 for no limit",
+    )
+    parser.add_argument(
+        "--dry-run", action="store_true", help="Count the stale sessions only"
+    )
+    args = parser.parse_args(argv)
+
+    try:
+        report = asyncio.run(
+            cleanup(
+                ttl_days=args.ttl_days,
+                archive=args.archive,
+                max_rows_per_second=args.max_rows_per_second,
+                dry_run=args.dry_run,
+            )
+        )
+    except Exception as e:  # noqa: BLE001 - reported, any failure aborts
+        print(f"\n❌ Error cleaning up sessions: {e}")
+        sys.exit(1)
+
+    if report.dry_run:
+        print(
+            f"{report.sessions} sessions idle since {report.idle_before:%Y-%m-%d} "
+            f"hold {report.activities} activities"
+        )
+        return
+    action = "Archived" if report.archived else "Deleted"
+    print(
+        f"\n✅ {action} {report.activities} activities of {report.sessions} "
+        f"stale sessions in {report.duration_ms / 1000:.1f}s"
+    )
+
+
+if __name__ == "__main__":
+    main()
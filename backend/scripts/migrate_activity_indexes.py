@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""
+Replace single-column activity indexes with ones shaped like the hot queries.
+
+Owner listings and date ranges filter on user_id or session_id plus a
+date range and order by date, created_at; exports page through one
+owner's activities in ID order; session migration filters on session_id
+with user_id IS NULL. This creates composite owner/date and owner/id
+indexes and a partial index for unmigrated sessions, then drops the
+single-column indexes they make redundant (and the unused category
+index), matching scripts/schema.sql.
+
+Indexes are built and dropped CONCURRENTLY over a direct connection
+(DATABASE_URL), so the table stays writable during the migration. Every
+step is skipped when already applied; an interrupted run leaves an
+invalid index behind, which the next run drops and rebuilds. Postgres
+cannot build indexes concurrently on a partitioned table, so once
+activities is partitioned (scripts/partition_activities.py) the
+statements run plainly and lock writes while they build.
+
+Usage:
+    python -m backend.scripts.migrate_activity_indexes [--dry-run]
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+import asyncpg
+
+from infrastructure.config.postgres import connect_postgres
+
+# Index name -> definition, as in scripts/schema.sql
+ACTIVITY_INDEXES = {
+    "idx_activities_user_date": "ON activities (user_id, date, created_at)",
+    "idx_activities_session_date": "ON activities (session_id, date, created_at)",
+    "idx_activities_user_id_order": "ON activities (user_id, id)",
+    "idx_activities_session_id_order": "ON activities (session_id, id)",
+    "idx_activities_unmigrated_session": (
+        "ON activities (session_id) WHERE user_id IS NULL"
+    ),
+}
+
+# Covered by the composite indexes (leading column) or never queried
+REDUNDANT_INDEXES = (
+    "idx_activities_user_id",
+    "idx_activities_session_id",
+    "idx_activities_category",
+)
+
+# NULL if missing, else whether the index finished building
+_INDEX_VALID_SQL = """
+SELECT i.indisvalid FROM pg_index i WHERE i.indexrelid = to_regclass($1)
+"""
+
+_PARTITIONED_SQL = """
+SELECT relkind = 'p' FROM pg_class WHERE oid = to_regclass('activities')
+"""
+
+
+async def plan_migration(conn: asyncpg.Connection) -> list[str]:
+    """List the statements still needed on this database.
+
+    Args:
+        conn: Connection whose search_path includes the activities table
+
+    Returns:
+        DDL statements in execution order (empty when up to date)
+    """
+    concurrently = "" if await conn.fetchval(_PARTITIONED_SQL) else " CONCURRENTLY"
+    statements = []
+    for name, definition in ACTIVITY_INDEXES.items():
+        valid = await conn.fetchval(_INDEX_VALID_SQL, name)
+        if valid:
+            continue
+        if valid is False:
+            statements.append(f"DROP INDEX{concurrently} {name}")
+        statements.append(f"CREATE INDEX{concurrently} {name} {definition}")
+    for name in REDUNDANT_INDEXES:
+        if await conn.fetchval("SELECT to_regclass($1)", name) is not None:
+            statements.append(f"DROP INDEX{concurrently} {name}")
+    return statements
+
+
+async def migrate(dsn: str | None = None, dry_run: bool = False) -> list[str]:
+    """Bring the activity indexes up to date.
+
+    Args:
+        dsn: Postgres DSN (default: DATABASE_URL from settings)
+        dry_run: Only report the statements that would run
+
+    Returns:
+        Statements executed (or planned, on a dry run)
+    """
+    conn = await connect_postgres(dsn)
+    try:
+        statements = await plan_migration(conn)
+        if not dry_run:
+            # CONCURRENTLY cannot run in a transaction: one statement at a time
+            for statement in statements:
+                print(f"  → {statement}")
+                await conn.execute(statement)
+            if statements:
+                await conn.execute("ANALYZE activities")
+    finally:
+        await conn.close()
+    return statements
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Parse arguments and run the migration."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "--dry-run", action="store_true", help="Print the statements without running"
+    )
+    args = parser.parse_args(argv)
+
+    try:
+        statements = asyncio.run(migrate(dry_run=args.dry_run))
+    except Exception as e:  # noqa: BLE001 - reported, any failure aborts
+        print(f"\n❌ Error migrating indexes: {e}")
+        sys.exit(1)
+
+    if not statements:
+        print("✅ Activity indexes are up to date")
+    elif args.dry_run:
+        print("Statements to run:")
+        for statement in statements:
+            print(f"  {statement}")
+    else:
+        print(f"\n✅ Applied {len(statements)} index changes")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,465 @@
+#!/usr/bin/env python3
+"""
+Partition the activities table by date and keep partitions ahead of time.
+
+Date-range queries over a single table read index entries of every
+year on record. Range-partitioning activities by month (or year) lets
+Postgres prune the partitions outside the queried range, keeps each
+partition's indexes small, and lets old partitions be detached or
+archived whole. The repository queries stay the same.
+
+Commands (direct connection, DATABASE_URL):
+
+convert   Rebuild an unpartitioned activities table as a partitioned one,
+          in one transaction: rows, indexes, foreign keys, triggers, RLS
+          policies and grants are carried over, and the primary key
+          becomes (id, date) as Postgres requires. The table is locked
+          while rows are copied; run it in a maintenance window. A
+          partitioned table only gets the ID guard below, if missing.
+ensure    Create the partitions for the coming months. Dates without a
+          partition land in activities_default and are moved out when
+          their partition is created; run it monthly (or schedule
+          ensure_activity_partitions() with pg_cron).
+
+The (id, date) primary key no longer keeps IDs unique on its own: the
+same ID could be stored on two dates, in two partitions. convert adds an
+activity_ids table holding each ID once, filled by statement triggers on
+activities. This costs one extra insert or delete per write statement.
+Lookups by ID alone (get_by_id, update and delete by ID) cannot be pruned
+and probe the primary key of every partition; benchmarks/
+activity_partitioning.py measures them.
+
+Usage:
+    python -m backend.scripts.partition_activities convert [--interval year]
+    python -m backend.scripts.partition_activities ensure --months-ahead 12
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+from datetime import date
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+import asyncpg
+
+from infrastructure.config.postgres import connect_postgres
+
+INTERVALS = ("month", "year")
+
+DEFAULT_MONTHS_AHEAD = 12
+
+# Table keeping the rows while convert copies them
+UNPARTITIONED_TABLE = "activities_unpartitioned"
+
+# Same text as in scripts/schema.sql
+ENSURE_PARTITIONS_FUNCTION = """\
+CREATE OR REPLACE FUNCTION ensure_activity_partitions(
+    p_interval TEXT,
+    p_from DATE,
+    p_to DATE
+)
+RETURNS SETOF TEXT
+LANGUAGE plpgsql AS $$
+DECLARE
+    v_start DATE;
+    v_end DATE;
+    v_name TEXT;
+BEGIN
+    IF p_interval NOT IN ('month', 'year') THEN
+        RAISE EXCEPTION 'Partition interval must be month or year, not %', p_interval;
+    END IF;
+
+    v_start := date_trunc(p_interval, p_from)::DATE;
+    WHILE v_start <= p_to LOOP
+        v_end := (v_start + ('1 ' || p_interval)::INTERVAL)::DATE;
+        v_name := 'activities_p' || to_char(
+            v_start, CASE p_interval WHEN 'month' THEN 'YYYY_MM' ELSE 'YYYY' END
+        );
+        IF to_regclass(v_name) IS NULL THEN
+            EXECUTE format(
+                'CREATE TABLE %I (LIKE activities '
+                'INCLUDING DEFAULTS INCLUDING CONSTRAINTS)',
+                v_name
+            );
+            EXECUTE format('ALTER TABLE %I ENABLE ROW LEVEL SECURITY', v_name);
+            EXECUTE format(
+                'WITH moved AS (DELETE FROM activities_default '
+                'WHERE date >= %L AND date < %L RETURNING *) '
+                'INSERT INTO %I SELECT * FROM moved',
+                v_start, v_end, v_name
+            );
+            EXECUTE format(
+                'ALTER TABLE activities ATTACH PARTITION %I '
+                'FOR VALUES FROM (%L) TO (%L)',
+                v_name, v_start, v_end
+            );
+            RETURN NEXT v_name;
+        END IF;
+        v_start := v_end;
+    END LOOP;
+END;
+$$;
+"""
+
+# Same text as in scripts/schema.sql: keeps IDs unique across partitions
+ACTIVITY_IDS_SQL = """\
+CREATE TABLE IF NOT EXISTS activity_ids (
+    id UUID PRIMARY KEY
+);
+-- No policies: only written by the triggers below
+ALTER TABLE activity_ids ENABLE ROW LEVEL SECURITY;
+
+CREATE OR REPLACE FUNCTION register_activity_ids()
+RETURNS TRIGGER
+LANGUAGE plpgsql SECURITY DEFINER SET search_path FROM CURRENT AS $$
+BEGIN
+    INSERT INTO activity_ids (id) SELECT id FROM new_activities;
+    RETURN NULL;
+END;
+$$;
+
+CREATE OR REPLACE FUNCTION release_activity_ids()
+RETURNS TRIGGER
+LANGUAGE plpgsql SECURITY DEFINER SET search_path FROM CURRENT AS $$
+BEGIN
+    DELETE FROM activity_ids WHERE id IN (SELECT id FROM old_activities);
+    RETURN NULL;
+END;
+$$;
+
+CREATE OR REPLACE FUNCTION clear_activity_ids()
+RETURNS TRIGGER
+LANGUAGE plpgsql SECURITY DEFINER SET search_path FROM CURRENT AS $$
+BEGIN
+    TRUNCATE activity_ids;
+    RETURN NULL;
+END;
+$$;
+
+CREATE OR REPLACE TRIGGER register_activity_ids AFTER INSERT ON activities
+    REFERENCING NEW TABLE AS new_activities
+    FOR EACH STATEMENT EXECUTE FUNCTION register_activity_ids();
+
+CREATE OR REPLACE TRIGGER release_activity_ids AFTER DELETE ON activities
+    REFERENCING OLD TABLE AS old_activities
+    FOR EACH STATEMENT EXECUTE FUNCTION release_activity_ids();
+
+CREATE OR REPLACE TRIGGER clear_activity_ids AFTER TRUNCATE ON activities
+    FOR EACH STATEMENT EXECUTE FUNCTION clear_activity_ids();
+
+INSERT INTO activity_ids (id) SELECT id FROM activities ON CONFLICT DO NOTHING;
+"""
+
+_PARTITIONED_SQL = """
+SELECT relkind = 'p' FROM pg_class WHERE oid = to_regclass('activities')
+"""
+
+# Everything of the table that CREATE TABLE (LIKE ...) does not copy
+_INDEXES_SQL = """
+SELECT i.indexrelid::regclass::text AS name,
+       pg_get_indexdef(i.indexrelid) AS definition
+FROM pg_index i
+WHERE i.indrelid = 'activities'::regclass AND NOT i.indisprimary
+ORDER BY 1
+"""
+
+_FOREIGN_KEYS_SQL = """
+SELECT conname AS name, pg_get_constraintdef(oid) AS definition
+FROM pg_constraint
+WHERE conrelid = 'activities'::regclass AND contype = 'f'
+ORDER BY 1
+"""
+
+_TRIGGERS_SQL = """
+SELECT pg_get_triggerdef(oid) AS definition
+FROM pg_trigger
+WHERE tgrelid = 'activities'::regclass AND NOT tgisinternal
+ORDER BY tgname
+"""
+
+_POLICIES_SQL = """
+SELECT policyname, permissive, roles, cmd, qual, with_check
+FROM pg_policies
+WHERE schemaname = current_schema() AND tablename = 'activities'
+ORDER BY policyname
+"""
+
+# Explicit grants; the owner's privileges come with ownership
+_GRANTS_SQL = """
+SELECT CASE WHEN a.grantee = 0 THEN 'PUBLIC'
+            ELSE quote_ident(a.grantee::regrole::text) END AS grantee,
+       string_agg(a.privilege_type, ', ' ORDER BY a.privilege_type) AS privileges
+FROM pg_class c, aclexplode(c.relacl) a
+WHERE c.oid = 'activities'::regclass AND a.grantee <> c.relowner
+GROUP BY a.grantee
+ORDER BY 1
+"""
+
+_TABLE_SQL = """
+SELECT relrowsecurity, obj_description(oid, 'pg_class') AS comment
+FROM pg_class WHERE oid = 'activities'::regclass
+"""
+
+
+async def is_partitioned(conn: asyncpg.Connection) -> bool:
+    """Check whether the activities table is partitioned.
+
+    Args:
+        conn: Connection whose search_path includes the activities table
+
+    Returns:
+        True if activities is a partitioned table
+
+    Raises:
+        ValueError: If there is no activities table
+    """
+    partitioned = await conn.fetchval(_PARTITIONED_SQL)
+    if partitioned is None:
+        raise ValueError("No activities table in the search path")
+    return partitioned
+
+
+def _add_months(day: date, months: int) -> date:
+    """First day of the month `months` after the month of `day`."""
+    year, month = divmod(day.month - 1 + months, 12)
+    return date(day.year + year, month + 1, 1)
+
+
+async def ensure_partitions(
+    conn: asyncpg.Connection,
+    interval: str,
+    start: date,
+    end: date,
+) -> list[str]:
+    """Create the missing partitions covering start..end.
+
+    Args:
+        conn: Connection whose search_path includes the activities table
+        interval: Partition size, "month" or "year"
+        start: First date to cover
+        end: Last date to cover
+
+    Returns:
+        Names of the partitions created
+
+    Raises:
+        ValueError: If the interval is unknown
+    """
+    if interval not in INTERVALS:
+        raise ValueError(f"Partition interval must be one of {INTERVALS}")
+    await conn.execute(ENSURE_PARTITIONS_FUNCTION)
+    rows = await conn.fetch(
+        "SELECT ensure_activity_partitions($1, $2, $3) AS name", interval, start, end
+    )
+    return [row["name"] for row in rows]
+
+
+def _policy_statement(policy: asyncpg.Record) -> str:
+    """CREATE POLICY statement recreating a policy of pg_policies."""
+    roles = ", ".join(
+        "PUBLIC" if role == "public" else f'"{role}"' for role in policy["roles"]
+    )
+    statement = (
+        f'CREATE POLICY "{policy["policyname"]}" ON activities '
+        f"AS {policy['permissive']} FOR {policy['cmd']} TO {roles}"
+    )
+    if policy["qual"] is not None:
+        statement += f" USING ({policy['qual']})"
+    if policy["with_check"] is not None:
+        statement += f" WITH CHECK ({policy['with_check']})"
+    return statement
+
+
+async def convert_to_partitioned(
+    conn: asyncpg.Connection,
+    interval: str = "month",
+    months_ahead: int = DEFAULT_MONTHS_AHEAD,
+) -> list[str]:
+    """Rebuild the activities table as a range-partitioned table.
+
+    Runs in one transaction; on error nothing changes. An already
+    partitioned table only gets the activity_ids guard (ACTIVITY_IDS_SQL).
+
+    Args:
+        conn: Connection whose search_path includes the activities table
+        interval: Partition size, "month" or "year"
+        months_ahead: Months past today to create partitions for
+
+    Returns:
+        Names of the partitions created (empty if already partitioned)
+
+    Raises:
+        ValueError: If the interval is unknown or there is no activities table
+    """
+    if interval not in INTERVALS:
+        raise ValueError(f"Partition interval must be one of {INTERVALS}")
+
+    async with conn.transaction():
+        if await is_partitioned(conn):
+            await conn.execute(ACTIVITY_IDS_SQL)
+            return []
+        await conn.execute("LOCK TABLE activities IN ACCESS EXCLUSIVE MODE")
+
+        indexes = await conn.fetch(_INDEXES_SQL)
+        foreign_keys = await conn.fetch(_FOREIGN_KEYS_SQL)
+        triggers = await conn.fetch(_TRIGGERS_SQL)
+        policies = await conn.fetch(_POLICIES_SQL)
+        grants = await conn.fetch(_GRANTS_SQL)
+        table = await conn.fetchrow(_TABLE_SQL)
+        first, last = await conn.fetchrow("SELECT min(date), max(date) FROM activities")
+
+        # Index and constraint names are per schema: free them for the new table
+        for index in indexes:
+            await conn.execute(f'DROP INDEX "{index["name"]}"')
+        primary_key = await conn.fetchval(
+            "SELECT conname FROM pg_constraint "
+            "WHERE conrelid = 'activities'::regclass AND contype = 'p'"
+        )
+        if primary_key is not None:
+            await conn.execute(
+                f'ALTER TABLE activities RENAME CONSTRAINT "{primary_key}" '
+                f"TO {UNPARTITIONED_TABLE}_pkey"
+            )
+        await conn.execute(f"ALTER TABLE activities RENAME TO {UNPARTITIONED_TABLE}")
+
+        await conn.execute(
+            f"CREATE TABLE activities (LIKE {UNPARTITIONED_TABLE} "
+            "INCLUDING DEFAULTS INCLUDING CONSTRAINTS INCLUDING COMMENTS, "
+            "PRIMARY KEY (id, date)) PARTITION BY RANGE (date)"
+        )
+        await conn.execute(
+            "CREATE TABLE activities_default PARTITION OF activities DEFAULT"
+        )
+        await conn.execute("ALTER TABLE activities_default ENABLE ROW LEVEL SECURITY")
+        today = date.today()
+        created = await ensure_partitions(
+            conn,
+            interval,
+            min(first or today, today),
+            max(last or today, _add_months(today, months_ahead)),
+        )
+
+        # The ID triggers register the rows as they are copied
+        await conn.execute(ACTIVITY_IDS_SQL)
+
+        # Indexes are cheaper to build once the rows are in
+        await conn.execute(
+            f"INSERT INTO activities SELECT * FROM {UNPARTITIONED_TABLE}"
+        )
+        for index in indexes:
+            await conn.execute(index["definition"])
+        for foreign_key in foreign_keys:
+            await conn.execute(
+                f'ALTER TABLE activities ADD CONSTRAINT "{foreign_key["name"]}" '
+                f"{foreign_key['definition']}"
+            )
+        for trigger in triggers:
+            await conn.execute(trigger["definition"])
+        if table["relrowsecurity"]:
+            await conn.execute("ALTER TABLE activities ENABLE ROW LEVEL SECURITY")
+        for policy in policies:
+            await conn.execute(_policy_statement(policy))
+        for grant in grants:
+            await conn.execute(
+                f"GRANT {grant['privileges']} ON activities TO {grant['grantee']}"
+            )
+        if table["comment"] is not None:
+            await conn.execute(
+                await conn.fetchval(
+                    "SELECT format('COMMENT ON TABLE activities IS %L', $1::text)",
+                    table["comment"],
+                )
+            )
+
+        await conn.execute(f"DROP TABLE {UNPARTITIONED_TABLE}")
+
+    await conn.execute("ANALYZE activities")
+    return created
+
+
+async def convert(
+    dsn: str | None = None,
+    interval: str = "month",
+    months_ahead: int = DEFAULT_MONTHS_AHEAD,
+) -> list[str]:
+    """Partition the activities table of a database.
+
+    Args:
+        dsn: Postgres DSN (default: DATABASE_URL from settings)
+        interval: Partition size, "month" or "year"
+        months_ahead: Months past today to create partitions for
+
+    Returns:
+        Names of the partitions created (empty if already partitioned)
+    """
+    conn = await connect_postgres(dsn)
+    try:
+        return await convert_to_partitioned(conn, interval, months_ahead)
+    finally:
+        await conn.close()
+
+
+async def ensure(
+    dsn: str | None = None,
+    interval: str = "month",
+    months_ahead: int = DEFAULT_MONTHS_AHEAD,
+) -> list[str]:
+    """Create the partitions from this month to months_ahead.
+
+    Args:
+        dsn: Postgres DSN (default: DATABASE_URL from settings)
+        interval: Partition size, "month" or "year"
+        months_ahead: Months past today to create partitions for
+
+    Returns:
+        Names of the partitions created
+
+    Raises:
+        ValueError: If activities is not partitioned
+    """
+    conn = await connect_postgres(dsn)
+    try:
+        if not await is_partitioned(conn):
+            raise ValueError("activities is not partitioned; run convert first")
+        today = date.today()
+        return await ensure_partitions(
+            conn, interval, today, _add_months(today, months_ahead)
+        )
+    finally:
+        await conn.close()
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Parse arguments and run a command."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("command", choices=("convert", "ensure"))
+    parser.add_argument(
+        "--interval", choices=INTERVALS, default="month", help="Partition size"
+    )
+    parser.add_argument(
+        "--months-ahead",
+        type=int,
+        default=DEFAULT_MONTHS_AHEAD,
+        help=f"Months past today to create partitions for "
+        f"(default: {DEFAULT_MONTHS_AHEAD})",
+    )
+    args = parser.parse_args(argv)
+
+    command = convert if args.command == "convert" else ensure
+    try:
+        created = asyncio.run(
+            command(interval=args.interval, months_ahead=args.months_ahead)
+        )
+    except Exception as e:  # noqa: BLE001 - reported, any failure aborts
+        print(f"\n❌ Error partitioning activities: {e}")
+        sys.exit(1)
+
+    for name in created:
+        print(f"  → {name}")
+    print(f"\n✅ Created {len(created)} activity partitions")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+"""
+Recalculate stored CO2e after emission factors were revised.
+
+Activities are streamed in ID order and rewritten in batches. The ID
+space is split into a fixed number of shards, each checkpointed under its
+own job ID, so an interrupted run resumes when started again with the
+same job ID, whatever the number of workers. With --workers N the shards
+are recalculated in N parallel processes. With DATABASE_URL set, each
+shard is locked while it runs, so a second run of the same job (or the
+API) cannot process it at the same time.
+
+Requires CACHE_BACKEND=redis: the footprints the API cached before the
+rewrite are invalidated through the shared cache.
+
+Usage:
+    python -m backend.scripts.recalculate_emissions --job-id defra-2024
+    python -m backend.scripts.recalculate_emissions --job-id defra-2024 \\
+        --types car_petrol,car_diesel --workers 4
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from domain.ports.recalculation_checkpoint_store import RecalculationCheckpoint
+
+# Shards of every job; --workers only decides how many run at once, so a
+# job keeps its checkpoints when resumed with another worker count
+SHARD_COUNT = 16
+
+
+def shard_job_id(job_id: str, index: int) -> str:
+    """Checkpoint ID of one shard of a job."""
+    return f"{job_id}:{index + 1}/{SHARD_COUNT}"
+
+
+async def _run_shards(
+    job_id: str,
+    activity_types: tuple[str, ...] | None,
+    indexes: list[int],
+    batch_size: int | None,
+) -> list[RecalculationCheckpoint]:
+    """Recalculate shards of a job one after another with one container.
+
+    Args:
+        job_id: Job ID the shard checkpoints derive from
+        activity_types: Only recalculate these types (None for all)
+        indexes: Zero-based shards to recalculate
+        batch_size: Activities per batch (None for the settings value)
+
+    Returns:
+        Final checkpoint of each shard, in the order of indexes
+    """
+    from api.dependencies.container import AppContainer
+    from domain.use_cases.recalculate_emissions import shard_bounds
+    from infrastructure.config.settings import get_settings
+    from infrastructure.config.supabase import get_supabase_client
+
+    settings = get_settings()
+    if batch_size is not None:
+        settings = settings.model_copy(update={"recalculation_batch_size": batch_size})
+
+    container = AppContainer(settings)
+    try:
+        container.shared_footprint_cache()
+        use_case = container.bind(get_supabase_client()).recalculate_emissions
+        checkpoints = []
+        for index in indexes:
+            after_id, before_id = shard_bounds(index, SHARD_COUNT)
+            shard_id = shard_job_id(job_id, index)
+            await container.lock_job(shard_id)
+            try:
+                checkpoints.append(
+                    await use_case.execute(
+                        shard_id,
+                        activity_types,
+                        after_id=after_id,
+                        before_id=before_id,
+                    )
+                )
+            finally:
+                await container.unlock_job(shard_id)
+        return checkpoints
+    finally:
+        await container.aclose()
+
+
+def run_shards(
+    job_id: str,
+    activity_types: tuple[str, ...] | None,
+    indexes: list[int],
+    batch_size: int | None,
+) -> list[RecalculationCheckpoint]:
+    """Recalculate shards of a job to completion (process entry point)."""
+    return asyncio.run(_run_shards(job_id, activity_types, indexes, batch_size))
+
+
+def recalculate(
+    job_id: str,
+    activity_types: tuple[str, ...] | None,
+    workers: int,
+    batch_size: int | None,
+) -> None:
+    """Recalculate all shards of a job and print their progress."""
+    shards = list(range(SHARD_COUNT))
+    if workers == 1:
+        checkpoints = run_shards(job_id, activity_types, shards, batch_size)
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [
+                pool.submit(
+                    run_shards, job_id, activity_types, shards[w::workers], batch_size
+                )
+                for w in range(workers)
+            ]
+            checkpoints = [c for future in futures for c in future.result()]
+
+    for checkpoint in sorted(checkpoints, key=lambda c: c.job_id):
+        print(
+            f"  ✓ {checkpoint.job_id}: scanned {checkpoint.scanned}, "
+            f"updated {checkpoint.updated}, skipped {checkpoint.skipped}"
+        )
+    print(
+        f"\n✅ Recalculated {sum(c.updated for c in checkpoints)} of "
+        f"{sum(c.scanned for c in checkpoints)} activities"
+    )
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Parse arguments and run the recalculation."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "--job-id", required=True, help="Job ID; rerun with the same ID to resume"
+    )
+    parser.add_argument(
+        "--types", help="Comma-separated activity types (default: all types)"
+    )
+    parser.add_argument(
+        "--batch-size", type=int, help="Activities per batch (default: settings)"
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help=f"Parallel processes, at most {SHARD_COUNT} (default: 1)",
+    )
+    args = parser.parse_args(argv)
+
+    if not 1 <= args.workers <= SHARD_COUNT:
+        parser.error(f"--workers must be between 1 and {SHARD_COUNT}")
+    if args.batch_size is not None and args.batch_size < 1:
+        parser.error("--batch-size must be at least 1")
+    activity_types = (
+        tuple(sorted({t.strip() for t in args.types.split(",") if t.strip()}))
+        if args.types
+        else None
+    )
+
+    try:
+        recalculate(args.job_id, activity_types or None, args.workers, args.batch_size)
+    except Exception as e:  # noqa: BLE001 - reported, any failure aborts
+        print(f"\n❌ Error recalculating emissions: {e}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
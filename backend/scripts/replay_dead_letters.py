@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Write the activities kept in the ingestion dead letter file.
+
+In queue mode (ACTIVITY_INGESTION_MODE=queue) new activities are
+acknowledged before they are inserted. Activities the queue could not
+insert after its retries are appended to INGESTION_DEAD_LETTER_PATH;
+this writes them with their original IDs, skipping any that reached the
+database after all, then renames the file to <path>.replayed.
+
+Usage:
+    python -m backend.scripts.replay_dead_letters [--path dead_letters.jsonl]
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+from pathlib import Path
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from api.dependencies.container import AppContainer
+from infrastructure.config.settings import get_settings
+from infrastructure.config.supabase import get_supabase_client
+from infrastructure.ingestion import DeadLetterFile
+
+
+async def replay(path: str | None = None) -> tuple[int, int]:
+    """Write the dead-lettered activities that are not stored yet.
+
+    Args:
+        path: Dead letter file (default: INGESTION_DEAD_LETTER_PATH)
+
+    Returns:
+        Activities written and activities already stored
+
+    Raises:
+        ValueError: If no dead letter file is configured or a line is invalid
+    """
+    settings = get_settings()
+    path = path or settings.ingestion_dead_letter_path
+    if not path:
+        raise ValueError("INGESTION_DEAD_LETTER_PATH must be set to replay")
+    activities = DeadLetterFile(path).read()
+    if not activities:
+        return 0, 0
+
+    container = AppContainer(settings)
+    try:
+        graph = container.bind(get_supabase_client())
+        missing = [
+            activity
+            for activity in activities
+            if await graph.activity_repository.get_by_id(activity.id) is None
+        ]
+        if missing:
+            saved = await graph.activity_repository.save_many(missing)
+            await graph.log_activity.record_saved(saved)
+    finally:
+        await container.aclose()
+
+    Path(path).rename(f"{path}.replayed")
+    return len(missing), len(activities) - len(missing)
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Parse arguments and replay the dead letter file."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "--path", help="Dead letter file (default: INGESTION_DEAD_LETTER_PATH)"
+    )
+    args = parser.parse_args(argv)
+
+    try:
+        written, stored = asyncio.run(replay(args.path))
+    except Exception as e:  # noqa: BLE001 - reported, any failure aborts
+        print(f"\n❌ Error replaying dead letters: {e}")
+        sys.exit(1)
+
+    print(f"\n✅ Wrote {written} activities ({stored} were already stored)")
+
+
+if __name__ == "__main__":
+    main()
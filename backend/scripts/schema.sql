@@ -31,8 +31,12 @@ CREATE TABLE IF NOT EXISTS emission_factors (
 );
 
 -- 3. Activities table
+-- Range-partitioned by date (one partition per month, see
+-- ensure_activity_partitions below) so date-range queries only touch the
+-- partitions in range. The primary key must include the partition key;
+-- activity_ids (below) keeps IDs unique across partitions.
 CREATE TABLE IF NOT EXISTS activities (
-    id          UUID PRIMARY KEY DEFAULT uuid_generate_v4(),
+    id          UUID         NOT NULL DEFAULT uuid_generate_v4(),
     user_id     UUID REFERENCES users(id) ON DELETE CASCADE,
     session_id  VARCHAR(255),
     category    VARCHAR(100) NOT NULL,
@@ -43,14 +47,85 @@ CREATE TABLE IF NOT EXISTS activities (
     notes       TEXT,
     metadata    JSONB,
     created_at  TIMESTAMP WITH TIME ZONE DEFAULT NOW(),
-    updated_at  TIMESTAMP WITH TIME ZONE DEFAULT NOW()
+    updated_at  TIMESTAMP WITH TIME ZONE DEFAULT NOW(),
+    PRIMARY KEY (id, date)
+) PARTITION BY RANGE (date);
+
+-- Catches dates without a partition yet; ensure_activity_partitions moves
+-- them out when their partition is created
+CREATE TABLE IF NOT EXISTS activities_default PARTITION OF activities DEFAULT;
+
+-- 4. Recalculation checkpoints
+-- Progress of CO2e recalculation jobs (scripts/recalculate_emissions.py)
+CREATE TABLE IF NOT EXISTS recalculation_checkpoints (
+    job_id          VARCHAR(100) PRIMARY KEY,
+    activity_types  TEXT[],
+    last_id         UUID,
+    scanned         BIGINT  NOT NULL DEFAULT 0,
+    updated         BIGINT  NOT NULL DEFAULT 0,
+    skipped         BIGINT  NOT NULL DEFAULT 0,
+    completed       BOOLEAN NOT NULL DEFAULT FALSE,
+    updated_at      TIMESTAMP WITH TIME ZONE DEFAULT NOW()
+);
+
+-- 5. Regional averages
+-- Per-capita annual footprints by country (scripts/seed_emission_factors.py)
+CREATE TABLE IF NOT EXISTS regional_averages (
+    country_code      CHAR(2)       PRIMARY KEY,
+    country_name      VARCHAR(100)  NOT NULL,
+    annual_average_kg DECIMAL(10, 2) NOT NULL,
+    created_at        TIMESTAMP WITH TIME ZONE DEFAULT NOW(),
+    updated_at        TIMESTAMP WITH TIME ZONE DEFAULT NOW()
+);
+
+-- 6. Activity rollups
+-- Monthly CO2e per owner and category of the activities moved to the
+-- Parquet archive (scripts/archive_activities.py), so population totals
+-- still count them. Anonymous owners are keyed by session_id.
+CREATE TABLE IF NOT EXISTS activity_rollups (
+    user_id         UUID REFERENCES users(id) ON DELETE CASCADE,
+    session_id      VARCHAR(255),
+    category        VARCHAR(100)   NOT NULL,
+    month           DATE           NOT NULL,
+    co2e_kg         DECIMAL(14, 6) NOT NULL,
+    activity_count  INTEGER        NOT NULL
+);
+-- One row per owner, category and month. An owner has either user_id or
+-- session_id, so the NULL one is coalesced to a placeholder (instead of
+-- UNIQUE NULLS NOT DISTINCT, which needs Postgres 15)
+ALTER TABLE activity_rollups
+    DROP CONSTRAINT IF EXISTS activity_rollups_user_id_session_id_category_month_key;
+CREATE UNIQUE INDEX IF NOT EXISTS idx_activity_rollups_owner_month ON activity_rollups (
+    COALESCE(user_id, '00000000-0000-0000-0000-000000000000'::UUID),
+    COALESCE(session_id, ''),
+    category,
+    month
+);
+
+-- 7. Scheduled job runs
+-- Latest due time run per background job, claimed by the API replica
+-- that runs it (under a per-job advisory lock) so no other replica
+-- repeats it. Only used over a direct connection.
+CREATE TABLE IF NOT EXISTS scheduled_job_runs (
+    job         TEXT PRIMARY KEY,
+    slot        TIMESTAMP WITH TIME ZONE NOT NULL,
+    started_at  TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT NOW()
 );
 
 -- Indexes
-CREATE INDEX IF NOT EXISTS idx_activities_user_id ON activities(user_id);
-CREATE INDEX IF NOT EXISTS idx_activities_session_id ON activities(session_id);
+-- Owner listings and date ranges filter on the owner and order by date, created_at
+-- (scripts/migrate_activity_indexes.py brings existing databases up to date)
+CREATE INDEX IF NOT EXISTS idx_activities_user_date ON activities(user_id, date, created_at);
+CREATE INDEX IF NOT EXISTS idx_activities_session_date ON activities(session_id, date, created_at);
+-- One owner's activities in ID order (exports and owner keyset pages)
+CREATE INDEX IF NOT EXISTS idx_activities_user_id_order ON activities(user_id, id);
+CREATE INDEX IF NOT EXISTS idx_activities_session_id_order ON activities(session_id, id);
+-- Anonymous activities still to migrate to an account
+CREATE INDEX IF NOT EXISTS idx_activities_unmigrated_session ON activities(session_id)
+    WHERE user_id IS NULL;
+-- Date ranges across all owners (percentile totals)
 CREATE INDEX IF NOT EXISTS idx_activities_date ON activities(date);
-CREATE INDEX IF NOT EXISTS idx_activities_category ON activities(category);
+-- Recalculation after an emission factor changes
 CREATE INDEX IF NOT EXISTS idx_activities_type ON activities(type);
 CREATE INDEX IF NOT EXISTS idx_emission_factors_category ON emission_factors(category);
 CREATE INDEX IF NOT EXISTS idx_emission_factors_type ON emission_factors(type);
@@ -62,16 +137,31 @@ CREATE INDEX IF NOT EXISTS idx_emission_factors_type ON emission_factors(type);
 ALTER TABLE users ENABLE ROW LEVEL SECURITY;
 ALTER TABLE emission_factors ENABLE ROW LEVEL SECURITY;
 ALTER TABLE activities ENABLE ROW LEVEL SECURITY;
+-- Partitions are only reached through activities; without policies,
+-- PostgREST cannot read or write them directly
+ALTER TABLE activities_default ENABLE ROW LEVEL SECURITY;
+ALTER TABLE regional_averages ENABLE ROW LEVEL SECURITY;
+ALTER TABLE activity_rollups ENABLE ROW LEVEL SECURITY;
+-- No policies: not exposed through PostgREST
+ALTER TABLE scheduled_job_runs ENABLE ROW LEVEL SECURITY;
 
 -- Emission factors: readable by everyone (public reference data)
 CREATE POLICY "Emission factors are publicly readable"
     ON emission_factors FOR SELECT
     USING (true);
 
--- Emission factors: can be inserted by anyone (for seeding)
-CREATE POLICY "Anyone can insert emission factors"
-    ON emission_factors FOR INSERT
-    WITH CHECK (true);
+-- Regional averages: public reference data like emission factors
+CREATE POLICY "Regional averages are publicly readable"
+    ON regional_averages FOR SELECT
+    USING (true);
+
+-- Reference data is read-only through the API: every CO2e calculation and
+-- comparison depends on it. scripts/seed_emission_factors.py writes it over
+-- DATABASE_URL. Drop the write policies earlier versions created.
+DROP POLICY IF EXISTS "Anyone can insert emission factors" ON emission_factors;
+DROP POLICY IF EXISTS "Anyone can update emission factors" ON emission_factors;
+DROP POLICY IF EXISTS "Anyone can insert regional averages" ON regional_averages;
+DROP POLICY IF EXISTS "Anyone can update regional averages" ON regional_averages;
 
 -- Activities: open for now (will be tightened when auth is added)
 CREATE POLICY "Anyone can insert activities"
@@ -86,6 +176,12 @@ CREATE POLICY "Anyone can delete activities"
     ON activities FOR DELETE
     USING (true);
 
+-- Activity rollups: read by activity_owner_totals, written only by the
+-- archival job over a direct connection
+CREATE POLICY "Activity rollups are readable"
+    ON activity_rollups FOR SELECT
+    USING (true);
+
 -- Users: users can only access their own data
 CREATE POLICY "Users can view own data" ON users
     FOR SELECT USING (auth.uid() = id);
@@ -114,9 +210,333 @@ CREATE TRIGGER update_emission_factors_updated_at BEFORE UPDATE ON emission_fact
 CREATE TRIGGER update_activities_updated_at BEFORE UPDATE ON activities
     FOR EACH ROW EXECUTE FUNCTION update_updated_at_column();
 
+CREATE TRIGGER update_regional_averages_updated_at BEFORE UPDATE ON regional_averages
+    FOR EACH ROW EXECUTE FUNCTION update_updated_at_column();
+
+CREATE TRIGGER update_recalculation_checkpoints_updated_at
+    BEFORE UPDATE ON recalculation_checkpoints
+    FOR EACH ROW EXECUTE FUNCTION update_updated_at_column();
+
+-- =============================================================================
+-- Aggregate functions (called via PostgREST RPC)
+-- =============================================================================
+
+-- Per-owner, per-category CO2e totals used to build population percentiles.
+-- Archived activities count through their monthly rollups: a month that
+-- overlaps the range counts whole.
+CREATE OR REPLACE FUNCTION activity_owner_totals(p_start_date DATE, p_end_date DATE)
+RETURNS TABLE (user_id UUID, session_id VARCHAR, category VARCHAR, co2e_kg DECIMAL)
+LANGUAGE sql STABLE AS $$
+    SELECT t.user_id, t.session_id, t.category, SUM(t.co2e_kg)
+    FROM (
+        SELECT a.user_id,
+               CASE WHEN a.user_id IS NULL THEN a.session_id END AS session_id,
+               a.category,
+               a.co2e_kg
+        FROM activities a
+        WHERE a.date BETWEEN p_start_date AND p_end_date
+        UNION ALL
+        SELECT r.user_id, r.session_id, r.category, r.co2e_kg
+        FROM activity_rollups r
+        WHERE r.month BETWEEN date_trunc('month', p_start_date)::DATE AND p_end_date
+    ) t
+    GROUP BY t.user_id, t.session_id, t.category;
+$$;
+
+-- Update an activity if it belongs to the caller, classifying failures
+-- (not_found / forbidden / category_mismatch) in the same round trip
+CREATE OR REPLACE FUNCTION update_owned_activity(
+    p_id UUID,
+    p_user_id UUID,
+    p_session_id VARCHAR,
+    p_category VARCHAR,
+    p_type VARCHAR,
+    p_value DECIMAL,
+    p_co2e_kg DECIMAL,
+    p_date DATE,
+    p_notes TEXT
+)
+RETURNS TABLE (status TEXT, previous JSONB, activity JSONB)
+LANGUAGE plpgsql AS $$
+DECLARE
+    v_old activities;
+    v_new activities;
+BEGIN
+    SELECT * INTO v_old FROM activities a WHERE a.id = p_id FOR UPDATE;
+    IF NOT FOUND THEN
+        RETURN QUERY SELECT 'not_found'::TEXT, NULL::JSONB, NULL::JSONB;
+        RETURN;
+    END IF;
+
+    IF (p_user_id IS NOT NULL AND v_old.user_id IS DISTINCT FROM p_user_id)
+       OR (p_user_id IS NULL AND v_old.session_id IS DISTINCT FROM p_session_id) THEN
+        RETURN QUERY SELECT 'forbidden'::TEXT, NULL::JSONB, NULL::JSONB;
+        RETURN;
+    END IF;
+
+    IF v_old.category <> p_category THEN
+        RETURN QUERY SELECT 'category_mismatch'::TEXT, to_jsonb(v_old), NULL::JSONB;
+        RETURN;
+    END IF;
+
+    UPDATE activities a
+    SET type = p_type,
+        value = p_value,
+        co2e_kg = p_co2e_kg,
+        date = p_date,
+        notes = p_notes
+    WHERE a.id = p_id
+    RETURNING * INTO v_new;
+
+    RETURN QUERY SELECT 'ok'::TEXT, to_jsonb(v_old), to_jsonb(v_new);
+END;
+$$;
+
+-- Change the type of many activities of one owner in a single statement.
+-- Selects by IDs (p_ids) or, when p_ids is NULL, by the caller's rows
+-- matching the filters. The new CO2e of each row is computed by the API
+-- with the factor in effect on its date and passed per row, along with
+-- the value and date it was computed from. Returns one row per targeted
+-- activity: 'ok' with old and new values, 'category_mismatch' (left
+-- unchanged), 'stale' when the row's value or date changed since its CO2e
+-- was computed (left unchanged, to compute again), and for requested IDs
+-- 'forbidden'. Requested IDs with no row are omitted.
+DROP FUNCTION IF EXISTS bulk_update_activity_type(
+    UUID, VARCHAR, UUID[], DATE, DATE, VARCHAR, VARCHAR, VARCHAR, DECIMAL
+);
+CREATE OR REPLACE FUNCTION bulk_update_activity_type(
+    p_user_id UUID,
+    p_session_id VARCHAR,
+    p_ids UUID[],
+    p_start_date DATE,
+    p_end_date DATE,
+    p_type_filter VARCHAR,
+    p_category VARCHAR,
+    p_type VARCHAR,
+    p_co2e_ids UUID[],
+    p_values DECIMAL[],
+    p_dates DATE[],
+    p_co2e_kg DECIMAL[]
+)
+RETURNS TABLE (id UUID, status TEXT, previous JSONB, activity JSONB)
+LANGUAGE sql AS $$
+    WITH target AS (
+        SELECT a.*,
+               CASE WHEN p_user_id IS NOT NULL THEN a.user_id = p_user_id
+                    ELSE a.session_id = p_session_id END AS owned
+        FROM activities a
+        WHERE (p_start_date IS NULL OR a.date >= p_start_date)
+          AND (p_end_date IS NULL OR a.date <= p_end_date)
+          AND (p_type_filter IS NULL OR a.type = p_type_filter)
+          AND CASE
+                WHEN p_ids IS NOT NULL THEN a.id = ANY (p_ids)
+                WHEN p_user_id IS NOT NULL THEN a.user_id = p_user_id
+                ELSE a.session_id = p_session_id
+              END
+        FOR UPDATE
+    ),
+    computed AS (
+        SELECT t.id, c.co2e_kg
+        FROM target t
+        JOIN unnest(p_co2e_ids, p_values, p_dates, p_co2e_kg)
+             AS c(id, value, date, co2e_kg)
+          ON c.id = t.id AND c.value = t.value AND c.date = t.date
+        WHERE t.owned AND t.category = p_category
+    ),
+    updated AS (
+        UPDATE activities a
+        SET type = p_type,
+            co2e_kg = c.co2e_kg
+        FROM target t
+        JOIN computed c ON c.id = t.id
+        WHERE a.id = t.id AND a.date = t.date
+        RETURNING a.id, to_jsonb(t) - 'owned' AS previous, to_jsonb(a) AS activity
+    )
+    SELECT u.id, 'ok'::TEXT, u.previous, u.activity FROM updated u
+    UNION ALL
+    SELECT t.id, 'stale'::TEXT, to_jsonb(t) - 'owned', NULL::JSONB
+    FROM target t
+    WHERE t.owned AND t.category = p_category
+      AND t.id NOT IN (SELECT c.id FROM computed c)
+    UNION ALL
+    SELECT t.id, 'category_mismatch'::TEXT, to_jsonb(t) - 'owned', NULL::JSONB
+    FROM target t
+    WHERE t.owned AND t.category <> p_category
+    UNION ALL
+    SELECT t.id, 'forbidden'::TEXT, NULL::JSONB, NULL::JSONB
+    FROM target t
+    WHERE t.owned IS NOT TRUE;
+$$;
+
+-- Set co2e_kg of many activities in one statement (recalculation job).
+-- Each CO2e is passed with the type, value and date it was computed from.
+-- Returns one row per activity still stored: 'ok' with old and new values,
+-- or 'stale' when the row's type, value or date changed since its CO2e was
+-- computed (left unchanged, with its current values to compute again), as
+-- in bulk_update_activity_type.
+DROP FUNCTION IF EXISTS update_activity_co2e(UUID[], DECIMAL[]);
+CREATE OR REPLACE FUNCTION update_activity_co2e(
+    p_ids UUID[],
+    p_types VARCHAR[],
+    p_values DECIMAL[],
+    p_dates DATE[],
+    p_co2e_kg DECIMAL[]
+)
+RETURNS TABLE (id UUID, status TEXT, previous JSONB, activity JSONB)
+LANGUAGE sql AS $$
+    WITH target AS (
+        SELECT a.*
+        FROM activities a
+        WHERE a.id = ANY (p_ids)
+        FOR UPDATE
+    ),
+    computed AS (
+        SELECT t.id, c.co2e_kg
+        FROM target t
+        JOIN unnest(p_ids, p_types, p_values, p_dates, p_co2e_kg)
+             AS c(id, type, value, date, co2e_kg)
+          ON c.id = t.id AND c.type = t.type AND c.value = t.value
+         AND c.date = t.date
+    ),
+    updated AS (
+        UPDATE activities a
+        SET co2e_kg = c.co2e_kg
+        FROM target t
+        JOIN computed c ON c.id = t.id
+        WHERE a.id = t.id AND a.date = t.date
+        RETURNING a.id, to_jsonb(t) AS previous, to_jsonb(a) AS activity
+    )
+    SELECT u.id, 'ok'::TEXT, u.previous, u.activity FROM updated u
+    UNION ALL
+    SELECT t.id, 'stale'::TEXT, to_jsonb(t), NULL::JSONB
+    FROM target t
+    WHERE t.id NOT IN (SELECT c.id FROM computed c);
+$$;
+
+-- =============================================================================
+-- Activity partitions
+-- =============================================================================
+
+-- Create the missing activity partitions covering p_from..p_to, one per month
+-- or year. Rows already parked in the default partition for a new range are
+-- moved into it. Returns the names of the partitions created. Run ahead of
+-- time, e.g. monthly from pg_cron or scripts/partition_activities.py ensure.
+-- (Same text as ENSURE_PARTITIONS_FUNCTION in scripts/partition_activities.py)
+CREATE OR REPLACE FUNCTION ensure_activity_partitions(
+    p_interval TEXT,
+    p_from DATE,
+    p_to DATE
+)
+RETURNS SETOF TEXT
+LANGUAGE plpgsql AS $$
+DECLARE
+    v_start DATE;
+    v_end DATE;
+    v_name TEXT;
+BEGIN
+    IF p_interval NOT IN ('month', 'year') THEN
+        RAISE EXCEPTION 'Partition interval must be month or year, not %', p_interval;
+    END IF;
+
+    v_start := date_trunc(p_interval, p_from)::DATE;
+    WHILE v_start <= p_to LOOP
+        v_end := (v_start + ('1 ' || p_interval)::INTERVAL)::DATE;
+        v_name := 'activities_p' || to_char(
+            v_start, CASE p_interval WHEN 'month' THEN 'YYYY_MM' ELSE 'YYYY' END
+        );
+        IF to_regclass(v_name) IS NULL THEN
+            EXECUTE format(
+                'CREATE TABLE %I (LIKE activities '
+                'INCLUDING DEFAULTS INCLUDING CONSTRAINTS)',
+                v_name
+            );
+            EXECUTE format('ALTER TABLE %I ENABLE ROW LEVEL SECURITY', v_name);
+            EXECUTE format(
+                'WITH moved AS (DELETE FROM activities_default '
+                'WHERE date >= %L AND date < %L RETURNING *) '
+                'INSERT INTO %I SELECT * FROM moved',
+                v_start, v_end, v_name
+            );
+            EXECUTE format(
+                'ALTER TABLE activities ATTACH PARTITION %I '
+                'FOR VALUES FROM (%L) TO (%L)',
+                v_name, v_start, v_end
+            );
+            RETURN NEXT v_name;
+        END IF;
+        v_start := v_end;
+    END LOOP;
+END;
+$$;
+
+-- Partitions for the past year and the year ahead
+SELECT ensure_activity_partitions(
+    'month',
+    (CURRENT_DATE - INTERVAL '1 year')::DATE,
+    (CURRENT_DATE + INTERVAL '1 year')::DATE
+);
+
+-- Activity IDs stay unique across partitions. The primary key is (id, date)
+-- because Postgres requires the partition key in it, so on its own it would
+-- accept one ID on two dates. activity_ids holds each ID once, kept in step
+-- by statement triggers on activities: one extra insert or delete per
+-- statement, from its transition table. Moving an activity to another date
+-- keeps its ID. Lookups by ID alone still probe every partition's primary
+-- key (benchmarks/activity_partitioning.py measures the cost). Safe to run
+-- again: it registers the IDs of existing rows.
+-- (Same text as ACTIVITY_IDS_SQL in scripts/partition_activities.py)
+CREATE TABLE IF NOT EXISTS activity_ids (
+    id UUID PRIMARY KEY
+);
+-- No policies: only written by the triggers below
+ALTER TABLE activity_ids ENABLE ROW LEVEL SECURITY;
+
+CREATE OR REPLACE FUNCTION register_activity_ids()
+RETURNS TRIGGER
+LANGUAGE plpgsql SECURITY DEFINER SET search_path FROM CURRENT AS $$
+BEGIN
+    INSERT INTO activity_ids (id) SELECT id FROM new_activities;
+    RETURN NULL;
+END;
+$$;
+
+CREATE OR REPLACE FUNCTION release_activity_ids()
+RETURNS TRIGGER
+LANGUAGE plpgsql SECURITY DEFINER SET search_path FROM CURRENT AS $$
+BEGIN
+    DELETE FROM activity_ids WHERE id IN (SELECT id FROM old_activities);
+    RETURN NULL;
+END;
+$$;
+
+CREATE OR REPLACE FUNCTION clear_activity_ids()
+RETURNS TRIGGER
+LANGUAGE plpgsql SECURITY DEFINER SET search_path FROM CURRENT AS $$
+BEGIN
+    TRUNCATE activity_ids;
+    RETURN NULL;
+END;
+$$;
+
+CREATE OR REPLACE TRIGGER register_activity_ids AFTER INSERT ON activities
+    REFERENCING NEW TABLE AS new_activities
+    FOR EACH STATEMENT EXECUTE FUNCTION register_activity_ids();
+
+CREATE OR REPLACE TRIGGER release_activity_ids AFTER DELETE ON activities
+    REFERENCING OLD TABLE AS old_activities
+    FOR EACH STATEMENT EXECUTE FUNCTION release_activity_ids();
+
+CREATE OR REPLACE TRIGGER clear_activity_ids AFTER TRUNCATE ON activities
+    FOR EACH STATEMENT EXECUTE FUNCTION clear_activity_ids();
+
+INSERT INTO activity_ids (id) SELECT id FROM activities ON CONFLICT DO NOTHING;
+
 -- =============================================================================
 -- Documentation
 -- =============================================================================
 COMMENT ON TABLE users IS 'User accounts and profiles';
 COMMENT ON TABLE emission_factors IS 'Emission factors for different activities and categories';
 COMMENT ON TABLE activities IS 'User activities tracking carbon emissions';
+COMMENT ON TABLE recalculation_checkpoints IS 'Progress of resumable CO2e recalculation jobs';
+COMMENT ON TABLE activity_rollups IS 'Monthly CO2e per owner and category of archived activities';
+COMMENT ON TABLE scheduled_job_runs IS 'Latest due time run per background job';
@@ -1,16 +1,35 @@
 #!/usr/bin/env python3
 """
-Seed database with emission factors.
+Seed database with emission factors and regional averages.
 
 Sources:
 - DEFRA 2023 Conversion Factors
 - EPA Emission Factors Hub
 
+Rows are written with one upsert per table, keyed on (category, type,
+source_year) for emission factors and country_code for regional
+averages, so rerunning the seed updates revised values in place.
+
+Both tables are read-only through the API (RLS allows SELECT only), so
+the seed writes over a direct connection (DATABASE_URL).
+
 Usage:
     python -m backend.scripts.seed_emission_factors
+    python -m backend.scripts.seed_emission_factors --dry-run
 """
 
+import argparse
+import asyncio
 import os
+import sys
+import time
+from dataclasses import dataclass, field
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+import asyncpg
+
+from infrastructure.config.postgres import connect_postgres
 
 # Source constants
 SOURCE_DEFRA = "DEFRA"
@@ -249,59 +268,165 @@ REGIONAL_AVERAGES = [
 ]
 
 
-def seed_database():
-    """Seed the database with emission factors and regional averages."""
-    import sys
+# Conflict key of each seeded table; existing rows with the same key are updated
+CONFLICT_KEYS = {
+    "emission_factors": ("category", "type", "source_year"),
+    "regional_averages": ("country_code",),
+}
 
-    sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
 
-    try:
-        from infrastructure.config.supabase import get_supabase_client
-
-        client = get_supabase_client()
-        table = client.table("emission_factors")
-
-        for factor_data in EMISSION_FACTORS:
-            existing = (
-                table.select("id")
-                .eq("category", factor_data["category"])
-                .eq("type", factor_data["type"])
-                .eq("source_year", factor_data["source_year"])
-                .execute()
-            )
+@dataclass
+class TableDiff:
+    """Difference between the seed payload and a table's rows."""
 
-            if existing.data:
-                print(
-                    f"  ⏭ {factor_data['category']}/{factor_data['type']}: already exists"
-                )
-            else:
-                table.insert(factor_data).execute()
-                print(
-                    f"  ✓ {factor_data['category']}/{factor_data['type']}: {factor_data['factor']} {factor_data['unit']}"
-                )
-
-        print(f"\n✅ Seeded {len(EMISSION_FACTORS)} emission factors")
-
-    except ImportError as e:
-        print(f"Import error: {e}")
-        print("\nFalling back to dry-run mode...")
-        print("Seeding emission factors...")
-        for factor in EMISSION_FACTORS:
-            print(
-                f"  - {factor['category']}/{factor['type']}: {factor['factor']} {factor['unit']}"
-            )
+    added: list[dict] = field(default_factory=list)
+    changed: list[tuple[dict, dict]] = field(default_factory=list)
+    unchanged: int = 0
 
-        print("\nSeeding regional averages...")
-        for region in REGIONAL_AVERAGES:
-            print(
-                f"  - {region['country_name']} ({region['country_code']}): {region['annual_average_kg']} kg/year"
-            )
 
-        print("\n✅ Seed data ready for insertion")
-        print(
-            "   Run with SUPABASE_URL and SUPABASE_PUBLISHABLE_KEY set to actually insert data"
+def build_payload() -> dict[str, list[dict]]:
+    """Rows to seed, by table."""
+    return {
+        "emission_factors": EMISSION_FACTORS,
+        "regional_averages": REGIONAL_AVERAGES,
+    }
+
+
+def _key(table: str, row: dict) -> tuple:
+    return tuple(row[column] for column in CONFLICT_KEYS[table])
+
+
+def _same(desired: dict, existing: dict) -> bool:
+    """Whether an existing row already holds every desired value."""
+    for column, value in desired.items():
+        current = existing.get(column)
+        if isinstance(value, float | int) and not isinstance(value, bool):
+            # NUMERIC columns come back as strings or floats
+            if current is None or float(current) != float(value):
+                return False
+        elif current != value:
+            return False
+    return True
+
+
+def diff_table(table: str, desired: list[dict], existing: list[dict]) -> TableDiff:
+    """Compare seed rows with a table's current rows by conflict key."""
+    existing_by_key = {_key(table, row): row for row in existing}
+    diff = TableDiff()
+    for row in desired:
+        current = existing_by_key.get(_key(table, row))
+        if current is None:
+            diff.added.append(row)
+        elif _same(row, current):
+            diff.unchanged += 1
+        else:
+            diff.changed.append((current, row))
+    return diff
+
+
+def _label(table: str, row: dict) -> str:
+    return "/".join(str(part) for part in _key(table, row))
+
+
+def _print_diff(table: str, diff: TableDiff) -> None:
+    """Print the rows a seed would add or change."""
+    for row in diff.added:
+        print(f"  + {_label(table, row)}")
+    for current, row in diff.changed:
+        changes = ", ".join(
+            f"{column}: {current.get(column)} → {value}"
+            for column, value in row.items()
+            if not _same({column: value}, current)
         )
+        print(f"  ~ {_label(table, row)} ({changes})")
+    print(
+        f"  {table}: {len(diff.added)} to add, {len(diff.changed)} to change, "
+        f"{diff.unchanged} unchanged"
+    )
+
+
+def _upsert_sql(table: str, columns: list[str]) -> str:
+    """Insert statement updating the rows whose conflict key exists."""
+    keys = CONFLICT_KEYS[table]
+    placeholders = ", ".join(f"${i}" for i in range(1, len(columns) + 1))
+    updates = ", ".join(f"{c} = EXCLUDED.{c}" for c in columns if c not in keys)
+    return (
+        f"INSERT INTO {table} ({', '.join(columns)}) VALUES ({placeholders}) "
+        f"ON CONFLICT ({', '.join(keys)}) DO UPDATE SET {updates}"
+    )
+
+
+async def seed(conn: asyncpg.Connection, dry_run: bool = False) -> dict[str, float]:
+    """Seed emission factors and regional averages with one upsert per table.
+
+    Args:
+        conn: Open connection to the database
+        dry_run: Print what would change without writing
+
+    Returns:
+        Seconds spent per table
+    """
+    timings: dict[str, float] = {}
+    for table, rows in build_payload().items():
+        start = time.perf_counter()
+        if dry_run:
+            existing = [dict(r) for r in await conn.fetch(f"SELECT * FROM {table}")]
+            _print_diff(table, diff_table(table, rows, existing))
+        else:
+            columns = list(rows[0])
+            await conn.executemany(
+                _upsert_sql(table, columns),
+                [tuple(row[c] for c in columns) for row in rows],
+            )
+            print(f"  ✓ {table}: upserted {len(rows)} rows")
+        timings[table] = time.perf_counter() - start
+
+    for table, seconds in timings.items():
+        print(f"  ⏱ {table}: {seconds * 1000:.0f} ms")
+    action = "Checked" if dry_run else "Seeded"
+    print(
+        f"\n✅ {action} {sum(len(rows) for rows in build_payload().values())} rows "
+        f"in {sum(timings.values()) * 1000:.0f} ms"
+    )
+    return timings
+
+
+async def seed_database(
+    dsn: str | None = None, dry_run: bool = False
+) -> dict[str, float]:
+    """Seed the database over a direct connection.
+
+    Args:
+        dsn: Postgres DSN (default: DATABASE_URL from settings)
+        dry_run: Print what would change without writing
+
+    Returns:
+        Seconds spent per table
+    """
+    conn = await connect_postgres(dsn)
+    try:
+        async with conn.transaction():
+            return await seed(conn, dry_run)
+    finally:
+        await conn.close()
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Parse arguments and run the seed."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="Show rows that would be added or changed without writing",
+    )
+    args = parser.parse_args(argv)
+
+    try:
+        asyncio.run(seed_database(dry_run=args.dry_run))
+    except Exception as e:  # noqa: BLE001 - reported, any failure aborts
+        print(f"\n❌ Error seeding database: {e}")
+        sys.exit(1)
 
 
 if __name__ == "__main__":
-    seed_database()
+    main()
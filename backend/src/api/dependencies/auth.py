@@ -1,5 +1,6 @@
 """Authentication dependencies for JWT validation via Supabase."""
 
+import hmac
 import logging
 from typing import Annotated
 from uuid import UUID
@@ -9,6 +10,7 @@ from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from supabase import Client
 
 from api.dependencies.database import get_supabase
+from infrastructure.config.settings import Settings, get_settings
 
 logger = logging.getLogger(__name__)
 
@@ -82,3 +84,30 @@ async def get_session_id(
         Session ID if present, None otherwise
     """
     return x_session_id
+
+
+async def require_admin(
+    x_admin_key: Annotated[str | None, Header()] = None,
+    settings: Settings = Depends(get_settings),
+) -> None:
+    """Require the administration key or raise 403.
+
+    Admin endpoints are disabled when no admin_api_key is configured.
+
+    Args:
+        x_admin_key: Key from X-Admin-Key header
+        settings: Application settings
+
+    Raises:
+        HTTPException: 403 if the key is missing, wrong or not configured
+    """
+    expected = settings.admin_api_key
+    if (
+        not expected
+        or not x_admin_key
+        or not hmac.compare_digest(x_admin_key.encode(), expected.encode())
+    ):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Admin key required",
+        )
@@ -0,0 +1,716 @@
+"""Application-lifetime dependency container."""
+
+import asyncio
+import logging
+from collections.abc import Coroutine
+from datetime import date, timedelta
+from functools import cached_property
+from pathlib import Path
+from typing import Any
+
+from fastapi import Request
+from supabase import Client, create_client
+
+from domain.entities.activity import Activity
+from domain.ports.activity_archive import ActivityArchive
+from domain.ports.activity_ingestion_queue import ActivityIngestionQueue
+from domain.ports.activity_repository import ActivityRepository
+from domain.ports.cache_backend import CacheBackend
+from domain.ports.footprint_cache import FootprintCache
+from domain.ports.job_scheduler import JobScheduler
+from domain.ports.session_cleaner import SessionCleaner
+from domain.services.aggregation_service import AggregationService
+from domain.services.calculation_service import CalculationService
+from domain.services.comparison_service import ComparisonService
+from domain.services.flight_distance_service import FlightDistanceService
+from domain.services.percentile_index import PopulationPercentileIndex
+from domain.use_cases.bulk_delete_activities import BulkDeleteActivitiesUseCase
+from domain.use_cases.bulk_update_activities import BulkUpdateActivitiesUseCase
+from domain.use_cases.calculate_flight import CalculateFlightUseCase
+from domain.use_cases.compare_to_region import CompareToRegionUseCase
+from domain.use_cases.delete_activity import DeleteActivityUseCase
+from domain.use_cases.export_activities import ExportActivitiesUseCase
+from domain.use_cases.get_footprint_breakdown import GetFootprintBreakdownUseCase
+from domain.use_cases.get_footprint_summary import GetFootprintSummaryUseCase
+from domain.use_cases.get_footprint_trend import GetFootprintTrendUseCase
+from domain.use_cases.import_activities import ImportActivitiesUseCase
+from domain.use_cases.log_activity import LogActivityUseCase
+from domain.use_cases.log_flight import LogFlightUseCase
+from domain.use_cases.migrate_activities import MigrateActivitiesUseCase
+from domain.use_cases.rebuild_percentile_index import RebuildPercentileIndexUseCase
+from domain.use_cases.recalculate_emissions import RecalculateEmissionsUseCase
+from domain.use_cases.update_activity import UpdateActivityUseCase
+from infrastructure.archive.parquet_activity_archive import ParquetActivityArchive
+from infrastructure.archive.postgres_activity_archiver import (
+    ArchivalReport,
+    PostgresActivityArchiver,
+    batch_name,
+)
+from infrastructure.cache.in_memory_cache_backend import InMemoryCacheBackend
+from infrastructure.cache.redis_cache_backend import RedisCacheBackend
+from infrastructure.cache.versioned_footprint_cache import VersionedFootprintCache
+from infrastructure.config.postgres import PostgresPool
+from infrastructure.config.settings import Settings
+from infrastructure.config.supabase import supabase_client_options
+from infrastructure.ingestion.batching_activity_queue import BatchingActivityQueue
+from infrastructure.ingestion.dead_letter_file import DeadLetterFile
+from infrastructure.maintenance.postgres_session_cleaner import PostgresSessionCleaner
+from infrastructure.repositories.cached_emission_factor_repository import (
+    CachedEmissionFactorRepository,
+    EmissionFactorCatalog,
+)
+from infrastructure.repositories.in_memory_activity_repository import (
+    InMemoryActivityRepository,
+)
+from infrastructure.repositories.json_airport_repository import (
+    JSONAirportRepository,
+)
+from infrastructure.repositories.json_region_data_provider import (
+    JSONRegionDataProvider,
+)
+from infrastructure.repositories.postgres_activity_repository import (
+    PostgresActivityRepository,
+)
+from infrastructure.repositories.read_routing_activity_repository import (
+    ReadRoutingActivityRepository,
+)
+from infrastructure.repositories.supabase_activity_repository import (
+    SupabaseActivityRepository,
+)
+from infrastructure.repositories.supabase_emission_factor_repository import (
+    SupabaseEmissionFactorRepository,
+)
+from infrastructure.repositories.supabase_recalculation_checkpoint_store import (
+    SupabaseRecalculationCheckpointStore,
+)
+from infrastructure.repositories.tiered_activity_repository import (
+    TieredActivityRepository,
+)
+from infrastructure.scheduling.asyncio_job_scheduler import AsyncioJobScheduler
+from infrastructure.scheduling.postgres_job_coordinator import PostgresJobCoordinator
+
+logger = logging.getLogger(__name__)
+
+DATA_DIR = Path(__file__).parent.parent.parent / "infrastructure" / "data"
+
+# Airport data file path
+AIRPORTS_DATA_FILE = DATA_DIR / "airports.json"
+
+# Regional data file path
+REGIONAL_DATA_FILE = DATA_DIR / "regional_averages.json"
+
+
+class ClientGraph:
+    """Repositories and use cases bound to one Supabase client.
+
+    Built once per client and reused for every request made with it.
+    """
+
+    def __init__(self, container: "AppContainer", client: Client) -> None:
+        """Wire repositories and use cases around a client.
+
+        Args:
+            container: Container holding process-wide components
+            client: Supabase client the repositories query
+        """
+        self.client = client
+
+        self.activity_repository = container.activity_repository(client)
+        self.emission_factor_repository = SupabaseEmissionFactorRepository(client)
+        self.cached_emission_factor_repository = CachedEmissionFactorRepository(
+            source=self.emission_factor_repository,
+            catalog=container.emission_factor_catalog,
+        )
+
+        self.log_activity = LogActivityUseCase(
+            activity_repo=self.activity_repository,
+            emission_factor_repo=self.cached_emission_factor_repository,
+            calculation_service=container.calculation_service,
+            percentile_index=container.percentile_index,
+            footprint_cache=container.footprint_cache,
+            ingestion_queue=container.ingestion_queue,
+        )
+        self.log_flight = LogFlightUseCase(
+            calculate_flight=container.calculate_flight,
+            log_activity=self.log_activity,
+        )
+        self.update_activity = UpdateActivityUseCase(
+            activity_repo=self.activity_repository,
+            emission_factor_repo=self.cached_emission_factor_repository,
+            calculation_service=container.calculation_service,
+            percentile_index=container.percentile_index,
+            footprint_cache=container.footprint_cache,
+        )
+        self.delete_activity = DeleteActivityUseCase(
+            activity_repo=self.activity_repository,
+            percentile_index=container.percentile_index,
+            footprint_cache=container.footprint_cache,
+        )
+        self.bulk_update_activities = BulkUpdateActivitiesUseCase(
+            activity_repo=self.activity_repository,
+            emission_factor_repo=self.cached_emission_factor_repository,
+            calculation_service=container.calculation_service,
+            percentile_index=container.percentile_index,
+            footprint_cache=container.footprint_cache,
+        )
+        self.bulk_delete_activities = BulkDeleteActivitiesUseCase(
+            activity_repo=self.activity_repository,
+            percentile_index=container.percentile_index,
+            footprint_cache=container.footprint_cache,
+        )
+        self.migrate_activities = MigrateActivitiesUseCase(
+            activity_repo=self.activity_repository,
+            percentile_index=container.percentile_index,
+            footprint_cache=container.footprint_cache,
+        )
+        self.import_activities = ImportActivitiesUseCase(
+            activity_repo=self.activity_repository,
+            emission_factor_repo=self.cached_emission_factor_repository,
+            calculation_service=container.calculation_service,
+            log_activity=self.log_activity,
+            batch_size=container.settings.import_batch_size,
+        )
+        self.export_activities = ExportActivitiesUseCase(
+            activity_repo=self.activity_repository,
+            chunk_size=container.settings.export_chunk_size,
+        )
+        self.footprint_summary = GetFootprintSummaryUseCase(
+            activity_repo=self.activity_repository,
+            aggregation_service=container.aggregation_service,
+            footprint_cache=container.footprint_cache,
+        )
+        self.footprint_breakdown = GetFootprintBreakdownUseCase(
+            activity_repo=self.activity_repository,
+            aggregation_service=container.aggregation_service,
+            footprint_cache=container.footprint_cache,
+        )
+        self.footprint_trend = GetFootprintTrendUseCase(
+            activity_repo=self.activity_repository,
+            aggregation_service=container.aggregation_service,
+            footprint_cache=container.footprint_cache,
+        )
+        self.compare_to_region = CompareToRegionUseCase(
+            activity_repo=self.activity_repository,
+            region_provider=container.region_data_provider,
+            aggregation_service=container.aggregation_service,
+            comparison_service=container.comparison_service,
+            percentile_index=container.percentile_index,
+            footprint_cache=container.footprint_cache,
+        )
+        self.rebuild_percentile_index = RebuildPercentileIndexUseCase(
+            activity_repo=self.activity_repository,
+            percentile_index=container.percentile_index,
+        )
+        self.recalculation_checkpoint_store = SupabaseRecalculationCheckpointStore(
+            client
+        )
+        # Reads factors uncached so a fresh seed is picked up immediately
+        self.recalculate_emissions = RecalculateEmissionsUseCase(
+            activity_repo=self.activity_repository,
+            emission_factor_repo=self.emission_factor_repository,
+            calculation_service=container.calculation_service,
+            checkpoint_store=self.recalculation_checkpoint_store,
+            batch_size=container.settings.recalculation_batch_size,
+            percentile_index=container.percentile_index,
+            footprint_cache=container.footprint_cache,
+        )
+
+
+class AppContainer:
+    """Holds services, repositories and use cases for the app lifetime.
+
+    Stateless services and process-wide components (reference data,
+    caches, indexes) are created once, lazily. Client-bound repositories
+    and use cases are grouped in a ClientGraph that is rebuilt only when
+    the Supabase client changes, so per-request dependency resolution
+    just looks objects up.
+    """
+
+    def __init__(self, settings: Settings) -> None:
+        """Initialize container.
+
+        Args:
+            settings: Application settings
+        """
+        self.settings = settings
+        self.aggregation_service = AggregationService()
+        self.calculation_service = CalculationService()
+        self.comparison_service = ComparisonService()
+        self.flight_distance_service = FlightDistanceService()
+        self._graph: ClientGraph | None = None
+        self._jobs: dict[str, asyncio.Task[Any]] = {}
+
+    def bind(self, client: Client) -> ClientGraph:
+        """Get the repositories and use cases bound to a client.
+
+        Args:
+            client: Supabase client of the current request
+
+        Returns:
+            Object graph for the client (reused while the client is unchanged)
+        """
+        if self._graph is None or self._graph.client is not client:
+            self._graph = ClientGraph(self, client)
+        return self._graph
+
+    def activity_repository(self, client: Client) -> ActivityRepository:
+        """Activity repository of the backend selected in settings.
+
+        With an archive configured, reads of old date ranges and exports
+        also include the archived activities.
+
+        Args:
+            client: Supabase client (used by the 'supabase' backend)
+
+        Returns:
+            Repository for the client
+
+        Raises:
+            ValueError: If the backend is unknown or misconfigured
+        """
+        hot = self._hot_activity_repository(client)
+        if self.activity_archive is None:
+            return hot
+        return TieredActivityRepository(
+            hot,
+            self.activity_archive,
+            self.settings.activity_archive_horizon_days,
+        )
+
+    def _hot_activity_repository(self, client: Client) -> ActivityRepository:
+        """Repository of the backend selected in settings, without the archive.
+
+        With a read replica configured, reads go to the replica except
+        right after the owner's own writes.
+        """
+        backend = self.settings.activity_repository_backend
+        replica: ActivityRepository | None = None
+        if backend == "supabase":
+            primary: ActivityRepository = SupabaseActivityRepository(client)
+            if self.supabase_replica_client is not None:
+                replica = SupabaseActivityRepository(self.supabase_replica_client)
+        elif backend == "postgres":
+            primary = self.postgres_activity_repository
+            replica = self.postgres_replica_activity_repository
+        elif backend == "memory":
+            return self.in_memory_activity_repository
+        else:
+            raise ValueError(f"Unknown activity repository backend: {backend}")
+        if replica is None:
+            return primary
+        return ReadRoutingActivityRepository(
+            primary,
+            replica,
+            self.cache_backend,
+            self.settings.read_your_writes_seconds,
+        )
+
+    @cached_property
+    def supabase_replica_client(self) -> Client | None:
+        """Supabase client of the read replica, if configured.
+
+        It has its own HTTP client over the connection pool shared with
+        the primary client, so each keeps sending to its own URL.
+        """
+        settings = self.settings
+        if not settings.supabase_read_replica_url:
+            return None
+        return create_client(
+            settings.supabase_read_replica_url,
+            settings.supabase_publishable_key,
+            supabase_client_options(),
+        )
+
+    @cached_property
+    def activity_archive(self) -> ActivityArchive | None:
+        """Archive of old activities, if configured (shared by all clients)."""
+        if not self.settings.activity_archive_uri:
+            return None
+        return ParquetActivityArchive(self.settings.activity_archive_uri)
+
+    @cached_property
+    def in_memory_activity_repository(self) -> InMemoryActivityRepository:
+        """Activity repository in process memory (shared by all clients)."""
+        return InMemoryActivityRepository()
+
+    @cached_property
+    def postgres_pool(self) -> PostgresPool:
+        """Process-wide Postgres pool, opened by its first query.
+
+        Raises:
+            ValueError: If database_url is not set
+        """
+        settings = self.settings
+        if not settings.database_url:
+            raise ValueError(
+                "database_url is required when activity_repository_backend "
+                "is 'postgres'"
+            )
+        return PostgresPool(
+            settings.database_url,
+            min_size=settings.database_pool_min_size,
+            max_size=settings.database_pool_max_size,
+        )
+
+    @cached_property
+    def postgres_activity_repository(self) -> PostgresActivityRepository:
+        """Activity repository on the Postgres pool (shared by all clients)."""
+        return PostgresActivityRepository(self.postgres_pool)
+
+    @cached_property
+    def postgres_replica_pool(self) -> PostgresPool | None:
+        """Process-wide pool on the read replica, if configured."""
+        settings = self.settings
+        if not settings.database_read_replica_url:
+            return None
+        return PostgresPool(
+            settings.database_read_replica_url,
+            min_size=settings.database_pool_min_size,
+            max_size=settings.database_pool_max_size,
+        )
+
+    @cached_property
+    def postgres_replica_activity_repository(
+        self,
+    ) -> PostgresActivityRepository | None:
+        """Activity repository on the read replica pool, if configured."""
+        if self.postgres_replica_pool is None:
+            return None
+        return PostgresActivityRepository(self.postgres_replica_pool)
+
+    @cached_property
+    def activity_archiver(self) -> PostgresActivityArchiver | None:
+        """Mover of activities into the archive, if both stores are configured."""
+        if not self.settings.database_url or self.activity_archive is None:
+            return None
+        return PostgresActivityArchiver(
+            self.postgres_pool, self.activity_archive, self.footprint_cache
+        )
+
+    async def _archive_activities(self) -> ArchivalReport:
+        """Archive the activities past the horizon (scheduled job)."""
+        if self.activity_archiver is None:
+            raise RuntimeError("Activity archive is not configured")
+        before = date.today() - timedelta(
+            days=self.settings.activity_archive_horizon_days
+        )
+        return await self.activity_archiver.archive_before(before, batch_name(before))
+
+    @cached_property
+    def session_cleaner(self) -> SessionCleaner | None:
+        """Cleaner of stale anonymous sessions, if database_url is set.
+
+        Raises:
+            ValueError: If the cleanup mode is unknown or misconfigured
+        """
+        settings = self.settings
+        if not settings.database_url:
+            return None
+        archiver = None
+        if settings.session_cleanup_mode == "archive":
+            if self.activity_archiver is None:
+                raise ValueError(
+                    "activity_archive_uri is required when session_cleanup_mode "
+                    "is 'archive'"
+                )
+            archiver = self.activity_archiver
+        elif settings.session_cleanup_mode != "delete":
+            raise ValueError(
+                f"Unknown session cleanup mode: {settings.session_cleanup_mode}"
+            )
+        return PostgresSessionCleaner(
+            self.postgres_pool,
+            ttl_days=settings.session_ttl_days,
+            batch_size=settings.session_cleanup_batch_size,
+            max_rows_per_second=settings.session_cleanup_max_rows_per_second,
+            archiver=archiver,
+            archive_horizon_days=settings.activity_archive_horizon_days,
+            footprint_cache=self.footprint_cache,
+            percentile_index=self.percentile_index,
+        )
+
+    @cached_property
+    def job_coordinator(self) -> PostgresJobCoordinator | None:
+        """Coordinator of jobs across processes, if database_url is set."""
+        if not self.settings.database_url:
+            return None
+        return PostgresJobCoordinator(self.postgres_pool)
+
+    @cached_property
+    def scheduler(self) -> JobScheduler | None:
+        """Scheduler of maintenance jobs, if enabled in settings.
+
+        Jobs needing a direct connection are only registered with
+        database_url set; replicas then coordinate through Postgres.
+
+        Raises:
+            ValueError: If a schedule or the cleanup mode is invalid
+        """
+        settings = self.settings
+        if not settings.scheduler_enabled:
+            return None
+        scheduler = AsyncioJobScheduler(
+            self.job_coordinator,
+            jitter_seconds=settings.scheduler_jitter_seconds,
+        )
+        if self.session_cleaner is not None and settings.session_cleanup_schedule:
+            scheduler.add(
+                "session_cleanup",
+                settings.session_cleanup_schedule,
+                self.session_cleaner.run,
+            )
+        if self.activity_archiver is not None and settings.activity_archive_schedule:
+            scheduler.add(
+                "activity_archive",
+                settings.activity_archive_schedule,
+                self._archive_activities,
+            )
+        return scheduler
+
+    @cached_property
+    def airport_repository(self) -> JSONAirportRepository:
+        """Airport reference data, loaded on first use."""
+        return JSONAirportRepository(AIRPORTS_DATA_FILE)
+
+    @cached_property
+    def region_data_provider(self) -> JSONRegionDataProvider:
+        """Regional averages, loaded on first use."""
+        return JSONRegionDataProvider(REGIONAL_DATA_FILE)
+
+    @cached_property
+    def emission_factor_catalog(self) -> EmissionFactorCatalog:
+        """Process-wide emission factor snapshot holder."""
+        return EmissionFactorCatalog(
+            ttl_seconds=self.settings.emission_factor_cache_ttl_seconds
+        )
+
+    @cached_property
+    def percentile_index(self) -> PopulationPercentileIndex:
+        """Process-wide population percentile index."""
+        return PopulationPercentileIndex(
+            min_population=self.settings.percentile_min_population,
+            rebuild_interval=timedelta(
+                seconds=self.settings.percentile_rebuild_interval_seconds
+            ),
+        )
+
+    @cached_property
+    def cache_backend(self) -> CacheBackend:
+        """Cache backend selected in settings.
+
+        Footprint data versions (behind cached results and ETags) live in
+        the backend, so several workers must share it: with the memory
+        backend, a write handled by one worker would leave the others
+        serving stale results and 304 responses.
+
+        Raises:
+            ValueError: If the backend is unknown or misconfigured
+        """
+        settings = self.settings
+        if settings.cache_backend == "memory":
+            if settings.web_concurrency > 1:
+                raise ValueError(
+                    "cache_backend 'memory' is per process: use 'redis' when "
+                    "web_concurrency is above 1"
+                )
+            return InMemoryCacheBackend(
+                max_entries=settings.footprint_cache_max_entries
+            )
+        if settings.cache_backend == "redis":
+            if not settings.redis_url:
+                raise ValueError("redis_url is required when cache_backend is 'redis'")
+            return RedisCacheBackend.from_url(settings.redis_url)
+        raise ValueError(f"Unknown cache backend: {settings.cache_backend}")
+
+    def shared_footprint_cache(self) -> FootprintCache:
+        """Footprint cache for writes made outside the API (scripts).
+
+        A script runs in its own process: with the memory backend, its
+        invalidations would only reach its own cache, and the API would
+        keep serving footprints (and 304 responses) from before its writes.
+
+        Returns:
+            Footprint cache whose invalidations reach every API worker
+
+        Raises:
+            ValueError: If the cache backend is not shared
+        """
+        if self.settings.cache_backend != "redis":
+            raise ValueError(
+                "CACHE_BACKEND must be 'redis' for scripts writing activities: "
+                "the memory cache is per process, so the API would not see "
+                "their cache invalidations"
+            )
+        return self.footprint_cache
+
+    @cached_property
+    def footprint_cache(self) -> FootprintCache:
+        """Footprint result cache on the configured backend."""
+        return VersionedFootprintCache(
+            backend=self.cache_backend,
+            ttl_seconds=self.settings.footprint_cache_ttl_seconds,
+        )
+
+    @cached_property
+    def ingestion_queue(self) -> ActivityIngestionQueue | None:
+        """Write-behind queue for new activities, if enabled in settings.
+
+        Raises:
+            ValueError: If the ingestion mode is unknown
+        """
+        settings = self.settings
+        if settings.activity_ingestion_mode == "sync":
+            return None
+        if settings.activity_ingestion_mode == "queue":
+            return BatchingActivityQueue(
+                flush=self._write_ingested,
+                max_batch_size=settings.ingestion_batch_size,
+                flush_interval_seconds=settings.ingestion_flush_interval_ms / 1000,
+                max_queue_size=settings.ingestion_queue_max_size,
+                max_retries=settings.ingestion_max_retries,
+                retry_backoff_seconds=settings.ingestion_retry_backoff_ms / 1000,
+                dead_letter=DeadLetterFile(settings.ingestion_dead_letter_path).write
+                if settings.ingestion_dead_letter_path
+                else None,
+            )
+        raise ValueError(
+            f"Unknown activity ingestion mode: {settings.activity_ingestion_mode}"
+        )
+
+    async def _write_ingested(self, activities: list[Activity]) -> None:
+        """Persist a queued batch through the currently bound client.
+
+        Only the insert is retried by the queue: once it committed, a
+        failure to update derived state is logged instead of raised, so
+        the batch is neither inserted again nor dead-lettered.
+        """
+        if self._graph is None:
+            raise RuntimeError("No client bound to write queued activities")
+        saved = await self._graph.activity_repository.save_many(activities)
+        try:
+            await self._graph.log_activity.record_saved(saved)
+        except Exception:
+            logger.exception(
+                "Derived state not updated for %d queued activities", len(saved)
+            )
+
+    @cached_property
+    def calculate_flight(self) -> CalculateFlightUseCase:
+        """Flight calculation use case (uses reference data only)."""
+        return CalculateFlightUseCase(
+            airport_repo=self.airport_repository,
+            distance_service=self.flight_distance_service,
+        )
+
+    async def start_job(self, job_id: str, job: Coroutine[Any, Any, Any]) -> None:
+        """Run a long job in the background of this process.
+
+        With database_url set, the job holds a lock for its whole run, so
+        no other replica or script runs the same job ID meanwhile.
+
+        Args:
+            job_id: Unique job identifier
+            job: Coroutine performing the job
+
+        Raises:
+            ValueError: If a job with this ID is still running
+        """
+        if self.job_running(job_id):
+            job.close()
+            raise ValueError(f"Job {job_id} is already running")
+        try:
+            await self.lock_job(job_id)
+        except ValueError:
+            job.close()
+            raise
+
+        task = asyncio.create_task(self._run_locked(job_id, job), name=job_id)
+        task.add_done_callback(self._job_done)
+        self._jobs[job_id] = task
+
+    async def lock_job(self, job_id: str) -> None:
+        """Lock a job ID across processes (no-op without database_url).
+
+        Args:
+            job_id: Job identifier; unlock_job() must follow
+
+        Raises:
+            ValueError: If another process holds the lock
+        """
+        coordinator = self.job_coordinator
+        if coordinator is not None and not await coordinator.try_lock(job_id):
+            raise ValueError(f"Job {job_id} is already running in another process")
+
+    async def unlock_job(self, job_id: str) -> None:
+        """Release a job ID locked by lock_job().
+
+        Args:
+            job_id: Job identifier
+        """
+        coordinator = self.job_coordinator
+        if coordinator is not None:
+            await coordinator.release(job_id)
+
+    async def _run_locked(self, job_id: str, job: Coroutine[Any, Any, Any]) -> Any:
+        """Run a job locked by lock_job(), unlocking it when done."""
+        try:
+            return await job
+        finally:
+            await self.unlock_job(job_id)
+
+    def job_running(self, job_id: str) -> bool:
+        """Check whether a background job is running in this process.
+
+        Args:
+            job_id: Job identifier
+
+        Returns:
+            True while the job's task has not finished
+        """
+        task = self._jobs.get(job_id)
+        return task is not None and not task.done()
+
+    def _job_done(self, task: asyncio.Task[Any]) -> None:
+        """Forget a finished job and log its failure, if any."""
+        self._jobs.pop(task.get_name(), None)
+        if not task.cancelled() and task.exception() is not None:
+            logger.error(
+                "Background job %s failed", task.get_name(), exc_info=task.exception()
+            )
+
+    async def aclose(self) -> None:
+        """Stop background jobs, flush queued writes and release connections.
+
+        Queued activities are written before connections are closed.
+        Cancelled jobs resume from their last checkpoint when restarted.
+        """
+        scheduler = self.__dict__.get("scheduler")
+        if scheduler is not None:
+            await scheduler.close()
+        jobs = list(self._jobs.values())
+        for task in jobs:
+            task.cancel()
+        await asyncio.gather(*jobs, return_exceptions=True)
+
+        queue = self.__dict__.get("ingestion_queue")
+        if queue is not None:
+            await queue.close()
+        if "cache_backend" in self.__dict__:
+            await self.cache_backend.close()
+        if "postgres_pool" in self.__dict__:
+            await self.postgres_pool.close()
+        replica_pool = self.__dict__.get("postgres_replica_pool")
+        if replica_pool is not None:
+            await replica_pool.close()
+
+
+async def get_container(request: Request) -> AppContainer:
+    """Get the container of the running application.
+
+    Args:
+        request: Current request
+
+    Returns:
+        Container created by create_app()
+    """
+    return request.app.state.container  # type: ignore[no-any-return]
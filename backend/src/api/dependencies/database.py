@@ -5,10 +5,12 @@ from supabase import Client
 from infrastructure.config.supabase import get_supabase_client
 
 
-def get_supabase() -> Client:
+async def get_supabase() -> Client:
     """Get Supabase client.
 
     Dependency for injecting Supabase client into route handlers.
+    Declared async so FastAPI resolves it on the event loop instead of
+    dispatching it to the threadpool.
 
     Returns:
         Client: Supabase client instance
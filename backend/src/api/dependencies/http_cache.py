@@ -0,0 +1,100 @@
+"""HTTP conditional request (ETag / If-None-Match) support."""
+
+import hashlib
+from typing import Any
+
+from fastapi import Request, Response, status
+
+# Reference data changes only on deploy or re-seed
+STATIC_CACHE_CONTROL = "public, max-age=3600"
+
+# Per-owner data must be revalidated on every use
+PRIVATE_CACHE_CONTROL = "private, no-cache"
+
+# Headers that select the owner of per-owner responses
+OWNER_VARY = "Authorization, X-Session-ID"
+
+# OpenAPI documentation for routes that may answer 304
+NOT_MODIFIED_RESPONSES: dict[int | str, dict[str, Any]] = {
+    status.HTTP_304_NOT_MODIFIED: {"description": "Not Modified"}
+}
+
+
+def make_etag(*parts: object) -> str:
+    """Build a weak ETag from the inputs that determine a response body.
+
+    Args:
+        *parts: Data version, request parameters, ...
+
+    Returns:
+        Quoted weak entity tag
+    """
+    digest = hashlib.sha256("\x1f".join(str(p) for p in parts).encode())
+    return f'W/"{digest.hexdigest()[:32]}"'
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """Check an If-None-Match header against an entity tag.
+
+    Uses weak comparison, as required for If-None-Match (RFC 9110).
+
+    Args:
+        if_none_match: Raw If-None-Match header value
+        etag: Current entity tag of the resource
+
+    Returns:
+        True if the client already holds the current representation
+    """
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+
+    opaque = etag.removeprefix("W/")
+    return any(
+        candidate.strip().removeprefix("W/") == opaque
+        for candidate in if_none_match.split(",")
+    )
+
+
+class ConditionalRequest:
+    """Dependency that answers conditional GETs.
+
+    Routes compute the ETag from data versions and parameters before
+    touching any repository, then call evaluate(). A matching
+    If-None-Match yields a bodiless 304; otherwise the validators are
+    attached to the regular response.
+    """
+
+    def __init__(self, request: Request, response: Response) -> None:
+        """Initialize from the current request.
+
+        Args:
+            request: Incoming request
+            response: Response whose headers are merged into the result
+        """
+        self._if_none_match = request.headers.get("if-none-match")
+        self._response = response
+
+    def evaluate(
+        self, etag: str, cache_control: str, vary: str | None = None
+    ) -> Response | None:
+        """Answer 304 if the client's copy is current, else tag the response.
+
+        Args:
+            etag: Current entity tag of the resource
+            cache_control: Cache-Control header value
+            vary: Optional Vary header value
+
+        Returns:
+            304 response to return immediately, or None to build the body
+        """
+        headers = {"ETag": etag, "Cache-Control": cache_control}
+        if vary:
+            headers["Vary"] = vary
+
+        if etag_matches(self._if_none_match, etag):
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+        self._response.headers.update(headers)
+        return None
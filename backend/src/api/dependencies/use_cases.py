@@ -1,23 +1,38 @@
-"""Use case dependency injection."""
+"""Use case dependency injection.
 
-from functools import lru_cache
-from pathlib import Path
+Dependencies resolve objects held by the application container, so a
+request only looks up prebuilt instances instead of constructing
+repositories and use cases.
+"""
 
 from fastapi import Depends
 from supabase import Client
 
+from api.dependencies.container import AppContainer, get_container
 from api.dependencies.database import get_supabase
-from domain.services.aggregation_service import AggregationService
-from domain.services.calculation_service import CalculationService
-from domain.services.comparison_service import ComparisonService
-from domain.services.flight_distance_service import FlightDistanceService
+from domain.ports.activity_ingestion_queue import ActivityIngestionQueue
+from domain.ports.activity_repository import ActivityRepository
+from domain.ports.emission_factor_repository import EmissionFactorRepository
+from domain.ports.footprint_cache import FootprintCache
+from domain.ports.job_scheduler import JobScheduler
+from domain.ports.recalculation_checkpoint_store import RecalculationCheckpointStore
+from domain.ports.session_cleaner import SessionCleaner
+from domain.services.percentile_index import PopulationPercentileIndex
+from domain.use_cases.bulk_delete_activities import BulkDeleteActivitiesUseCase
+from domain.use_cases.bulk_update_activities import BulkUpdateActivitiesUseCase
 from domain.use_cases.calculate_flight import CalculateFlightUseCase
 from domain.use_cases.compare_to_region import CompareToRegionUseCase
+from domain.use_cases.delete_activity import DeleteActivityUseCase
+from domain.use_cases.export_activities import ExportActivitiesUseCase
 from domain.use_cases.get_footprint_breakdown import GetFootprintBreakdownUseCase
 from domain.use_cases.get_footprint_summary import GetFootprintSummaryUseCase
 from domain.use_cases.get_footprint_trend import GetFootprintTrendUseCase
-from domain.use_cases.delete_activity import DeleteActivityUseCase
+from domain.use_cases.import_activities import ImportActivitiesUseCase
 from domain.use_cases.log_activity import LogActivityUseCase
+from domain.use_cases.log_flight import LogFlightUseCase
+from domain.use_cases.migrate_activities import MigrateActivitiesUseCase
+from domain.use_cases.rebuild_percentile_index import RebuildPercentileIndexUseCase
+from domain.use_cases.recalculate_emissions import RecalculateEmissionsUseCase
 from domain.use_cases.update_activity import UpdateActivityUseCase
 from infrastructure.repositories.json_airport_repository import (
     JSONAirportRepository,
@@ -25,178 +40,403 @@ from infrastructure.repositories.json_airport_repository import (
 from infrastructure.repositories.json_region_data_provider import (
     JSONRegionDataProvider,
 )
-from infrastructure.repositories.supabase_activity_repository import (
-    SupabaseActivityRepository,
-)
-from infrastructure.repositories.supabase_emission_factor_repository import (
-    SupabaseEmissionFactorRepository,
-)
 
 
-def get_log_activity_use_case(
+async def get_log_activity_use_case(
+    container: AppContainer = Depends(get_container),
     client: Client = Depends(get_supabase),
 ) -> LogActivityUseCase:
-    """Get LogActivityUseCase with injected dependencies.
+    """Get LogActivityUseCase for the request's client.
+
+    Args:
+        container: Application container
+        client: Supabase client from dependency
+
+    Returns:
+        Shared LogActivityUseCase instance
+    """
+    return container.bind(client).log_activity
+
+
+async def get_log_flight_use_case(
+    container: AppContainer = Depends(get_container),
+    client: Client = Depends(get_supabase),
+) -> LogFlightUseCase:
+    """Get LogFlightUseCase for the request's client.
+
+    Args:
+        container: Application container
+        client: Supabase client from dependency
+
+    Returns:
+        Shared LogFlightUseCase instance
+    """
+    return container.bind(client).log_flight
+
+
+async def get_import_activities_use_case(
+    container: AppContainer = Depends(get_container),
+    client: Client = Depends(get_supabase),
+) -> ImportActivitiesUseCase:
+    """Get ImportActivitiesUseCase for the request's client.
+
+    Args:
+        container: Application container
+        client: Supabase client from dependency
+
+    Returns:
+        Shared ImportActivitiesUseCase instance
+    """
+    return container.bind(client).import_activities
+
+
+async def get_export_activities_use_case(
+    container: AppContainer = Depends(get_container),
+    client: Client = Depends(get_supabase),
+) -> ExportActivitiesUseCase:
+    """Get ExportActivitiesUseCase for the request's client.
 
     Args:
+        container: Application container
         client: Supabase client from dependency
 
     Returns:
-        Configured LogActivityUseCase instance
+        Shared ExportActivitiesUseCase instance
     """
-    return LogActivityUseCase(
-        activity_repo=SupabaseActivityRepository(client),
-        emission_factor_repo=SupabaseEmissionFactorRepository(client),
-        calculation_service=CalculationService(),
-    )
+    return container.bind(client).export_activities
 
 
-def get_footprint_summary_use_case(
+async def get_footprint_summary_use_case(
+    container: AppContainer = Depends(get_container),
     client: Client = Depends(get_supabase),
 ) -> GetFootprintSummaryUseCase:
-    """Get GetFootprintSummaryUseCase with injected dependencies.
+    """Get GetFootprintSummaryUseCase for the request's client.
 
     Args:
+        container: Application container
         client: Supabase client from dependency
 
     Returns:
-        Configured GetFootprintSummaryUseCase instance
+        Shared GetFootprintSummaryUseCase instance
     """
-    return GetFootprintSummaryUseCase(
-        activity_repo=SupabaseActivityRepository(client),
-        aggregation_service=AggregationService(),
-    )
+    return container.bind(client).footprint_summary
 
 
-def get_footprint_breakdown_use_case(
+async def get_footprint_breakdown_use_case(
+    container: AppContainer = Depends(get_container),
     client: Client = Depends(get_supabase),
 ) -> GetFootprintBreakdownUseCase:
-    """Get GetFootprintBreakdownUseCase with injected dependencies.
+    """Get GetFootprintBreakdownUseCase for the request's client.
 
     Args:
+        container: Application container
         client: Supabase client from dependency
 
     Returns:
-        Configured GetFootprintBreakdownUseCase instance
+        Shared GetFootprintBreakdownUseCase instance
     """
-    return GetFootprintBreakdownUseCase(
-        activity_repo=SupabaseActivityRepository(client),
-        aggregation_service=AggregationService(),
-    )
+    return container.bind(client).footprint_breakdown
 
 
-def get_footprint_trend_use_case(
+async def get_footprint_trend_use_case(
+    container: AppContainer = Depends(get_container),
     client: Client = Depends(get_supabase),
 ) -> GetFootprintTrendUseCase:
-    """Get GetFootprintTrendUseCase with injected dependencies.
+    """Get GetFootprintTrendUseCase for the request's client.
 
     Args:
+        container: Application container
         client: Supabase client from dependency
 
     Returns:
-        Configured GetFootprintTrendUseCase instance
+        Shared GetFootprintTrendUseCase instance
     """
-    return GetFootprintTrendUseCase(
-        activity_repo=SupabaseActivityRepository(client),
-        aggregation_service=AggregationService(),
-    )
+    return container.bind(client).footprint_trend
 
 
-# Airport data file path
-AIRPORTS_DATA_FILE = (
-    Path(__file__).parent.parent.parent / "infrastructure" / "data" / "airports.json"
-)
+async def get_activity_repository(
+    container: AppContainer = Depends(get_container),
+    client: Client = Depends(get_supabase),
+) -> ActivityRepository:
+    """Get the activity repository for the request's client.
 
-# Regional data file path
-REGIONAL_DATA_FILE = (
-    Path(__file__).parent.parent.parent
-    / "infrastructure"
-    / "data"
-    / "regional_averages.json"
-)
+    Args:
+        container: Application container
+        client: Supabase client from dependency
 
+    Returns:
+        Shared ActivityRepository instance
+    """
+    return container.bind(client).activity_repository
+
+
+async def get_airport_repository(
+    container: AppContainer = Depends(get_container),
+) -> JSONAirportRepository:
+    """Get the process-wide airport repository.
+
+    Args:
+        container: Application container
+
+    Returns:
+        Shared JSONAirportRepository instance
+    """
+    return container.airport_repository
+
+
+async def get_region_data_provider(
+    container: AppContainer = Depends(get_container),
+) -> JSONRegionDataProvider:
+    """Get the process-wide regional data provider.
+
+    Args:
+        container: Application container
+
+    Returns:
+        Shared JSONRegionDataProvider instance
+    """
+    return container.region_data_provider
+
+
+async def get_emission_factor_repository(
+    container: AppContainer = Depends(get_container),
+    client: Client = Depends(get_supabase),
+) -> EmissionFactorRepository:
+    """Get the emission factor repository served from the shared snapshot.
+
+    Args:
+        container: Application container
+        client: Supabase client from dependency
+
+    Returns:
+        Shared EmissionFactorRepository instance
+    """
+    return container.bind(client).cached_emission_factor_repository
+
+
+async def get_footprint_cache(
+    container: AppContainer = Depends(get_container),
+) -> FootprintCache:
+    """Get the process-wide footprint result cache.
 
-@lru_cache(maxsize=1)
-def get_airport_repository() -> JSONAirportRepository:
-    """Get JSONAirportRepository with airport data (singleton).
+    Args:
+        container: Application container
 
     Returns:
-        Configured JSONAirportRepository instance
+        Shared FootprintCache instance
     """
-    return JSONAirportRepository(AIRPORTS_DATA_FILE)
+    return container.footprint_cache
+
 
+async def get_ingestion_queue(
+    container: AppContainer = Depends(get_container),
+) -> ActivityIngestionQueue | None:
+    """Get the write-behind ingestion queue.
 
-@lru_cache(maxsize=1)
-def get_region_data_provider() -> JSONRegionDataProvider:
-    """Get JSONRegionDataProvider with regional data (singleton).
+    Args:
+        container: Application container
 
     Returns:
-        Configured JSONRegionDataProvider instance
+        Shared queue, or None when activities are saved synchronously
     """
-    return JSONRegionDataProvider(REGIONAL_DATA_FILE)
+    return container.ingestion_queue
 
 
-@lru_cache(maxsize=1)
-def get_calculate_flight_use_case() -> CalculateFlightUseCase:
-    """Get CalculateFlightUseCase with injected dependencies (singleton).
+async def get_session_cleaner(
+    container: AppContainer = Depends(get_container),
+) -> SessionCleaner | None:
+    """Get the stale anonymous session cleaner.
+
+    Args:
+        container: Application container
 
     Returns:
-        Configured CalculateFlightUseCase instance
+        Shared cleaner, or None without a direct database connection
     """
-    return CalculateFlightUseCase(
-        airport_repo=get_airport_repository(),
-        distance_service=FlightDistanceService(),
-    )
+    return container.session_cleaner
 
 
-def get_compare_to_region_use_case(
+async def get_job_scheduler(
+    container: AppContainer = Depends(get_container),
+) -> JobScheduler | None:
+    """Get the maintenance job scheduler.
+
+    Args:
+        container: Application container
+
+    Returns:
+        Shared scheduler, or None when scheduling is disabled
+    """
+    return container.scheduler
+
+
+async def get_percentile_index(
+    container: AppContainer = Depends(get_container),
+) -> PopulationPercentileIndex:
+    """Get the process-wide population percentile index.
+
+    Args:
+        container: Application container
+
+    Returns:
+        Shared PopulationPercentileIndex instance
+    """
+    return container.percentile_index
+
+
+async def get_rebuild_percentile_index_use_case(
+    container: AppContainer = Depends(get_container),
+    client: Client = Depends(get_supabase),
+) -> RebuildPercentileIndexUseCase:
+    """Get RebuildPercentileIndexUseCase for the request's client.
+
+    Args:
+        container: Application container
+        client: Supabase client from dependency
+
+    Returns:
+        Shared RebuildPercentileIndexUseCase instance
+    """
+    return container.bind(client).rebuild_percentile_index
+
+
+async def get_calculate_flight_use_case(
+    container: AppContainer = Depends(get_container),
+) -> CalculateFlightUseCase:
+    """Get the process-wide CalculateFlightUseCase.
+
+    Args:
+        container: Application container
+
+    Returns:
+        Shared CalculateFlightUseCase instance
+    """
+    return container.calculate_flight
+
+
+async def get_compare_to_region_use_case(
+    container: AppContainer = Depends(get_container),
     client: Client = Depends(get_supabase),
 ) -> CompareToRegionUseCase:
-    """Get CompareToRegionUseCase with injected dependencies.
+    """Get CompareToRegionUseCase for the request's client.
 
     Args:
+        container: Application container
         client: Supabase client from dependency
 
     Returns:
-        Configured CompareToRegionUseCase instance
+        Shared CompareToRegionUseCase instance
     """
-    return CompareToRegionUseCase(
-        activity_repo=SupabaseActivityRepository(client),
-        region_provider=get_region_data_provider(),
-        aggregation_service=AggregationService(),
-        comparison_service=ComparisonService(),
-    )
+    return container.bind(client).compare_to_region
 
 
-def get_update_activity_use_case(
+async def get_update_activity_use_case(
+    container: AppContainer = Depends(get_container),
     client: Client = Depends(get_supabase),
 ) -> UpdateActivityUseCase:
-    """Get UpdateActivityUseCase with injected dependencies.
+    """Get UpdateActivityUseCase for the request's client.
 
     Args:
+        container: Application container
         client: Supabase client from dependency
 
     Returns:
-        Configured UpdateActivityUseCase instance
+        Shared UpdateActivityUseCase instance
     """
-    return UpdateActivityUseCase(
-        activity_repo=SupabaseActivityRepository(client),
-        emission_factor_repo=SupabaseEmissionFactorRepository(client),
-        calculation_service=CalculationService(),
-    )
+    return container.bind(client).update_activity
 
 
-def get_delete_activity_use_case(
+async def get_delete_activity_use_case(
+    container: AppContainer = Depends(get_container),
     client: Client = Depends(get_supabase),
 ) -> DeleteActivityUseCase:
-    """Get DeleteActivityUseCase with injected dependencies.
+    """Get DeleteActivityUseCase for the request's client.
+
+    Args:
+        container: Application container
+        client: Supabase client from dependency
+
+    Returns:
+        Shared DeleteActivityUseCase instance
+    """
+    return container.bind(client).delete_activity
+
+
+async def get_bulk_update_activities_use_case(
+    container: AppContainer = Depends(get_container),
+    client: Client = Depends(get_supabase),
+) -> BulkUpdateActivitiesUseCase:
+    """Get BulkUpdateActivitiesUseCase for the request's client.
+
+    Args:
+        container: Application container
+        client: Supabase client from dependency
+
+    Returns:
+        Shared BulkUpdateActivitiesUseCase instance
+    """
+    return container.bind(client).bulk_update_activities
+
+
+async def get_bulk_delete_activities_use_case(
+    container: AppContainer = Depends(get_container),
+    client: Client = Depends(get_supabase),
+) -> BulkDeleteActivitiesUseCase:
+    """Get BulkDeleteActivitiesUseCase for the request's client.
+
+    Args:
+        container: Application container
+        client: Supabase client from dependency
+
+    Returns:
+        Shared BulkDeleteActivitiesUseCase instance
+    """
+    return container.bind(client).bulk_delete_activities
+
+
+async def get_migrate_activities_use_case(
+    container: AppContainer = Depends(get_container),
+    client: Client = Depends(get_supabase),
+) -> MigrateActivitiesUseCase:
+    """Get MigrateActivitiesUseCase for the request's client.
+
+    Args:
+        container: Application container
+        client: Supabase client from dependency
+
+    Returns:
+        Shared MigrateActivitiesUseCase instance
+    """
+    return container.bind(client).migrate_activities
+
+
+async def get_recalculate_emissions_use_case(
+    container: AppContainer = Depends(get_container),
+    client: Client = Depends(get_supabase),
+) -> RecalculateEmissionsUseCase:
+    """Get RecalculateEmissionsUseCase for the request's client.
+
+    Args:
+        container: Application container
+        client: Supabase client from dependency
+
+    Returns:
+        Shared RecalculateEmissionsUseCase instance
+    """
+    return container.bind(client).recalculate_emissions
+
+
+async def get_recalculation_checkpoint_store(
+    container: AppContainer = Depends(get_container),
+    client: Client = Depends(get_supabase),
+) -> RecalculationCheckpointStore:
+    """Get the recalculation checkpoint store for the request's client.
 
     Args:
+        container: Application container
         client: Supabase client from dependency
 
     Returns:
-        Configured DeleteActivityUseCase instance
+        Shared RecalculationCheckpointStore instance
     """
-    return DeleteActivityUseCase(
-        activity_repo=SupabaseActivityRepository(client),
-    )
+    return container.bind(client).recalculation_checkpoint_store
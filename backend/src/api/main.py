@@ -1,12 +1,17 @@
 """FastAPI application entry point."""
 
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import RedirectResponse
 
+from api.dependencies.container import AppContainer
 from api.middleware.error_handler import add_exception_handlers
 from api.routes import (
     activities,
+    admin,
     airports,
     comparison,
     emission_factors,
@@ -16,10 +21,29 @@ from api.routes import (
     users,
 )
 from infrastructure.config.settings import get_settings
+from infrastructure.config.supabase import (
+    close_supabase_http_client,
+    warm_up_supabase_http_client,
+)
 
 settings = get_settings()
 
 
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """Warm up connections and start scheduled jobs; release them on shutdown."""
+    # Fail at startup, not on the first request, if the cache is misconfigured
+    _ = app.state.container.cache_backend
+    if settings.supabase_warmup_connections > 0:
+        await warm_up_supabase_http_client()
+    scheduler = app.state.container.scheduler
+    if scheduler is not None:
+        scheduler.start()
+    yield
+    await app.state.container.aclose()
+    close_supabase_http_client()
+
+
 def create_app() -> FastAPI:
     """Create and configure FastAPI application.
 
@@ -33,8 +57,12 @@ def create_app() -> FastAPI:
         docs_url="/docs",
         openapi_url="/openapi.json",
         redirect_slashes=False,
+        lifespan=lifespan,
     )
 
+    # Services, repositories and use cases shared by all requests
+    app.state.container = AppContainer(settings)
+
     # CORS middleware
     app.add_middleware(
         CORSMiddleware,
@@ -79,6 +107,7 @@ def create_app() -> FastAPI:
         prefix="/api/v1/comparison",
         tags=["comparison"],
     )
+    app.include_router(admin.router, prefix="/api/v1/admin", tags=["admin"])
 
     return app
 
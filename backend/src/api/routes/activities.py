@@ -1,32 +1,159 @@
 """Activity API routes."""
 
+import csv
+import io
+import json
+from collections.abc import AsyncIterator, Iterator
+from typing import Literal
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
-from supabase import Client
+from fastapi import APIRouter, Depends, File, HTTPException, Query, UploadFile, status
+from fastapi.responses import StreamingResponse
 
 from api.dependencies.auth import get_optional_user, get_session_id
-from api.dependencies.database import get_supabase
 from api.dependencies.use_cases import (
+    get_activity_repository,
+    get_bulk_delete_activities_use_case,
+    get_bulk_update_activities_use_case,
     get_delete_activity_use_case,
+    get_export_activities_use_case,
+    get_import_activities_use_case,
     get_log_activity_use_case,
+    get_log_flight_use_case,
     get_update_activity_use_case,
 )
-from api.schemas.activity import ActivityInput, ActivityResponse, ActivityUpdateInput
+from api.schemas.activity import (
+    ActivityImportResponse,
+    ActivityInput,
+    ActivityResponse,
+    ActivityUpdateInput,
+    BulkDeleteInput,
+    BulkResultItem,
+    BulkResultResponse,
+    BulkUpdateInput,
+    ImportRejectedRow,
+)
+from domain.entities.activity import Activity
+from domain.ports.activity_ingestion_queue import IngestionQueueFullError
+from domain.ports.activity_repository import (
+    WRITE_OK,
+    ActivityRepository,
+    ActivitySelection,
+    OwnedWriteResult,
+)
+from domain.use_cases.bulk_delete_activities import BulkDeleteActivitiesUseCase
+from domain.use_cases.bulk_update_activities import BulkUpdateActivitiesUseCase
 from domain.use_cases.delete_activity import DeleteActivityUseCase
+from domain.use_cases.export_activities import ExportActivitiesUseCase
+from domain.use_cases.import_activities import (
+    REQUIRED_FIELDS,
+    ImportActivitiesUseCase,
+    ImportRow,
+)
 from domain.use_cases.log_activity import LogActivityUseCase
+from domain.use_cases.log_flight import LogFlightUseCase
 from domain.use_cases.update_activity import UpdateActivityUseCase
-from infrastructure.repositories.supabase_activity_repository import (
-    SupabaseActivityRepository,
-)
 
 router = APIRouter()
 
+# Column order of CSV exports
+EXPORT_COLUMNS = [
+    "id",
+    "date",
+    "category",
+    "type",
+    "value",
+    "co2e_kg",
+    "notes",
+    "metadata",
+    "created_at",
+    "updated_at",
+]
+
+EXPORT_MEDIA_TYPES = {"ndjson": "application/x-ndjson", "csv": "text/csv"}
+
+
+def _selection(input: BulkDeleteInput) -> ActivitySelection:
+    """Convert bulk request input to a domain selection."""
+    criteria = input.filter
+    return ActivitySelection(
+        ids=tuple(dict.fromkeys(input.ids)) if input.ids is not None else None,
+        start_date=criteria.start_date if criteria else None,
+        end_date=criteria.end_date if criteria else None,
+        activity_type=criteria.type if criteria else None,
+    )
+
+
+async def _ndjson_export(chunks: AsyncIterator[list[Activity]]) -> AsyncIterator[str]:
+    """Encode each chunk as newline-delimited JSON as soon as it is read."""
+    async for chunk in chunks:
+        yield "".join(
+            ActivityResponse.model_validate(activity).model_dump_json() + "\n"
+            for activity in chunk
+        )
+
+
+async def _csv_export(chunks: AsyncIterator[list[Activity]]) -> AsyncIterator[str]:
+    """Encode the header, then each chunk as CSV rows as soon as it is read."""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(EXPORT_COLUMNS)
+    yield buffer.getvalue()
+
+    async for chunk in chunks:
+        buffer.seek(0)
+        buffer.truncate()
+        for activity in chunk:
+            writer.writerow(
+                [
+                    activity.id,
+                    activity.date.isoformat(),
+                    activity.category,
+                    activity.type,
+                    activity.value,
+                    activity.co2e_kg,
+                    activity.notes or "",
+                    json.dumps(activity.metadata) if activity.metadata else "",
+                    activity.created_at.isoformat(),
+                    activity.updated_at.isoformat() if activity.updated_at else "",
+                ]
+            )
+        yield buffer.getvalue()
+
+
+def _csv_rows(reader: csv.DictReader) -> Iterator[ImportRow]:
+    """Read CSV records lazily, ending with an error row if the file breaks."""
+    try:
+        for record in reader:
+            yield ImportRow(line=reader.line_num, fields=record)
+    except (csv.Error, UnicodeDecodeError) as e:
+        yield ImportRow(
+            line=reader.line_num + 1,
+            fields={},
+            error=f"Unreadable file from this line on: {e}",
+        )
+
+
+def _bulk_response(results: dict[UUID, OwnedWriteResult]) -> BulkResultResponse:
+    """Build the per-activity response of a bulk operation."""
+    return BulkResultResponse(
+        succeeded=sum(1 for r in results.values() if r.status == WRITE_OK),
+        results=[
+            BulkResultItem(
+                id=activity_id,
+                status=result.status,
+                co2e_kg=result.activity.co2e_kg if result.activity else None,
+            )
+            for activity_id, result in results.items()
+        ],
+    )
+
 
 @router.post("", response_model=ActivityResponse, status_code=status.HTTP_201_CREATED)
 async def create_activity(
     input: ActivityInput,
     use_case: LogActivityUseCase = Depends(get_log_activity_use_case),
+    log_flight: LogFlightUseCase = Depends(get_log_flight_use_case),
     user_id: UUID | None = Depends(get_optional_user),
     session_id: str | None = Depends(get_session_id),
 ) -> ActivityResponse:
@@ -34,6 +161,8 @@ async def create_activity(
 
     Calculates CO2e based on activity type and emission factors.
     Activity is linked to either authenticated user or anonymous session.
+    Flights with origin_iata and destination_iata in metadata get their
+    distance and flight type computed from the airports.
     """
     if user_id is None and session_id is None:
         raise HTTPException(
@@ -42,16 +171,29 @@ async def create_activity(
         )
 
     try:
-        activity = await use_case.execute(
-            category=input.category,
-            activity_type=input.type,
-            value=input.value,
-            activity_date=input.date,
-            notes=input.notes,
-            user_id=user_id,
-            session_id=session_id,
-            metadata=input.metadata,
-        )
+        route = input.flight_route
+        if route is not None:
+            activity = await log_flight.execute(
+                origin_iata=route[0],
+                destination_iata=route[1],
+                activity_date=input.date,
+                notes=input.notes,
+                user_id=user_id,
+                session_id=session_id,
+                metadata=input.metadata,
+            )
+        else:
+            # ActivityInput requires a value whenever there is no route
+            activity = await use_case.execute(
+                category=input.category,
+                activity_type=input.type,
+                value=input.value,
+                activity_date=input.date,
+                notes=input.notes,
+                user_id=user_id,
+                session_id=session_id,
+                metadata=input.metadata,
+            )
         return ActivityResponse(
             id=activity.id,
             category=activity.category,
@@ -69,11 +211,17 @@ async def create_activity(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=str(e),
         )
+    except IngestionQueueFullError as e:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=str(e),
+            headers={"Retry-After": "1"},
+        )
 
 
 @router.get("", response_model=list[ActivityResponse])
 async def list_activities(
-    client: Client = Depends(get_supabase),
+    repo: ActivityRepository = Depends(get_activity_repository),
     user_id: UUID | None = Depends(get_optional_user),
     session_id: str | None = Depends(get_session_id),
     limit: int = Query(50, ge=1, le=100),
@@ -89,8 +237,6 @@ async def list_activities(
             detail="Either Authorization header or X-Session-ID header is required",
         )
 
-    repo = SupabaseActivityRepository(client)
-
     if user_id:
         activities = await repo.list_by_user(user_id, limit=limit, offset=offset)
     else:
@@ -113,6 +259,166 @@ async def list_activities(
     ]
 
 
+@router.get(
+    "/export",
+    response_class=StreamingResponse,
+    responses={
+        status.HTTP_200_OK: {
+            "content": {media_type: {} for media_type in EXPORT_MEDIA_TYPES.values()},
+            "description": "All activities of the caller, in ID order",
+        }
+    },
+)
+async def export_activities(
+    export_format: Literal["ndjson", "csv"] = Query("ndjson", alias="format"),
+    use_case: ExportActivitiesUseCase = Depends(get_export_activities_use_case),
+    user_id: UUID | None = Depends(get_optional_user),
+    session_id: str | None = Depends(get_session_id),
+) -> StreamingResponse:
+    """Export the full activity history of the current user or session.
+
+    Streams NDJSON (one activity object per line, same fields as the list
+    endpoint) or CSV. Rows are read in chunks and sent as they arrive.
+    """
+    if user_id is None and session_id is None:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Either Authorization header or X-Session-ID header is required",
+        )
+
+    chunks = use_case.execute(user_id, session_id)
+    body = _csv_export(chunks) if export_format == "csv" else _ndjson_export(chunks)
+    return StreamingResponse(
+        body,
+        media_type=EXPORT_MEDIA_TYPES[export_format],
+        headers={
+            "Content-Disposition": f'attachment; filename="activities.{export_format}"',
+            "Cache-Control": "private, no-store",
+        },
+    )
+
+
+@router.post("/import", response_model=ActivityImportResponse)
+async def import_activities(
+    file: UploadFile = File(..., description="UTF-8 CSV with a header row"),
+    use_case: ImportActivitiesUseCase = Depends(get_import_activities_use_case),
+    user_id: UUID | None = Depends(get_optional_user),
+    session_id: str | None = Depends(get_session_id),
+) -> ActivityImportResponse:
+    """Import activities from a CSV file.
+
+    Columns: date (YYYY-MM-DD), type, value, and optionally category and
+    notes. Column names are case-insensitive; other columns are ignored.
+    The file is read row by row; valid rows are saved in batches and
+    invalid rows are reported by line number without stopping the import.
+    """
+    if user_id is None and session_id is None:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Either Authorization header or X-Session-ID header is required",
+        )
+
+    text = io.TextIOWrapper(file.file, encoding="utf-8-sig", newline="")
+    reader = csv.DictReader(text)
+    try:
+        header = {name.strip().lower() for name in reader.fieldnames or []}
+    except (csv.Error, UnicodeDecodeError) as e:
+        text.detach()
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"CSV file could not be read: {e}",
+        ) from None
+    missing = [name for name in REQUIRED_FIELDS if name not in header]
+    if missing:
+        text.detach()
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"CSV header must include: {', '.join(missing)}",
+        )
+
+    try:
+        report = await use_case.execute(_csv_rows(reader), user_id, session_id)
+    finally:
+        text.detach()
+
+    return ActivityImportResponse(
+        imported=report.imported,
+        rejected=report.rejected,
+        rejected_rows=[
+            ImportRejectedRow(line=row.line, reason=row.reason)
+            for row in report.rejected_rows
+        ],
+    )
+
+
+@router.post("/bulk-update", response_model=BulkResultResponse)
+async def bulk_update_activities(
+    input: BulkUpdateInput,
+    use_case: BulkUpdateActivitiesUseCase = Depends(
+        get_bulk_update_activities_use_case
+    ),
+    user_id: UUID | None = Depends(get_optional_user),
+    session_id: str | None = Depends(get_session_id),
+) -> BulkResultResponse:
+    """Change the type of many activities at once.
+
+    CO2e is recalculated from each activity's value. Ownership is checked
+    inside the update; activities in another category are left unchanged.
+    """
+    if user_id is None and session_id is None:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Either Authorization header or X-Session-ID header is required",
+        )
+
+    try:
+        results = await use_case.execute(
+            user_id=user_id,
+            session_id=session_id,
+            selection=_selection(input),
+            activity_type=input.type,
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        )
+    return _bulk_response(results)
+
+
+@router.post("/bulk-delete", response_model=BulkResultResponse)
+async def bulk_delete_activities(
+    input: BulkDeleteInput,
+    use_case: BulkDeleteActivitiesUseCase = Depends(
+        get_bulk_delete_activities_use_case
+    ),
+    user_id: UUID | None = Depends(get_optional_user),
+    session_id: str | None = Depends(get_session_id),
+) -> BulkResultResponse:
+    """Delete many activities at once.
+
+    Only activities owned by the caller are deleted.
+    """
+    if user_id is None and session_id is None:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Either Authorization header or X-Session-ID header is required",
+        )
+
+    try:
+        results = await use_case.execute(
+            user_id=user_id,
+            session_id=session_id,
+            selection=_selection(input),
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        )
+    return _bulk_response(results)
+
+
 @router.put("/{activity_id}", response_model=ActivityResponse)
 async def update_activity(
     activity_id: UUID,
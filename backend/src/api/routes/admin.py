@@ -0,0 +1,100 @@
+"""Administration API routes."""
+
+from datetime import UTC, datetime
+
+from fastapi import APIRouter, Depends, HTTPException, status
+
+from api.dependencies.auth import require_admin
+from api.dependencies.container import AppContainer, get_container
+from api.dependencies.use_cases import (
+    get_recalculate_emissions_use_case,
+    get_recalculation_checkpoint_store,
+)
+from api.schemas.admin import RecalculationInput, RecalculationStatusResponse
+from domain.ports.recalculation_checkpoint_store import (
+    RecalculationCheckpoint,
+    RecalculationCheckpointStore,
+)
+from domain.use_cases.recalculate_emissions import RecalculateEmissionsUseCase
+
+router = APIRouter(dependencies=[Depends(require_admin)])
+
+
+def _status(
+    checkpoint: RecalculationCheckpoint, running: bool
+) -> RecalculationStatusResponse:
+    """Build the status response of a job."""
+    return RecalculationStatusResponse(
+        job_id=checkpoint.job_id,
+        activity_types=list(checkpoint.activity_types)
+        if checkpoint.activity_types is not None
+        else None,
+        scanned=checkpoint.scanned,
+        updated=checkpoint.updated,
+        skipped=checkpoint.skipped,
+        completed=checkpoint.completed,
+        running=running,
+    )
+
+
+@router.post(
+    "/recalculations",
+    response_model=RecalculationStatusResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+)
+async def start_recalculation(
+    input: RecalculationInput,
+    use_case: RecalculateEmissionsUseCase = Depends(get_recalculate_emissions_use_case),
+    store: RecalculationCheckpointStore = Depends(get_recalculation_checkpoint_store),
+    container: AppContainer = Depends(get_container),
+) -> RecalculationStatusResponse:
+    """Start or resume a CO2e recalculation job in the background.
+
+    Recomputes stored CO2e of activities with the current emission factors.
+    Passing the ID of an interrupted job resumes it from its checkpoint.
+    """
+    job_id = input.job_id or ("recalc-" + datetime.now(UTC).strftime("%Y%m%dT%H%M%S"))
+    activity_types = (
+        tuple(sorted(set(input.activity_types))) if input.activity_types else None
+    )
+
+    checkpoint = await store.load(job_id)
+    if checkpoint is not None and checkpoint.activity_types != activity_types:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=f"Job {job_id} was started for other activity types",
+        )
+    if checkpoint is not None and checkpoint.completed:
+        return _status(checkpoint, running=False)
+
+    try:
+        await container.start_job(job_id, use_case.execute(job_id, activity_types))
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=str(e),
+        )
+
+    return _status(
+        checkpoint
+        or RecalculationCheckpoint(job_id=job_id, activity_types=activity_types),
+        running=True,
+    )
+
+
+@router.get("/recalculations/{job_id}", response_model=RecalculationStatusResponse)
+async def get_recalculation(
+    job_id: str,
+    store: RecalculationCheckpointStore = Depends(get_recalculation_checkpoint_store),
+    container: AppContainer = Depends(get_container),
+) -> RecalculationStatusResponse:
+    """Get the progress of a CO2e recalculation job."""
+    checkpoint = await store.load(job_id)
+    if checkpoint is None:
+        if not container.job_running(job_id):
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Recalculation job not found: {job_id}",
+            )
+        checkpoint = RecalculationCheckpoint(job_id=job_id)
+    return _status(checkpoint, running=container.job_running(job_id))
@@ -1,7 +1,13 @@
 """Airport search endpoints."""
 
-from fastapi import APIRouter, Depends, Query
-
+from fastapi import APIRouter, Depends, Query, Response
+
+from api.dependencies.http_cache import (
+    NOT_MODIFIED_RESPONSES,
+    STATIC_CACHE_CONTROL,
+    ConditionalRequest,
+    make_etag,
+)
 from api.dependencies.use_cases import get_airport_repository
 from api.schemas.airport import AirportResponse, AirportSearchResponse
 from domain.ports.airport_repository import AirportRepository
@@ -9,14 +15,17 @@ from domain.ports.airport_repository import AirportRepository
 router = APIRouter(prefix="/airports", tags=["airports"])
 
 
-@router.get("/search", response_model=AirportSearchResponse)
+@router.get(
+    "/search", response_model=AirportSearchResponse, responses=NOT_MODIFIED_RESPONSES
+)
 async def search_airports(
     q: str = Query(
         ..., min_length=2, description="Search query (IATA code or city name)"
     ),
     limit: int = Query(10, ge=1, le=50, description="Maximum number of results"),
     airport_repo: AirportRepository = Depends(get_airport_repository),
-) -> AirportSearchResponse:
+    conditional: ConditionalRequest = Depends(),
+) -> AirportSearchResponse | Response:
     """
     Search airports by IATA code or city name.
 
@@ -24,7 +33,15 @@ async def search_airports(
     - **limit**: Maximum number of results (1-50)
 
     Returns list of matching airports with their details.
+    Supports If-None-Match revalidation against the airport data hash.
     """
+    version = await airport_repo.data_version()
+    if version is not None:
+        etag = make_etag(version, q.upper(), limit)
+        not_modified = conditional.evaluate(etag, STATIC_CACHE_CONTROL)
+        if not_modified is not None:
+            return not_modified
+
     airports = await airport_repo.search(q, limit)
 
     return AirportSearchResponse(
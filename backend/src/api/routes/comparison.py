@@ -1,10 +1,27 @@
 """API routes for regional comparison."""
 
-from fastapi import APIRouter, Depends, HTTPException, Query
+from uuid import UUID
+
+from fastapi import (
+    APIRouter,
+    BackgroundTasks,
+    Depends,
+    HTTPException,
+    Query,
+    Response,
+)
 
 from api.dependencies.auth import get_optional_user, get_session_id
+from api.dependencies.http_cache import (
+    NOT_MODIFIED_RESPONSES,
+    STATIC_CACHE_CONTROL,
+    ConditionalRequest,
+    make_etag,
+)
 from api.dependencies.use_cases import (
     get_compare_to_region_use_case,
+    get_percentile_index,
+    get_rebuild_percentile_index_use_case,
     get_region_data_provider,
 )
 from api.schemas.comparison import (
@@ -12,28 +29,39 @@ from api.schemas.comparison import (
     RegionInfo,
     RegionListResponse,
 )
-from domain.entities.user import User
 from domain.ports.region_data_provider import RegionDataProvider
+from domain.services.percentile_index import PopulationPercentileIndex
 from domain.use_cases.compare_to_region import (
     CompareToRegionInput,
     CompareToRegionUseCase,
 )
+from domain.use_cases.rebuild_percentile_index import RebuildPercentileIndexUseCase
 
 router = APIRouter()
 
 
-@router.get("/regions", response_model=RegionListResponse)
+@router.get(
+    "/regions", response_model=RegionListResponse, responses=NOT_MODIFIED_RESPONSES
+)
 async def list_regions(
     region_provider: RegionDataProvider = Depends(get_region_data_provider),
-) -> RegionListResponse:
+    conditional: ConditionalRequest = Depends(),
+) -> RegionListResponse | Response:
     """List all available regions for comparison.
 
     Returns a list of regions with their codes, names, and average
     annual carbon footprints. No authentication required.
+    Supports If-None-Match revalidation against the regional data hash.
 
     Returns:
-        List of available regions
+        List of available regions, or 304 if unchanged
     """
+    version = await region_provider.data_version()
+    if version is not None:
+        not_modified = conditional.evaluate(make_etag(version), STATIC_CACHE_CONTROL)
+        if not_modified is not None:
+            return not_modified
+
     regions = await region_provider.list_all()
 
     return RegionListResponse(
@@ -50,6 +78,7 @@ async def list_regions(
 
 @router.get("/compare", response_model=ComparisonResponse)
 async def compare_to_region(
+    background_tasks: BackgroundTasks,
     region_code: str = Query(
         ...,
         description="Region code to compare against (e.g., 'na', 'eu', 'world')",
@@ -61,9 +90,13 @@ async def compare_to_region(
         description="Time period for comparison",
         pattern="^(month|year)$",
     ),
-    user: User | None = Depends(get_optional_user),
-    session_id: str = Depends(get_session_id),
+    user_id: UUID | None = Depends(get_optional_user),
+    session_id: str | None = Depends(get_session_id),
     use_case: CompareToRegionUseCase = Depends(get_compare_to_region_use_case),
+    percentile_index: PopulationPercentileIndex = Depends(get_percentile_index),
+    rebuild_use_case: RebuildPercentileIndexUseCase = Depends(
+        get_rebuild_percentile_index_use_case
+    ),
 ) -> ComparisonResponse:
     """Compare user's footprint to regional average.
 
@@ -73,12 +106,18 @@ async def compare_to_region(
 
     Requires either authentication (Bearer token) or session ID.
 
+    Percentiles come from the population percentile index; when the index
+    is due for a reload, it is rebuilt in the background after responding.
+
     Args:
+        background_tasks: Tasks run after the response is sent
         region_code: Region code to compare against
         period: Time period ("month" or "year")
-        user: Authenticated user (optional)
+        user_id: Authenticated user ID (optional)
         session_id: Session identifier
         use_case: Injected use case
+        percentile_index: Shared population percentile index
+        rebuild_use_case: Use case that reloads the percentile index
 
     Returns:
         Detailed comparison with metrics and insights
@@ -88,14 +127,17 @@ async def compare_to_region(
     """
     try:
         input_data = CompareToRegionInput(
-            user_id=user.id if user else None,
-            session_id=session_id if not user else None,
+            user_id=user_id,
+            session_id=session_id if not user_id else None,
             region_code=region_code,
             period=period,
         )
 
         result = await use_case.execute(input_data)
 
+        if percentile_index.claim_rebuild():
+            background_tasks.add_task(rebuild_use_case.execute)
+
         return ComparisonResponse(
             user_footprint=result.user_footprint,
             regional_average=result.regional_average,
@@ -1,27 +1,41 @@
 """Emission factors API routes."""
 
-from fastapi import APIRouter, Depends, Query
-from supabase import Client
+from fastapi import APIRouter, Depends, Query, Response
 
-from api.dependencies.database import get_supabase
-from api.schemas.activity import EmissionFactorResponse
-from infrastructure.repositories.supabase_emission_factor_repository import (
-    SupabaseEmissionFactorRepository,
+from api.dependencies.http_cache import (
+    NOT_MODIFIED_RESPONSES,
+    STATIC_CACHE_CONTROL,
+    ConditionalRequest,
+    make_etag,
 )
+from api.dependencies.use_cases import get_emission_factor_repository
+from api.schemas.activity import EmissionFactorResponse
+from domain.ports.emission_factor_repository import EmissionFactorRepository
 
 router = APIRouter()
 
 
-@router.get("", response_model=list[EmissionFactorResponse])
+@router.get(
+    "",
+    response_model=list[EmissionFactorResponse],
+    responses=NOT_MODIFIED_RESPONSES,
+)
 async def list_emission_factors(
     category: str | None = Query(None, description="Filter by category"),
-    client: Client = Depends(get_supabase),
-) -> list[EmissionFactorResponse]:
+    repo: EmissionFactorRepository = Depends(get_emission_factor_repository),
+    conditional: ConditionalRequest = Depends(),
+) -> list[EmissionFactorResponse] | Response:
     """List emission factors, optionally filtered by category.
 
     Returns emission factors with their conversion rates.
+    Supports If-None-Match revalidation against the factor data hash.
     """
-    repo = SupabaseEmissionFactorRepository(client)
+    version = await repo.data_version()
+    if version is not None:
+        etag = make_etag(version, category or "")
+        not_modified: Response | None = conditional.evaluate(etag, STATIC_CACHE_CONTROL)
+        if not_modified is not None:
+            return not_modified
 
     if category:
         factors = await repo.list_by_category(category)
@@ -36,6 +50,7 @@ async def list_emission_factors(
             factor=factor.factor,
             unit=factor.unit,
             source=factor.source,
+            source_year=factor.source_year,
         )
         for factor in factors
     ]
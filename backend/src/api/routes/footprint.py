@@ -4,11 +4,19 @@ from datetime import date
 from typing import Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
 
 from api.dependencies.auth import get_optional_user, get_session_id
+from api.dependencies.http_cache import (
+    NOT_MODIFIED_RESPONSES,
+    OWNER_VARY,
+    PRIVATE_CACHE_CONTROL,
+    ConditionalRequest,
+    make_etag,
+)
 from api.dependencies.use_cases import (
     get_footprint_breakdown_use_case,
+    get_footprint_cache,
     get_footprint_summary_use_case,
     get_footprint_trend_use_case,
 )
@@ -19,6 +27,8 @@ from api.schemas.footprint import (
     FootprintTrendResponse,
     TrendDataPoint,
 )
+from domain.ports.footprint_cache import FootprintCache
+from domain.services.owner_key import owner_key
 from domain.use_cases.get_footprint_breakdown import (
     GetFootprintBreakdownInput,
     GetFootprintBreakdownUseCase,
@@ -38,7 +48,39 @@ _PERIOD_PATTERN = "^(day|week|month|year|all)$"
 _AUTH_REQUIRED_MSG = "Either Authorization header or X-Session-ID header is required"
 
 
-@router.get("/summary", response_model=FootprintSummaryResponse)
+async def _footprint_etag(
+    footprint_cache: FootprintCache,
+    user_id: UUID | None,
+    session_id: str | None,
+    *params: object,
+) -> str:
+    """Build an ETag from the owner's data version and request parameters.
+
+    The version changes on every write to the owner's activities and is
+    kept in the cache backend, which every worker shares (several workers
+    require the Redis backend). Today's date is included because relative
+    periods move with the calendar.
+
+    Args:
+        footprint_cache: Cache holding owner data versions
+        user_id: Authenticated user ID
+        session_id: Anonymous session ID
+        *params: Endpoint name and query parameters
+
+    Returns:
+        Weak entity tag
+    """
+    owner = owner_key(user_id, session_id)
+    version = await footprint_cache.version(owner)
+    etag: str = make_etag(owner, version, date.today(), *params)
+    return etag
+
+
+@router.get(
+    "/summary",
+    response_model=FootprintSummaryResponse,
+    responses=NOT_MODIFIED_RESPONSES,
+)
 async def get_footprint_summary(
     period: str = Query("month", pattern=_PERIOD_PATTERN),
     start_date: Optional[date] = None,
@@ -46,7 +88,9 @@ async def get_footprint_summary(
     user_id: UUID | None = Depends(get_optional_user),
     session_id: str | None = Depends(get_session_id),
     use_case: GetFootprintSummaryUseCase = Depends(get_footprint_summary_use_case),
-) -> FootprintSummaryResponse:
+    footprint_cache: FootprintCache = Depends(get_footprint_cache),
+    conditional: ConditionalRequest = Depends(),
+) -> FootprintSummaryResponse | Response:
     """Get carbon footprint summary for period.
 
     Returns total emissions, activity count, comparison with previous
@@ -58,6 +102,19 @@ async def get_footprint_summary(
             detail=_AUTH_REQUIRED_MSG,
         )
 
+    etag = await _footprint_etag(
+        footprint_cache,
+        user_id,
+        session_id if not user_id else None,
+        "summary",
+        period,
+        start_date,
+        end_date,
+    )
+    not_modified = conditional.evaluate(etag, PRIVATE_CACHE_CONTROL, OWNER_VARY)
+    if not_modified is not None:
+        return not_modified
+
     input_data = GetFootprintSummaryInput(
         user_id=user_id,
         session_id=session_id if not user_id else None,
@@ -80,7 +137,11 @@ async def get_footprint_summary(
     )
 
 
-@router.get("/breakdown", response_model=FootprintBreakdownResponse)
+@router.get(
+    "/breakdown",
+    response_model=FootprintBreakdownResponse,
+    responses=NOT_MODIFIED_RESPONSES,
+)
 async def get_footprint_breakdown(
     period: str = Query("month", pattern=_PERIOD_PATTERN),
     start_date: Optional[date] = None,
@@ -88,7 +149,9 @@ async def get_footprint_breakdown(
     user_id: UUID | None = Depends(get_optional_user),
     session_id: str | None = Depends(get_session_id),
     use_case: GetFootprintBreakdownUseCase = Depends(get_footprint_breakdown_use_case),
-) -> FootprintBreakdownResponse:
+    footprint_cache: FootprintCache = Depends(get_footprint_cache),
+    conditional: ConditionalRequest = Depends(),
+) -> FootprintBreakdownResponse | Response:
     """Get carbon footprint breakdown by category.
 
     Returns emissions grouped by category with percentages.
@@ -99,6 +162,19 @@ async def get_footprint_breakdown(
             detail=_AUTH_REQUIRED_MSG,
         )
 
+    etag = await _footprint_etag(
+        footprint_cache,
+        user_id,
+        session_id if not user_id else None,
+        "breakdown",
+        period,
+        start_date,
+        end_date,
+    )
+    not_modified = conditional.evaluate(etag, PRIVATE_CACHE_CONTROL, OWNER_VARY)
+    if not_modified is not None:
+        return not_modified
+
     input_data = GetFootprintBreakdownInput(
         user_id=user_id,
         session_id=session_id if not user_id else None,
@@ -124,7 +200,9 @@ async def get_footprint_breakdown(
     )
 
 
-@router.get("/trend", response_model=FootprintTrendResponse)
+@router.get(
+    "/trend", response_model=FootprintTrendResponse, responses=NOT_MODIFIED_RESPONSES
+)
 async def get_footprint_trend(
     period: str = Query("month", pattern=_PERIOD_PATTERN),
     start_date: Optional[date] = None,
@@ -133,7 +211,9 @@ async def get_footprint_trend(
     user_id: UUID | None = Depends(get_optional_user),
     session_id: str | None = Depends(get_session_id),
     use_case: GetFootprintTrendUseCase = Depends(get_footprint_trend_use_case),
-) -> FootprintTrendResponse:
+    footprint_cache: FootprintCache = Depends(get_footprint_cache),
+    conditional: ConditionalRequest = Depends(),
+) -> FootprintTrendResponse | Response:
     """Get carbon footprint trend over time.
 
     Returns time-series data with configurable granularity.
@@ -144,6 +224,20 @@ async def get_footprint_trend(
             detail=_AUTH_REQUIRED_MSG,
         )
 
+    etag = await _footprint_etag(
+        footprint_cache,
+        user_id,
+        session_id if not user_id else None,
+        "trend",
+        period,
+        start_date,
+        end_date,
+        granularity,
+    )
+    not_modified = conditional.evaluate(etag, PRIVATE_CACHE_CONTROL, OWNER_VARY)
+    if not_modified is not None:
+        return not_modified
+
     input_data = GetFootprintTrendInput(
         user_id=user_id,
         session_id=session_id if not user_id else None,
@@ -1,8 +1,25 @@
 """Health check endpoint."""
 
-from fastapi import APIRouter
+from fastapi import APIRouter, Depends
 
-from api.schemas.health import HealthResponse
+from api.dependencies.use_cases import (
+    get_footprint_cache,
+    get_ingestion_queue,
+    get_job_scheduler,
+    get_session_cleaner,
+)
+from api.schemas.health import (
+    CacheStatsResponse,
+    HealthResponse,
+    IngestionStatsResponse,
+    MetricsResponse,
+    ScheduledJobStatsResponse,
+    SessionCleanupStatsResponse,
+)
+from domain.ports.activity_ingestion_queue import ActivityIngestionQueue
+from domain.ports.footprint_cache import FootprintCache
+from domain.ports.job_scheduler import JobScheduler
+from domain.ports.session_cleaner import SessionCleaner
 
 router = APIRouter()
 
@@ -19,3 +36,74 @@ async def get_health() -> HealthResponse:
     return HealthResponse(
         status="ok", message="Carbon Footprint Tracker API is running"
     )
+
+
+@router.get("/health/metrics", response_model=MetricsResponse, tags=["health"])
+async def get_metrics(
+    footprint_cache: FootprintCache = Depends(get_footprint_cache),
+    ingestion_queue: ActivityIngestionQueue | None = Depends(get_ingestion_queue),
+    session_cleaner: SessionCleaner | None = Depends(get_session_cleaner),
+    scheduler: JobScheduler | None = Depends(get_job_scheduler),
+) -> MetricsResponse:
+    """Runtime metrics endpoint.
+
+    Returns counters of in-process components of this worker.
+
+    Returns:
+        MetricsResponse: Component metrics
+    """
+    stats = footprint_cache.stats()
+    ingestion = None
+    if ingestion_queue is not None:
+        queue_stats = ingestion_queue.stats()
+        ingestion = IngestionStatsResponse(
+            depth=queue_stats.depth,
+            submitted=queue_stats.submitted,
+            rejected=queue_stats.rejected,
+            flushes=queue_stats.flushes,
+            flushed=queue_stats.flushed,
+            retries=queue_stats.retries,
+            failed=queue_stats.failed,
+            last_flush_ms=queue_stats.last_flush_ms,
+            mean_flush_ms=queue_stats.mean_flush_ms,
+            max_flush_ms=queue_stats.max_flush_ms,
+        )
+    session_cleanup = None
+    if session_cleaner is not None:
+        cleanup_stats = session_cleaner.stats()
+        session_cleanup = SessionCleanupStatsResponse(
+            runs=cleanup_stats.runs,
+            failed=cleanup_stats.failed,
+            sessions=cleanup_stats.sessions,
+            activities=cleanup_stats.activities,
+            last_run_ms=cleanup_stats.last_run_ms,
+            last_finished_at=cleanup_stats.last_finished_at,
+        )
+    scheduled_jobs = None
+    if scheduler is not None:
+        scheduled_jobs = [
+            ScheduledJobStatsResponse(
+                name=job.name,
+                schedule=job.schedule,
+                runs=job.runs,
+                failed=job.failed,
+                skipped=job.skipped,
+                running=job.running,
+                last_run_ms=job.last_run_ms,
+                last_started_at=job.last_started_at,
+                next_run_at=job.next_run_at,
+            )
+            for job in scheduler.stats()
+        ]
+    return MetricsResponse(
+        footprint_cache=CacheStatsResponse(
+            hits=stats.hits,
+            misses=stats.misses,
+            evictions=stats.evictions,
+            entries=stats.entries,
+            hit_ratio=stats.hit_ratio,
+        ),
+        ingestion=ingestion,
+        session_cleanup=session_cleanup,
+        scheduled_jobs=scheduled_jobs,
+    )
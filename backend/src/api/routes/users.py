@@ -7,15 +7,13 @@ from supabase import Client
 
 from api.dependencies.auth import get_current_user
 from api.dependencies.database import get_supabase
+from api.dependencies.use_cases import get_migrate_activities_use_case
 from api.schemas.user import (
     MigrateActivitiesRequest,
     MigrateActivitiesResponse,
     UserResponse,
 )
 from domain.use_cases.migrate_activities import MigrateActivitiesUseCase
-from infrastructure.repositories.supabase_activity_repository import (
-    SupabaseActivityRepository,
-)
 
 router = APIRouter()
 
@@ -55,14 +53,11 @@ async def get_current_user_profile(
 async def migrate_activities(
     body: MigrateActivitiesRequest,
     user_id: UUID = Depends(get_current_user),
-    client: Client = Depends(get_supabase),
+    use_case: MigrateActivitiesUseCase = Depends(get_migrate_activities_use_case),
 ) -> MigrateActivitiesResponse:
     """Migrate anonymous activities to authenticated user.
 
     Links all activities with the given session_id to the authenticated user.
     """
-    use_case = MigrateActivitiesUseCase(
-        activity_repo=SupabaseActivityRepository(client),
-    )
     count = await use_case.execute(user_id=user_id, session_id=body.session_id)
     return MigrateActivitiesResponse(migrated_count=count)
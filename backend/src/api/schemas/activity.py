@@ -1,23 +1,61 @@
 """Activity API schemas."""
 
+import re
 from datetime import date, datetime
 from uuid import UUID
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, model_validator
+
+_IATA_CODE = re.compile(r"[A-Za-z]{3}")
 
 
 class ActivityInput(BaseModel):
-    """Input schema for creating an activity."""
+    """Input schema for creating an activity.
+
+    Flights (type "flight" or a flight_* type) whose metadata carries
+    origin_iata and destination_iata are resolved on the server: the
+    distance and flight type are computed from the airports, and value
+    may be omitted.
+    """
 
     category: str = Field(..., pattern="^(transport|energy|food)$", max_length=50)
     type: str = Field(..., max_length=100)
-    value: float = Field(..., gt=0, le=100000)
+    value: float | None = Field(
+        None, gt=0, le=100000, description="Required unless logging a flight route"
+    )
     date: date
     notes: str | None = Field(None, max_length=500)
     metadata: dict | None = Field(
         None, description="Optional metadata (e.g., flight origin/destination)"
     )
 
+    @property
+    def flight_route(self) -> tuple[str, str] | None:
+        """Origin and destination IATA codes of a flight, if given."""
+        if self.type != "flight" and not self.type.startswith("flight_"):
+            return None
+        if not self.metadata:
+            return None
+        origin = self.metadata.get("origin_iata")
+        destination = self.metadata.get("destination_iata")
+        if not isinstance(origin, str) or not isinstance(destination, str):
+            return None
+        return origin, destination
+
+    @model_validator(mode="after")
+    def require_value_or_route(self) -> "ActivityInput":
+        """Require a value unless the flight route determines it."""
+        route = self.flight_route
+        if route is None:
+            if self.value is None:
+                raise ValueError("value is required")
+            return self
+        if self.category != "transport":
+            raise ValueError("Flights belong to category 'transport'")
+        if not all(_IATA_CODE.fullmatch(code) for code in route):
+            raise ValueError("origin_iata and destination_iata must be IATA codes")
+        return self
+
 
 class ActivityUpdateInput(BaseModel):
     """Input schema for updating an activity."""
@@ -28,6 +66,73 @@ class ActivityUpdateInput(BaseModel):
     notes: str | None = Field(None, max_length=500)
 
 
+class ActivityFilterInput(BaseModel):
+    """Filter selecting activities for a bulk operation."""
+
+    start_date: date | None = None
+    end_date: date | None = None
+    type: str | None = Field(None, max_length=100)
+
+
+class BulkDeleteInput(BaseModel):
+    """Input schema for deleting many activities.
+
+    Select activities by ID, by filter, or by IDs narrowed by a filter.
+    """
+
+    ids: list[UUID] | None = Field(None, min_length=1, max_length=500)
+    filter: ActivityFilterInput | None = None
+
+    @model_validator(mode="after")
+    def require_selection(self) -> "BulkDeleteInput":
+        """Reject requests that would select every activity."""
+        if self.ids is None and (
+            self.filter is None or not self.filter.model_dump(exclude_none=True)
+        ):
+            raise ValueError("Provide ids or at least one filter")
+        return self
+
+
+class BulkUpdateInput(BulkDeleteInput):
+    """Input schema for changing the type of many activities."""
+
+    type: str = Field(..., max_length=100)
+
+
+class BulkResultItem(BaseModel):
+    """Outcome of a bulk operation for one activity."""
+
+    id: UUID
+    status: str = Field(
+        ..., description="ok, not_found, forbidden or category_mismatch"
+    )
+    co2e_kg: float | None = None
+
+
+class BulkResultResponse(BaseModel):
+    """Response schema for a bulk operation."""
+
+    succeeded: int
+    results: list[BulkResultItem]
+
+
+class ImportRejectedRow(BaseModel):
+    """A CSV line that was not imported."""
+
+    line: int = Field(..., description="Line number in the uploaded file")
+    reason: str
+
+
+class ActivityImportResponse(BaseModel):
+    """Outcome of a CSV import."""
+
+    imported: int = Field(..., ge=0, description="Activities created")
+    rejected: int = Field(..., ge=0, description="Lines refused")
+    rejected_rows: list[ImportRejectedRow] = Field(
+        ..., description="First refused lines with reasons"
+    )
+
+
 class ActivityResponse(BaseModel):
     """Response schema for an activity."""
 
@@ -54,5 +159,6 @@ class EmissionFactorResponse(BaseModel):
     factor: float
     unit: str
     source: str | None
+    source_year: int | None = None
 
     model_config = {"from_attributes": True}
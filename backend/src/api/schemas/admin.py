@@ -0,0 +1,31 @@
+"""Administration API schemas."""
+
+from pydantic import BaseModel, Field
+
+
+class RecalculationInput(BaseModel):
+    """Input schema for starting or resuming a CO2e recalculation."""
+
+    job_id: str | None = Field(
+        None,
+        pattern=r"^[A-Za-z0-9_.:-]+$",
+        max_length=100,
+        description="Job to resume; a new ID is generated when omitted",
+    )
+    activity_types: list[str] | None = Field(
+        None,
+        min_length=1,
+        description="Only recalculate these activity types (all when omitted)",
+    )
+
+
+class RecalculationStatusResponse(BaseModel):
+    """Progress of a CO2e recalculation job."""
+
+    job_id: str
+    activity_types: list[str] | None
+    scanned: int = Field(..., ge=0, description="Activities read")
+    updated: int = Field(..., ge=0, description="Activities whose CO2e changed")
+    skipped: int = Field(..., ge=0, description="Activities without a factor")
+    completed: bool
+    running: bool = Field(..., description="Whether this worker is running the job")
@@ -1,5 +1,7 @@
 """Health check schema."""
 
+from datetime import datetime
+
 from pydantic import BaseModel, Field
 
 
@@ -19,3 +21,75 @@ class HealthResponse(BaseModel):
             "example": {"status": "ok", "message": "Service is running"}
         }
     }
+
+
+class CacheStatsResponse(BaseModel):
+    """Cache effectiveness counters."""
+
+    hits: int = Field(..., ge=0, description="Lookups served from the cache")
+    misses: int = Field(..., ge=0, description="Lookups that had to be computed")
+    evictions: int = Field(..., ge=0, description="Entries dropped by LRU eviction")
+    entries: int = Field(..., ge=0, description="Entries currently held")
+    hit_ratio: float = Field(..., ge=0, le=1, description="hits / (hits + misses)")
+
+
+class IngestionStatsResponse(BaseModel):
+    """Write-behind ingestion queue counters."""
+
+    depth: int = Field(..., ge=0, description="Activities waiting to be written")
+    submitted: int = Field(..., ge=0, description="Activities accepted")
+    rejected: int = Field(..., ge=0, description="Activities refused (queue full)")
+    flushes: int = Field(..., ge=0, description="Batch writes attempted")
+    flushed: int = Field(..., ge=0, description="Activities written")
+    retries: int = Field(..., ge=0, description="Batch writes retried")
+    failed: int = Field(..., ge=0, description="Activities dead-lettered after retries")
+    last_flush_ms: float = Field(..., ge=0, description="Latest flush duration")
+    mean_flush_ms: float = Field(..., ge=0, description="Average flush duration")
+    max_flush_ms: float = Field(..., ge=0, description="Longest flush duration")
+
+
+class SessionCleanupStatsResponse(BaseModel):
+    """Stale anonymous session cleanup counters."""
+
+    runs: int = Field(..., ge=0, description="Cleanup runs completed")
+    failed: int = Field(..., ge=0, description="Cleanup runs that failed")
+    sessions: int = Field(..., ge=0, description="Stale sessions reclaimed")
+    activities: int = Field(..., ge=0, description="Activities reclaimed")
+    last_run_ms: float = Field(..., ge=0, description="Latest run duration")
+    last_finished_at: datetime | None = Field(
+        None, description="End of the latest completed run"
+    )
+
+
+class ScheduledJobStatsResponse(BaseModel):
+    """Counters of one scheduled maintenance job in this process."""
+
+    name: str = Field(..., description="Job name")
+    schedule: str = Field(..., description="Cron expression or interval")
+    runs: int = Field(..., ge=0, description="Runs completed")
+    failed: int = Field(..., ge=0, description="Runs that failed")
+    skipped: int = Field(..., ge=0, description="Due runs left to another replica")
+    running: bool = Field(..., description="Whether the job is running now")
+    last_run_ms: float = Field(..., ge=0, description="Latest run duration")
+    last_started_at: datetime | None = Field(
+        None, description="Start of the latest run"
+    )
+    next_run_at: datetime | None = Field(
+        None, description="Next due time, before jitter"
+    )
+
+
+class MetricsResponse(BaseModel):
+    """Runtime metrics of in-process components."""
+
+    footprint_cache: CacheStatsResponse
+    ingestion: IngestionStatsResponse | None = Field(
+        None, description="Ingestion queue counters (queue mode only)"
+    )
+    session_cleanup: SessionCleanupStatsResponse | None = Field(
+        None,
+        description="Cleanups run by this process (with a database connection only)",
+    )
+    scheduled_jobs: list[ScheduledJobStatsResponse] | None = Field(
+        None, description="Scheduled maintenance jobs (scheduler enabled only)"
+    )
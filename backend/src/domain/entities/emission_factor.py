@@ -20,6 +20,7 @@ class EmissionFactor:
         source: Data source reference (e.g., "DEFRA 2023")
         notes: Additional information about the factor
         created_at: Timestamp when factor was added
+        source_year: Year from which the factor applies (None if unversioned)
 
     Example:
         EmissionFactor(
@@ -38,6 +39,7 @@ class EmissionFactor:
     source: str | None
     notes: str | None
     created_at: datetime
+    source_year: int | None = None
 
     def __post_init__(self) -> None:
         """Validate entity invariants."""
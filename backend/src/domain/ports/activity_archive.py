@@ -0,0 +1,82 @@
+"""Activity archive port (interface)."""
+
+from abc import ABC, abstractmethod
+from datetime import date
+from uuid import UUID
+
+from domain.entities.activity import Activity
+
+
+class ActivityArchive(ABC):
+    """Port (interface) for cold storage of old activities.
+
+    Activities past the archival horizon are moved out of the activity
+    repository into the archive, grouped by owner. Archived activities
+    are read-only: they are listed with an owner's history but no longer
+    updated or deleted one by one.
+    """
+
+    @abstractmethod
+    async def write(self, activities: list[Activity], batch: str) -> int:
+        """Add activities to the archive of their owners.
+
+        Args:
+            activities: Activities to archive (any owners)
+            batch: Name of this archival run, unique per run; batches are
+                stored next to the earlier ones
+
+        Returns:
+            Number of activities written
+        """
+
+    @abstractmethod
+    async def list_by_date_range(
+        self,
+        user_id: UUID | None,
+        session_id: str | None,
+        start_date: date,
+        end_date: date,
+    ) -> list[Activity]:
+        """List archived activities of an owner within a date range.
+
+        Args:
+            user_id: User ID if authenticated
+            session_id: Session ID for anonymous users
+            start_date: Start of date range (inclusive)
+            end_date: End of date range (inclusive)
+
+        Returns:
+            List of activities ordered by date ascending
+        """
+
+    @abstractmethod
+    async def list_owned_after_id(
+        self,
+        user_id: UUID | None,
+        session_id: str | None,
+        after_id: UUID | None,
+        limit: int,
+    ) -> list[Activity]:
+        """List an owner's archived activities in ID order.
+
+        Args:
+            user_id: User ID if authenticated
+            session_id: Session ID for anonymous users
+            after_id: Return activities with a greater ID (None from the start)
+            limit: Maximum number of activities
+
+        Returns:
+            Activities ordered by ID ascending
+        """
+
+    @abstractmethod
+    async def migrate_session_to_user(self, user_id: UUID, session_id: str) -> int:
+        """Move the archived activities of a session to a user.
+
+        Args:
+            user_id: Authenticated user's ID
+            session_id: Anonymous session identifier
+
+        Returns:
+            Count of activities migrated
+        """
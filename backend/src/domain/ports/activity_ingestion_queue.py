@@ -0,0 +1,77 @@
+"""Activity ingestion queue port (interface)."""
+
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+
+from domain.entities.activity import Activity
+
+
+class IngestionQueueFullError(RuntimeError):
+    """Raised when an activity cannot be queued (queue full or closing)."""
+
+
+@dataclass(frozen=True)
+class IngestionStats:
+    """Counters of an ingestion queue.
+
+    Attributes:
+        depth: Activities waiting to be written
+        submitted: Activities accepted since start
+        rejected: Activities refused because the queue was full
+        flushes: Batch writes attempted
+        flushed: Activities written
+        retries: Batch writes retried after a failure
+        failed: Activities that could not be written even after retries
+            (dead-lettered)
+        last_flush_ms: Duration of the most recent flush
+        max_flush_ms: Longest flush duration
+        total_flush_ms: Summed flush duration
+    """
+
+    depth: int
+    submitted: int
+    rejected: int
+    flushes: int
+    flushed: int
+    retries: int
+    failed: int
+    last_flush_ms: float
+    max_flush_ms: float
+    total_flush_ms: float
+
+    @property
+    def mean_flush_ms(self) -> float:
+        """Average flush duration (0.0 before the first flush)."""
+        return self.total_flush_ms / self.flushes if self.flushes else 0.0
+
+
+class ActivityIngestionQueue(ABC):
+    """Port (interface) for write-behind activity persistence.
+
+    Accepted activities are written later, in batches. Callers acknowledge
+    them as created, so implementations must retry failed writes and keep
+    what still cannot be written for recovery instead of dropping it, and
+    must write everything accepted before close() returns.
+    """
+
+    @abstractmethod
+    async def submit(self, activity: Activity) -> None:
+        """Queue an activity for writing.
+
+        Args:
+            activity: Fully computed activity to persist
+
+        Raises:
+            IngestionQueueFullError: If the queue cannot take more activities
+        """
+
+    @abstractmethod
+    def stats(self) -> IngestionStats:
+        """Get queue counters.
+
+        Returns:
+            Current depth, throughput and flush latency counters
+        """
+
+    async def close(self) -> None:
+        """Stop accepting activities and write the ones still queued."""
@@ -1,12 +1,87 @@
 """Activity repository port (interface)."""
 
 from abc import ABC, abstractmethod
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
 from datetime import date
 from uuid import UUID
 
 from domain.entities.activity import Activity
 
 
+@dataclass(frozen=True)
+class OwnerCategoryTotal:
+    """Total CO2e of one owner in one category over a date range.
+
+    Attributes:
+        user_id: User ID if the owner is authenticated
+        session_id: Session ID if the owner is anonymous
+        category: Activity category
+        co2e_kg: Summed CO2e in kilograms
+    """
+
+    user_id: UUID | None
+    session_id: str | None
+    category: str
+    co2e_kg: float
+
+
+# CO2e of activities changed to another type, in input order
+Co2eCalculator = Callable[[list[Activity]], Awaitable[list[float]]]
+
+# Outcomes of ownership-checked writes
+WRITE_OK = "ok"
+WRITE_NOT_FOUND = "not_found"
+WRITE_FORBIDDEN = "forbidden"
+WRITE_CATEGORY_MISMATCH = "category_mismatch"
+
+
+@dataclass(frozen=True)
+class OwnedWriteResult:
+    """Outcome of an update or delete filtered on the activity owner.
+
+    Attributes:
+        status: WRITE_OK, WRITE_NOT_FOUND, WRITE_FORBIDDEN or
+            WRITE_CATEGORY_MISMATCH
+        activity: Activity after the write (updates that succeeded only)
+        previous: Activity before the write (set on success and on
+            category mismatch)
+    """
+
+    status: str
+    activity: Activity | None = None
+    previous: Activity | None = None
+
+
+@dataclass(frozen=True)
+class ActivitySelection:
+    """Activities of one owner targeted by a bulk write.
+
+    Either explicit IDs or a filter; filters also narrow an ID list.
+
+    Attributes:
+        ids: Activity IDs to target (None selects by filter only)
+        start_date: Start of date range (inclusive)
+        end_date: End of date range (inclusive)
+        activity_type: Only activities of this type
+    """
+
+    ids: tuple[UUID, ...] | None = None
+    start_date: date | None = None
+    end_date: date | None = None
+    activity_type: str | None = None
+
+    @property
+    def is_empty(self) -> bool:
+        """Whether no IDs and no filter are set (i.e. every activity)."""
+        return (
+            self.ids is None
+            and self.start_date is None
+            and self.end_date is None
+            and self.activity_type is None
+        )
+
+
 class ActivityRepository(ABC):
     """Port (interface) for activity persistence.
 
@@ -29,6 +104,17 @@ class ActivityRepository(ABC):
         """
         pass
 
+    @abstractmethod
+    async def save_many(self, activities: list[Activity]) -> list[Activity]:
+        """Persist several activities in one write.
+
+        Args:
+            activities: Activity entities to save
+
+        Returns:
+            Saved activities with values from storage, in input order
+        """
+
     @abstractmethod
     async def get_by_id(self, activity_id: UUID) -> Activity | None:
         """Retrieve activity by ID.
@@ -136,3 +222,191 @@ class ActivityRepository(ABC):
             True if deleted, False if not found
         """
         pass
+
+    @abstractmethod
+    async def update_owned(
+        self,
+        activity_id: UUID,
+        user_id: UUID | None,
+        session_id: str | None,
+        category: str,
+        activity_type: str,
+        value: float,
+        co2e_kg: float,
+        activity_date: date,
+        notes: str | None,
+    ) -> OwnedWriteResult:
+        """Update an activity only if it belongs to the given owner.
+
+        The ownership and category checks are part of the write itself,
+        so no separate lookup is needed. Authenticated owners are matched
+        on user_id, anonymous owners on session_id.
+
+        Args:
+            activity_id: Activity identifier
+            user_id: User ID if authenticated
+            session_id: Session ID for anonymous users
+            category: Category the new type belongs to (must match the row)
+            activity_type: Updated activity type
+            value: Updated activity amount
+            co2e_kg: Recalculated CO2e in kilograms
+            activity_date: Updated date when activity occurred
+            notes: Updated optional user notes
+
+        Returns:
+            Write outcome with the activity before and after the update
+
+        Raises:
+            ValueError: If neither user_id nor session_id is provided
+        """
+
+    @abstractmethod
+    async def delete_owned(
+        self, activity_id: UUID, user_id: UUID | None, session_id: str | None
+    ) -> OwnedWriteResult:
+        """Delete an activity only if it belongs to the given owner.
+
+        Args:
+            activity_id: Activity identifier
+            user_id: User ID if authenticated
+            session_id: Session ID for anonymous users
+
+        Returns:
+            Write outcome with the deleted activity as previous
+
+        Raises:
+            ValueError: If neither user_id nor session_id is provided
+        """
+
+    @abstractmethod
+    async def delete_many_owned(
+        self,
+        user_id: UUID | None,
+        session_id: str | None,
+        selection: ActivitySelection,
+    ) -> dict[UUID, OwnedWriteResult]:
+        """Delete the selected activities of an owner in one statement.
+
+        Args:
+            user_id: User ID if authenticated
+            session_id: Session ID for anonymous users
+            selection: Activities to delete
+
+        Returns:
+            Outcome per activity: every requested ID when selecting by
+            IDs, otherwise only the deleted activities
+
+        Raises:
+            ValueError: If neither user_id nor session_id is provided
+        """
+
+    @abstractmethod
+    async def update_type_many_owned(
+        self,
+        user_id: UUID | None,
+        session_id: str | None,
+        selection: ActivitySelection,
+        category: str,
+        activity_type: str,
+        co2e_for: Co2eCalculator,
+    ) -> dict[UUID, OwnedWriteResult]:
+        """Change the type of the selected activities.
+
+        The owned rows in the category of the new type are read, their
+        CO2e is computed by co2e_for from their value and date, and they
+        are updated in one statement that skips rows changed in between;
+        those are read and computed again. Rows outside the category are
+        left unchanged and reported as category mismatches.
+
+        Args:
+            user_id: User ID if authenticated
+            session_id: Session ID for anonymous users
+            selection: Activities to update
+            category: Category of the new type
+            activity_type: New activity type
+            co2e_for: Coroutine function returning the CO2e of activities
+                as the new type, in input order
+
+        Returns:
+            Outcome per activity: every requested ID when selecting by
+            IDs, otherwise every owned activity matching the filter
+
+        Raises:
+            ValueError: If neither user_id nor session_id is provided
+        """
+
+    @abstractmethod
+    async def list_after_id(
+        self,
+        after_id: UUID | None,
+        limit: int,
+        activity_types: tuple[str, ...] | None = None,
+        before_id: UUID | None = None,
+    ) -> list[Activity]:
+        """List activities of all owners in ID order (keyset pagination).
+
+        Args:
+            after_id: Return activities with a greater ID (None from the start)
+            limit: Maximum number of activities
+            activity_types: Only activities of these types (None for all)
+            before_id: Return activities with a smaller ID (None to the end)
+
+        Returns:
+            Activities ordered by ID ascending
+        """
+
+    @abstractmethod
+    async def list_owned_after_id(
+        self,
+        user_id: UUID | None,
+        session_id: str | None,
+        after_id: UUID | None,
+        limit: int,
+    ) -> list[Activity]:
+        """List one owner's activities in ID order (keyset pagination).
+
+        Args:
+            user_id: User ID if authenticated
+            session_id: Session ID for anonymous users
+            after_id: Return activities with a greater ID (None from the start)
+            limit: Maximum number of activities
+
+        Returns:
+            Activities ordered by ID ascending
+        """
+
+    @abstractmethod
+    async def update_co2e_many(
+        self, activities: list[Activity], co2e_for: Co2eCalculator
+    ) -> dict[UUID, OwnedWriteResult]:
+        """Set the CO2e of many activities in one statement.
+
+        Each row is only written while its type, value and date match the
+        activity its CO2e was computed from; rows changed since are
+        computed again from their current values.
+
+        Args:
+            activities: Activities as read
+            co2e_for: Computes the current CO2e of activities
+
+        Returns:
+            WRITE_OK outcome, with the activity before and after the write,
+            per activity updated; activities deleted since are omitted
+
+        Raises:
+            RuntimeError: If rows keep changing between computation and update
+        """
+
+    @abstractmethod
+    async def list_owner_totals(
+        self, start_date: date, end_date: date
+    ) -> list[OwnerCategoryTotal]:
+        """Sum CO2e per owner and category across all owners.
+
+        Args:
+            start_date: Start of date range (inclusive)
+            end_date: End of date range (inclusive)
+
+        Returns:
+            One total per (owner, category) pair with activities in range
+        """
@@ -34,3 +34,13 @@ class AirportRepository(ABC):
             Airport if found, None otherwise
         """
         pass
+
+    async def data_version(self) -> str | None:
+        """
+        Get a version identifying the current airport data.
+
+        Returns:
+            Content hash that changes whenever the data changes,
+            or None if the source cannot provide one
+        """
+        return None
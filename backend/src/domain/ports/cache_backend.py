@@ -0,0 +1,95 @@
+"""Key-value cache backend port (interface)."""
+
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class BackendUsage:
+    """Storage counters of a cache backend.
+
+    Attributes:
+        entries: Keys currently held
+        evictions: Keys dropped to stay within the size bound
+    """
+
+    entries: int
+    evictions: int
+
+
+class CacheBackend(ABC):
+    """Port (interface) for a byte-oriented key-value cache.
+
+    Implementations may be process-local or shared between workers
+    and replicas. Values are opaque bytes; callers own serialization.
+    """
+
+    @abstractmethod
+    async def get(self, key: str) -> bytes | None:
+        """Retrieve a value.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Stored bytes if present and not expired, None otherwise
+        """
+
+    @abstractmethod
+    async def set(self, key: str, value: bytes, ttl_seconds: int | None = None) -> None:
+        """Store a value.
+
+        Args:
+            key: Cache key
+            value: Bytes to store
+            ttl_seconds: Expiry in seconds (None keeps the key until evicted)
+        """
+
+    @abstractmethod
+    async def set_if_absent(
+        self, key: str, value: bytes, ttl_seconds: int | None = None
+    ) -> bytes:
+        """Store a value unless the key already holds one.
+
+        Args:
+            key: Cache key
+            value: Bytes to store if the key is missing
+            ttl_seconds: Expiry in seconds (None keeps the key until evicted)
+
+        Returns:
+            Value held by the key: the existing one, or `value` if stored
+        """
+
+    @abstractmethod
+    async def delete(self, key: str) -> None:
+        """Remove a value if present.
+
+        Args:
+            key: Cache key
+        """
+
+    @abstractmethod
+    async def incr(self, key: str) -> int:
+        """Atomically increment an integer counter.
+
+        Missing keys start from 0. Counters never expire.
+
+        Args:
+            key: Counter key
+
+        Returns:
+            Value after the increment
+        """
+
+    async def close(self) -> None:
+        """Release connections held by the backend."""
+
+    def usage(self) -> BackendUsage:
+        """Get storage counters held by this process.
+
+        Shared backends evict on the server, so they report zeros.
+
+        Returns:
+            Current entry and eviction counters
+        """
+        return BackendUsage(entries=0, evictions=0)
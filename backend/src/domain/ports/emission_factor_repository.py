@@ -1,6 +1,7 @@
 """Emission factor repository port (interface)."""
 
 from abc import ABC, abstractmethod
+from datetime import date
 
 from domain.entities.emission_factor import EmissionFactor
 
@@ -14,16 +15,34 @@ class EmissionFactorRepository(ABC):
 
     @abstractmethod
     async def get_by_type(self, activity_type: str) -> EmissionFactor | None:
-        """Retrieve emission factor by activity type.
+        """Retrieve the most recent emission factor of an activity type.
 
         Args:
             activity_type: Activity type (e.g., "car_petrol", "bus")
 
         Returns:
-            Emission factor if found, None otherwise
+            Latest emission factor if found, None otherwise
         """
         pass
 
+    async def get_by_type_on(
+        self, activity_type: str, on: date
+    ) -> EmissionFactor | None:
+        """Retrieve the emission factor of an activity type valid on a date.
+
+        A factor applies from January 1 of its source year until the next
+        version of the same type takes over. Dates before the oldest
+        version use the oldest version.
+
+        Args:
+            activity_type: Activity type (e.g., "car_petrol", "bus")
+            on: Date the activity took place
+
+        Returns:
+            Emission factor in effect on that date, None if the type is unknown
+        """
+        return await self.get_by_type(activity_type)
+
     @abstractmethod
     async def list_by_category(self, category: str) -> list[EmissionFactor]:
         """List all emission factors for a category.
@@ -44,3 +63,12 @@ class EmissionFactorRepository(ABC):
             List of all emission factors ordered by category, then type
         """
         pass
+
+    async def data_version(self) -> str | None:
+        """Get a version identifying the current emission factors.
+
+        Returns:
+            Content hash that changes whenever the factors change,
+            or None if the source cannot provide one
+        """
+        return None
@@ -0,0 +1,116 @@
+"""Footprint result cache port (interface)."""
+
+from abc import ABC, abstractmethod
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from typing import Any, TypeVar
+
+T = TypeVar("T")
+
+
+@dataclass(frozen=True)
+class CacheStats:
+    """Cache effectiveness counters.
+
+    Attributes:
+        hits: Lookups served from the cache
+        misses: Lookups that had to be computed
+        evictions: Entries dropped to stay within the size bound
+        entries: Entries currently held
+    """
+
+    hits: int
+    misses: int
+    evictions: int
+    entries: int
+
+    @property
+    def hit_ratio(self) -> float:
+        """Share of lookups served from the cache (0.0 when unused)."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class FootprintCache(ABC):
+    """Port (interface) for caching computed footprint results.
+
+    Entries are scoped to an owner and tagged with the owner's data
+    version. Any write to the owner's activities bumps the version, so
+    entries computed before the write can no longer be read.
+    """
+
+    @abstractmethod
+    async def version(self, owner: str) -> int:
+        """Get the current data version of an owner.
+
+        Args:
+            owner: Owner key
+
+        Returns:
+            Version number used to tag cache entries
+        """
+
+    @abstractmethod
+    async def invalidate(self, owner: str) -> None:
+        """Bump an owner's data version after their activities changed.
+
+        Args:
+            owner: Owner key
+        """
+
+    @abstractmethod
+    async def get(self, owner: str, version: int, key: str) -> Any | None:
+        """Retrieve a cached result.
+
+        Args:
+            owner: Owner key
+            version: Owner data version the result was computed at
+            key: Result key (kind, period, range, ...)
+
+        Returns:
+            Cached value if present, None otherwise
+        """
+
+    @abstractmethod
+    async def set(self, owner: str, version: int, key: str, value: Any) -> None:
+        """Store a computed result.
+
+        Args:
+            owner: Owner key
+            version: Owner data version the result was computed at
+            key: Result key (kind, period, range, ...)
+            value: Result to cache
+        """
+
+    @abstractmethod
+    def stats(self) -> CacheStats:
+        """Get cache effectiveness counters.
+
+        Returns:
+            Current hit/miss/eviction counters
+        """
+
+    async def get_or_compute(
+        self, owner: str, key: str, compute: Callable[[], Awaitable[T]]
+    ) -> T:
+        """Return a cached result or compute and cache it.
+
+        The version is read before computing, so a write that lands while
+        the result is being computed leaves the stored entry unreachable.
+
+        Args:
+            owner: Owner key
+            key: Result key (kind, period, range, ...)
+            compute: Coroutine factory producing the result on a miss
+
+        Returns:
+            Cached or freshly computed result
+        """
+        version = await self.version(owner)
+        cached = await self.get(owner, version, key)
+        if cached is not None:
+            return cached  # type: ignore[no-any-return]
+
+        value = await compute()
+        await self.set(owner, version, key, value)
+        return value
@@ -0,0 +1,102 @@
+"""Background job scheduler ports (interfaces)."""
+
+from abc import ABC, abstractmethod
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any
+
+
+@dataclass(frozen=True)
+class ScheduledJobStats:
+    """Counters of one scheduled job in this process.
+
+    Attributes:
+        name: Job name
+        schedule: Schedule specification
+        runs: Runs completed
+        failed: Runs that raised
+        skipped: Due runs left to another replica (or still running)
+        running: Whether the job is running now
+        last_run_ms: Duration of the most recent run
+        last_started_at: Start of the most recent run
+        next_run_at: Next due time (before jitter)
+    """
+
+    name: str
+    schedule: str
+    runs: int
+    failed: int
+    skipped: int
+    running: bool
+    last_run_ms: float
+    last_started_at: datetime | None
+    next_run_at: datetime | None
+
+
+class JobCoordinator(ABC):
+    """Port (interface) electing the replica that runs a due job.
+
+    Every replica computes the same due times (slots) for a job; the
+    coordinator lets exactly one of them run each slot, and none while a
+    previous run is still going.
+    """
+
+    @abstractmethod
+    async def try_acquire(self, job: str, slot: datetime) -> bool:
+        """Claim a due run of a job.
+
+        Args:
+            job: Job name
+            slot: Due time of the run, identical on every replica
+
+        Returns:
+            True if this process should run it; release() must follow
+        """
+
+    @abstractmethod
+    async def release(self, job: str) -> None:
+        """Let other replicas run the job again after a claimed run.
+
+        Args:
+            job: Job name
+        """
+
+
+class JobScheduler(ABC):
+    """Port (interface) for running jobs periodically in the background."""
+
+    @abstractmethod
+    def add(
+        self,
+        name: str,
+        schedule: str,
+        job: Callable[[], Awaitable[Any]],
+    ) -> None:
+        """Register a job.
+
+        Args:
+            name: Unique job name
+            schedule: Cron expression (``"15 3 * * *"``) or interval
+                (``"@every 10m"``)
+            job: Coroutine function performing one run
+
+        Raises:
+            ValueError: If the name is taken or the schedule is invalid
+        """
+
+    @abstractmethod
+    def start(self) -> None:
+        """Start running the registered jobs on their schedules."""
+
+    @abstractmethod
+    async def close(self) -> None:
+        """Stop scheduling and cancel running jobs."""
+
+    @abstractmethod
+    def stats(self) -> list[ScheduledJobStats]:
+        """Get counters of every registered job.
+
+        Returns:
+            Snapshot per job, in registration order
+        """
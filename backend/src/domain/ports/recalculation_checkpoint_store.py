@@ -0,0 +1,54 @@
+"""Recalculation checkpoint store port (interface)."""
+
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from uuid import UUID
+
+
+@dataclass(frozen=True)
+class RecalculationCheckpoint:
+    """Progress of a CO2e recalculation job.
+
+    Attributes:
+        job_id: Job identifier (shards of one run use distinct IDs)
+        activity_types: Types being recalculated (None for all)
+        last_id: Highest activity ID processed so far (keyset position)
+        scanned: Activities read
+        updated: Activities whose CO2e changed and was written
+        skipped: Activities without an emission factor
+        completed: Whether the job reached the end of its range
+    """
+
+    job_id: str
+    activity_types: tuple[str, ...] | None = None
+    last_id: UUID | None = None
+    scanned: int = 0
+    updated: int = 0
+    skipped: int = 0
+    completed: bool = False
+
+
+class RecalculationCheckpointStore(ABC):
+    """Port (interface) for persisting recalculation progress.
+
+    Lets an interrupted job resume after the last written batch.
+    """
+
+    @abstractmethod
+    async def load(self, job_id: str) -> RecalculationCheckpoint | None:
+        """Load a job's checkpoint.
+
+        Args:
+            job_id: Job identifier
+
+        Returns:
+            Last saved checkpoint, or None for a new job
+        """
+
+    @abstractmethod
+    async def save(self, checkpoint: RecalculationCheckpoint) -> None:
+        """Save a job's checkpoint, replacing the previous one.
+
+        Args:
+            checkpoint: Progress to persist
+        """
@@ -33,3 +33,12 @@ class RegionDataProvider(ABC):
             Regional average if found, None otherwise
         """
         pass
+
+    async def data_version(self) -> str | None:
+        """Get a version identifying the current regional data.
+
+        Returns:
+            Content hash that changes whenever the data changes,
+            or None if the source cannot provide one
+        """
+        return None
@@ -0,0 +1,79 @@
+"""Stale session cleaner port (interface)."""
+
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from datetime import datetime
+
+
+@dataclass(frozen=True)
+class SessionCleanupReport:
+    """Outcome of one cleanup run.
+
+    Attributes:
+        idle_before: Sessions without activity since this time were stale
+        sessions: Stale sessions reclaimed (found, on a dry run)
+        activities: Activities reclaimed (that would be, on a dry run)
+        batches: Batches processed
+        duration_ms: Duration of the run
+        archived: Whether activities past the archival horizon were archived
+            instead of deleted
+        dry_run: Whether the run only counted the stale sessions
+    """
+
+    idle_before: datetime
+    sessions: int
+    activities: int
+    batches: int
+    duration_ms: float
+    archived: bool
+    dry_run: bool
+
+
+@dataclass(frozen=True)
+class SessionCleanupStats:
+    """Counters of a session cleaner (dry runs excluded).
+
+    Attributes:
+        runs: Cleanup runs completed
+        failed: Cleanup runs that raised
+        sessions: Sessions reclaimed since start
+        activities: Activities reclaimed since start
+        last_run_ms: Duration of the most recent completed run
+        last_finished_at: End of the most recent completed run
+    """
+
+    runs: int
+    failed: int
+    sessions: int
+    activities: int
+    last_run_ms: float
+    last_finished_at: datetime | None
+
+
+class SessionCleaner(ABC):
+    """Port (interface) for reclaiming abandoned anonymous sessions.
+
+    Activities of anonymous visitors are keyed by session ID until the
+    visitor signs up and migrates them. Sessions that stay idle past a
+    time-to-live are never migrated, so their activities are removed
+    from the activity repository (deleted or archived).
+    """
+
+    @abstractmethod
+    async def run(self, dry_run: bool = False) -> SessionCleanupReport:
+        """Reclaim the activities of every stale session.
+
+        Args:
+            dry_run: Only count the stale sessions and their activities
+
+        Returns:
+            Sessions and activities reclaimed
+        """
+
+    @abstractmethod
+    def stats(self) -> SessionCleanupStats:
+        """Get counters since start.
+
+        Returns:
+            Snapshot of run counters
+        """
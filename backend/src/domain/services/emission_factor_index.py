@@ -0,0 +1,84 @@
+"""Interval index of versioned emission factors."""
+
+from bisect import bisect_right
+from collections.abc import Iterable
+from datetime import date
+
+from domain.entities.emission_factor import EmissionFactor
+
+
+def effective_from(factor: EmissionFactor) -> date:
+    """First date a factor applies to.
+
+    Args:
+        factor: Emission factor
+
+    Returns:
+        January 1 of the source year, or date.min for unversioned factors
+    """
+    if factor.source_year is None:
+        return date.min
+    return date(factor.source_year, 1, 1)
+
+
+class EmissionFactorIndex:
+    """Emission factors by activity type and effective period.
+
+    Each type keeps its versions sorted by start date; a version is
+    effective until the next one starts. Lookups bisect the start dates,
+    so finding the factor for a date is O(log v) in the number of
+    versions of the type.
+    """
+
+    def __init__(self, factors: Iterable[EmissionFactor]) -> None:
+        """Build the index.
+
+        When two factors of a type share a start date the later one wins.
+
+        Args:
+            factors: Emission factors of any types and source years
+        """
+        versions: dict[str, dict[date, EmissionFactor]] = {}
+        for factor in factors:
+            versions.setdefault(factor.type, {})[effective_from(factor)] = factor
+
+        self._starts: dict[str, list[date]] = {}
+        self._factors: dict[str, list[EmissionFactor]] = {}
+        for activity_type, by_start in versions.items():
+            starts = sorted(by_start)
+            self._starts[activity_type] = starts
+            self._factors[activity_type] = [by_start[s] for s in starts]
+
+    def __len__(self) -> int:
+        """Number of activity types in the index."""
+        return len(self._factors)
+
+    def latest(self, activity_type: str) -> EmissionFactor | None:
+        """Get the most recent version of a type.
+
+        Args:
+            activity_type: Activity type (e.g., "car_petrol")
+
+        Returns:
+            Newest emission factor, None if the type is unknown
+        """
+        factors = self._factors.get(activity_type)
+        return factors[-1] if factors else None
+
+    def on(self, activity_type: str, on: date) -> EmissionFactor | None:
+        """Get the version of a type in effect on a date.
+
+        Dates before the first version fall back to the first version.
+
+        Args:
+            activity_type: Activity type (e.g., "car_petrol")
+            on: Date the activity took place
+
+        Returns:
+            Emission factor in effect, None if the type is unknown
+        """
+        factors = self._factors.get(activity_type)
+        if not factors:
+            return None
+        position = bisect_right(self._starts[activity_type], on)
+        return factors[max(position - 1, 0)]
@@ -0,0 +1,39 @@
+"""Stable identifier for the owner of a set of activities."""
+
+from uuid import UUID
+
+
+def owner_key(user_id: UUID | None, session_id: str | None) -> str:
+    """Build a stable key for an activity owner.
+
+    Authenticated users take precedence over anonymous sessions, matching
+    how repositories filter activities.
+
+    Args:
+        user_id: User ID if authenticated
+        session_id: Session ID for anonymous users
+
+    Returns:
+        Owner key such as "user:<uuid>" or "session:<id>"
+
+    Raises:
+        ValueError: If neither user_id nor session_id is provided
+    """
+    if user_id is not None:
+        return f"user:{user_id}"
+    if session_id:
+        return f"session:{session_id}"
+    raise ValueError("Either user_id or session_id must be provided")
+
+
+def require_owner(user_id: UUID | None, session_id: str | None) -> None:
+    """Refuse an operation that is not scoped to an owner.
+
+    Args:
+        user_id: User ID if authenticated
+        session_id: Session ID for anonymous users
+
+    Raises:
+        ValueError: If neither user_id nor session_id is provided
+    """
+    owner_key(user_id, session_id)
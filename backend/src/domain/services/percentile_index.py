@@ -0,0 +1,228 @@
+"""Population percentile index backed by quantile sketches."""
+
+from collections.abc import Iterable
+from datetime import UTC, date, datetime, timedelta
+
+from domain.services.quantile_sketch import TDigest
+
+TOTAL_CATEGORY = "total"
+GLOBAL_REGION = "world"
+
+
+class PopulationPercentileIndex:
+    """Percentiles of annualized per-owner footprints by region and category.
+
+    Keeps each owner's trailing-window CO2e per category and one t-digest
+    per (region, category). Every owner belongs to the global population;
+    owners also join the population of the region they compare against.
+
+    Writes are applied incrementally: a new owner is added to the sketches
+    straight away, while changes to an existing owner only update the
+    running totals and are folded into the sketches once enough of them
+    accumulate. A full reload from persisted activities is due every
+    ``rebuild_interval`` so the trailing window keeps moving.
+    """
+
+    def __init__(
+        self,
+        window_days: int = 365,
+        min_population: int = 50,
+        rebuild_interval: timedelta = timedelta(hours=1),
+        stale_fraction: float = 0.05,
+        compression: float = 100.0,
+    ) -> None:
+        """Initialize an empty index.
+
+        Args:
+            window_days: Length of the trailing window that is annualized
+            min_population: Owners required before a percentile is reported
+            rebuild_interval: Maximum age of the last full reload
+            stale_fraction: Share of owners that may change before re-sketching
+            compression: t-digest compression for each sketch
+        """
+        self._window_days = window_days
+        self._min_population = min_population
+        self._rebuild_interval = rebuild_interval
+        self._stale_fraction = stale_fraction
+        self._compression = compression
+        self._totals: dict[str, dict[str, float]] = {}
+        self._regions: dict[str, str] = {}
+        self._sketches: dict[tuple[str, str], TDigest] = {}
+        self._stale_updates = 0
+        self._last_rebuild: datetime | None = None
+        self._rebuild_claimed_at: datetime | None = None
+
+    @property
+    def population(self) -> int:
+        """Number of owners tracked by the index."""
+        return len(self._totals)
+
+    def window(self, today: date | None = None) -> tuple[date, date]:
+        """Get the trailing date window used for annualized totals.
+
+        Args:
+            today: Reference date (defaults to today)
+
+        Returns:
+            Tuple of (start_date, end_date), both inclusive
+        """
+        end = today or date.today()
+        return end - timedelta(days=self._window_days - 1), end
+
+    def load(
+        self,
+        totals: Iterable[tuple[str, str, float]],
+        now: datetime | None = None,
+    ) -> None:
+        """Replace all owner totals and rebuild every sketch.
+
+        Args:
+            totals: (owner_key, category, co2e_kg) rows for the current window
+            now: Time of the reload (defaults to current UTC time)
+        """
+        fresh: dict[str, dict[str, float]] = {}
+        for owner, category, co2e_kg in totals:
+            categories = fresh.setdefault(owner, {})
+            categories[category] = categories.get(category, 0.0) + co2e_kg
+        self._totals = fresh
+        self._last_rebuild = now or datetime.now(UTC)
+        self._rebuild_claimed_at = None
+        self._resketch()
+
+    def claim_rebuild(self, now: datetime | None = None) -> bool:
+        """Check whether a full reload is due and claim it.
+
+        Only one caller gets True per rebuild interval, so concurrent
+        requests do not start duplicate reloads.
+
+        Args:
+            now: Current time (defaults to current UTC time)
+
+        Returns:
+            True if the caller should reload the index
+        """
+        now = now or datetime.now(UTC)
+        if self._rebuild_claimed_at and (
+            now - self._rebuild_claimed_at < self._rebuild_interval
+        ):
+            return False
+        if self._last_rebuild and now - self._last_rebuild < self._rebuild_interval:
+            return False
+        self._rebuild_claimed_at = now
+        return True
+
+    def record(
+        self,
+        owner: str,
+        category: str,
+        co2e_delta_kg: float,
+        activity_date: date,
+        today: date | None = None,
+    ) -> None:
+        """Apply a change in an owner's emissions.
+
+        Args:
+            owner: Owner key
+            category: Activity category
+            co2e_delta_kg: Change in CO2e (negative for deletions)
+            activity_date: Date of the affected activity
+            today: Reference date for the trailing window
+        """
+        start, end = self.window(today)
+        if not start <= activity_date <= end or co2e_delta_kg == 0:
+            return
+
+        is_new = owner not in self._totals
+        categories = self._totals.setdefault(owner, {})
+        categories[category] = max(categories.get(category, 0.0) + co2e_delta_kg, 0.0)
+
+        if is_new:
+            for region in self._owner_regions(owner):
+                self._sketch(region, category).add(categories[category])
+                self._sketch(region, TOTAL_CATEGORY).add(categories[category])
+        else:
+            self._stale_updates += 1
+
+    def assign_region(self, owner: str, region: str) -> None:
+        """Place an owner in a regional population.
+
+        Args:
+            owner: Owner key
+            region: Region code the owner compares against
+        """
+        region = region.lower()
+        if region == GLOBAL_REGION or self._regions.get(owner) == region:
+            return
+        self._regions[owner] = region
+        if owner in self._totals:
+            self._stale_updates += 1
+
+    def merge_owner(self, source: str, target: str) -> None:
+        """Fold one owner's totals into another (e.g., session migration).
+
+        Args:
+            source: Owner key being merged away
+            target: Owner key receiving the totals
+        """
+        categories = self._totals.pop(source, None)
+        region = self._regions.pop(source, None)
+        if region and target not in self._regions:
+            self._regions[target] = region
+        if not categories:
+            return
+        merged = self._totals.setdefault(target, {})
+        for category, co2e_kg in categories.items():
+            merged[category] = merged.get(category, 0.0) + co2e_kg
+        self._stale_updates += 1
+
+    def remove_owner(self, owner: str) -> None:
+        """Drop an owner whose activities were removed (e.g., stale session).
+
+        Args:
+            owner: Owner key
+        """
+        self._regions.pop(owner, None)
+        if self._totals.pop(owner, None) is not None:
+            self._stale_updates += 1
+
+    def percentile(self, region: str, category: str, value: float) -> int | None:
+        """Get the percentile of an annualized footprint.
+
+        Args:
+            region: Region code
+            category: Activity category or TOTAL_CATEGORY
+            value: Annualized CO2e in kg
+
+        Returns:
+            Percentile (0-100), or None if the population is too small
+        """
+        if self._stale_updates > max(1, self._stale_fraction * len(self._totals)):
+            self._resketch()
+
+        sketch = self._sketches.get((region.lower(), category))
+        if sketch is None or sketch.count < self._min_population:
+            return None
+        percentile: int = round(sketch.cdf(value) * 100)
+        return min(max(percentile, 0), 100)
+
+    def _owner_regions(self, owner: str) -> list[str]:
+        """List the populations an owner belongs to."""
+        region = self._regions.get(owner)
+        return [GLOBAL_REGION, region] if region else [GLOBAL_REGION]
+
+    def _sketch(self, region: str, category: str) -> TDigest:
+        """Get or create the sketch for a (region, category) pair."""
+        key = (region, category)
+        if key not in self._sketches:
+            self._sketches[key] = TDigest(self._compression)
+        return self._sketches[key]
+
+    def _resketch(self) -> None:
+        """Rebuild all sketches from the in-memory owner totals."""
+        self._sketches = {}
+        for owner, categories in self._totals.items():
+            for region in self._owner_regions(owner):
+                for category, co2e_kg in categories.items():
+                    self._sketch(region, category).add(co2e_kg)
+                self._sketch(region, TOTAL_CATEGORY).add(sum(categories.values()))
+        self._stale_updates = 0
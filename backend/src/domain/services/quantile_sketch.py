@@ -0,0 +1,193 @@
+"""Mergeable quantile sketch (t-digest) for population percentiles."""
+
+from bisect import bisect_left, bisect_right
+
+
+class TDigest:
+    """Merging t-digest over a stream of weighted values.
+
+    Keeps a bounded number of centroids (roughly ``compression``) whose
+    sizes shrink towards the tails, so extreme percentiles stay accurate.
+    Values are buffered and merged in batches; queries run a binary search
+    over the sorted centroids, i.e. O(log n) in the number of centroids.
+
+    Pure data structure with no external dependencies. Two digests built
+    on different shards can be combined with ``merge``.
+    """
+
+    def __init__(self, compression: float = 100.0) -> None:
+        """Initialize an empty digest.
+
+        Args:
+            compression: Accuracy/size trade-off (higher keeps more centroids)
+
+        Raises:
+            ValueError: If compression is not positive
+        """
+        if compression <= 0:
+            raise ValueError("Compression must be positive")
+        self._compression = compression
+        self._buffer_limit = int(compression * 5)
+        self._means: list[float] = []
+        self._weights: list[float] = []
+        self._ranks: list[float] = []
+        self._buffer: list[tuple[float, float]] = []
+        self._total_weight = 0.0
+        self._min = float("inf")
+        self._max = float("-inf")
+
+    @property
+    def count(self) -> float:
+        """Total weight of all values added to the digest."""
+        return self._total_weight
+
+    @property
+    def centroid_count(self) -> int:
+        """Number of centroids after merging pending values."""
+        self._flush()
+        return len(self._means)
+
+    def add(self, value: float, weight: float = 1.0) -> None:
+        """Add a value to the digest.
+
+        Args:
+            value: Observed value
+            weight: Number of observations represented by the value
+
+        Raises:
+            ValueError: If weight is not positive
+        """
+        if weight <= 0:
+            raise ValueError("Weight must be positive")
+        self._buffer.append((value, weight))
+        self._total_weight += weight
+        self._min = min(self._min, value)
+        self._max = max(self._max, value)
+        if len(self._buffer) >= self._buffer_limit:
+            self._flush()
+
+    def merge(self, other: "TDigest") -> None:
+        """Merge another digest into this one.
+
+        Args:
+            other: Digest to absorb (left unchanged)
+        """
+        other._flush()
+        if not other._means:
+            return
+        self._buffer.extend(zip(other._means, other._weights))
+        self._total_weight += other._total_weight
+        self._min = min(self._min, other._min)
+        self._max = max(self._max, other._max)
+        self._flush()
+
+    def cdf(self, value: float) -> float:
+        """Estimate the fraction of observations below a value.
+
+        Args:
+            value: Value to rank
+
+        Returns:
+            Fraction in [0, 1]; 0.0 for an empty digest
+        """
+        self._flush()
+        if not self._means:
+            return 0.0
+        if value < self._min:
+            return 0.0
+        if value >= self._max:
+            return 1.0
+
+        # Piecewise-linear interpolation over (min, 0), centroid centres, (max, N)
+        index = bisect_right(self._means, value)
+        if index == 0:
+            x0, y0 = self._min, 0.0
+            x1, y1 = self._means[0], self._ranks[0]
+        elif index == len(self._means):
+            x0, y0 = self._means[-1], self._ranks[-1]
+            x1, y1 = self._max, self._total_weight
+        else:
+            x0, y0 = self._means[index - 1], self._ranks[index - 1]
+            x1, y1 = self._means[index], self._ranks[index]
+
+        if x1 == x0:
+            rank = y1
+        else:
+            rank = y0 + (y1 - y0) * (value - x0) / (x1 - x0)
+        return min(max(rank / self._total_weight, 0.0), 1.0)
+
+    def quantile(self, q: float) -> float:
+        """Estimate the value at a quantile.
+
+        Args:
+            q: Quantile in [0, 1]
+
+        Returns:
+            Estimated value at the quantile
+
+        Raises:
+            ValueError: If q is outside [0, 1] or the digest is empty
+        """
+        if not 0.0 <= q <= 1.0:
+            raise ValueError("Quantile must be between 0 and 1")
+        self._flush()
+        if not self._means:
+            raise ValueError("Cannot compute quantile of an empty digest")
+
+        target = q * self._total_weight
+        index = bisect_left(self._ranks, target)
+        if index == 0:
+            x0, y0 = self._min, 0.0
+            x1, y1 = self._means[0], self._ranks[0]
+        elif index == len(self._ranks):
+            x0, y0 = self._means[-1], self._ranks[-1]
+            x1, y1 = self._max, self._total_weight
+        else:
+            x0, y0 = self._means[index - 1], self._ranks[index - 1]
+            x1, y1 = self._means[index], self._ranks[index]
+
+        if y1 == y0:
+            return x1
+        return x0 + (x1 - x0) * (target - y0) / (y1 - y0)
+
+    def _flush(self) -> None:
+        """Merge buffered values into the centroid list."""
+        if not self._buffer:
+            return
+
+        points = sorted(
+            list(zip(self._means, self._weights)) + self._buffer,
+            key=lambda point: point[0],
+        )
+        self._buffer = []
+
+        means: list[float] = []
+        weights: list[float] = []
+        total = self._total_weight
+        cumulative = 0.0
+        current_mean, current_weight = points[0]
+
+        for mean, weight in points[1:]:
+            # Size bound from the k1 scale function: small centroids at the tails
+            q = (cumulative + (current_weight + weight) / 2) / total
+            limit = 4 * total * q * (1 - q) / self._compression
+            if current_weight + weight <= max(limit, 1.0):
+                merged = current_weight + weight
+                current_mean += (mean - current_mean) * weight / merged
+                current_weight = merged
+            else:
+                means.append(current_mean)
+                weights.append(current_weight)
+                cumulative += current_weight
+                current_mean, current_weight = mean, weight
+
+        means.append(current_mean)
+        weights.append(current_weight)
+
+        self._means = means
+        self._weights = weights
+        self._ranks = []
+        running = 0.0
+        for weight in weights:
+            self._ranks.append(running + weight / 2)
+            running += weight
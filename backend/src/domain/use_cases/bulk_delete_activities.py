@@ -0,0 +1,80 @@
+"""Use case for deleting many activities at once."""
+
+from uuid import UUID
+
+from domain.ports.activity_repository import (
+    WRITE_OK,
+    ActivityRepository,
+    ActivitySelection,
+    OwnedWriteResult,
+)
+from domain.ports.footprint_cache import FootprintCache
+from domain.services.owner_key import owner_key
+from domain.services.percentile_index import PopulationPercentileIndex
+
+
+class BulkDeleteActivitiesUseCase:
+    """Use case for deleting a selection of an owner's activities.
+
+    The selection is deleted with one owner-filtered statement; the
+    footprint cache is invalidated once for the whole batch.
+    """
+
+    def __init__(
+        self,
+        activity_repo: ActivityRepository,
+        percentile_index: PopulationPercentileIndex | None = None,
+        footprint_cache: FootprintCache | None = None,
+    ) -> None:
+        """Initialize use case with dependencies.
+
+        Args:
+            activity_repo: Repository for activity persistence
+            percentile_index: Optional population percentile index to update
+            footprint_cache: Optional footprint cache to invalidate on writes
+        """
+        self._activity_repo = activity_repo
+        self._percentile_index = percentile_index
+        self._footprint_cache = footprint_cache
+
+    async def execute(
+        self,
+        user_id: UUID | None,
+        session_id: str | None,
+        selection: ActivitySelection,
+    ) -> dict[UUID, OwnedWriteResult]:
+        """Execute the bulk delete use case.
+
+        Args:
+            user_id: User ID if authenticated
+            session_id: Session ID for anonymous users
+            selection: Activities to delete (IDs and/or filters)
+
+        Returns:
+            Outcome per activity
+
+        Raises:
+            ValueError: If the selection has neither IDs nor a filter
+        """
+        if selection.is_empty:
+            raise ValueError("Provide activity IDs or at least one filter")
+
+        results: dict[UUID, OwnedWriteResult]
+        results = await self._activity_repo.delete_many_owned(
+            user_id, session_id, selection
+        )
+
+        deleted = [
+            r.previous for r in results.values() if r.status == WRITE_OK and r.previous
+        ]
+        if deleted:
+            owner = owner_key(user_id, session_id)
+            if self._footprint_cache is not None:
+                await self._footprint_cache.invalidate(owner)
+            if self._percentile_index is not None:
+                for activity in deleted:
+                    self._percentile_index.record(
+                        owner, activity.category, -activity.co2e_kg, activity.date
+                    )
+
+        return results
@@ -0,0 +1,138 @@
+"""Use case for changing the type of many activities at once."""
+
+from functools import partial
+from uuid import UUID
+
+from domain.entities.activity import Activity
+from domain.ports.activity_repository import (
+    WRITE_OK,
+    ActivityRepository,
+    ActivitySelection,
+    OwnedWriteResult,
+)
+from domain.ports.emission_factor_repository import EmissionFactorRepository
+from domain.ports.footprint_cache import FootprintCache
+from domain.services.calculation_service import CalculationService
+from domain.services.owner_key import owner_key
+from domain.services.percentile_index import PopulationPercentileIndex
+
+
+class BulkUpdateActivitiesUseCase:
+    """Use case for changing the type of a selection of activities.
+
+    Orchestrates the process of:
+    1. Checking the new type exists
+    2. Recomputing the CO2e of each selected activity with the factor of
+       the new type in effect on its date, in one vectorized calculation
+    3. Updating type and CO2e of all selected activities in one statement
+    4. Invalidating the footprint cache once for the whole batch
+    """
+
+    def __init__(
+        self,
+        activity_repo: ActivityRepository,
+        emission_factor_repo: EmissionFactorRepository,
+        calculation_service: CalculationService,
+        percentile_index: PopulationPercentileIndex | None = None,
+        footprint_cache: FootprintCache | None = None,
+    ) -> None:
+        """Initialize use case with dependencies.
+
+        Args:
+            activity_repo: Repository for activity persistence
+            emission_factor_repo: Repository for emission factors
+            calculation_service: Service for CO2e calculations
+            percentile_index: Optional population percentile index to update
+            footprint_cache: Optional footprint cache to invalidate on writes
+        """
+        self._activity_repo = activity_repo
+        self._emission_factor_repo = emission_factor_repo
+        self._calculation_service = calculation_service
+        self._percentile_index = percentile_index
+        self._footprint_cache = footprint_cache
+
+    async def execute(
+        self,
+        user_id: UUID | None,
+        session_id: str | None,
+        selection: ActivitySelection,
+        activity_type: str,
+    ) -> dict[UUID, OwnedWriteResult]:
+        """Execute the bulk update use case.
+
+        Args:
+            user_id: User ID if authenticated
+            session_id: Session ID for anonymous users
+            selection: Activities to update (IDs and/or filters)
+            activity_type: New activity type (e.g., "car_diesel")
+
+        Returns:
+            Outcome per activity; CO2e of updated activities is recomputed
+            from their stored value and date
+
+        Raises:
+            ValueError: If the selection is empty or the type is unknown
+        """
+        if selection.is_empty:
+            raise ValueError("Provide activity IDs or at least one filter")
+
+        factor = await self._emission_factor_repo.get_by_type(activity_type)
+        if not factor:
+            raise ValueError(f"Unknown activity type: {activity_type}")
+
+        results: dict[UUID, OwnedWriteResult]
+        results = await self._activity_repo.update_type_many_owned(
+            user_id=user_id,
+            session_id=session_id,
+            selection=selection,
+            category=factor.category,
+            activity_type=activity_type,
+            co2e_for=partial(self._co2e_as, activity_type),
+        )
+
+        changed = [
+            (r.previous, r.activity)
+            for r in results.values()
+            if r.status == WRITE_OK and r.previous and r.activity
+        ]
+        if changed:
+            owner = owner_key(user_id, session_id)
+            if self._footprint_cache is not None:
+                await self._footprint_cache.invalidate(owner)
+            if self._percentile_index is not None:
+                for previous, activity in changed:
+                    self._percentile_index.record(
+                        owner, previous.category, -previous.co2e_kg, previous.date
+                    )
+                    self._percentile_index.record(
+                        owner, activity.category, activity.co2e_kg, activity.date
+                    )
+
+        return results
+
+    async def _co2e_as(
+        self, activity_type: str, activities: list[Activity]
+    ) -> list[float]:
+        """CO2e of activities as another type, with each date's factor.
+
+        Args:
+            activity_type: New activity type
+            activities: Activities to compute, read just before the update
+
+        Returns:
+            CO2e in kilograms per activity, in input order
+
+        Raises:
+            ValueError: If the type has no factor for one of the dates
+        """
+        factors = {}
+        for day in {activity.date for activity in activities}:
+            factor = await self._emission_factor_repo.get_by_type_on(activity_type, day)
+            if factor is None:
+                raise ValueError(f"Unknown activity type: {activity_type}")
+            factors[day] = factor
+        co2e: list[float] = self._calculation_service.calculate_co2e_many(
+            [activity.value for activity in activities],
+            [factors[activity.date] for activity in activities],
+        )
+        return co2e
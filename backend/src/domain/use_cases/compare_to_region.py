@@ -4,10 +4,17 @@ from dataclasses import dataclass
 from datetime import date
 from uuid import UUID
 
+from domain.entities.region import RegionalAverage
 from domain.ports.activity_repository import ActivityRepository
+from domain.ports.footprint_cache import FootprintCache
 from domain.ports.region_data_provider import RegionDataProvider
 from domain.services.aggregation_service import AggregationService
 from domain.services.comparison_service import ComparisonService
+from domain.services.owner_key import owner_key
+from domain.services.percentile_index import (
+    TOTAL_CATEGORY,
+    PopulationPercentileIndex,
+)
 
 
 @dataclass
@@ -27,6 +34,21 @@ class CompareToRegionInput:
     period: str = "year"
 
 
+@dataclass
+class OwnerPeriodTotals:
+    """Owner's CO2e over a period, the cached part of a comparison.
+
+    Attributes:
+        total_co2e_kg: Total CO2e of the period
+        by_category: CO2e per category
+        activity_count: Activities in the period
+    """
+
+    total_co2e_kg: float
+    by_category: dict[str, float]
+    activity_count: int
+
+
 @dataclass
 class ComparisonResult:
     """Result of regional comparison.
@@ -51,6 +73,11 @@ class CompareToRegionUseCase:
     1. Retrieving regional benchmark data
     2. Calculating user's footprint for the period
     3. Computing comparison metrics and insights
+
+    When a percentile index is provided, the percentile is ranked against
+    the annualized footprints of other owners in the region; otherwise (or
+    while the population is too small) it is estimated from the ratio to
+    the regional average.
     """
 
     def __init__(
@@ -59,6 +86,8 @@ class CompareToRegionUseCase:
         region_provider: RegionDataProvider,
         aggregation_service: AggregationService,
         comparison_service: ComparisonService,
+        percentile_index: PopulationPercentileIndex | None = None,
+        footprint_cache: FootprintCache | None = None,
     ) -> None:
         """Initialize use case with dependencies.
 
@@ -67,11 +96,15 @@ class CompareToRegionUseCase:
             region_provider: Provider for regional averages
             aggregation_service: Service for footprint calculations
             comparison_service: Service for comparison metrics
+            percentile_index: Optional population percentile index
+            footprint_cache: Optional cache for computed results
         """
         self._activity_repo = activity_repo
         self._region_provider = region_provider
         self._aggregation_service = aggregation_service
         self._comparison_service = comparison_service
+        self._percentile_index = percentile_index
+        self._footprint_cache = footprint_cache
 
     async def execute(self, input_data: CompareToRegionInput) -> ComparisonResult:
         """Execute comparison use case.
@@ -95,26 +128,98 @@ class CompareToRegionUseCase:
             input_data.period
         )
 
+        totals = await self._owner_totals(input_data, start_date, end_date)
+        return self._compare(input_data, region, totals, start_date, end_date)
+
+    async def _owner_totals(
+        self, input_data: CompareToRegionInput, start_date: date, end_date: date
+    ) -> OwnerPeriodTotals:
+        """Get the owner's totals for the period, from the cache if possible.
+
+        Only the owner's own totals are cached: they change with the
+        owner's data version, while the population percentile changes
+        with other owners' writes and index rebuilds.
+
+        Args:
+            input_data: Comparison input parameters
+            start_date: Start of the period
+            end_date: End of the period
+
+        Returns:
+            Owner's CO2e totals for the period
+        """
+        if self._footprint_cache is None:
+            return await self._compute_totals(input_data, start_date, end_date)
+
+        totals: OwnerPeriodTotals = await self._footprint_cache.get_or_compute(
+            owner_key(input_data.user_id, input_data.session_id),
+            f"period_totals:{start_date}:{end_date}",
+            lambda: self._compute_totals(input_data, start_date, end_date),
+        )
+        return totals
+
+    async def _compute_totals(
+        self, input_data: CompareToRegionInput, start_date: date, end_date: date
+    ) -> OwnerPeriodTotals:
+        """Sum the owner's persisted activities of the period.
+
+        Args:
+            input_data: Comparison input parameters
+            start_date: Start of the period
+            end_date: End of the period
+
+        Returns:
+            Owner's CO2e totals for the period
+        """
         activities = await self._activity_repo.list_by_date_range(
             user_id=input_data.user_id,
             session_id=input_data.session_id,
             start_date=start_date,
             end_date=end_date,
         )
-
-        user_total = self._aggregation_service.calculate_total_co2e(activities)
-        user_breakdown = self._aggregation_service.calculate_breakdown_by_category(
-            activities
+        return OwnerPeriodTotals(
+            total_co2e_kg=self._aggregation_service.calculate_total_co2e(activities),
+            by_category=self._aggregation_service.calculate_breakdown_by_category(
+                activities
+            ),
+            activity_count=len(activities),
         )
 
+    def _compare(
+        self,
+        input_data: CompareToRegionInput,
+        region: RegionalAverage,
+        totals: OwnerPeriodTotals,
+        start_date: date,
+        end_date: date,
+    ) -> ComparisonResult:
+        """Compare the owner's totals to the region and its population.
+
+        Args:
+            input_data: Comparison input parameters
+            region: Regional benchmark to compare against
+            totals: Owner's CO2e totals for the period
+            start_date: Start of the period
+            end_date: End of the period
+
+        Returns:
+            Comparison result with metrics and insights
+        """
+        user_total = totals.total_co2e_kg
+        user_breakdown = totals.by_category
+
         # Calculate comparison metrics
         diff_kg, diff_pct = self._comparison_service.calculate_difference(
             user_total, region.average_annual_co2e_kg
         )
 
-        percentile = self._comparison_service.calculate_percentile(
-            user_total, region.average_annual_co2e_kg
+        percentile = self._population_percentile(
+            input_data, region.code, user_total, start_date, end_date
         )
+        if percentile is None:
+            percentile = self._comparison_service.calculate_percentile(
+                user_total, region.average_annual_co2e_kg
+            )
 
         rating = self._comparison_service.get_rating(percentile)
 
@@ -129,7 +234,7 @@ class CompareToRegionUseCase:
                 "total_co2e_kg": user_total,
                 "start_date": start_date,
                 "end_date": end_date,
-                "activity_count": len(activities),
+                "activity_count": totals.activity_count,
             },
             regional_average={
                 "region_code": region.code,
@@ -148,3 +253,36 @@ class CompareToRegionUseCase:
                 "regional_avg_by_category": region.breakdown,
             },
         )
+
+    def _population_percentile(
+        self,
+        input_data: CompareToRegionInput,
+        region_code: str,
+        user_total: float,
+        start_date: date,
+        end_date: date,
+    ) -> int | None:
+        """Rank the user's annualized footprint within the region population.
+
+        Args:
+            input_data: Comparison input parameters
+            region_code: Region to rank against
+            user_total: User's CO2e for the period
+            start_date: Start of the period
+            end_date: End of the period
+
+        Returns:
+            Percentile (0-100), or None if no index or population too small
+        """
+        if self._percentile_index is None:
+            return None
+
+        self._percentile_index.assign_region(
+            owner_key(input_data.user_id, input_data.session_id), region_code
+        )
+        period_days = (end_date - start_date).days + 1
+        annualized = user_total * 365 / period_days
+        percentile: int | None = self._percentile_index.percentile(
+            region_code, TOTAL_CATEGORY, annualized
+        )
+        return percentile
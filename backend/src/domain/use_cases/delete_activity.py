@@ -2,24 +2,40 @@
 
 from uuid import UUID
 
-from domain.ports.activity_repository import ActivityRepository
+from domain.ports.activity_repository import (
+    WRITE_FORBIDDEN,
+    WRITE_NOT_FOUND,
+    WRITE_OK,
+    ActivityRepository,
+)
+from domain.ports.footprint_cache import FootprintCache
+from domain.services.owner_key import owner_key
+from domain.services.percentile_index import PopulationPercentileIndex
 
 
 class DeleteActivityUseCase:
     """Use case for deleting an existing activity.
 
-    Orchestrates the process of:
-    1. Verifying activity exists and user has permission
-    2. Deleting the activity from the repository
+    Deletes the activity with a write filtered on its owner, so
+    existence and permission are checked without a separate lookup.
     """
 
-    def __init__(self, activity_repo: ActivityRepository) -> None:
+    def __init__(
+        self,
+        activity_repo: ActivityRepository,
+        percentile_index: PopulationPercentileIndex | None = None,
+        footprint_cache: FootprintCache | None = None,
+    ) -> None:
         """Initialize use case with dependencies.
 
         Args:
             activity_repo: Repository for activity persistence
+            percentile_index: Optional population percentile index to update
+            footprint_cache: Optional footprint cache to invalidate on writes
         """
         self._activity_repo = activity_repo
+        self._percentile_index = percentile_index
+        self._footprint_cache = footprint_cache
 
     async def execute(
         self,
@@ -38,20 +54,23 @@ class DeleteActivityUseCase:
             ValueError: If activity not found
             PermissionError: If user doesn't own this activity
         """
-        # Fetch existing activity
-        existing = await self._activity_repo.get_by_id(activity_id)
-        if not existing:
+        # Delete guarded by owner in the same write
+        result = await self._activity_repo.delete_owned(
+            activity_id, user_id, session_id
+        )
+        if result.status == WRITE_NOT_FOUND:
             raise ValueError(f"Activity not found: {activity_id}")
-
-        # Authorization: Check ownership
-        if user_id:
-            if existing.user_id != user_id:
-                raise PermissionError("Not authorized to delete this activity")
-        else:
-            if existing.session_id != session_id:
-                raise PermissionError("Not authorized to delete this activity")
-
-        # Delete from repository
-        deleted = await self._activity_repo.delete(activity_id)
-        if not deleted:
+        if result.status == WRITE_FORBIDDEN:
+            raise PermissionError("Not authorized to delete this activity")
+        if result.status != WRITE_OK or not result.previous:
             raise ValueError(f"Failed to delete activity: {activity_id}")
+
+        existing = result.previous
+        owner = owner_key(existing.user_id, existing.session_id)
+
+        if self._footprint_cache is not None:
+            await self._footprint_cache.invalidate(owner)
+        if self._percentile_index is not None:
+            self._percentile_index.record(
+                owner, existing.category, -existing.co2e_kg, existing.date
+            )
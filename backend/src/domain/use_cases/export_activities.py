@@ -0,0 +1,62 @@
+"""Use case for exporting an owner's full activity history."""
+
+from collections.abc import AsyncIterator
+from uuid import UUID
+
+from domain.entities.activity import Activity
+from domain.ports.activity_repository import ActivityRepository
+
+
+class ExportActivitiesUseCase:
+    """Stream all activities of a user or session in chunks.
+
+    Pages through the owner's activities by ID, so each chunk is read
+    only when the consumer asks for it and memory stays bounded by the
+    chunk size however long the history is.
+    """
+
+    def __init__(
+        self, activity_repo: ActivityRepository, chunk_size: int = 1000
+    ) -> None:
+        """Initialize use case with dependencies.
+
+        Args:
+            activity_repo: Repository for activity persistence
+            chunk_size: Activities read per repository call
+        """
+        self._activity_repo = activity_repo
+        self._chunk_size = chunk_size
+
+    def execute(
+        self, user_id: UUID | None, session_id: str | None
+    ) -> AsyncIterator[list[Activity]]:
+        """Stream the owner's activities.
+
+        Args:
+            user_id: User ID if authenticated
+            session_id: Session ID for anonymous users
+
+        Returns:
+            Async iterator of non-empty chunks in ID order
+
+        Raises:
+            ValueError: If neither user_id nor session_id is provided
+        """
+        if user_id is None and session_id is None:
+            raise ValueError("Either user_id or session_id must be provided")
+        return self._chunks(user_id, session_id)
+
+    async def _chunks(
+        self, user_id: UUID | None, session_id: str | None
+    ) -> AsyncIterator[list[Activity]]:
+        """Yield chunks until a short page marks the end."""
+        after_id: UUID | None = None
+        while True:
+            chunk = await self._activity_repo.list_owned_after_id(
+                user_id, session_id, after_id, self._chunk_size
+            )
+            if chunk:
+                yield chunk
+            if len(chunk) < self._chunk_size:
+                return
+            after_id = chunk[-1].id
@@ -6,7 +6,9 @@ from typing import Optional
 from uuid import UUID
 
 from domain.ports.activity_repository import ActivityRepository
+from domain.ports.footprint_cache import FootprintCache
 from domain.services.aggregation_service import AggregationService
+from domain.services.owner_key import owner_key
 
 
 @dataclass
@@ -70,15 +72,18 @@ class GetFootprintBreakdownUseCase:
         self,
         activity_repo: ActivityRepository,
         aggregation_service: AggregationService,
+        footprint_cache: FootprintCache | None = None,
     ) -> None:
         """Initialize with dependencies.
 
         Args:
             activity_repo: Activity persistence port
             aggregation_service: Aggregation calculations service
+            footprint_cache: Optional cache for computed results
         """
         self._activity_repo = activity_repo
         self._aggregation_service = aggregation_service
+        self._footprint_cache = footprint_cache
 
     async def execute(
         self, input_data: GetFootprintBreakdownInput
@@ -99,6 +104,29 @@ class GetFootprintBreakdownUseCase:
                 input_data.period
             )
 
+        if self._footprint_cache is None:
+            return await self._compute(input_data, start_date, end_date)
+
+        result: FootprintBreakdown = await self._footprint_cache.get_or_compute(
+            owner_key(input_data.user_id, input_data.session_id),
+            f"breakdown:{input_data.period}:{start_date}:{end_date}",
+            lambda: self._compute(input_data, start_date, end_date),
+        )
+        return result
+
+    async def _compute(
+        self, input_data: GetFootprintBreakdownInput, start_date: date, end_date: date
+    ) -> FootprintBreakdown:
+        """Compute the breakdown from persisted activities.
+
+        Args:
+            input_data: Input with period and user/session info
+            start_date: Resolved start of period
+            end_date: Resolved end of period
+
+        Returns:
+            FootprintBreakdown with category-level data
+        """
         activities = await self._activity_repo.list_by_date_range(
             user_id=input_data.user_id,
             session_id=input_data.session_id,
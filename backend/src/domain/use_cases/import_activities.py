@@ -0,0 +1,313 @@
+"""Use case for importing many activities at once."""
+
+import math
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass, field
+from datetime import UTC, date, datetime
+from uuid import UUID, uuid4
+
+from domain.entities.activity import Activity
+from domain.entities.emission_factor import EmissionFactor
+from domain.ports.activity_repository import ActivityRepository
+from domain.ports.emission_factor_repository import EmissionFactorRepository
+from domain.services.calculation_service import CalculationService
+from domain.use_cases.log_activity import LogActivityUseCase
+
+# Same limits as activities logged one at a time
+MAX_VALUE = 100000
+MAX_TYPE_LENGTH = 100
+MAX_NOTES_LENGTH = 500
+
+REQUIRED_FIELDS = ("date", "type", "value")
+
+
+@dataclass(frozen=True)
+class ImportRow:
+    """One record of an import file.
+
+    Attributes:
+        line: Line number in the source file, for the report
+        fields: Raw field values by column name
+        error: Why the record could not be read, if it could not
+    """
+
+    line: int
+    fields: Mapping[str | None, str | None]
+    error: str | None = None
+
+
+@dataclass(frozen=True)
+class RejectedRow:
+    """A record that was not imported.
+
+    Attributes:
+        line: Line number in the source file
+        reason: Why the record was rejected
+    """
+
+    line: int
+    reason: str
+
+
+@dataclass
+class ImportReport:
+    """Outcome of an import.
+
+    Attributes:
+        imported: Activities saved
+        rejected: Records refused
+        rejected_rows: First rejected records with reasons (capped)
+    """
+
+    imported: int = 0
+    rejected: int = 0
+    rejected_rows: list[RejectedRow] = field(default_factory=list)
+
+
+@dataclass(frozen=True)
+class ParsedImportRow:
+    """A record whose fields passed validation.
+
+    Attributes:
+        activity_date: Date of the activity
+        activity_type: Emission factor type to apply
+        value: Activity amount in the factor's unit
+        category: Category named in the record, if any
+        notes: Optional notes
+    """
+
+    activity_date: date
+    activity_type: str
+    value: float
+    category: str | None
+    notes: str | None
+
+
+def parse_import_row(row: ImportRow) -> ParsedImportRow:
+    """Validate the fields of one record.
+
+    Column names are matched case-insensitively and values are stripped.
+
+    Args:
+        row: Record as read from the file
+
+    Returns:
+        Typed field values
+
+    Raises:
+        ValueError: Describing the first problem found
+    """
+    if row.error is not None:
+        raise ValueError(row.error)
+
+    fields = {
+        key.strip().lower(): (value or "").strip()
+        for key, value in row.fields.items()
+        if key is not None
+    }
+    for name in REQUIRED_FIELDS:
+        if not fields.get(name):
+            raise ValueError(f"Missing {name}")
+
+    try:
+        activity_date = date.fromisoformat(fields["date"])
+    except ValueError:
+        raise ValueError(f"Invalid date: {fields['date']}") from None
+
+    try:
+        value = float(fields["value"])
+    except ValueError:
+        raise ValueError(f"Invalid value: {fields['value']}") from None
+    if not math.isfinite(value) or not 0 < value <= MAX_VALUE:
+        raise ValueError(f"Value must be greater than 0 and at most {MAX_VALUE}")
+
+    activity_type = fields["type"]
+    if len(activity_type) > MAX_TYPE_LENGTH:
+        raise ValueError(f"Type longer than {MAX_TYPE_LENGTH} characters")
+
+    notes = fields.get("notes") or None
+    if notes is not None and len(notes) > MAX_NOTES_LENGTH:
+        raise ValueError(f"Notes longer than {MAX_NOTES_LENGTH} characters")
+
+    return ParsedImportRow(
+        activity_date=activity_date,
+        activity_type=activity_type,
+        value=value,
+        category=fields.get("category") or None,
+        notes=notes,
+    )
+
+
+def match_emission_factor(
+    parsed: ParsedImportRow, factor: EmissionFactor | None
+) -> EmissionFactor:
+    """Check the factor found for a record's type and date applies to it.
+
+    Args:
+        parsed: Validated record
+        factor: Factor of the record's type valid on its date, if any
+
+    Returns:
+        The factor
+
+    Raises:
+        ValueError: If the type is unknown or the record names another category
+    """
+    if factor is None:
+        raise ValueError(f"Unknown activity type: {parsed.activity_type}")
+    if parsed.category and parsed.category != factor.category:
+        raise ValueError(
+            f"Activity type '{parsed.activity_type}' does not belong to category "
+            f"'{parsed.category}'"
+        )
+    return factor
+
+
+@dataclass(frozen=True)
+class _ValidRow:
+    """A validated record waiting for its batch."""
+
+    factor: EmissionFactor
+    value: float
+    activity_date: date
+    notes: str | None
+
+
+class ImportActivitiesUseCase:
+    """Import activities from a stream of records.
+
+    Orchestrates the process of:
+    1. Validating each record against the emission factor catalog
+    2. Calculating CO2e for a batch of valid records in one call
+    3. Saving each batch with one multi-row write
+
+    Records are consumed one by one, so memory holds one batch and a
+    capped list of rejected lines regardless of the input size.
+    """
+
+    def __init__(
+        self,
+        activity_repo: ActivityRepository,
+        emission_factor_repo: EmissionFactorRepository,
+        calculation_service: CalculationService,
+        log_activity: LogActivityUseCase,
+        batch_size: int = 500,
+        max_reported_rejections: int = 100,
+    ) -> None:
+        """Initialize use case with dependencies.
+
+        Args:
+            activity_repo: Repository for persisting activities
+            emission_factor_repo: Repository for emission factors (cached)
+            calculation_service: Service for CO2e calculations
+            log_activity: Use case whose record_saved() updates derived state
+            batch_size: Records calculated and saved together
+            max_reported_rejections: Rejected records listed in the report
+        """
+        self._activity_repo = activity_repo
+        self._emission_factor_repo = emission_factor_repo
+        self._calculation_service = calculation_service
+        self._log_activity = log_activity
+        self._batch_size = batch_size
+        self._max_reported_rejections = max_reported_rejections
+
+    async def execute(
+        self,
+        rows: Iterable[ImportRow],
+        user_id: UUID | None,
+        session_id: str | None,
+    ) -> ImportReport:
+        """Execute the import.
+
+        Valid records are saved even when others are rejected. Batches
+        saved before a storage error stay saved.
+
+        Args:
+            rows: Records to import, read lazily
+            user_id: User ID if authenticated
+            session_id: Session ID for anonymous users
+
+        Returns:
+            Counts of imported and rejected records
+
+        Raises:
+            ValueError: If neither user_id nor session_id is provided
+        """
+        if user_id is None and session_id is None:
+            raise ValueError("Either user_id or session_id must be provided")
+
+        report = ImportReport()
+        batch: list[_ValidRow] = []
+        for row in rows:
+            try:
+                batch.append(await self._validate(row))
+            except ValueError as e:
+                self._reject(report, row.line, str(e))
+                continue
+
+            if len(batch) >= self._batch_size:
+                await self._save(batch, user_id, session_id, report)
+                batch = []
+
+        if batch:
+            await self._save(batch, user_id, session_id, report)
+        return report
+
+    async def _validate(self, row: ImportRow) -> _ValidRow:
+        """Check one record and resolve its emission factor.
+
+        Raises:
+            ValueError: Describing the first problem found
+        """
+        parsed = parse_import_row(row)
+        factor = match_emission_factor(
+            parsed,
+            await self._emission_factor_repo.get_by_type_on(
+                parsed.activity_type, parsed.activity_date
+            ),
+        )
+        return _ValidRow(
+            factor=factor,
+            value=parsed.value,
+            activity_date=parsed.activity_date,
+            notes=parsed.notes,
+        )
+
+    async def _save(
+        self,
+        batch: list[_ValidRow],
+        user_id: UUID | None,
+        session_id: str | None,
+        report: ImportReport,
+    ) -> None:
+        """Calculate and save one batch of validated records."""
+        co2e = self._calculation_service.calculate_co2e_many(
+            [row.value for row in batch], [row.factor for row in batch]
+        )
+        now = datetime.now(UTC)
+        activities = [
+            Activity(
+                id=uuid4(),
+                category=row.factor.category,
+                type=row.factor.type,
+                value=row.value,
+                co2e_kg=co2e_kg,
+                date=row.activity_date,
+                notes=row.notes,
+                metadata=None,
+                user_id=user_id,
+                session_id=session_id,
+                created_at=now,
+            )
+            for row, co2e_kg in zip(batch, co2e, strict=True)
+        ]
+
+        saved = await self._activity_repo.save_many(activities)
+        await self._log_activity.record_saved(saved)
+        report.imported += len(saved)
+
+    def _reject(self, report: ImportReport, line: int, reason: str) -> None:
+        """Count a rejected record and list it while under the cap."""
+        report.rejected += 1
+        if len(report.rejected_rows) < self._max_reported_rejections:
+            report.rejected_rows.append(RejectedRow(line=line, reason=reason))
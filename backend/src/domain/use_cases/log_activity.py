@@ -4,9 +4,13 @@ from datetime import date, datetime, timezone
 from uuid import UUID, uuid4
 
 from domain.entities.activity import Activity
+from domain.ports.activity_ingestion_queue import ActivityIngestionQueue
 from domain.ports.activity_repository import ActivityRepository
 from domain.ports.emission_factor_repository import EmissionFactorRepository
+from domain.ports.footprint_cache import FootprintCache
 from domain.services.calculation_service import CalculationService
+from domain.services.owner_key import owner_key
+from domain.services.percentile_index import PopulationPercentileIndex
 
 
 class LogActivityUseCase:
@@ -16,6 +20,9 @@ class LogActivityUseCase:
     1. Retrieving the emission factor for the activity type
     2. Calculating CO2e emissions
     3. Creating and persisting the activity
+
+    With an ingestion queue, the computed activity is queued and written
+    later in a batch; the queue's flush then calls record_saved().
     """
 
     def __init__(
@@ -23,6 +30,9 @@ class LogActivityUseCase:
         activity_repo: ActivityRepository,
         emission_factor_repo: EmissionFactorRepository,
         calculation_service: CalculationService,
+        percentile_index: PopulationPercentileIndex | None = None,
+        footprint_cache: FootprintCache | None = None,
+        ingestion_queue: ActivityIngestionQueue | None = None,
     ) -> None:
         """Initialize use case with dependencies.
 
@@ -30,10 +40,17 @@ class LogActivityUseCase:
             activity_repo: Repository for persisting activities
             emission_factor_repo: Repository for retrieving emission factors
             calculation_service: Service for CO2e calculations
+            percentile_index: Optional population percentile index to update
+            footprint_cache: Optional footprint cache to invalidate on writes
+            ingestion_queue: Optional write-behind queue used instead of
+                saving each activity synchronously
         """
         self._activity_repo = activity_repo
         self._emission_factor_repo = emission_factor_repo
         self._calculation_service = calculation_service
+        self._percentile_index = percentile_index
+        self._footprint_cache = footprint_cache
+        self._ingestion_queue = ingestion_queue
 
     async def execute(
         self,
@@ -63,11 +80,14 @@ class LogActivityUseCase:
 
         Raises:
             ValueError: If activity type is unknown or user/session not provided
+            IngestionQueueFullError: If queued ingestion is saturated
         """
         if user_id is None and session_id is None:
             raise ValueError("Either user_id or session_id must be provided")
 
-        factor = await self._emission_factor_repo.get_by_type(activity_type)
+        factor = await self._emission_factor_repo.get_by_type_on(
+            activity_type, activity_date
+        )
         if not factor:
             raise ValueError(f"Unknown activity type: {activity_type}")
 
@@ -87,4 +107,33 @@ class LogActivityUseCase:
             created_at=datetime.now(timezone.utc),
         )
 
-        return await self._activity_repo.save(activity)
+        if self._ingestion_queue is not None:
+            await self._ingestion_queue.submit(activity)
+            return activity
+
+        saved = await self._activity_repo.save(activity)
+        await self.record_saved([saved])
+        return saved
+
+    async def record_saved(self, activities: list[Activity]) -> None:
+        """Update derived state once activities are persisted.
+
+        Invalidates the footprint cache of each owner once and adds the
+        activities to the percentile index.
+
+        Args:
+            activities: Activities that were written
+        """
+        owners = []
+        for activity in activities:
+            owner = owner_key(activity.user_id, activity.session_id)
+            if owner not in owners:
+                owners.append(owner)
+            if self._percentile_index is not None:
+                self._percentile_index.record(
+                    owner, activity.category, activity.co2e_kg, activity.date
+                )
+
+        if self._footprint_cache is not None:
+            for owner in owners:
+                await self._footprint_cache.invalidate(owner)
@@ -0,0 +1,92 @@
+"""Use case for logging a flight from its airport codes."""
+
+from datetime import date
+from uuid import UUID
+
+from domain.entities.activity import Activity
+from domain.use_cases.calculate_flight import (
+    CalculateFlightInput,
+    CalculateFlightUseCase,
+)
+from domain.use_cases.log_activity import LogActivityUseCase
+
+FLIGHT_CATEGORY = "transport"
+
+
+class LogFlightUseCase:
+    """Log a flight given only its origin and destination airports.
+
+    Orchestrates the process of:
+    1. Computing distance and flight type from the airport index
+    2. Logging a transport activity of that type and distance, which
+       applies the matching flight_* emission factor
+    """
+
+    def __init__(
+        self,
+        calculate_flight: CalculateFlightUseCase,
+        log_activity: LogActivityUseCase,
+    ) -> None:
+        """Initialize use case with dependencies.
+
+        Args:
+            calculate_flight: Use case resolving airports to distance and type
+            log_activity: Use case calculating and persisting the activity
+        """
+        self._calculate_flight = calculate_flight
+        self._log_activity = log_activity
+
+    async def execute(
+        self,
+        origin_iata: str,
+        destination_iata: str,
+        activity_date: date,
+        notes: str | None,
+        user_id: UUID | None,
+        session_id: str | None,
+        metadata: dict | None = None,
+    ) -> Activity:
+        """Execute the log flight use case.
+
+        Args:
+            origin_iata: Origin airport IATA code
+            destination_iata: Destination airport IATA code
+            activity_date: Date of the flight
+            notes: Optional user notes
+            user_id: User ID if authenticated
+            session_id: Session ID for anonymous users
+            metadata: Optional extra metadata (e.g., airport names) kept
+                alongside the computed flight details
+
+        Returns:
+            Created Activity entity with calculated CO2e
+
+        Raises:
+            ValueError: If an airport is unknown, the flight type has no
+                emission factor, or user/session not provided
+            IngestionQueueFullError: If queued ingestion is saturated
+        """
+        flight = await self._calculate_flight.execute(
+            CalculateFlightInput(
+                origin_iata=origin_iata.upper(),
+                destination_iata=destination_iata.upper(),
+            )
+        )
+
+        return await self._log_activity.execute(
+            category=FLIGHT_CATEGORY,
+            activity_type=flight.flight_type,
+            value=flight.distance_km,
+            activity_date=activity_date,
+            notes=notes,
+            user_id=user_id,
+            session_id=session_id,
+            metadata={
+                **(metadata or {}),
+                "origin_iata": flight.origin_iata,
+                "destination_iata": flight.destination_iata,
+                "distance_km": flight.distance_km,
+                "flight_type": flight.flight_type,
+                "is_domestic": flight.is_domestic,
+            },
+        )
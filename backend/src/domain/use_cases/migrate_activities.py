@@ -3,6 +3,9 @@
 from uuid import UUID
 
 from domain.ports.activity_repository import ActivityRepository
+from domain.ports.footprint_cache import FootprintCache
+from domain.services.owner_key import owner_key
+from domain.services.percentile_index import PopulationPercentileIndex
 
 
 class MigrateActivitiesUseCase:
@@ -12,13 +15,22 @@ class MigrateActivitiesUseCase:
     (identified by session_id) are linked to their authenticated account.
     """
 
-    def __init__(self, activity_repo: ActivityRepository):
+    def __init__(
+        self,
+        activity_repo: ActivityRepository,
+        percentile_index: PopulationPercentileIndex | None = None,
+        footprint_cache: FootprintCache | None = None,
+    ):
         """Initialize with activity repository.
 
         Args:
             activity_repo: Activity persistence port
+            percentile_index: Optional population percentile index to update
+            footprint_cache: Optional footprint cache to invalidate on writes
         """
         self._activity_repo = activity_repo
+        self._percentile_index = percentile_index
+        self._footprint_cache = footprint_cache
 
     async def execute(self, user_id: UUID, session_id: str) -> int:
         """Link all activities with session_id to user_id.
@@ -33,7 +45,21 @@ class MigrateActivitiesUseCase:
         if not session_id:
             return 0
 
-        return await self._activity_repo.migrate_session_to_user(
+        migrated = await self._activity_repo.migrate_session_to_user(
             user_id=user_id,
             session_id=session_id,
         )
+
+        if not migrated:
+            return 0
+
+        session_owner = owner_key(None, session_id)
+        user_owner = owner_key(user_id, None)
+
+        if self._footprint_cache is not None:
+            await self._footprint_cache.invalidate(session_owner)
+            await self._footprint_cache.invalidate(user_owner)
+        if self._percentile_index is not None:
+            self._percentile_index.merge_owner(session_owner, user_owner)
+
+        return migrated
@@ -0,0 +1,47 @@
+"""Use case for reloading the population percentile index."""
+
+from datetime import date
+
+from domain.ports.activity_repository import ActivityRepository
+from domain.services.owner_key import owner_key
+from domain.services.percentile_index import PopulationPercentileIndex
+
+
+class RebuildPercentileIndexUseCase:
+    """Reload per-owner footprint totals into the percentile index.
+
+    Run periodically so the trailing window advances and changes made
+    by other workers are picked up.
+    """
+
+    def __init__(
+        self,
+        activity_repo: ActivityRepository,
+        percentile_index: PopulationPercentileIndex,
+    ) -> None:
+        """Initialize use case with dependencies.
+
+        Args:
+            activity_repo: Repository for activity aggregates
+            percentile_index: Index to reload
+        """
+        self._activity_repo = activity_repo
+        self._percentile_index = percentile_index
+
+    async def execute(self, today: date | None = None) -> int:
+        """Reload the index from persisted activities.
+
+        Args:
+            today: Reference date for the trailing window (defaults to today)
+
+        Returns:
+            Number of owners in the rebuilt index
+        """
+        start_date, end_date = self._percentile_index.window(today)
+        totals = await self._activity_repo.list_owner_totals(start_date, end_date)
+
+        self._percentile_index.load(
+            (owner_key(t.user_id, t.session_id), t.category, t.co2e_kg) for t in totals
+        )
+        population: int = self._percentile_index.population
+        return population
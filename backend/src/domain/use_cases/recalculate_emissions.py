@@ -0,0 +1,256 @@
+"""Use case for recalculating stored CO2e after emission factor revisions."""
+
+from dataclasses import replace
+from functools import partial
+from uuid import UUID
+
+from domain.entities.activity import Activity
+from domain.entities.emission_factor import EmissionFactor
+from domain.ports.activity_repository import WRITE_OK, ActivityRepository
+from domain.ports.emission_factor_repository import EmissionFactorRepository
+from domain.ports.footprint_cache import FootprintCache
+from domain.ports.recalculation_checkpoint_store import (
+    RecalculationCheckpoint,
+    RecalculationCheckpointStore,
+)
+from domain.services.calculation_service import CalculationService
+from domain.services.emission_factor_index import EmissionFactorIndex
+from domain.services.owner_key import owner_key
+from domain.services.percentile_index import PopulationPercentileIndex
+
+# Size of the UUID key space, split evenly between shards
+_UUID_SPACE = 1 << 128
+
+
+def shard_bounds(index: int, count: int) -> tuple[UUID | None, UUID | None]:
+    """Split the activity ID space into contiguous shards.
+
+    Args:
+        index: Zero-based shard number
+        count: Total number of shards
+
+    Returns:
+        (after_id, before_id) keyset bounds of the shard; None means open
+
+    Raises:
+        ValueError: If index is outside range(count)
+    """
+    if count < 1 or not 0 <= index < count:
+        raise ValueError(f"Invalid shard {index} of {count}")
+
+    start = _UUID_SPACE * index // count
+    end = _UUID_SPACE * (index + 1) // count
+    after_id = UUID(int=start - 1) if index > 0 else None
+    before_id = UUID(int=end) if index < count - 1 else None
+    return after_id, before_id
+
+
+class RecalculateEmissionsUseCase:
+    """Recompute stored CO2e of activities with current emission factors.
+
+    Orchestrates the process of:
+    1. Streaming activities in ID order, one batch at a time
+    2. Recomputing CO2e with the factor version in effect on each
+       activity's date, one calculation per factor and batch
+    3. Writing only changed values with one set-based update, guarded
+       against concurrent edits (changed rows are computed again)
+    4. Checkpointing the keyset position so the job can resume
+    """
+
+    def __init__(
+        self,
+        activity_repo: ActivityRepository,
+        emission_factor_repo: EmissionFactorRepository,
+        calculation_service: CalculationService,
+        checkpoint_store: RecalculationCheckpointStore,
+        batch_size: int = 1000,
+        percentile_index: PopulationPercentileIndex | None = None,
+        footprint_cache: FootprintCache | None = None,
+    ) -> None:
+        """Initialize use case with dependencies.
+
+        Args:
+            activity_repo: Repository for activity persistence
+            emission_factor_repo: Repository for emission factors (read uncached)
+            calculation_service: Service for CO2e calculations
+            checkpoint_store: Store for job progress
+            batch_size: Activities read and written per batch
+            percentile_index: Optional population percentile index to update
+            footprint_cache: Optional footprint cache to invalidate on writes
+        """
+        self._activity_repo = activity_repo
+        self._emission_factor_repo = emission_factor_repo
+        self._calculation_service = calculation_service
+        self._checkpoint_store = checkpoint_store
+        self._batch_size = batch_size
+        self._percentile_index = percentile_index
+        self._footprint_cache = footprint_cache
+
+    async def execute(
+        self,
+        job_id: str,
+        activity_types: tuple[str, ...] | None = None,
+        after_id: UUID | None = None,
+        before_id: UUID | None = None,
+        max_batches: int | None = None,
+    ) -> RecalculationCheckpoint:
+        """Run or resume a recalculation job.
+
+        Args:
+            job_id: Job identifier; an existing job resumes from its checkpoint
+            activity_types: Only recalculate these types (None for all)
+            after_id: Exclusive lower ID bound of a new job (for sharding)
+            before_id: Exclusive upper ID bound (for sharding)
+            max_batches: Stop after this many batches (None runs to the end)
+
+        Returns:
+            Checkpoint after the last processed batch
+
+        Raises:
+            ValueError: If a resumed job was started for other types
+        """
+        checkpoint = await self._checkpoint_store.load(job_id)
+        if checkpoint is None:
+            checkpoint = RecalculationCheckpoint(
+                job_id=job_id, activity_types=activity_types, last_id=after_id
+            )
+            await self._checkpoint_store.save(checkpoint)
+        elif checkpoint.activity_types != activity_types:
+            raise ValueError(
+                f"Job {job_id} was started for types {checkpoint.activity_types}"
+            )
+
+        # One read of the current factors per run; versions are resolved
+        # per activity date in memory
+        factors = EmissionFactorIndex(await self._emission_factor_repo.get_all())
+        batches = 0
+        while not checkpoint.completed and (
+            max_batches is None or batches < max_batches
+        ):
+            page = await self._activity_repo.list_after_id(
+                checkpoint.last_id,
+                self._batch_size,
+                activity_types=activity_types,
+                before_id=before_id,
+            )
+            if not page:
+                checkpoint = replace(checkpoint, completed=True)
+                await self._checkpoint_store.save(checkpoint)
+                break
+
+            updated, skipped = await self._process(page, factors)
+            checkpoint = replace(
+                checkpoint,
+                last_id=page[-1].id,
+                scanned=checkpoint.scanned + len(page),
+                updated=checkpoint.updated + updated,
+                skipped=checkpoint.skipped + skipped,
+                completed=len(page) < self._batch_size,
+            )
+            await self._checkpoint_store.save(checkpoint)
+            batches += 1
+
+        return checkpoint
+
+    async def _process(
+        self, page: list[Activity], factors: EmissionFactorIndex
+    ) -> tuple[int, int]:
+        """Recompute and write one batch.
+
+        Args:
+            page: Activities of the batch
+            factors: Emission factors loaded for this run
+
+        Returns:
+            (updated, skipped) counts of the batch
+        """
+        changed: list[Activity] = []
+        skipped = 0
+        for activity, co2e_kg in zip(
+            page, self._recalculate(page, factors), strict=True
+        ):
+            if co2e_kg is None:
+                skipped += 1
+            elif co2e_kg != activity.co2e_kg:
+                changed.append(activity)
+
+        if not changed:
+            return 0, skipped
+
+        results = await self._activity_repo.update_co2e_many(
+            changed, partial(self._current_co2e, factors)
+        )
+
+        updated = 0
+        owners: set[str] = set()
+        for result in results.values():
+            previous, activity = result.previous, result.activity
+            if result.status != WRITE_OK or not previous or not activity:
+                continue
+            updated += 1
+            owner = owner_key(activity.user_id, activity.session_id)
+            owners.add(owner)
+            if self._percentile_index is not None:
+                self._percentile_index.record(
+                    owner,
+                    activity.category,
+                    activity.co2e_kg - previous.co2e_kg,
+                    activity.date,
+                )
+        if self._footprint_cache is not None:
+            for owner in owners:
+                await self._footprint_cache.invalidate(owner)
+
+        return updated, skipped
+
+    def _recalculate(
+        self, activities: list[Activity], factors: EmissionFactorIndex
+    ) -> list[float | None]:
+        """CO2e of activities with the factor in effect on each date.
+
+        One calculation runs per factor, over all of its activities.
+
+        Args:
+            activities: Activities to compute
+            factors: Emission factors loaded for this run
+
+        Returns:
+            CO2e in kilograms per activity, in input order (None without
+            a factor for its type and date)
+        """
+        by_factor: dict[EmissionFactor, list[int]] = {}
+        for i, activity in enumerate(activities):
+            factor = factors.on(activity.type, activity.date)
+            if factor is not None:
+                by_factor.setdefault(factor, []).append(i)
+
+        co2e: list[float | None] = [None] * len(activities)
+        for factor, indexes in by_factor.items():
+            new_values = self._calculation_service.calculate_co2e_many(
+                [activities[i].value for i in indexes], factor
+            )
+            for i, co2e_kg in zip(indexes, new_values, strict=True):
+                co2e[i] = co2e_kg
+        return co2e
+
+    async def _current_co2e(
+        self, factors: EmissionFactorIndex, activities: list[Activity]
+    ) -> list[float]:
+        """CO2e to store for activities, computed again right before the write.
+
+        Activities changed since they were read may have moved to a type
+        without a factor; those keep their stored CO2e.
+
+        Args:
+            factors: Emission factors loaded for this run
+            activities: Activities to compute, as currently stored
+
+        Returns:
+            CO2e in kilograms per activity, in input order
+        """
+        return [
+            activity.co2e_kg if co2e_kg is None else co2e_kg
+            for activity, co2e_kg in zip(
+                activities, self._recalculate(activities, factors), strict=True
+            )
+        ]
@@ -4,19 +4,28 @@ from datetime import date
 from uuid import UUID
 
 from domain.entities.activity import Activity
-from domain.ports.activity_repository import ActivityRepository
+from domain.ports.activity_repository import (
+    WRITE_CATEGORY_MISMATCH,
+    WRITE_FORBIDDEN,
+    WRITE_NOT_FOUND,
+    WRITE_OK,
+    ActivityRepository,
+)
 from domain.ports.emission_factor_repository import EmissionFactorRepository
+from domain.ports.footprint_cache import FootprintCache
 from domain.services.calculation_service import CalculationService
+from domain.services.owner_key import owner_key
+from domain.services.percentile_index import PopulationPercentileIndex
 
 
 class UpdateActivityUseCase:
     """Use case for updating an existing activity.
 
     Orchestrates the process of:
-    1. Verifying activity exists and user has permission
-    2. Retrieving the emission factor for the new activity type
-    3. Recalculating CO2e emissions
-    4. Updating the activity in the repository
+    1. Retrieving the emission factor for the new activity type
+    2. Recalculating CO2e emissions
+    3. Updating the activity in the repository, guarded by owner and
+       category in the same write
     """
 
     def __init__(
@@ -24,6 +33,8 @@ class UpdateActivityUseCase:
         activity_repo: ActivityRepository,
         emission_factor_repo: EmissionFactorRepository,
         calculation_service: CalculationService,
+        percentile_index: PopulationPercentileIndex | None = None,
+        footprint_cache: FootprintCache | None = None,
     ) -> None:
         """Initialize use case with dependencies.
 
@@ -31,10 +42,14 @@ class UpdateActivityUseCase:
             activity_repo: Repository for activity persistence
             emission_factor_repo: Repository for emission factors
             calculation_service: Service for CO2e calculations
+            percentile_index: Optional population percentile index to update
+            footprint_cache: Optional footprint cache to invalidate on writes
         """
         self._activity_repo = activity_repo
         self._emission_factor_repo = emission_factor_repo
         self._calculation_service = calculation_service
+        self._percentile_index = percentile_index
+        self._footprint_cache = footprint_cache
 
     async def execute(
         self,
@@ -64,49 +79,53 @@ class UpdateActivityUseCase:
             ValueError: If activity not found or type is unknown
             PermissionError: If user doesn't own this activity
         """
-        # Fetch existing activity
-        existing = await self._activity_repo.get_by_id(activity_id)
-        if not existing:
-            raise ValueError(f"Activity not found: {activity_id}")
-
-        # Authorization: Check ownership
-        if user_id:
-            if existing.user_id != user_id:
-                raise PermissionError("Not authorized to update this activity")
-        else:
-            if existing.session_id != session_id:
-                raise PermissionError("Not authorized to update this activity")
-
-        # Fetch emission factor for the new type
-        # Category cannot be changed, use existing category
-        factor = await self._emission_factor_repo.get_by_type(activity_type)
+        # Fetch the emission factor in effect on the activity's date
+        factor = await self._emission_factor_repo.get_by_type_on(
+            activity_type, activity_date
+        )
         if not factor:
             raise ValueError(f"Unknown activity type: {activity_type}")
 
-        # Verify type belongs to same category
-        if factor.category != existing.category:
-            raise ValueError(
-                f"Activity type '{activity_type}' does not belong to category "
-                f"'{existing.category}'"
-            )
-
         # Recalculate CO2e
         new_co2e = self._calculation_service.calculate_co2e(value, factor)
 
-        # Create updated activity entity
-        updated_activity = Activity(
-            id=existing.id,
-            category=existing.category,  # Category cannot change
-            type=activity_type,
+        # Ownership and category are checked by the update itself.
+        # Category cannot change, so the row must already be in the
+        # category of the new type.
+        result = await self._activity_repo.update_owned(
+            activity_id=activity_id,
+            user_id=user_id,
+            session_id=session_id,
+            category=factor.category,
+            activity_type=activity_type,
             value=value,
             co2e_kg=new_co2e,
-            date=activity_date,
+            activity_date=activity_date,
             notes=notes,
-            metadata=existing.metadata,  # Preserve metadata
-            user_id=existing.user_id,
-            session_id=existing.session_id,
-            created_at=existing.created_at,
         )
+        if result.status == WRITE_NOT_FOUND:
+            raise ValueError(f"Activity not found: {activity_id}")
+        if result.status == WRITE_FORBIDDEN:
+            raise PermissionError("Not authorized to update this activity")
+        if result.status == WRITE_CATEGORY_MISMATCH and result.previous:
+            raise ValueError(
+                f"Activity type '{activity_type}' does not belong to category "
+                f"'{result.previous.category}'"
+            )
+        if result.status != WRITE_OK or not result.activity or not result.previous:
+            raise ValueError(f"Failed to update activity: {activity_id}")
+
+        existing, saved = result.previous, result.activity
+        owner = owner_key(existing.user_id, existing.session_id)
+
+        if self._footprint_cache is not None:
+            await self._footprint_cache.invalidate(owner)
+        if self._percentile_index is not None:
+            self._percentile_index.record(
+                owner, existing.category, -existing.co2e_kg, existing.date
+            )
+            self._percentile_index.record(
+                owner, saved.category, saved.co2e_kg, saved.date
+            )
 
-        # Save to repository
-        return await self._activity_repo.update(updated_activity)
+        return saved
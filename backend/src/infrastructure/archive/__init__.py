@@ -0,0 +1,15 @@
+"""Cold storage of archived activities."""
+
+from .parquet_activity_archive import ParquetActivityArchive
+from .postgres_activity_archiver import (
+    ArchivalReport,
+    PostgresActivityArchiver,
+    batch_name,
+)
+
+__all__ = [
+    "ArchivalReport",
+    "ParquetActivityArchive",
+    "PostgresActivityArchiver",
+    "batch_name",
+]
@@ -0,0 +1,282 @@
+"""Activity archive in Parquet files on local disk or object storage."""
+
+import asyncio
+import hashlib
+import json
+from collections import defaultdict
+from datetime import date
+from typing import Any
+from uuid import UUID
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+from pyarrow import fs
+
+from domain.entities.activity import Activity
+from domain.ports.activity_archive import ActivityArchive
+
+ARCHIVE_SCHEMA = pa.schema(
+    [
+        ("id", pa.string()),
+        ("user_id", pa.string()),
+        ("session_id", pa.string()),
+        ("category", pa.string()),
+        ("type", pa.string()),
+        ("value", pa.float64()),
+        ("co2e_kg", pa.float64()),
+        ("date", pa.date32()),
+        ("notes", pa.string()),
+        ("metadata", pa.string()),
+        ("created_at", pa.timestamp("us", tz="UTC")),
+        ("updated_at", pa.timestamp("us", tz="UTC")),
+    ]
+)
+
+_SUFFIX = ".parquet"
+
+# Files are sorted by ID, so each row group covers a narrow ID range and
+# keyset pages skip the groups below their cursor using the statistics
+_ROW_GROUP_SIZE = 10_000
+
+
+def owner_directory(user_id: UUID | None, session_id: str | None) -> str:
+    """Directory of one owner's files, relative to the archive root.
+
+    Session IDs are client-chosen strings, so they are hashed into a
+    fixed-length, path-safe name (128 bits of SHA-256).
+
+    Raises:
+        ValueError: If neither user_id nor session_id is provided
+    """
+    if user_id is not None:
+        return f"user={user_id}"
+    if session_id is None:
+        raise ValueError("Either user_id or session_id must be provided")
+    return f"session={hashlib.sha256(session_id.encode()).hexdigest()[:32]}"
+
+
+def _to_record(activity: Activity) -> dict[str, Any]:
+    """Convert an activity to a row of ARCHIVE_SCHEMA."""
+    return {
+        "id": str(activity.id),
+        "user_id": str(activity.user_id) if activity.user_id else None,
+        "session_id": activity.session_id,
+        "category": activity.category,
+        "type": activity.type,
+        "value": activity.value,
+        "co2e_kg": activity.co2e_kg,
+        "date": activity.date,
+        "notes": activity.notes,
+        "metadata": json.dumps(activity.metadata)
+        if activity.metadata is not None
+        else None,
+        "created_at": activity.created_at,
+        "updated_at": activity.updated_at,
+    }
+
+
+def _to_entity(record: dict[str, Any]) -> Activity:
+    """Convert a row of ARCHIVE_SCHEMA to a domain entity."""
+    return Activity(
+        id=UUID(record["id"]),
+        category=record["category"],
+        type=record["type"],
+        value=record["value"],
+        co2e_kg=record["co2e_kg"],
+        date=record["date"],
+        notes=record["notes"],
+        metadata=json.loads(record["metadata"]) if record["metadata"] else None,
+        user_id=UUID(record["user_id"]) if record["user_id"] else None,
+        session_id=record["session_id"],
+        created_at=record["created_at"],
+        updated_at=record["updated_at"],
+    )
+
+
+class ParquetActivityArchive(ActivityArchive):
+    """Archive activities as Parquet files, one directory per owner.
+
+    Every archival batch adds one file per owner
+    (``<root>/user=<id>/<batch>.parquet``), so an owner's history is
+    read from a handful of files without touching anyone else's. The
+    root is a local path or any URI pyarrow supports (e.g.
+    ``s3://bucket/activities``). File I/O runs in worker threads.
+
+    A batch interrupted between writing its files and removing the rows
+    from the hot table is archived again by the next run; reads drop
+    the duplicate copies by ID. Rows are written in ID order, so keyset
+    pages only read the row groups past their cursor.
+    """
+
+    def __init__(self, uri: str) -> None:
+        """Initialize archive on a storage location.
+
+        Args:
+            uri: Absolute local path or object storage URI of the root
+        """
+        self._fs, self._root = fs.FileSystem.from_uri(uri)
+
+    async def write(self, activities: list[Activity], batch: str) -> int:
+        """Add activities to the archive of their owners.
+
+        Args:
+            activities: Activities to archive (any owners)
+            batch: Name of this archival run, unique per run
+
+        Returns:
+            Number of activities written
+        """
+        by_owner: dict[str, list[dict[str, Any]]] = defaultdict(list)
+        for activity in activities:
+            directory = owner_directory(activity.user_id, activity.session_id)
+            by_owner[directory].append(_to_record(activity))
+        for directory, records in by_owner.items():
+            await asyncio.to_thread(self._write_file, directory, batch, records)
+        return len(activities)
+
+    async def list_by_date_range(
+        self,
+        user_id: UUID | None,
+        session_id: str | None,
+        start_date: date,
+        end_date: date,
+    ) -> list[Activity]:
+        """List archived activities of an owner within a date range.
+
+        Args:
+            user_id: User ID if authenticated
+            session_id: Session ID for anonymous users
+            start_date: Start of date range (inclusive)
+            end_date: End of date range (inclusive)
+
+        Returns:
+            List of activities ordered by date ascending
+        """
+        activities = await asyncio.to_thread(
+            self._read_owner,
+            user_id,
+            session_id,
+            [("date", ">=", start_date), ("date", "<=", end_date)],
+        )
+        return sorted(activities, key=lambda a: (a.date, a.created_at))
+
+    async def list_owned_after_id(
+        self,
+        user_id: UUID | None,
+        session_id: str | None,
+        after_id: UUID | None,
+        limit: int,
+    ) -> list[Activity]:
+        """List an owner's archived activities in ID order.
+
+        Args:
+            user_id: User ID if authenticated
+            session_id: Session ID for anonymous users
+            after_id: Return activities with a greater ID (None from the start)
+            limit: Maximum number of activities
+
+        Returns:
+            Activities ordered by ID ascending
+        """
+        return await asyncio.to_thread(
+            self._read_page, user_id, session_id, after_id, limit
+        )
+
+    async def migrate_session_to_user(self, user_id: UUID, session_id: str) -> int:
+        """Move the archived activities of a session to a user.
+
+        Each session file is rewritten into the user's directory under a
+        name derived from it, then removed, so repeating an interrupted
+        migration finishes it without duplicates.
+
+        Args:
+            user_id: Authenticated user's ID
+            session_id: Anonymous session identifier
+
+        Returns:
+            Count of activities migrated
+        """
+        return await asyncio.to_thread(self._migrate, user_id, session_id)
+
+    def _path(self, *parts: str) -> str:
+        """Path below the archive root."""
+        return "/".join([self._root.rstrip("/"), *parts])
+
+    def _write_file(
+        self, directory: str, batch: str, records: list[dict[str, Any]]
+    ) -> None:
+        """Write one owner's records of a batch as a Parquet file."""
+        self._fs.create_dir(self._path(directory), recursive=True)
+        path = self._path(directory, batch + _SUFFIX)
+        # Readers skip files until they are complete under their final name
+        table = pa.Table.from_pylist(records, schema=ARCHIVE_SCHEMA)
+        pq.write_table(
+            table.sort_by("id"),
+            path + ".tmp",
+            filesystem=self._fs,
+            compression="zstd",
+            row_group_size=_ROW_GROUP_SIZE,
+        )
+        self._fs.move(path + ".tmp", path)
+
+    def _files(self, directory: str) -> list[str]:
+        """Complete Parquet files of an owner directory."""
+        infos = self._fs.get_file_info(
+            fs.FileSelector(self._path(directory), allow_not_found=True)
+        )
+        return sorted(
+            info.path
+            for info in infos
+            if info.type == fs.FileType.File and info.path.endswith(_SUFFIX)
+        )
+
+    def _read_owner(
+        self,
+        user_id: UUID | None,
+        session_id: str | None,
+        filters: list[tuple[str, str, Any]] | None,
+    ) -> list[Activity]:
+        """Read an owner's archived activities, without duplicates."""
+        by_id: dict[str, Activity] = {}
+        for path in self._files(owner_directory(user_id, session_id)):
+            table = pq.read_table(path, filesystem=self._fs, filters=filters)
+            for record in table.to_pylist():
+                by_id[record["id"]] = _to_entity(record)
+        return list(by_id.values())
+
+    def _read_page(
+        self,
+        user_id: UUID | None,
+        session_id: str | None,
+        after_id: UUID | None,
+        limit: int,
+    ) -> list[Activity]:
+        """Read the first `limit` archived activities of an owner past a cursor.
+
+        Takes the next `limit` rows of each file and merges them, so only
+        rows that can be on the page are converted. Canonical UUID strings
+        sort like the UUIDs themselves.
+        """
+        filters = [("id", ">", str(after_id))] if after_id is not None else None
+        by_id: dict[str, Activity] = {}
+        for path in self._files(owner_directory(user_id, session_id)):
+            table = pq.read_table(path, filesystem=self._fs, filters=filters)
+            for record in table.sort_by("id").slice(0, limit).to_pylist():
+                by_id[record["id"]] = _to_entity(record)
+        return [by_id[key] for key in sorted(by_id)[:limit]]
+
+    def _migrate(self, user_id: UUID, session_id: str) -> int:
+        """Rewrite a session's files into the user's directory."""
+        source = owner_directory(None, session_id)
+        target = owner_directory(user_id, None)
+        migrated = 0
+        for path in self._files(source):
+            table = pq.read_table(path, filesystem=self._fs)
+            records = [
+                {**record, "user_id": str(user_id)} for record in table.to_pylist()
+            ]
+            name = path.rsplit("/", 1)[-1].removesuffix(_SUFFIX)
+            self._write_file(target, f"{name}-{source}", records)
+            self._fs.delete_file(path)
+            migrated += len(records)
+        return migrated
@@ -0,0 +1,204 @@
+"""Archival of old activities from Postgres into an ActivityArchive."""
+
+from dataclasses import dataclass
+from datetime import UTC, date, datetime
+from uuid import UUID
+
+from domain.ports.activity_archive import ActivityArchive
+from domain.ports.footprint_cache import FootprintCache
+from domain.services.owner_key import owner_key
+from infrastructure.config.postgres import PostgresPool
+from infrastructure.repositories.postgres_activity_repository import (
+    COLUMNS,
+    PostgresActivityRepository,
+)
+
+# Owners with activities before the cutoff; sessions only for anonymous rows
+_OWNERS = """
+SELECT user_id, CASE WHEN user_id IS NULL THEN session_id END AS session_id
+FROM activities
+WHERE date < $1
+GROUP BY 1, 2
+"""
+
+# Remove an owner's activities (before a cutoff date, if given), add them
+# to the monthly rollups and return them for the archive, in one statement
+_MOVE = {
+    (owner, bounded): f"""
+WITH moved AS (
+    DELETE FROM activities
+    WHERE {condition}{" AND date < $2" if bounded else ""}
+    RETURNING {COLUMNS}
+), rolled_up AS (
+    INSERT INTO activity_rollups
+        (user_id, session_id, category, month, co2e_kg, activity_count)
+    SELECT user_id, CASE WHEN user_id IS NULL THEN session_id END, category,
+           date_trunc('month', date)::DATE, SUM(co2e_kg), count(*)
+    FROM moved
+    GROUP BY 1, 2, 3, 4
+    ON CONFLICT (
+        (COALESCE(user_id, '00000000-0000-0000-0000-000000000000'::UUID)),
+        (COALESCE(session_id, '')),
+        category,
+        month
+    ) DO UPDATE
+    SET co2e_kg = activity_rollups.co2e_kg + EXCLUDED.co2e_kg,
+        activity_count = activity_rollups.activity_count + EXCLUDED.activity_count
+)
+SELECT * FROM moved
+"""
+    for owner, condition in (
+        ("user", "user_id = $1"),
+        ("session", "user_id IS NULL AND session_id = $1"),
+    )
+    for bounded in (True, False)
+}
+
+
+# Remove the rest of an anonymous session's activities
+_DELETE_SESSION = """
+WITH deleted AS (
+    DELETE FROM activities
+    WHERE user_id IS NULL AND session_id = $1
+    RETURNING 1
+)
+SELECT count(*) FROM deleted
+"""
+
+
+def batch_name(before: date) -> str:
+    """Archive batch name of a run: its cutoff and start time."""
+    started = datetime.now(UTC).strftime("%Y%m%dT%H%M%S%f")
+    return f"before-{before.isoformat()}-{started}"
+
+
+@dataclass(frozen=True)
+class ArchivalReport:
+    """Outcome of an archival run.
+
+    Attributes:
+        owners: Owners whose activities were archived
+        activities: Activities moved to the archive
+    """
+
+    owners: int
+    activities: int
+
+
+class PostgresActivityArchiver:
+    """Move activities older than a cutoff from Postgres to an archive.
+
+    Works one owner at a time, so memory is bounded by the largest
+    owner history. Each owner's rows are deleted, rolled up and written
+    to the archive in one transaction: if the archive write fails the
+    rows stay in Postgres, and if the commit fails after the write the
+    next run archives them again (the archive drops duplicates by ID).
+    Cached footprints of each archived owner are invalidated after the
+    commit.
+    """
+
+    def __init__(
+        self,
+        pool: PostgresPool,
+        archive: ActivityArchive,
+        footprint_cache: FootprintCache | None = None,
+    ) -> None:
+        """Initialize archiver with both stores.
+
+        Args:
+            pool: Postgres pool (connections decode JSONB metadata)
+            archive: Archive receiving the activities
+            footprint_cache: Cache whose entries of archived owners are
+                invalidated
+        """
+        self._pool = pool
+        self._archive = archive
+        self._footprint_cache = footprint_cache
+
+    async def list_owners(self, before: date) -> list[tuple[UUID | None, str | None]]:
+        """List the owners with activities dated before a cutoff.
+
+        Args:
+            before: Cutoff date (exclusive)
+
+        Returns:
+            (user_id, session_id) per owner; session_id only for anonymous owners
+        """
+        pool = await self._pool.get()
+        rows = await pool.fetch(_OWNERS, before)
+        return [(row["user_id"], row["session_id"]) for row in rows]
+
+    async def archive_owner(
+        self,
+        user_id: UUID | None,
+        session_id: str | None,
+        before: date | None,
+        batch: str,
+    ) -> int:
+        """Move one owner's activities dated before a cutoff.
+
+        Args:
+            user_id: User ID if authenticated
+            session_id: Session ID for anonymous users
+            before: Cutoff date (exclusive), None for every activity
+            batch: Archive batch name of this run
+
+        Returns:
+            Number of activities archived
+        """
+        owner_type = "user" if user_id is not None else "session"
+        query = _MOVE[owner_type, before is not None]
+        args: list[UUID | str | date | None] = [
+            user_id if user_id is not None else session_id
+        ]
+        if before is not None:
+            args.append(before)
+        pool = await self._pool.get()
+        async with pool.acquire() as conn, conn.transaction():
+            rows = await conn.fetch(query, *args)
+            activities = [PostgresActivityRepository._row_to_entity(r) for r in rows]
+            archived: int = await self._archive.write(activities, batch)
+        if archived and self._footprint_cache is not None:
+            await self._footprint_cache.invalidate(owner_key(user_id, session_id))
+        return archived
+
+    async def reclaim_session(self, session_id: str, before: date, batch: str) -> int:
+        """Archive a session's activities dated before a cutoff, delete the rest.
+
+        Reads only look in the archive for date ranges reaching past the
+        archival horizon, so newer activities would no longer be found
+        once archived: they are deleted instead. Both happen in one
+        transaction, as in archive_owner().
+
+        Args:
+            session_id: Anonymous session being reclaimed
+            before: Archival horizon (exclusive)
+            batch: Archive batch name of this run
+
+        Returns:
+            Number of activities archived or deleted
+        """
+        pool = await self._pool.get()
+        async with pool.acquire() as conn, conn.transaction():
+            rows = await conn.fetch(_MOVE["session", True], session_id, before)
+            deleted: int = await conn.fetchval(_DELETE_SESSION, session_id)
+            activities = [PostgresActivityRepository._row_to_entity(r) for r in rows]
+            archived: int = await self._archive.write(activities, batch)
+        return archived + deleted
+
+    async def archive_before(self, before: date, batch: str) -> ArchivalReport:
+        """Move every activity dated before a cutoff.
+
+        Args:
+            before: Cutoff date (exclusive)
+            batch: Archive batch name, unique per run
+
+        Returns:
+            Owners and activities archived
+        """
+        owners = archived = 0
+        for user_id, session_id in await self.list_owners(before):
+            moved = await self.archive_owner(user_id, session_id, before, batch)
+            owners += 1 if moved else 0
+            archived += moved
+        return ArchivalReport(owners=owners, activities=archived)
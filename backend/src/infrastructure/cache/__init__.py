@@ -0,0 +1,7 @@
+"""Cache implementations."""
+
+from .in_memory_cache_backend import InMemoryCacheBackend
+from .redis_cache_backend import RedisCacheBackend
+from .versioned_footprint_cache import VersionedFootprintCache
+
+__all__ = ["InMemoryCacheBackend", "RedisCacheBackend", "VersionedFootprintCache"]
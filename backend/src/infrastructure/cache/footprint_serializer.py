@@ -0,0 +1,108 @@
+"""JSON serialization of footprint results for shared caches."""
+
+import json
+from dataclasses import fields, is_dataclass
+from datetime import date, datetime
+from typing import Any
+
+from domain.use_cases.compare_to_region import OwnerPeriodTotals
+from domain.use_cases.get_footprint_breakdown import (
+    CategoryBreakdownItem,
+    FootprintBreakdown,
+)
+from domain.use_cases.get_footprint_summary import FootprintSummary
+from domain.use_cases.get_footprint_trend import FootprintTrend, TrendDataPoint
+
+# Only these dataclasses may be rebuilt from cached bytes
+SERIALIZABLE_TYPES: dict[str, type] = {
+    cls.__name__: cls
+    for cls in (
+        FootprintSummary,
+        FootprintBreakdown,
+        CategoryBreakdownItem,
+        FootprintTrend,
+        TrendDataPoint,
+        OwnerPeriodTotals,
+    )
+}
+
+_TYPE_TAG = "__type__"
+
+
+def dumps(value: Any) -> bytes:
+    """Serialize a footprint result to bytes.
+
+    Args:
+        value: Registered dataclass, or JSON data containing them
+
+    Returns:
+        UTF-8 encoded JSON
+
+    Raises:
+        TypeError: If the value contains an unsupported type
+    """
+    return json.dumps(_encode(value), separators=(",", ":")).encode()
+
+
+def loads(data: bytes) -> Any:
+    """Deserialize a footprint result produced by dumps().
+
+    Args:
+        data: UTF-8 encoded JSON
+
+    Returns:
+        Rebuilt value
+
+    Raises:
+        ValueError: If the data is malformed or names an unknown type
+    """
+    try:
+        return _decode(json.loads(data))
+    except (KeyError, TypeError) as e:
+        raise ValueError(f"Invalid cached footprint payload: {e}") from e
+
+
+def _encode(value: Any) -> Any:
+    """Convert a value into JSON-compatible data with type tags."""
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    if isinstance(value, datetime):
+        return {_TYPE_TAG: "datetime", "value": value.isoformat()}
+    if isinstance(value, date):
+        return {_TYPE_TAG: "date", "value": value.isoformat()}
+    if is_dataclass(value) and not isinstance(value, type):
+        name = type(value).__name__
+        if SERIALIZABLE_TYPES.get(name) is not type(value):
+            raise TypeError(f"{name} is not registered for caching")
+        return {
+            _TYPE_TAG: name,
+            "fields": {f.name: _encode(getattr(value, f.name)) for f in fields(value)},
+        }
+    if isinstance(value, (list, tuple)):
+        return [_encode(item) for item in value]
+    if isinstance(value, dict):
+        if _TYPE_TAG in value:
+            raise TypeError(f"Dict keys must not include {_TYPE_TAG!r}")
+        return {str(k): _encode(v) for k, v in value.items()}
+    raise TypeError(f"Cannot serialize {type(value).__name__}")
+
+
+def _decode(value: Any) -> Any:
+    """Rebuild a value from type-tagged JSON data."""
+    if isinstance(value, list):
+        return [_decode(item) for item in value]
+    if not isinstance(value, dict):
+        return value
+    if _TYPE_TAG not in value:
+        return {k: _decode(v) for k, v in value.items()}
+
+    tag = value[_TYPE_TAG]
+    if tag == "date":
+        return date.fromisoformat(value["value"])
+    if tag == "datetime":
+        return datetime.fromisoformat(value["value"])
+    if tag not in SERIALIZABLE_TYPES:
+        raise ValueError(f"Unknown cached type: {tag}")
+    return SERIALIZABLE_TYPES[tag](
+        **{k: _decode(v) for k, v in value["fields"].items()}
+    )
@@ -0,0 +1,134 @@
+"""In-process LRU implementation of CacheBackend port."""
+
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+
+from domain.ports.cache_backend import BackendUsage, CacheBackend
+
+
+class InMemoryCacheBackend(CacheBackend):
+    """Bounded LRU cache held in process memory.
+
+    Suitable for a single worker or for tests. Values expire lazily on
+    read. Counters are kept outside the LRU so they are never evicted,
+    matching a Redis server run with a volatile-lru policy.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 10000,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize backend with a size bound.
+
+        Args:
+            max_entries: Maximum number of stored values
+            clock: Monotonic time source in seconds
+
+        Raises:
+            ValueError: If max_entries is not positive
+        """
+        if max_entries <= 0:
+            raise ValueError("max_entries must be positive")
+        self._max_entries = max_entries
+        self._clock = clock
+        self._entries: OrderedDict[str, tuple[bytes, float | None]] = OrderedDict()
+        self._counters: dict[str, int] = {}
+        self._evictions = 0
+
+    async def get(self, key: str) -> bytes | None:
+        """Retrieve a value.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Stored bytes if present and not expired, None otherwise
+        """
+        if key in self._counters:
+            return str(self._counters[key]).encode()
+
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        value, expires_at = entry
+        if expires_at is not None and expires_at <= self._clock():
+            del self._entries[key]
+            return None
+
+        self._entries.move_to_end(key)
+        return value
+
+    async def set(self, key: str, value: bytes, ttl_seconds: int | None = None) -> None:
+        """Store a value, evicting the least recently used one if full.
+
+        Args:
+            key: Cache key
+            value: Bytes to store
+            ttl_seconds: Expiry in seconds (None keeps the key until evicted)
+        """
+        self._counters.pop(key, None)
+        expires_at = self._clock() + ttl_seconds if ttl_seconds is not None else None
+        self._entries[key] = (value, expires_at)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+            self._evictions += 1
+
+    async def set_if_absent(
+        self, key: str, value: bytes, ttl_seconds: int | None = None
+    ) -> bytes:
+        """Store a value unless the key already holds one.
+
+        Args:
+            key: Cache key
+            value: Bytes to store if the key is missing
+            ttl_seconds: Expiry in seconds (None keeps the key until evicted)
+
+        Returns:
+            Value held by the key: the existing one, or `value` if stored
+        """
+        current = await self.get(key)
+        if current is not None:
+            return current
+        await self.set(key, value, ttl_seconds)
+        return value
+
+    async def delete(self, key: str) -> None:
+        """Remove a value if present.
+
+        Args:
+            key: Cache key
+        """
+        self._entries.pop(key, None)
+        self._counters.pop(key, None)
+
+    async def incr(self, key: str) -> int:
+        """Increment an integer counter.
+
+        Args:
+            key: Counter key
+
+        Returns:
+            Value after the increment
+
+        Raises:
+            ValueError: If the key holds a non-integer value
+        """
+        if key not in self._counters:
+            current = await self.get(key)
+            self._entries.pop(key, None)
+            self._counters[key] = int(current) if current is not None else 0
+
+        self._counters[key] += 1
+        return self._counters[key]
+
+    def usage(self) -> BackendUsage:
+        """Get storage counters.
+
+        Returns:
+            Current entry and eviction counters
+        """
+        return BackendUsage(entries=len(self._entries), evictions=self._evictions)
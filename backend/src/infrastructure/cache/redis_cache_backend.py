@@ -0,0 +1,108 @@
+"""Redis implementation of CacheBackend port."""
+
+from redis.asyncio import Redis
+
+from domain.ports.cache_backend import CacheBackend
+
+
+class RedisCacheBackend(CacheBackend):
+    """Cache shared by all workers and replicas through a Redis server.
+
+    Works with any server speaking the Redis protocol (Redis, Valkey,
+    KeyDB, ...). Run the server with a volatile-* eviction policy so
+    counters, which carry no expiry, are never evicted.
+    """
+
+    def __init__(self, client: Redis, key_prefix: str = "carbon:") -> None:
+        """Initialize backend with a Redis client.
+
+        Args:
+            client: Async Redis client (owns the connection pool)
+            key_prefix: Prefix namespacing every key of this application
+        """
+        self._client = client
+        self._key_prefix = key_prefix
+
+    @classmethod
+    def from_url(cls, url: str, key_prefix: str = "carbon:") -> "RedisCacheBackend":
+        """Create a backend connected to a Redis URL.
+
+        Connections are opened lazily on first use. RESP2 is used so
+        servers without HELLO/RESP3 support work too.
+
+        Args:
+            url: Redis URL (e.g. "redis://localhost:6379/0")
+            key_prefix: Prefix namespacing every key of this application
+
+        Returns:
+            Configured RedisCacheBackend instance
+        """
+        return cls(Redis.from_url(url, protocol=2), key_prefix=key_prefix)
+
+    async def get(self, key: str) -> bytes | None:
+        """Retrieve a value.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Stored bytes if present and not expired, None otherwise
+        """
+        value = await self._client.get(self._key_prefix + key)
+        if isinstance(value, str):  # client created with decode_responses=True
+            return value.encode()
+        return value
+
+    async def set(self, key: str, value: bytes, ttl_seconds: int | None = None) -> None:
+        """Store a value.
+
+        Args:
+            key: Cache key
+            value: Bytes to store
+            ttl_seconds: Expiry in seconds (None keeps the key until evicted)
+        """
+        await self._client.set(self._key_prefix + key, value, ex=ttl_seconds)
+
+    async def set_if_absent(
+        self, key: str, value: bytes, ttl_seconds: int | None = None
+    ) -> bytes:
+        """Store a value unless the key already holds one (SET NX).
+
+        Args:
+            key: Cache key
+            value: Bytes to store if the key is missing
+            ttl_seconds: Expiry in seconds (None keeps the key until evicted)
+
+        Returns:
+            Value held by the key: the existing one, or `value` if stored
+        """
+        if await self._client.set(
+            self._key_prefix + key, value, ex=ttl_seconds, nx=True
+        ):
+            return value
+        current = await self.get(key)
+        # Expired between the two commands: nothing holds it any more
+        return current if current is not None else value
+
+    async def delete(self, key: str) -> None:
+        """Remove a value if present.
+
+        Args:
+            key: Cache key
+        """
+        await self._client.delete(self._key_prefix + key)
+
+    async def incr(self, key: str) -> int:
+        """Atomically increment an integer counter.
+
+        Args:
+            key: Counter key
+
+        Returns:
+            Value after the increment
+        """
+        return int(await self._client.incr(self._key_prefix + key))
+
+    async def close(self) -> None:
+        """Close the connection pool."""
+        await self._client.aclose()
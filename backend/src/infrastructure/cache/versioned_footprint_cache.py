@@ -0,0 +1,154 @@
+"""FootprintCache implementation on top of a CacheBackend."""
+
+from typing import Any
+
+from domain.ports.cache_backend import CacheBackend
+from domain.ports.footprint_cache import CacheStats, FootprintCache
+from infrastructure.cache import footprint_serializer
+
+# Bump when the serialized layout changes so old entries are ignored
+FORMAT_VERSION = 1
+
+
+class VersionedFootprintCache(FootprintCache):
+    """Footprint cache storing serialized results in a key-value backend.
+
+    Owner versions are drawn from one shared sequence counter and stored
+    with the same expiry as results. When an owner's version key has
+    expired or been evicted, it is seeded with the current sequence
+    value, so the owner keeps that version until their next invalidation
+    instead of moving with every other owner's writes. Every
+    invalidation advances the sequence, so a version number that was
+    ever current for an owner is never reused for newer data.
+    """
+
+    def __init__(
+        self,
+        backend: CacheBackend,
+        ttl_seconds: int = 3600,
+        namespace: str = "footprint",
+    ) -> None:
+        """Initialize cache on a backend.
+
+        Args:
+            backend: Key-value storage (in-process or shared)
+            ttl_seconds: Expiry of cached results and owner versions
+            namespace: Key prefix separating this cache from other users
+                of the backend
+
+        Raises:
+            ValueError: If ttl_seconds is not positive
+        """
+        if ttl_seconds <= 0:
+            raise ValueError("ttl_seconds must be positive")
+        self._backend = backend
+        self._ttl_seconds = ttl_seconds
+        self._prefix = f"{namespace}:v{FORMAT_VERSION}"
+        self._hits = 0
+        self._misses = 0
+
+    async def version(self, owner: str) -> int:
+        """Get the current data version of an owner.
+
+        Args:
+            owner: Owner key
+
+        Returns:
+            Version number used to tag cache entries
+        """
+        raw = await self._backend.get(self._version_key(owner))
+        if raw is None:
+            sequence = await self._backend.get(self._sequence_key())
+            # A concurrent invalidation or seed wins: use the stored version
+            raw = await self._backend.set_if_absent(
+                self._version_key(owner), sequence or b"0", self._ttl_seconds
+            )
+        return int(raw)
+
+    async def invalidate(self, owner: str) -> None:
+        """Bump an owner's data version after their activities changed.
+
+        Args:
+            owner: Owner key
+        """
+        version = await self._backend.incr(self._sequence_key())
+        await self._backend.set(
+            self._version_key(owner), str(version).encode(), self._ttl_seconds
+        )
+
+    async def get(self, owner: str, version: int, key: str) -> Any | None:
+        """Retrieve a cached result.
+
+        Entries that cannot be deserialized are dropped and count as misses.
+
+        Args:
+            owner: Owner key
+            version: Owner data version the result was computed at
+            key: Result key
+
+        Returns:
+            Cached value if present, None otherwise
+        """
+        entry_key = self._entry_key(owner, version, key)
+        data = await self._backend.get(entry_key)
+        if data is None:
+            self._misses += 1
+            return None
+
+        try:
+            value = footprint_serializer.loads(data)
+        except ValueError:
+            await self._backend.delete(entry_key)
+            self._misses += 1
+            return None
+
+        self._hits += 1
+        return value
+
+    async def set(self, owner: str, version: int, key: str, value: Any) -> None:
+        """Store a computed result.
+
+        Args:
+            owner: Owner key
+            version: Owner data version the result was computed at
+            key: Result key
+            value: Result to cache
+        """
+        await self._backend.set(
+            self._entry_key(owner, version, key),
+            footprint_serializer.dumps(value),
+            self._ttl_seconds,
+        )
+
+    def stats(self) -> CacheStats:
+        """Get cache effectiveness counters.
+
+        Hits and misses are counted per process; entries and evictions
+        come from the backend.
+
+        Returns:
+            Current hit/miss/eviction counters
+        """
+        usage = self._backend.usage()
+        return CacheStats(
+            hits=self._hits,
+            misses=self._misses,
+            evictions=usage.evictions,
+            entries=usage.entries,
+        )
+
+    async def close(self) -> None:
+        """Release connections held by the backend."""
+        await self._backend.close()
+
+    def _sequence_key(self) -> str:
+        """Key of the shared version sequence counter."""
+        return f"{self._prefix}:seq"
+
+    def _version_key(self, owner: str) -> str:
+        """Key holding an owner's current version."""
+        return f"{self._prefix}:version:{owner}"
+
+    def _entry_key(self, owner: str, version: int, key: str) -> str:
+        """Key holding one cached result."""
+        return f"{self._prefix}:entry:{owner}:{version}:{key}"
@@ -0,0 +1,80 @@
+"""Direct Postgres connection configuration."""
+
+import asyncio
+import json
+
+import asyncpg
+
+from .settings import get_settings
+
+
+async def connect_postgres(dsn: str | None = None) -> asyncpg.Connection:
+    """Open a direct connection to the Postgres database.
+
+    Args:
+        dsn: Connection string (default: DATABASE_URL from settings)
+
+    Returns:
+        Open asyncpg connection; the caller closes it
+
+    Raises:
+        ValueError: If no DSN is given or configured
+    """
+    dsn = dsn or get_settings().database_url
+    if not dsn:
+        raise ValueError("DATABASE_URL must be set for direct Postgres access")
+    return await asyncpg.connect(dsn)
+
+
+async def _init_connection(conn: asyncpg.Connection) -> None:
+    """Decode JSONB columns to Python objects on every pooled connection."""
+    await conn.set_type_codec(
+        "jsonb", encoder=json.dumps, decoder=json.loads, schema="pg_catalog"
+    )
+
+
+class PostgresPool:
+    """asyncpg connection pool opened on first use.
+
+    The container is built synchronously, so the pool cannot be opened
+    when it is configured; the first query opens it instead. Each pooled
+    connection keeps its own prepared statement cache, so a query text
+    is parsed and planned once per connection and then only executed.
+    """
+
+    def __init__(self, dsn: str, min_size: int = 1, max_size: int = 10) -> None:
+        """Configure the pool without connecting.
+
+        Args:
+            dsn: Postgres connection string
+            min_size: Connections kept open
+            max_size: Connections open at most
+        """
+        self._dsn = dsn
+        self._min_size = min_size
+        self._max_size = max_size
+        self._pool: asyncpg.Pool | None = None
+        self._lock = asyncio.Lock()
+
+    async def get(self) -> asyncpg.Pool:
+        """Get the pool, opening it on first call.
+
+        Returns:
+            Open connection pool
+        """
+        if self._pool is None:
+            async with self._lock:
+                if self._pool is None:
+                    self._pool = await asyncpg.create_pool(
+                        self._dsn,
+                        min_size=self._min_size,
+                        max_size=self._max_size,
+                        init=_init_connection,
+                    )
+        return self._pool
+
+    async def close(self) -> None:
+        """Close the pool's connections, if it was opened."""
+        if self._pool is not None:
+            await self._pool.close()
+            self._pool = None
@@ -1,10 +1,96 @@
 """Supabase client configuration."""
 
+import asyncio
+import logging
 from functools import lru_cache
 
+import httpx
 from supabase import Client, create_client
+from supabase.lib.client_options import SyncClientOptions
 
-from .settings import get_settings
+from .settings import Settings, get_settings
+
+logger = logging.getLogger(__name__)
+
+
+def create_http_transport(settings: Settings) -> httpx.HTTPTransport:
+    """Create the HTTP connection pool used for Supabase.
+
+    Args:
+        settings: Settings with the pool limits
+
+    Returns:
+        Transport keeping connections alive between requests
+    """
+    return httpx.HTTPTransport(
+        http2=settings.supabase_http2,
+        limits=httpx.Limits(
+            max_connections=settings.supabase_max_connections,
+            max_keepalive_connections=settings.supabase_max_keepalive_connections,
+            keepalive_expiry=settings.supabase_keepalive_expiry_seconds,
+        ),
+    )
+
+
+def create_http_client(
+    settings: Settings, transport: httpx.HTTPTransport | None = None
+) -> httpx.Client:
+    """Create an HTTP client for Supabase.
+
+    Args:
+        settings: Settings with the pool limits and timeouts
+        transport: Connection pool to send through (default: a new one)
+
+    Returns:
+        HTTP client keeping connections alive between requests
+    """
+    return httpx.Client(
+        transport=transport or create_http_transport(settings),
+        timeout=httpx.Timeout(
+            settings.supabase_timeout_seconds,
+            connect=settings.supabase_connect_timeout_seconds,
+        ),
+    )
+
+
+@lru_cache
+def get_supabase_transport() -> httpx.HTTPTransport:
+    """Get the process-wide HTTP connection pool for Supabase.
+
+    PostgREST queries and auth calls of every Supabase client go through
+    it, so connections (and their TLS sessions) are reused instead of
+    opened per client.
+
+    Returns:
+        Shared transport, closed by close_supabase_http_client()
+    """
+    return create_http_transport(get_settings())
+
+
+@lru_cache
+def get_supabase_http_client() -> httpx.Client:
+    """Get the HTTP client for direct requests to Supabase (warmup).
+
+    Returns:
+        HTTP client over the shared connection pool
+    """
+    return create_http_client(get_settings(), get_supabase_transport())
+
+
+def supabase_client_options() -> SyncClientOptions:
+    """Options making a Supabase client use the shared connection pool.
+
+    Each Supabase client gets its own HTTP client over the shared
+    transport: postgrest and storage3 set the base URL and auth headers
+    of the HTTP client they are given, so clients of different projects
+    (primary and read replica) must not share one.
+
+    Returns:
+        Fresh options (clients keep their auth headers in them)
+    """
+    return SyncClientOptions(
+        httpx_client=create_http_client(get_settings(), get_supabase_transport())
+    )
 
 
 @lru_cache
@@ -15,4 +101,50 @@ def get_supabase_client() -> Client:
         Configured Supabase client
     """
     settings = get_settings()
-    return create_client(settings.supabase_url, settings.supabase_publishable_key)
+    return create_client(
+        settings.supabase_url,
+        settings.supabase_publishable_key,
+        supabase_client_options(),
+    )
+
+
+async def warm_up_supabase_http_client() -> int:
+    """Open pooled connections to Supabase before the first request.
+
+    Sends concurrent requests to the auth health endpoint, so the
+    connections (TCP and TLS handshakes) are ready when traffic starts.
+    A failure is logged and does not prevent startup.
+
+    Returns:
+        Number of successful warmup requests
+    """
+    settings = get_settings()
+    http_client = get_supabase_http_client()
+    url = f"{settings.supabase_url.rstrip('/')}/auth/v1/health"
+    headers = {"apikey": settings.supabase_publishable_key}
+
+    def ping() -> bool:
+        try:
+            http_client.get(url, headers=headers).raise_for_status()
+        except httpx.HTTPError as exc:
+            logger.warning("Supabase connection warmup failed: %s", exc)
+            return False
+        return True
+
+    results = await asyncio.gather(
+        *(asyncio.to_thread(ping) for _ in range(settings.supabase_warmup_connections))
+    )
+    return sum(results)
+
+
+def close_supabase_http_client() -> None:
+    """Close the shared connection pool, if it was opened.
+
+    The cached Supabase client is dropped with it; a later call to
+    get_supabase_client() opens a new pool.
+    """
+    if get_supabase_transport.cache_info().currsize:
+        get_supabase_transport().close()
+    get_supabase_transport.cache_clear()
+    get_supabase_http_client.cache_clear()
+    get_supabase_client.cache_clear()
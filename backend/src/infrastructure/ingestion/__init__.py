@@ -0,0 +1,7 @@
+"""Write-behind and bulk ingestion implementations."""
+
+from .batching_activity_queue import BatchingActivityQueue
+from .dead_letter_file import DeadLetterFile
+from .postgres_copy_loader import PostgresCopyLoader
+
+__all__ = ["BatchingActivityQueue", "DeadLetterFile", "PostgresCopyLoader"]
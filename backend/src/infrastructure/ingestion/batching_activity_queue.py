@@ -0,0 +1,219 @@
+"""In-process batching implementation of ActivityIngestionQueue port."""
+
+import asyncio
+import contextlib
+import logging
+import time
+from collections.abc import Awaitable, Callable
+
+from domain.entities.activity import Activity
+from domain.ports.activity_ingestion_queue import (
+    ActivityIngestionQueue,
+    IngestionQueueFullError,
+    IngestionStats,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class BatchingActivityQueue(ActivityIngestionQueue):
+    """Bounded asyncio queue flushed by a background task in micro-batches.
+
+    A batch is written when it reaches max_batch_size activities or when
+    flush_interval_seconds have passed since its first activity, whichever
+    comes first. A full queue rejects new activities instead of growing,
+    so callers can shed load.
+
+    Accepted activities were already acknowledged to clients, so a failed
+    write is not dropped: the batch is retried with exponential backoff
+    (new activities queue up meanwhile, up to the queue bound), then
+    written one activity at a time so a single bad row cannot sink the
+    others. Activities that still fail are handed to the dead letter
+    sink, or logged in full without one.
+    """
+
+    def __init__(
+        self,
+        flush: Callable[[list[Activity]], Awaitable[None]],
+        max_batch_size: int = 100,
+        flush_interval_seconds: float = 0.05,
+        max_queue_size: int = 10000,
+        max_retries: int = 3,
+        retry_backoff_seconds: float = 0.2,
+        dead_letter: Callable[[list[Activity]], Awaitable[None]] | None = None,
+        clock: Callable[[], float] = time.perf_counter,
+        sleep: Callable[[float], Awaitable[None]] = asyncio.sleep,
+    ) -> None:
+        """Initialize an idle queue.
+
+        The flush task starts with the first submitted activity.
+
+        Args:
+            flush: Coroutine function writing one batch
+            max_batch_size: Activities per batch at most
+            flush_interval_seconds: Longest wait before a partial batch is written
+            max_queue_size: Queued activities at most before rejecting
+            max_retries: Retries of a failed batch before writing it one by one
+            retry_backoff_seconds: Wait before the first retry, doubled after
+                each further failure
+            dead_letter: Coroutine function keeping activities that could not
+                be written (None logs them)
+            clock: Time source in seconds used for flush latency
+            sleep: Coroutine function waiting between retries
+        """
+        self._flush = flush
+        self._max_batch_size = max_batch_size
+        self._flush_interval_seconds = flush_interval_seconds
+        self._queue: asyncio.Queue[Activity] = asyncio.Queue(maxsize=max_queue_size)
+        self._max_retries = max_retries
+        self._retry_backoff_seconds = retry_backoff_seconds
+        self._dead_letter = dead_letter
+        self._clock = clock
+        self._sleep = sleep
+        self._task: asyncio.Task[None] | None = None
+        self._closing = False
+
+        self._submitted = 0
+        self._rejected = 0
+        self._flushes = 0
+        self._flushed = 0
+        self._retries = 0
+        self._failed = 0
+        self._last_flush_ms = 0.0
+        self._max_flush_ms = 0.0
+        self._total_flush_ms = 0.0
+
+    async def submit(self, activity: Activity) -> None:
+        """Queue an activity for writing.
+
+        Args:
+            activity: Fully computed activity to persist
+
+        Raises:
+            IngestionQueueFullError: If the queue is full or closing
+        """
+        if self._closing:
+            raise IngestionQueueFullError("Ingestion queue is shutting down")
+        try:
+            self._queue.put_nowait(activity)
+        except asyncio.QueueFull:
+            self._rejected += 1
+            raise IngestionQueueFullError("Ingestion queue is full") from None
+
+        self._submitted += 1
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    def stats(self) -> IngestionStats:
+        """Get queue counters.
+
+        Returns:
+            Current depth, throughput and flush latency counters
+        """
+        return IngestionStats(
+            depth=self._queue.qsize(),
+            submitted=self._submitted,
+            rejected=self._rejected,
+            flushes=self._flushes,
+            flushed=self._flushed,
+            retries=self._retries,
+            failed=self._failed,
+            last_flush_ms=self._last_flush_ms,
+            max_flush_ms=self._max_flush_ms,
+            total_flush_ms=self._total_flush_ms,
+        )
+
+    async def close(self) -> None:
+        """Stop accepting activities and write the ones still queued."""
+        self._closing = True
+        if self._task is None:
+            return
+        await self._queue.join()
+        self._task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await self._task
+        self._task = None
+
+    async def _run(self) -> None:
+        """Collect and write batches until cancelled."""
+        while True:
+            batch = await self._collect()
+            try:
+                await self._write(batch)
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+    async def _collect(self) -> list[Activity]:
+        """Wait for a full batch or for the flush interval to elapse."""
+        batch = [await self._queue.get()]
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self._flush_interval_seconds
+
+        while len(batch) < self._max_batch_size:
+            if not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+                continue
+            remaining = deadline - loop.time()
+            if remaining <= 0 or self._closing:
+                break
+            try:
+                batch.append(await asyncio.wait_for(self._queue.get(), remaining))
+            except TimeoutError:
+                break
+        return batch
+
+    async def _write(self, batch: list[Activity]) -> None:
+        """Write one batch, retrying and dead-lettering what keeps failing."""
+        for attempt in range(self._max_retries + 1):
+            if attempt:
+                self._retries += 1
+                await self._sleep(self._retry_backoff_seconds * 2 ** (attempt - 1))
+            if await self._write_timed(batch):
+                self._flushed += len(batch)
+                return
+
+        failed = batch
+        if len(batch) > 1:
+            failed = []
+            for activity in batch:
+                if await self._write_timed([activity]):
+                    self._flushed += 1
+                else:
+                    failed.append(activity)
+        if failed:
+            self._failed += len(failed)
+            await self._give_up(failed)
+
+    async def _write_timed(self, batch: list[Activity]) -> bool:
+        """Attempt one write and record its latency."""
+        started = self._clock()
+        try:
+            await self._flush(batch)
+        except Exception:
+            logger.warning(
+                "Failed to write %d queued activities", len(batch), exc_info=True
+            )
+            return False
+        finally:
+            elapsed_ms = (self._clock() - started) * 1000
+            self._flushes += 1
+            self._last_flush_ms = elapsed_ms
+            self._max_flush_ms = max(self._max_flush_ms, elapsed_ms)
+            self._total_flush_ms += elapsed_ms
+        return True
+
+    async def _give_up(self, activities: list[Activity]) -> None:
+        """Keep activities that could not be written for recovery."""
+        if self._dead_letter is not None:
+            try:
+                await self._dead_letter(activities)
+                logger.error(
+                    "Dead-lettered %d queued activities after retries",
+                    len(activities),
+                )
+                return
+            except Exception:
+                logger.exception("Failed to dead-letter queued activities")
+        for activity in activities:
+            logger.error("Lost queued activity after retries: %r", activity)
@@ -0,0 +1,103 @@
+"""Dead letter file for activities the ingestion queue could not write."""
+
+import asyncio
+import json
+from datetime import date, datetime
+from pathlib import Path
+from typing import Any
+from uuid import UUID
+
+from domain.entities.activity import Activity
+
+
+def _encode(activity: Activity) -> dict[str, Any]:
+    """JSON-compatible fields of an activity."""
+    return {
+        "id": str(activity.id),
+        "category": activity.category,
+        "type": activity.type,
+        "value": activity.value,
+        "co2e_kg": activity.co2e_kg,
+        "date": activity.date.isoformat(),
+        "notes": activity.notes,
+        "metadata": activity.metadata,
+        "user_id": str(activity.user_id) if activity.user_id else None,
+        "session_id": activity.session_id,
+        "created_at": activity.created_at.isoformat(),
+        "updated_at": activity.updated_at.isoformat() if activity.updated_at else None,
+    }
+
+
+def _decode(row: dict[str, Any]) -> Activity:
+    """Rebuild an activity from its JSON fields."""
+    return Activity(
+        id=UUID(row["id"]),
+        category=row["category"],
+        type=row["type"],
+        value=float(row["value"]),
+        co2e_kg=float(row["co2e_kg"]),
+        date=date.fromisoformat(row["date"]),
+        notes=row["notes"],
+        metadata=row["metadata"],
+        user_id=UUID(row["user_id"]) if row["user_id"] else None,
+        session_id=row["session_id"],
+        created_at=datetime.fromisoformat(row["created_at"]),
+        updated_at=datetime.fromisoformat(row["updated_at"])
+        if row["updated_at"]
+        else None,
+    )
+
+
+class DeadLetterFile:
+    """JSON lines file keeping activities until they are replayed.
+
+    Each line holds one complete activity, including its ID, so replaying
+    the file with scripts/replay_dead_letters.py writes exactly the
+    activities that clients were told were created.
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        """Initialize dead letter file.
+
+        Args:
+            path: File appended to (created with its directory if missing)
+        """
+        self._path = Path(path)
+
+    async def write(self, activities: list[Activity]) -> None:
+        """Append activities to the file.
+
+        Args:
+            activities: Activities that could not be written
+        """
+        await asyncio.to_thread(self._append, activities)
+
+    def read(self) -> list[Activity]:
+        """Read every activity kept in the file.
+
+        Returns:
+            Activities in the order they were dead-lettered
+
+        Raises:
+            ValueError: If a line is not a valid activity
+        """
+        if not self._path.exists():
+            return []
+        activities = []
+        with self._path.open(encoding="utf-8") as f:
+            for number, line in enumerate(f, start=1):
+                if not line.strip():
+                    continue
+                try:
+                    activities.append(_decode(json.loads(line)))
+                except (KeyError, TypeError, ValueError) as e:
+                    raise ValueError(f"Invalid dead letter on line {number}") from e
+        return activities
+
+    def _append(self, activities: list[Activity]) -> None:
+        """Append and flush activities to disk (blocking)."""
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        with self._path.open("a", encoding="utf-8") as f:
+            for activity in activities:
+                f.write(json.dumps(_encode(activity)) + "\n")
+            f.flush()
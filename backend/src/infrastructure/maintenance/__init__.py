@@ -0,0 +1,5 @@
+"""Scheduled maintenance of stored data."""
+
+from .postgres_session_cleaner import PostgresSessionCleaner
+
+__all__ = ["PostgresSessionCleaner"]
@@ -0,0 +1,254 @@
+"""Cleanup of stale anonymous sessions in Postgres."""
+
+import asyncio
+import logging
+import time
+from collections.abc import Awaitable, Callable
+from datetime import UTC, date, datetime, timedelta
+
+from domain.ports.footprint_cache import FootprintCache
+from domain.ports.session_cleaner import (
+    SessionCleaner,
+    SessionCleanupReport,
+    SessionCleanupStats,
+)
+from domain.services.owner_key import owner_key
+from domain.services.percentile_index import PopulationPercentileIndex
+from infrastructure.archive.postgres_activity_archiver import PostgresActivityArchiver
+from infrastructure.config.postgres import PostgresPool
+
+logger = logging.getLogger(__name__)
+
+# Next sessions (in ID order) whose unmigrated activities were all
+# created and last edited before the cutoff; walks
+# idx_activities_unmigrated_session
+_STALE = """
+SELECT session_id
+FROM activities
+WHERE user_id IS NULL AND session_id > $1
+GROUP BY session_id
+HAVING max(GREATEST(created_at, updated_at)) < $2
+ORDER BY session_id
+LIMIT $3
+"""
+
+_DELETE = f"""
+WITH stale AS ({_STALE}), deleted AS (
+    DELETE FROM activities a
+    USING stale s
+    WHERE a.user_id IS NULL AND a.session_id = s.session_id
+    RETURNING 1
+)
+SELECT (SELECT array_agg(session_id ORDER BY session_id) FROM stale) AS session_ids,
+       (SELECT count(*) FROM deleted) AS activities
+"""
+
+_COUNT = f"""
+WITH stale AS ({_STALE})
+SELECT (SELECT array_agg(session_id ORDER BY session_id) FROM stale) AS session_ids,
+       (SELECT count(*)
+        FROM activities a
+        JOIN stale s ON a.session_id = s.session_id
+        WHERE a.user_id IS NULL) AS activities
+"""
+
+
+class PostgresSessionCleaner(SessionCleaner):
+    """Delete or archive anonymous sessions idle past a time-to-live.
+
+    A session is stale when none of its unmigrated activities was created
+    or edited within the TTL. Stale sessions are processed in batches in
+    session ID order, each batch in its own transaction, so a run can be
+    interrupted and repeated at any time. With an archiver, the
+    activities of each stale session dated past the archival horizon are
+    moved to the archive (keeping their rollups), where reads of old date
+    ranges still find them; the newer ones are deleted.
+
+    Cached footprints and percentile entries of reclaimed sessions are
+    dropped, so their owners' reads never serve removed activities.
+
+    Runs are paced to at most max_rows_per_second reclaimed activities,
+    so a large backlog does not saturate the database. Runs of one
+    cleaner are serialized.
+    """
+
+    def __init__(
+        self,
+        pool: PostgresPool,
+        ttl_days: int = 90,
+        batch_size: int = 500,
+        max_rows_per_second: int = 0,
+        archiver: PostgresActivityArchiver | None = None,
+        archive_horizon_days: int = 365,
+        footprint_cache: FootprintCache | None = None,
+        percentile_index: PopulationPercentileIndex | None = None,
+        clock: Callable[[], float] = time.perf_counter,
+        sleep: Callable[[float], Awaitable[None]] = asyncio.sleep,
+    ) -> None:
+        """Initialize cleaner.
+
+        Args:
+            pool: Postgres pool
+            ttl_days: Days without activity after which a session is stale
+            batch_size: Sessions per batch
+            max_rows_per_second: Activities reclaimed per second at most
+                (0 for no limit)
+            archiver: Archiver to move stale sessions to (None deletes them)
+            archive_horizon_days: Age in days past which activities are
+                archived rather than deleted (with an archiver)
+            footprint_cache: Cache whose entries of reclaimed sessions are
+                invalidated
+            percentile_index: Index reclaimed sessions are removed from
+            clock: Time source in seconds used for pacing and durations
+            sleep: Coroutine function waiting a number of seconds
+        """
+        self._pool = pool
+        self._ttl = timedelta(days=ttl_days)
+        self._batch_size = batch_size
+        self._max_rows_per_second = max_rows_per_second
+        self._archiver = archiver
+        self._archive_horizon = timedelta(days=archive_horizon_days)
+        self._footprint_cache = footprint_cache
+        self._percentile_index = percentile_index
+        self._clock = clock
+        self._sleep = sleep
+        self._lock = asyncio.Lock()
+
+        self._runs = 0
+        self._failed = 0
+        self._sessions = 0
+        self._activities = 0
+        self._last_run_ms = 0.0
+        self._last_finished_at: datetime | None = None
+
+    async def run(self, dry_run: bool = False) -> SessionCleanupReport:
+        """Reclaim the activities of every stale session.
+
+        Args:
+            dry_run: Only count the stale sessions and their activities
+
+        Returns:
+            Sessions and activities reclaimed (found, on a dry run)
+        """
+        async with self._lock:
+            try:
+                report = await self._run(dry_run)
+            except Exception:
+                if not dry_run:
+                    self._failed += 1
+                raise
+        if not dry_run:
+            self._runs += 1
+            self._sessions += report.sessions
+            self._activities += report.activities
+            self._last_run_ms = report.duration_ms
+            self._last_finished_at = datetime.now(UTC)
+        logger.info(
+            "Session cleanup%s: %d sessions, %d activities in %.0f ms",
+            " (dry run)" if dry_run else "",
+            report.sessions,
+            report.activities,
+            report.duration_ms,
+        )
+        return report
+
+    def stats(self) -> SessionCleanupStats:
+        """Get counters since start.
+
+        Returns:
+            Snapshot of run counters
+        """
+        return SessionCleanupStats(
+            runs=self._runs,
+            failed=self._failed,
+            sessions=self._sessions,
+            activities=self._activities,
+            last_run_ms=self._last_run_ms,
+            last_finished_at=self._last_finished_at,
+        )
+
+    async def _run(self, dry_run: bool) -> SessionCleanupReport:
+        """Process stale sessions batch by batch."""
+        started = self._clock()
+        idle_before = datetime.now(UTC) - self._ttl
+        batch_name = "sessions-" + idle_before.strftime("%Y%m%dT%H%M%S%f")
+        archive_before = date.today() - self._archive_horizon
+        after = ""
+        sessions = activities = batches = 0
+        while True:
+            if dry_run:
+                found, reclaimed = await self._batch(_COUNT, after, idle_before)
+            elif self._archiver is not None:
+                found, reclaimed = await self._archive_batch(
+                    self._archiver, after, idle_before, archive_before, batch_name
+                )
+            else:
+                found, reclaimed = await self._batch(_DELETE, after, idle_before)
+            if not found:
+                break
+            if not dry_run:
+                await self._forget(found)
+            batches += 1
+            sessions += len(found)
+            activities += reclaimed
+            if len(found) < self._batch_size:
+                break
+            after = found[-1]
+            if not dry_run:
+                await self._pace(started, activities)
+        return SessionCleanupReport(
+            idle_before=idle_before,
+            sessions=sessions,
+            activities=activities,
+            batches=batches,
+            duration_ms=(self._clock() - started) * 1000,
+            archived=self._archiver is not None,
+            dry_run=dry_run,
+        )
+
+    async def _batch(
+        self, query: str, after: str, idle_before: datetime
+    ) -> tuple[list[str], int]:
+        """Run one counting or deleting batch statement.
+
+        Returns:
+            Stale sessions of the batch in ID order, and their activities
+        """
+        pool = await self._pool.get()
+        row = await pool.fetchrow(query, after, idle_before, self._batch_size)
+        return row["session_ids"] or [], row["activities"]
+
+    async def _archive_batch(
+        self,
+        archiver: PostgresActivityArchiver,
+        after: str,
+        idle_before: datetime,
+        archive_before: date,
+        batch_name: str,
+    ) -> tuple[list[str], int]:
+        """Archive (or delete, if recent) the next batch of stale sessions."""
+        pool = await self._pool.get()
+        rows = await pool.fetch(_STALE, after, idle_before, self._batch_size)
+        reclaimed = 0
+        for row in rows:
+            reclaimed += await archiver.reclaim_session(
+                row["session_id"], archive_before, batch_name
+            )
+        return [row["session_id"] for row in rows], reclaimed
+
+    async def _forget(self, session_ids: list[str]) -> None:
+        """Drop cached footprints and percentile entries of reclaimed sessions."""
+        for session_id in session_ids:
+            owner = owner_key(None, session_id)
+            if self._footprint_cache is not None:
+                await self._footprint_cache.invalidate(owner)
+            if self._percentile_index is not None:
+                self._percentile_index.remove_owner(owner)
+
+    async def _pace(self, started: float, reclaimed: int) -> None:
+        """Wait until the run is within its rate limit."""
+        if not self._max_rows_per_second:
+            return
+        ahead = reclaimed / self._max_rows_per_second - (self._clock() - started)
+        if ahead > 0:
+            await self._sleep(ahead)
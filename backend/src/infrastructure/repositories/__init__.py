@@ -1,11 +1,23 @@
-"""Repository implementations using Supabase."""
+"""Repository implementations using Supabase, Postgres directly or memory."""
 
+from .in_memory_activity_repository import InMemoryActivityRepository
+from .postgres_activity_repository import PostgresActivityRepository
+from .read_routing_activity_repository import ReadRoutingActivityRepository
 from .supabase_activity_repository import SupabaseActivityRepository
 from .supabase_emission_factor_repository import (
     SupabaseEmissionFactorRepository,
 )
+from .supabase_recalculation_checkpoint_store import (
+    SupabaseRecalculationCheckpointStore,
+)
+from .tiered_activity_repository import TieredActivityRepository
 
 __all__ = [
+    "InMemoryActivityRepository",
+    "PostgresActivityRepository",
+    "ReadRoutingActivityRepository",
     "SupabaseActivityRepository",
     "SupabaseEmissionFactorRepository",
+    "SupabaseRecalculationCheckpointStore",
+    "TieredActivityRepository",
 ]
@@ -0,0 +1,166 @@
+"""In-memory snapshot of emission factors in front of another repository."""
+
+import hashlib
+import json
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import date
+
+from domain.entities.emission_factor import EmissionFactor
+from domain.ports.emission_factor_repository import EmissionFactorRepository
+from domain.services.emission_factor_index import EmissionFactorIndex
+
+
+@dataclass(frozen=True)
+class EmissionFactorSnapshot:
+    """Emission factors loaded at one point in time.
+
+    Attributes:
+        factors: All factors ordered by category, then type
+        index: Factors indexed by activity type and effective period
+        content_hash: SHA-256 over the factor values
+        loaded_at: Clock reading when the snapshot was taken
+    """
+
+    factors: list[EmissionFactor]
+    index: EmissionFactorIndex
+    content_hash: str
+    loaded_at: float
+
+
+class EmissionFactorCatalog:
+    """Process-wide holder of the current emission factor snapshot.
+
+    Emission factors change only when reference data is re-seeded, so
+    they are loaded once and refreshed after a TTL.
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: int = 3600,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize an empty catalog.
+
+        Args:
+            ttl_seconds: Seconds before the snapshot is reloaded
+            clock: Monotonic time source in seconds
+        """
+        self._ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._snapshot: EmissionFactorSnapshot | None = None
+
+    async def snapshot(
+        self, source: EmissionFactorRepository
+    ) -> EmissionFactorSnapshot:
+        """Get the current snapshot, loading it from source when stale.
+
+        Args:
+            source: Repository to load factors from
+
+        Returns:
+            Current emission factor snapshot
+        """
+        now = self._clock()
+        if (
+            self._snapshot is None
+            or now - self._snapshot.loaded_at >= self._ttl_seconds
+        ):
+            factors = await source.get_all()
+            self._snapshot = EmissionFactorSnapshot(
+                factors=factors,
+                index=EmissionFactorIndex(factors),
+                content_hash=self._hash(factors),
+                loaded_at=now,
+            )
+        return self._snapshot
+
+    def invalidate(self) -> None:
+        """Drop the snapshot so the next read reloads it."""
+        self._snapshot = None
+
+    @staticmethod
+    def _hash(factors: list[EmissionFactor]) -> str:
+        """Hash the values that are exposed to clients."""
+        payload = [
+            [f.id, f.category, f.type, f.factor, f.unit, f.source, f.source_year]
+            for f in factors
+        ]
+        return hashlib.sha256(json.dumps(payload, default=str).encode()).hexdigest()
+
+
+class CachedEmissionFactorRepository(EmissionFactorRepository):
+    """Emission factor repository served from a catalog snapshot."""
+
+    def __init__(
+        self, source: EmissionFactorRepository, catalog: EmissionFactorCatalog
+    ) -> None:
+        """Initialize repository.
+
+        Args:
+            source: Repository to load factors from on a catalog miss
+            catalog: Shared snapshot holder
+        """
+        self._source = source
+        self._catalog = catalog
+
+    async def get_by_type(self, activity_type: str) -> EmissionFactor | None:
+        """Retrieve the most recent emission factor of an activity type.
+
+        Args:
+            activity_type: Activity type (e.g., "car_petrol")
+
+        Returns:
+            Latest emission factor if found, None otherwise
+        """
+        snapshot = await self._catalog.snapshot(self._source)
+        return snapshot.index.latest(activity_type)
+
+    async def get_by_type_on(
+        self, activity_type: str, on: date
+    ) -> EmissionFactor | None:
+        """Retrieve the emission factor of an activity type valid on a date.
+
+        Answered from the snapshot's interval index without a query.
+
+        Args:
+            activity_type: Activity type (e.g., "car_petrol")
+            on: Date the activity took place
+
+        Returns:
+            Emission factor in effect on that date, None if the type is unknown
+        """
+        snapshot = await self._catalog.snapshot(self._source)
+        return snapshot.index.on(activity_type, on)
+
+    async def list_by_category(self, category: str) -> list[EmissionFactor]:
+        """List all emission factors for a category.
+
+        Args:
+            category: Category name ("transport", "energy", "food")
+
+        Returns:
+            List of emission factors ordered by type
+        """
+        snapshot = await self._catalog.snapshot(self._source)
+        return [f for f in snapshot.factors if f.category == category]
+
+    async def get_all(self) -> list[EmissionFactor]:
+        """Retrieve all emission factors.
+
+        Returns:
+            List of all emission factors ordered by category, type, then
+            source year
+        """
+        snapshot = await self._catalog.snapshot(self._source)
+        return list(snapshot.factors)
+
+    async def data_version(self) -> str | None:
+        """Get the content hash of the current snapshot.
+
+        Returns:
+            SHA-256 over the factor values
+        """
+        snapshot = await self._catalog.snapshot(self._source)
+        return snapshot.content_hash
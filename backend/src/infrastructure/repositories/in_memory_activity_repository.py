@@ -0,0 +1,678 @@
+"""In-process implementation of ActivityRepository port."""
+
+from bisect import bisect_left, bisect_right, insort
+from collections import defaultdict
+from collections.abc import Iterable
+from dataclasses import dataclass, field, replace
+from datetime import UTC, date, datetime
+from typing import Any
+from uuid import UUID
+
+from domain.entities.activity import Activity
+from domain.ports.activity_repository import (
+    WRITE_CATEGORY_MISMATCH,
+    WRITE_FORBIDDEN,
+    WRITE_NOT_FOUND,
+    WRITE_OK,
+    ActivityRepository,
+    ActivitySelection,
+    Co2eCalculator,
+    OwnedWriteResult,
+    OwnerCategoryTotal,
+)
+from domain.services.owner_key import require_owner
+
+# Sort keys; IDs are stored as integers, which order like Postgres UUIDs
+_OwnerDateKey = tuple[int, float, int]  # (date ordinal, created_at, id)
+
+# Larger batches are appended and merged by one sort: the existing keys
+# form a single sorted run, so the cost grows with the batch, not the list
+_INSORT_MAX = 32
+
+
+def _owner_date_key(activity: Activity) -> _OwnerDateKey:
+    """Key of an activity in its owners' date indexes."""
+    return (
+        activity.date.toordinal(),
+        activity.created_at.timestamp(),
+        activity.id.int,
+    )
+
+
+def _insert_sorted(keys: list[Any], new_keys: list[Any]) -> None:
+    """Add keys to a sorted list, by insort or by one sort for batches."""
+    if len(new_keys) <= _INSORT_MAX:
+        for key in new_keys:
+            insort(keys, key)
+    else:
+        keys.extend(new_keys)
+        keys.sort()
+
+
+def _remove_sorted(keys: list[Any], key: Any) -> None:
+    """Remove a key from a sorted list."""
+    i = bisect_left(keys, key)
+    if i < len(keys) and keys[i] == key:
+        del keys[i]
+
+
+@dataclass
+class _OwnerIndex:
+    """Sorted keys of one owner's activities."""
+
+    by_date: list[_OwnerDateKey] = field(default_factory=list)
+    by_id: list[int] = field(default_factory=list)
+
+    def add(self, activities: list[Activity]) -> None:
+        """Index new activities of the owner."""
+        _insert_sorted(self.by_date, [_owner_date_key(a) for a in activities])
+        _insert_sorted(self.by_id, [a.id.int for a in activities])
+
+
+class InMemoryActivityRepository(ActivityRepository):
+    """Activity repository held in process memory.
+
+    Meant for local development without Supabase and as a realistic
+    fixture for tests and benchmarks with millions of rows. Activities
+    are indexed per owner in date order and by ID, so range reads and
+    keyset pages are bisect lookups plus a slice instead of scans.
+
+    Mirrors the Postgres adapters: authenticated owners are matched on
+    user_id and anonymous ones on session_id, listings are ordered the
+    same way and ownership-checked writes report the same outcomes.
+    No method awaits, so each call is atomic on the event loop.
+    Values are kept as given, without rounding to column scale.
+    """
+
+    def __init__(self, activities: Iterable[Activity] = ()) -> None:
+        """Initialize repository, optionally preloaded.
+
+        Args:
+            activities: Activities to start with
+        """
+        self._activities: dict[int, Activity] = {}
+        self._ids: list[int] = []
+        self._by_user: defaultdict[UUID, _OwnerIndex] = defaultdict(_OwnerIndex)
+        self._by_session: defaultdict[str, _OwnerIndex] = defaultdict(_OwnerIndex)
+        self._add(list(activities))
+
+    def __len__(self) -> int:
+        """Number of stored activities."""
+        return len(self._activities)
+
+    async def save(self, activity: Activity) -> Activity:
+        """Store a new activity.
+
+        Args:
+            activity: Activity entity to save
+
+        Returns:
+            The stored activity
+
+        Raises:
+            ValueError: If an activity with the same ID exists
+        """
+        self._add([activity])
+        return activity
+
+    async def save_many(self, activities: list[Activity]) -> list[Activity]:
+        """Store several new activities, sorting each index once.
+
+        Args:
+            activities: Activity entities to save
+
+        Returns:
+            The stored activities, in input order
+
+        Raises:
+            ValueError: If an ID exists already or repeats in the batch
+        """
+        self._add(activities)
+        return list(activities)
+
+    async def get_by_id(self, activity_id: UUID) -> Activity | None:
+        """Retrieve activity by ID.
+
+        Args:
+            activity_id: Activity identifier
+
+        Returns:
+            Activity if found, None otherwise
+        """
+        return self._activities.get(activity_id.int)
+
+    async def list_by_user(
+        self, user_id: UUID, limit: int = 100, offset: int = 0
+    ) -> list[Activity]:
+        """List activities for authenticated user.
+
+        Args:
+            user_id: User identifier
+            limit: Maximum number of activities
+            offset: Number to skip
+
+        Returns:
+            List of activities ordered by date descending
+        """
+        return self._newest_first(self._by_user.get(user_id), limit, offset)
+
+    async def list_by_session(
+        self, session_id: str, limit: int = 100, offset: int = 0
+    ) -> list[Activity]:
+        """List activities for anonymous session.
+
+        Args:
+            session_id: Session identifier
+            limit: Maximum number of activities
+            offset: Number to skip
+
+        Returns:
+            List of activities ordered by date descending
+        """
+        return self._newest_first(self._by_session.get(session_id), limit, offset)
+
+    async def migrate_session_to_user(self, user_id: UUID, session_id: str) -> int:
+        """Migrate anonymous activities from session to authenticated user.
+
+        Args:
+            user_id: Authenticated user's ID
+            session_id: Anonymous session identifier
+
+        Returns:
+            Count of activities migrated
+        """
+        index = self._by_session.get(session_id)
+        if index is None:
+            return 0
+        migrated = [
+            self._activities[key[2]]
+            for key in index.by_date
+            if self._activities[key[2]].user_id is None
+        ]
+        if not migrated:
+            return 0
+
+        # Only the user index changes: dates, IDs and the session stay
+        for activity in migrated:
+            self._activities[activity.id.int] = replace(activity, user_id=user_id)
+        index = self._by_user[user_id]
+        _insert_sorted(index.by_date, [_owner_date_key(a) for a in migrated])
+        _insert_sorted(index.by_id, sorted(a.id.int for a in migrated))
+        return len(migrated)
+
+    async def list_by_date_range(
+        self,
+        user_id: UUID | None,
+        session_id: str | None,
+        start_date: date,
+        end_date: date,
+    ) -> list[Activity]:
+        """List activities within a date range by bisecting the owner's index.
+
+        Args:
+            user_id: User ID if authenticated
+            session_id: Session ID for anonymous users
+            start_date: Start of date range (inclusive)
+            end_date: End of date range (inclusive)
+
+        Returns:
+            List of activities ordered by date ascending
+        """
+        index = self._owner_index(user_id, session_id)
+        if index is None:
+            return []
+        keys = index.by_date
+        lo = bisect_left(keys, (start_date.toordinal(),))
+        hi = bisect_left(keys, (end_date.toordinal() + 1,))
+        return [self._activities[key[2]] for key in keys[lo:hi]]
+
+    async def update(self, activity: Activity) -> Activity:
+        """Update existing activity.
+
+        Like the database adapters, owner, category and creation time are
+        kept from the stored activity.
+
+        Args:
+            activity: Activity entity with updated values
+
+        Returns:
+            Updated activity
+
+        Raises:
+            ValueError: If activity not found
+        """
+        old = self._activities.get(activity.id.int)
+        if old is None:
+            raise ValueError(f"Activity not found: {activity.id}")
+        return self._replace(
+            old,
+            replace(
+                old,
+                type=activity.type,
+                value=activity.value,
+                co2e_kg=activity.co2e_kg,
+                date=activity.date,
+                notes=activity.notes,
+                metadata=activity.metadata,
+                updated_at=datetime.now(UTC),
+            ),
+        )
+
+    async def delete(self, activity_id: UUID) -> bool:
+        """Delete activity by ID.
+
+        Args:
+            activity_id: Activity identifier
+
+        Returns:
+            True if deleted, False if not found
+        """
+        activity = self._activities.get(activity_id.int)
+        if activity is None:
+            return False
+        self._remove(activity)
+        return True
+
+    async def update_owned(
+        self,
+        activity_id: UUID,
+        user_id: UUID | None,
+        session_id: str | None,
+        category: str,
+        activity_type: str,
+        value: float,
+        co2e_kg: float,
+        activity_date: date,
+        notes: str | None,
+    ) -> OwnedWriteResult:
+        """Update an activity only if it belongs to the given owner.
+
+        Args:
+            activity_id: Activity identifier
+            user_id: User ID if authenticated
+            session_id: Session ID for anonymous users
+            category: Category the new type belongs to (must match the row)
+            activity_type: Updated activity type
+            value: Updated activity amount
+            co2e_kg: Recalculated CO2e in kilograms
+            activity_date: Updated date when activity occurred
+            notes: Updated optional user notes
+
+        Returns:
+            Write outcome with the activity before and after the update
+        """
+        require_owner(user_id, session_id)
+        old = self._activities.get(activity_id.int)
+        if old is None:
+            return OwnedWriteResult(status=WRITE_NOT_FOUND)
+        if not self._owns(old, user_id, session_id):
+            return OwnedWriteResult(status=WRITE_FORBIDDEN)
+        if old.category != category:
+            return OwnedWriteResult(status=WRITE_CATEGORY_MISMATCH, previous=old)
+        new = self._replace(
+            old,
+            replace(
+                old,
+                type=activity_type,
+                value=value,
+                co2e_kg=co2e_kg,
+                date=activity_date,
+                notes=notes,
+                updated_at=datetime.now(UTC),
+            ),
+        )
+        return OwnedWriteResult(status=WRITE_OK, activity=new, previous=old)
+
+    async def delete_owned(
+        self, activity_id: UUID, user_id: UUID | None, session_id: str | None
+    ) -> OwnedWriteResult:
+        """Delete an activity only if it belongs to the given owner.
+
+        Args:
+            activity_id: Activity identifier
+            user_id: User ID if authenticated
+            session_id: Session ID for anonymous users
+
+        Returns:
+            Write outcome with the deleted activity as previous
+        """
+        require_owner(user_id, session_id)
+        activity = self._activities.get(activity_id.int)
+        if activity is None:
+            return OwnedWriteResult(status=WRITE_NOT_FOUND)
+        if not self._owns(activity, user_id, session_id):
+            return OwnedWriteResult(status=WRITE_FORBIDDEN)
+        self._remove(activity)
+        return OwnedWriteResult(status=WRITE_OK, previous=activity)
+
+    async def delete_many_owned(
+        self,
+        user_id: UUID | None,
+        session_id: str | None,
+        selection: ActivitySelection,
+    ) -> dict[UUID, OwnedWriteResult]:
+        """Delete the selected activities of an owner.
+
+        Args:
+            user_id: User ID if authenticated
+            session_id: Session ID for anonymous users
+            selection: Activities to delete
+
+        Returns:
+            Outcome per activity: every requested ID when selecting by
+            IDs, otherwise only the deleted activities
+        """
+        require_owner(user_id, session_id)
+        outcomes = {}
+        for activity_id, activity in self._select(user_id, session_id, selection):
+            if activity is None:
+                outcomes[activity_id] = OwnedWriteResult(status=WRITE_NOT_FOUND)
+            elif not self._owns(activity, user_id, session_id):
+                outcomes[activity_id] = OwnedWriteResult(status=WRITE_FORBIDDEN)
+            else:
+                self._remove(activity)
+                outcomes[activity_id] = OwnedWriteResult(
+                    status=WRITE_OK, previous=activity
+                )
+        return outcomes
+
+    async def update_type_many_owned(
+        self,
+        user_id: UUID | None,
+        session_id: str | None,
+        selection: ActivitySelection,
+        category: str,
+        activity_type: str,
+        co2e_for: Co2eCalculator,
+    ) -> dict[UUID, OwnedWriteResult]:
+        """Change the type of the selected activities.
+
+        Args:
+            user_id: User ID if authenticated
+            session_id: Session ID for anonymous users
+            selection: Activities to update
+            category: Category of the new type
+            activity_type: New activity type
+            co2e_for: Computes the CO2e of activities as the new type
+
+        Returns:
+            Outcome per activity: every requested ID when selecting by
+            IDs, otherwise every owned activity matching the filter
+        """
+        require_owner(user_id, session_id)
+        outcomes: dict[UUID, OwnedWriteResult] = {}
+        updatable = []
+        for activity_id, old in self._select(user_id, session_id, selection):
+            if old is None:
+                outcomes[activity_id] = OwnedWriteResult(status=WRITE_NOT_FOUND)
+            elif not self._owns(old, user_id, session_id):
+                outcomes[activity_id] = OwnedWriteResult(status=WRITE_FORBIDDEN)
+            elif old.category != category:
+                outcomes[activity_id] = OwnedWriteResult(
+                    status=WRITE_CATEGORY_MISMATCH, previous=old
+                )
+            else:
+                outcomes[activity_id] = OwnedWriteResult(status=WRITE_OK)
+                updatable.append(old)
+
+        now = datetime.now(UTC)
+        co2e = await co2e_for(updatable) if updatable else []
+        for old, co2e_kg in zip(updatable, co2e, strict=True):
+            new = self._replace(
+                old,
+                replace(old, type=activity_type, co2e_kg=co2e_kg, updated_at=now),
+            )
+            outcomes[old.id] = OwnedWriteResult(
+                status=WRITE_OK, activity=new, previous=old
+            )
+        return outcomes
+
+    async def list_after_id(
+        self,
+        after_id: UUID | None,
+        limit: int,
+        activity_types: tuple[str, ...] | None = None,
+        before_id: UUID | None = None,
+    ) -> list[Activity]:
+        """List activities of all owners in ID order (keyset pagination).
+
+        Args:
+            after_id: Return activities with a greater ID (None from the start)
+            limit: Maximum number of activities
+            activity_types: Only activities of these types (None for all)
+            before_id: Return activities with a smaller ID (None to the end)
+
+        Returns:
+            Activities ordered by ID ascending
+        """
+        lo = 0 if after_id is None else bisect_right(self._ids, after_id.int)
+        hi = (
+            len(self._ids)
+            if before_id is None
+            else bisect_left(self._ids, before_id.int)
+        )
+        if activity_types is None:
+            return [self._activities[i] for i in self._ids[lo : min(hi, lo + limit)]]
+
+        page: list[Activity] = []
+        for i in range(lo, hi):
+            if len(page) >= limit:
+                break
+            activity = self._activities[self._ids[i]]
+            if activity.type in activity_types:
+                page.append(activity)
+        return page
+
+    async def list_owned_after_id(
+        self,
+        user_id: UUID | None,
+        session_id: str | None,
+        after_id: UUID | None,
+        limit: int,
+    ) -> list[Activity]:
+        """List one owner's activities in ID order (keyset pagination).
+
+        Args:
+            user_id: User ID if authenticated
+            session_id: Session ID for anonymous users
+            after_id: Return activities with a greater ID (None from the start)
+            limit: Maximum number of activities
+
+        Returns:
+            Activities ordered by ID ascending
+        """
+        index = self._owner_index(user_id, session_id)
+        if index is None:
+            return []
+        lo = 0 if after_id is None else bisect_right(index.by_id, after_id.int)
+        return [self._activities[i] for i in index.by_id[lo : lo + limit]]
+
+    async def update_co2e_many(
+        self, activities: list[Activity], co2e_for: Co2eCalculator
+    ) -> dict[UUID, OwnedWriteResult]:
+        """Set the CO2e of many activities.
+
+        CO2e is not part of any index, so activities are replaced in place.
+        Activities whose type, value or date changed since they were read
+        are computed from their current values.
+
+        Args:
+            activities: Activities as read
+            co2e_for: Computes the current CO2e of activities
+
+        Returns:
+            WRITE_OK outcome per activity updated
+        """
+        current = []
+        for read in activities:
+            old = self._activities.get(read.id.int)
+            if old is not None:
+                current.append(old)
+        if not current:
+            return {}
+        now = datetime.now(UTC)
+        outcomes: dict[UUID, OwnedWriteResult] = {}
+        for old, co2e_kg in zip(current, await co2e_for(current), strict=True):
+            new = replace(old, co2e_kg=co2e_kg, updated_at=now)
+            self._activities[old.id.int] = new
+            outcomes[old.id] = OwnedWriteResult(
+                status=WRITE_OK, activity=new, previous=old
+            )
+        return outcomes
+
+    async def list_owner_totals(
+        self, start_date: date, end_date: date
+    ) -> list[OwnerCategoryTotal]:
+        """Sum CO2e per owner and category in one pass over all activities.
+
+        Like the database aggregate, this reads every activity in range;
+        scanning storage directly beats bisecting a date index and then
+        looking each activity up by ID.
+
+        Args:
+            start_date: Start of date range (inclusive)
+            end_date: End of date range (inclusive)
+
+        Returns:
+            One total per (owner, category) pair with activities in range
+        """
+        totals: defaultdict[tuple[UUID | None, str | None, str], float] = defaultdict(
+            float
+        )
+        for a in self._activities.values():
+            if not start_date <= a.date <= end_date:
+                continue
+            session_id = a.session_id if a.user_id is None else None
+            totals[(a.user_id, session_id, a.category)] += a.co2e_kg
+        return [
+            OwnerCategoryTotal(
+                user_id=user_id,
+                session_id=session_id,
+                category=category,
+                co2e_kg=round(co2e_kg, 6),
+            )
+            for (user_id, session_id, category), co2e_kg in totals.items()
+        ]
+
+    def _owner_index(
+        self, user_id: UUID | None, session_id: str | None
+    ) -> _OwnerIndex | None:
+        """Index of the owner that filters are matched on."""
+        if user_id:
+            return self._by_user.get(user_id)
+        if session_id is None:
+            return None
+        return self._by_session.get(session_id)
+
+    @staticmethod
+    def _owns(activity: Activity, user_id: UUID | None, session_id: str | None) -> bool:
+        """Whether an activity belongs to the given owner."""
+        if user_id:
+            return bool(activity.user_id == user_id)
+        return bool(activity.session_id == session_id)
+
+    def _newest_first(
+        self, index: _OwnerIndex | None, limit: int, offset: int
+    ) -> list[Activity]:
+        """Page of an owner's activities by date descending."""
+        if index is None:
+            return []
+        stop = len(index.by_date) - offset
+        if stop <= 0:
+            return []
+        keys = index.by_date[max(stop - limit, 0) : stop]
+        return [self._activities[key[2]] for key in reversed(keys)]
+
+    def _select(
+        self,
+        user_id: UUID | None,
+        session_id: str | None,
+        selection: ActivitySelection,
+    ) -> list[tuple[UUID, Activity | None]]:
+        """Activities targeted by a bulk write, None for unmatched IDs.
+
+        Selecting by IDs yields every requested ID; IDs that do not exist
+        or fail the filter map to None. Otherwise the owner's activities
+        matching the filter are yielded.
+        """
+
+        def matches(activity: Activity) -> bool:
+            return (
+                (selection.start_date is None or activity.date >= selection.start_date)
+                and (selection.end_date is None or activity.date <= selection.end_date)
+                and (
+                    selection.activity_type is None
+                    or activity.type == selection.activity_type
+                )
+            )
+
+        if selection.ids is not None:
+            selected = []
+            for activity_id in selection.ids:
+                activity = self._activities.get(activity_id.int)
+                if activity is not None and not matches(activity):
+                    activity = None
+                selected.append((activity_id, activity))
+            return selected
+
+        index = self._owner_index(user_id, session_id)
+        if index is None:
+            return []
+        keys = index.by_date
+        lo, hi = 0, len(keys)
+        if selection.start_date is not None:
+            lo = bisect_left(keys, (selection.start_date.toordinal(),))
+        if selection.end_date is not None:
+            hi = bisect_left(keys, (selection.end_date.toordinal() + 1,))
+        return [
+            (activity.id, activity)
+            for activity in (self._activities[key[2]] for key in keys[lo:hi])
+            if matches(activity)
+        ]
+
+    def _add(self, activities: list[Activity]) -> None:
+        """Store new activities and add them to every index.
+
+        Raises:
+            ValueError: If an ID exists already or repeats in the batch
+        """
+        ids = [a.id.int for a in activities]
+        if len(set(ids)) != len(ids) or any(i in self._activities for i in ids):
+            raise ValueError("Activity with the same ID already exists")
+
+        by_user: defaultdict[UUID, list[Activity]] = defaultdict(list)
+        by_session: defaultdict[str, list[Activity]] = defaultdict(list)
+        for activity in activities:
+            self._activities[activity.id.int] = activity
+            if activity.user_id is not None:
+                by_user[activity.user_id].append(activity)
+            if activity.session_id is not None:
+                by_session[activity.session_id].append(activity)
+
+        _insert_sorted(self._ids, sorted(ids))
+        for user_id, owned in by_user.items():
+            self._by_user[user_id].add(owned)
+        for session_id, owned in by_session.items():
+            self._by_session[session_id].add(owned)
+
+    def _remove(self, activity: Activity) -> None:
+        """Delete a stored activity from storage and every index."""
+        del self._activities[activity.id.int]
+        _remove_sorted(self._ids, activity.id.int)
+        for owners, owner in (
+            (self._by_user, activity.user_id),
+            (self._by_session, activity.session_id),
+        ):
+            if owner is None:
+                continue
+            index = owners[owner]
+            _remove_sorted(index.by_date, _owner_date_key(activity))
+            _remove_sorted(index.by_id, activity.id.int)
+            if not index.by_id:
+                del owners[owner]
+
+    def _replace(self, old: Activity, new: Activity) -> Activity:
+        """Swap a stored activity for a new version with the same ID."""
+        self._remove(old)
+        self._add([new])
+        return new
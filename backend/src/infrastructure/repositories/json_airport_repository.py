@@ -1,5 +1,6 @@
 """JSON-based airport repository implementation."""
 
+import hashlib
 import json
 from pathlib import Path
 
@@ -19,6 +20,7 @@ class JSONAirportRepository(AirportRepository):
         """
         self._data_file = data_file
         self._airports: list[Airport] = []
+        self._content_hash = ""
         self._load_data()
 
     def _load_data(self) -> None:
@@ -26,21 +28,22 @@ class JSONAirportRepository(AirportRepository):
         if not self._data_file.exists():
             raise FileNotFoundError(f"Airport data file not found: {self._data_file}")
 
-        with open(self._data_file, "r", encoding="utf-8") as f:
-            data = json.load(f)
-            self._airports = [
-                Airport(
-                    iata_code=row["iata_code"],
-                    icao_code=row.get("icao_code", ""),
-                    name=row["name"],
-                    city=row["city"],
-                    country=row["country"],
-                    country_code=row["country_code"],
-                    latitude=float(row["latitude"]),
-                    longitude=float(row["longitude"]),
-                )
-                for row in data
-            ]
+        raw = self._data_file.read_bytes()
+        self._content_hash = hashlib.sha256(raw).hexdigest()
+        data = json.loads(raw)
+        self._airports = [
+            Airport(
+                iata_code=row["iata_code"],
+                icao_code=row.get("icao_code", ""),
+                name=row["name"],
+                city=row["city"],
+                country=row["country"],
+                country_code=row["country_code"],
+                latitude=float(row["latitude"]),
+                longitude=float(row["longitude"]),
+            )
+            for row in data
+        ]
 
     async def search(self, query: str, limit: int = 10) -> list[Airport]:
         """
@@ -78,3 +81,12 @@ class JSONAirportRepository(AirportRepository):
             if airport.iata_code.upper() == iata_upper:
                 return airport
         return None
+
+    async def data_version(self) -> str | None:
+        """
+        Get the content hash of the loaded airport file.
+
+        Returns:
+            SHA-256 of the data file, computed at load
+        """
+        return self._content_hash
@@ -1,5 +1,6 @@
 """JSON-based region data provider implementation."""
 
+import hashlib
 import json
 from pathlib import Path
 
@@ -26,6 +27,7 @@ class JSONRegionDataProvider(RegionDataProvider):
         """
         self._data_file = data_file
         self._regions: list[RegionalAverage] = []
+        self._content_hash = ""
         self._load_data()
 
     def _load_data(self) -> None:
@@ -35,18 +37,19 @@ class JSONRegionDataProvider(RegionDataProvider):
             FileNotFoundError: If file doesn't exist
             ValueError: If JSON is invalid
         """
-        with open(self._data_file, "r", encoding="utf-8") as f:
-            data = json.load(f)
-            self._regions = [
-                RegionalAverage(
-                    code=row["code"],
-                    name=row["name"],
-                    average_annual_co2e_kg=row["average_annual_co2e_kg"],
-                    breakdown=row["breakdown"],
-                    source=row["source"],
-                )
-                for row in data
-            ]
+        raw = self._data_file.read_bytes()
+        self._content_hash = hashlib.sha256(raw).hexdigest()
+        data = json.loads(raw)
+        self._regions = [
+            RegionalAverage(
+                code=row["code"],
+                name=row["name"],
+                average_annual_co2e_kg=row["average_annual_co2e_kg"],
+                breakdown=row["breakdown"],
+                source=row["source"],
+            )
+            for row in data
+        ]
 
     async def list_all(self) -> list[RegionalAverage]:
         """List all available regions.
@@ -70,3 +73,11 @@ class JSONRegionDataProvider(RegionDataProvider):
             if region.code.lower() == code_lower:
                 return region
         return None
+
+    async def data_version(self) -> str | None:
+        """Get the content hash of the loaded data file.
+
+        Returns:
+            SHA-256 of the data file, computed at load
+        """
+        return self._content_hash
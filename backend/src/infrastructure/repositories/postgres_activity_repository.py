@@ -0,0 +1,784 @@
+"""Postgres (asyncpg) implementation of ActivityRepository port."""
+
+import json
+from collections.abc import Mapping
+from dataclasses import replace
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Any
+from uuid import UUID
+
+from domain.entities.activity import Activity
+from domain.ports.activity_repository import (
+    WRITE_FORBIDDEN,
+    WRITE_NOT_FOUND,
+    WRITE_OK,
+    ActivityRepository,
+    ActivitySelection,
+    Co2eCalculator,
+    OwnedWriteResult,
+    OwnerCategoryTotal,
+)
+from domain.services.owner_key import require_owner
+from infrastructure.config.postgres import PostgresPool
+
+COLUMNS = (
+    "id, user_id, session_id, category, type, value, co2e_kg, date, notes, "
+    "metadata, created_at, updated_at"
+)
+
+# Hot queries are fixed texts, so each pooled connection prepares them once
+_INSERT = f"""
+INSERT INTO activities
+    (id, user_id, session_id, category, type, value, co2e_kg, date, notes, metadata)
+VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10)
+RETURNING {COLUMNS}
+"""
+
+# JSONB travels as text inside the array and is cast per row
+_INSERT_MANY = f"""
+INSERT INTO activities
+    (id, user_id, session_id, category, type, value, co2e_kg, date, notes, metadata)
+SELECT id, user_id, session_id, category, type, value, co2e_kg, date, notes,
+       metadata::jsonb
+FROM unnest(
+    $1::uuid[], $2::uuid[], $3::varchar[], $4::varchar[], $5::varchar[],
+    $6::numeric[], $7::numeric[], $8::date[], $9::text[], $10::text[]
+) AS t(id, user_id, session_id, category, type, value, co2e_kg, date, notes, metadata)
+RETURNING {COLUMNS}
+"""
+
+_GET_BY_ID = f"SELECT {COLUMNS} FROM activities WHERE id = $1"
+
+_EXISTS = "SELECT EXISTS (SELECT 1 FROM activities WHERE id = $1)"
+
+# Owner lookups, one text per owner column so each plan uses that column's index
+_LIST_BY_OWNER = {
+    column: f"""
+SELECT {COLUMNS} FROM activities
+WHERE {column} = $1
+ORDER BY date DESC, created_at DESC
+LIMIT $2 OFFSET $3
+"""
+    for column in ("user_id", "session_id")
+}
+
+_LIST_BY_DATE_RANGE = {
+    column: f"""
+SELECT {COLUMNS} FROM activities
+WHERE {column} = $1 AND date BETWEEN $2 AND $3
+ORDER BY date
+"""
+    for column in ("user_id", "session_id")
+}
+
+# One owner's activities in ID order, served by the (owner, id) indexes
+_LIST_OWNED_FIRST = {
+    column: f"SELECT {COLUMNS} FROM activities WHERE {column} = $1 ORDER BY id LIMIT $2"
+    for column in ("user_id", "session_id")
+}
+
+_LIST_OWNED_AFTER = {
+    column: f"""
+SELECT {COLUMNS} FROM activities
+WHERE {column} = $1 AND id > $2
+ORDER BY id
+LIMIT $3
+"""
+    for column in ("user_id", "session_id")
+}
+
+_MIGRATE = """
+UPDATE activities SET user_id = $1
+WHERE session_id = $2 AND user_id IS NULL
+"""
+
+_UPDATE = f"""
+UPDATE activities
+SET type = $2, value = $3, co2e_kg = $4, date = $5, notes = $6, metadata = $7,
+    updated_at = NOW()
+WHERE id = $1
+RETURNING {COLUMNS}
+"""
+
+_DELETE = "DELETE FROM activities WHERE id = $1"
+
+# Status of bulk_update_activity_type rows changed since they were read
+_STALE = "stale"
+# Reads and updates of changed rows before a bulk update gives up
+_STALE_ATTEMPTS = 3
+
+
+def _numeric(value: float) -> Decimal:
+    """Convert a float for a NUMERIC parameter without binary noise."""
+    return Decimal(repr(value))
+
+
+def _owner(user_id: UUID | None, session_id: str | None) -> tuple[str, Any]:
+    """Owner column and value to filter on.
+
+    Raises:
+        ValueError: If neither user_id nor session_id is provided
+    """
+    require_owner(user_id, session_id)
+    if user_id:
+        return "user_id", user_id
+    return "session_id", session_id
+
+
+def _where_selection(selection: ActivitySelection, params: list[Any]) -> list[str]:
+    """SQL conditions of a selection, appending their parameters."""
+    conditions = []
+    if selection.ids is not None:
+        params.append(list(selection.ids))
+        conditions.append(f"id = ANY(${len(params)}::uuid[])")
+    if selection.start_date is not None:
+        params.append(selection.start_date)
+        conditions.append(f"date >= ${len(params)}")
+    if selection.end_date is not None:
+        params.append(selection.end_date)
+        conditions.append(f"date <= ${len(params)}")
+    if selection.activity_type is not None:
+        params.append(selection.activity_type)
+        conditions.append(f"type = ${len(params)}")
+    return conditions
+
+
+def _count(status: str) -> int:
+    """Row count from a command status such as 'UPDATE 3'."""
+    return int(status.split()[-1])
+
+
+class PostgresActivityRepository(ActivityRepository):
+    """Postgres implementation of ActivityRepository.
+
+    Queries the activities table directly through an asyncpg pool,
+    skipping the HTTP and JSON round trip of PostgREST. Values travel
+    in Postgres' binary format and hot queries run as prepared
+    statements. Ownership-checked bulk writes call the same SQL
+    functions as SupabaseActivityRepository.
+
+    Needs a direct (session-mode) connection: transaction-pooling
+    proxies do not keep prepared statements between transactions.
+    """
+
+    def __init__(self, pool: PostgresPool) -> None:
+        """Initialize repository with a connection pool.
+
+        Args:
+            pool: Lazily opened asyncpg pool
+        """
+        self._pool = pool
+
+    async def save(self, activity: Activity) -> Activity:
+        """Persist activity with one prepared INSERT.
+
+        Args:
+            activity: Activity entity to save
+
+        Returns:
+            Activity with values from database
+        """
+        pool = await self._pool.get()
+        row = await pool.fetchrow(_INSERT, *self._entity_to_params(activity))
+        return self._row_to_entity(row)
+
+    async def save_many(self, activities: list[Activity]) -> list[Activity]:
+        """Persist several activities with one INSERT over unnested arrays.
+
+        The statement text does not depend on the number of rows, so it
+        is prepared once for every batch size.
+
+        Args:
+            activities: Activity entities to save
+
+        Returns:
+            Saved activities with values from database, in input order
+        """
+        if not activities:
+            return []
+        params = [self._entity_to_params(a) for a in activities]
+        columns = [list(c) for c in zip(*params, strict=True)]
+        columns[-1] = [json.dumps(m) if m is not None else None for m in columns[-1]]
+        pool = await self._pool.get()
+        rows = await pool.fetch(_INSERT_MANY, *columns)
+        saved = {row["id"]: self._row_to_entity(row) for row in rows}
+        return [saved[a.id] for a in activities]
+
+    async def get_by_id(self, activity_id: UUID) -> Activity | None:
+        """Retrieve activity by ID.
+
+        Args:
+            activity_id: Activity identifier
+
+        Returns:
+            Activity if found, None otherwise
+        """
+        pool = await self._pool.get()
+        row = await pool.fetchrow(_GET_BY_ID, activity_id)
+        return self._row_to_entity(row) if row else None
+
+    async def list_by_user(
+        self, user_id: UUID, limit: int = 100, offset: int = 0
+    ) -> list[Activity]:
+        """List activities for authenticated user.
+
+        Args:
+            user_id: User identifier
+            limit: Maximum number of activities
+            offset: Number to skip
+
+        Returns:
+            List of activities ordered by date descending
+        """
+        pool = await self._pool.get()
+        rows = await pool.fetch(_LIST_BY_OWNER["user_id"], user_id, limit, offset)
+        return [self._row_to_entity(row) for row in rows]
+
+    async def list_by_session(
+        self, session_id: str, limit: int = 100, offset: int = 0
+    ) -> list[Activity]:
+        """List activities for anonymous session.
+
+        Args:
+            session_id: Session identifier
+            limit: Maximum number of activities
+            offset: Number to skip
+
+        Returns:
+            List of activities ordered by date descending
+        """
+        pool = await self._pool.get()
+        rows = await pool.fetch(_LIST_BY_OWNER["session_id"], session_id, limit, offset)
+        return [self._row_to_entity(row) for row in rows]
+
+    async def migrate_session_to_user(self, user_id: UUID, session_id: str) -> int:
+        """Migrate anonymous activities from session to authenticated user.
+
+        Args:
+            user_id: Authenticated user's ID
+            session_id: Anonymous session identifier
+
+        Returns:
+            Count of activities migrated
+        """
+        pool = await self._pool.get()
+        return _count(await pool.execute(_MIGRATE, user_id, session_id))
+
+    async def list_by_date_range(
+        self,
+        user_id: UUID | None,
+        session_id: str | None,
+        start_date: date,
+        end_date: date,
+    ) -> list[Activity]:
+        """List activities within a date range with a prepared query.
+
+        Args:
+            user_id: User ID if authenticated
+            session_id: Session ID for anonymous users
+            start_date: Start of date range (inclusive)
+            end_date: End of date range (inclusive)
+
+        Returns:
+            List of activities ordered by date ascending
+        """
+        column, owner = _owner(user_id, session_id)
+        pool = await self._pool.get()
+        rows = await pool.fetch(
+            _LIST_BY_DATE_RANGE[column], owner, start_date, end_date
+        )
+        return [self._row_to_entity(row) for row in rows]
+
+    async def update(self, activity: Activity) -> Activity:
+        """Update existing activity.
+
+        Args:
+            activity: Activity entity with updated values
+
+        Returns:
+            Updated activity from database
+
+        Raises:
+            ValueError: If activity not found
+        """
+        pool = await self._pool.get()
+        row = await pool.fetchrow(
+            _UPDATE,
+            activity.id,
+            activity.type,
+            _numeric(activity.value),
+            _numeric(activity.co2e_kg),
+            activity.date,
+            activity.notes,
+            activity.metadata,
+        )
+        if row is None:
+            raise ValueError(f"Activity not found: {activity.id}")
+        return self._row_to_entity(row)
+
+    async def delete(self, activity_id: UUID) -> bool:
+        """Delete activity by ID.
+
+        Args:
+            activity_id: Activity identifier
+
+        Returns:
+            True if deleted, False if not found
+        """
+        pool = await self._pool.get()
+        return _count(await pool.execute(_DELETE, activity_id)) > 0
+
+    async def update_owned(
+        self,
+        activity_id: UUID,
+        user_id: UUID | None,
+        session_id: str | None,
+        category: str,
+        activity_type: str,
+        value: float,
+        co2e_kg: float,
+        activity_date: date,
+        notes: str | None,
+    ) -> OwnedWriteResult:
+        """Update an activity only if it belongs to the given owner.
+
+        Runs the ``update_owned_activity`` function, which locks the row,
+        checks owner and category and applies the update in one round trip.
+
+        Args:
+            activity_id: Activity identifier
+            user_id: User ID if authenticated
+            session_id: Session ID for anonymous users
+            category: Category the new type belongs to (must match the row)
+            activity_type: Updated activity type
+            value: Updated activity amount
+            co2e_kg: Recalculated CO2e in kilograms
+            activity_date: Updated date when activity occurred
+            notes: Updated optional user notes
+
+        Returns:
+            Write outcome with the activity before and after the update
+        """
+        require_owner(user_id, session_id)
+        pool = await self._pool.get()
+        row = await pool.fetchrow(
+            "SELECT status, previous, activity "
+            "FROM update_owned_activity($1, $2, $3, $4, $5, $6, $7, $8, $9)",
+            activity_id,
+            user_id,
+            session_id,
+            category,
+            activity_type,
+            _numeric(value),
+            _numeric(co2e_kg),
+            activity_date,
+            notes,
+        )
+        if row is None:
+            return OwnedWriteResult(status=WRITE_NOT_FOUND)
+        return self._write_result(row)
+
+    async def delete_owned(
+        self, activity_id: UUID, user_id: UUID | None, session_id: str | None
+    ) -> OwnedWriteResult:
+        """Delete an activity only if it belongs to the given owner.
+
+        The owner filter is part of the DELETE. The row is looked up only
+        when nothing was deleted, to tell a missing row from a foreign one.
+
+        Args:
+            activity_id: Activity identifier
+            user_id: User ID if authenticated
+            session_id: Session ID for anonymous users
+
+        Returns:
+            Write outcome with the deleted activity as previous
+        """
+        column, owner = _owner(user_id, session_id)
+        pool = await self._pool.get()
+        row = await pool.fetchrow(
+            f"DELETE FROM activities WHERE id = $1 AND {column} = $2 "
+            f"RETURNING {COLUMNS}",
+            activity_id,
+            owner,
+        )
+        if row is not None:
+            return OwnedWriteResult(status=WRITE_OK, previous=self._row_to_entity(row))
+        if not await pool.fetchval(_EXISTS, activity_id):
+            return OwnedWriteResult(status=WRITE_NOT_FOUND)
+        return OwnedWriteResult(status=WRITE_FORBIDDEN)
+
+    async def delete_many_owned(
+        self,
+        user_id: UUID | None,
+        session_id: str | None,
+        selection: ActivitySelection,
+    ) -> dict[UUID, OwnedWriteResult]:
+        """Delete the selected activities of an owner in one statement.
+
+        When selecting by IDs, IDs that were not deleted are looked up in
+        one query to tell missing rows from foreign ones.
+
+        Args:
+            user_id: User ID if authenticated
+            session_id: Session ID for anonymous users
+            selection: Activities to delete
+
+        Returns:
+            Outcome per activity: every requested ID when selecting by
+            IDs, otherwise only the deleted activities
+        """
+        column, owner = _owner(user_id, session_id)
+        params: list[Any] = [owner]
+        conditions = [f"{column} = $1", *_where_selection(selection, params)]
+        pool = await self._pool.get()
+        rows = await pool.fetch(
+            f"DELETE FROM activities WHERE {' AND '.join(conditions)} "
+            f"RETURNING {COLUMNS}",
+            *params,
+        )
+        deleted = {
+            row["id"]: OwnedWriteResult(
+                status=WRITE_OK, previous=self._row_to_entity(row)
+            )
+            for row in rows
+        }
+        if selection.ids is None:
+            return deleted
+
+        missing = [i for i in selection.ids if i not in deleted]
+        foreign: set[UUID] = set()
+        if missing:
+            params = []
+            conditions = _where_selection(
+                ActivitySelection(
+                    ids=tuple(missing),
+                    start_date=selection.start_date,
+                    end_date=selection.end_date,
+                    activity_type=selection.activity_type,
+                ),
+                params,
+            )
+            foreign = {
+                row["id"]
+                for row in await pool.fetch(
+                    f"SELECT id FROM activities WHERE {' AND '.join(conditions)}",
+                    *params,
+                )
+            }
+
+        return {
+            i: deleted.get(i)
+            or OwnedWriteResult(
+                status=WRITE_FORBIDDEN if i in foreign else WRITE_NOT_FOUND
+            )
+            for i in selection.ids
+        }
+
+    async def update_type_many_owned(
+        self,
+        user_id: UUID | None,
+        session_id: str | None,
+        selection: ActivitySelection,
+        category: str,
+        activity_type: str,
+        co2e_for: Co2eCalculator,
+    ) -> dict[UUID, OwnedWriteResult]:
+        """Change the type of the selected activities in one statement.
+
+        In one transaction, locks and reads the owned rows in the category,
+        computes their CO2e and runs the ``bulk_update_activity_type``
+        function, which updates them and classifies the others. Rows the
+        function reports as changed since the read (only possible for rows
+        that were not locked yet) are read and computed again.
+
+        Args:
+            user_id: User ID if authenticated
+            session_id: Session ID for anonymous users
+            selection: Activities to update
+            category: Category of the new type
+            activity_type: New activity type
+            co2e_for: Computes the CO2e of activities as the new type
+
+        Returns:
+            Outcome per activity: every requested ID when selecting by
+            IDs, otherwise every owned activity matching the filter
+
+        Raises:
+            RuntimeError: If rows keep changing between read and update
+        """
+        column, owner = _owner(user_id, session_id)
+        outcomes: dict[UUID, OwnedWriteResult] = {}
+        pending = selection
+        pool = await self._pool.get()
+        for _ in range(_STALE_ATTEMPTS):
+            params: list[Any] = [owner, category]
+            conditions = [
+                f"{column} = $1",
+                "category = $2",
+                *_where_selection(pending, params),
+            ]
+            async with pool.acquire() as conn, conn.transaction():
+                current = [
+                    self._row_to_entity(row)
+                    for row in await conn.fetch(
+                        f"SELECT {COLUMNS} FROM activities "
+                        f"WHERE {' AND '.join(conditions)} FOR UPDATE",
+                        *params,
+                    )
+                ]
+                co2e = await co2e_for(current) if current else []
+                rows = await conn.fetch(
+                    "SELECT id, status, previous, activity FROM "
+                    "bulk_update_activity_type("
+                    "$1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11, $12)",
+                    user_id,
+                    session_id,
+                    list(pending.ids) if pending.ids is not None else None,
+                    pending.start_date,
+                    pending.end_date,
+                    pending.activity_type,
+                    category,
+                    activity_type,
+                    [a.id for a in current],
+                    [_numeric(a.value) for a in current],
+                    [a.date for a in current],
+                    [_numeric(c) for c in co2e],
+                )
+
+            stale = [row["id"] for row in rows if row["status"] == _STALE]
+            outcomes.update(
+                (row["id"], self._write_result(row))
+                for row in rows
+                if row["status"] != _STALE
+            )
+            if not stale:
+                break
+            pending = replace(selection, ids=tuple(stale))
+        else:
+            raise RuntimeError("Activities kept changing during the bulk update")
+
+        if selection.ids is None:
+            return outcomes
+        return {
+            i: outcomes.get(i, OwnedWriteResult(status=WRITE_NOT_FOUND))
+            for i in selection.ids
+        }
+
+    async def list_after_id(
+        self,
+        after_id: UUID | None,
+        limit: int,
+        activity_types: tuple[str, ...] | None = None,
+        before_id: UUID | None = None,
+    ) -> list[Activity]:
+        """List activities of all owners in ID order (keyset pagination).
+
+        Args:
+            after_id: Return activities with a greater ID (None from the start)
+            limit: Maximum number of activities
+            activity_types: Only activities of these types (None for all)
+            before_id: Return activities with a smaller ID (None to the end)
+
+        Returns:
+            Activities ordered by ID ascending
+        """
+        params: list[Any] = []
+        conditions = ["TRUE"]
+        if after_id is not None:
+            params.append(after_id)
+            conditions.append(f"id > ${len(params)}")
+        if before_id is not None:
+            params.append(before_id)
+            conditions.append(f"id < ${len(params)}")
+        if activity_types is not None:
+            params.append(list(activity_types))
+            conditions.append(f"type = ANY(${len(params)}::varchar[])")
+        params.append(limit)
+        pool = await self._pool.get()
+        rows = await pool.fetch(
+            f"SELECT {COLUMNS} FROM activities WHERE {' AND '.join(conditions)} "
+            f"ORDER BY id LIMIT ${len(params)}",
+            *params,
+        )
+        return [self._row_to_entity(row) for row in rows]
+
+    async def list_owned_after_id(
+        self,
+        user_id: UUID | None,
+        session_id: str | None,
+        after_id: UUID | None,
+        limit: int,
+    ) -> list[Activity]:
+        """List one owner's activities in ID order (keyset pagination).
+
+        Each page is a range scan of the (owner, id) index from after_id,
+        so deep pages cost the same as the first one, unlike offset paging.
+
+        Args:
+            user_id: User ID if authenticated
+            session_id: Session ID for anonymous users
+            after_id: Return activities with a greater ID (None from the start)
+            limit: Maximum number of activities
+
+        Returns:
+            Activities ordered by ID ascending
+        """
+        column, owner = _owner(user_id, session_id)
+        pool = await self._pool.get()
+        if after_id is None:
+            rows = await pool.fetch(_LIST_OWNED_FIRST[column], owner, limit)
+        else:
+            rows = await pool.fetch(_LIST_OWNED_AFTER[column], owner, after_id, limit)
+        return [self._row_to_entity(row) for row in rows]
+
+    async def update_co2e_many(
+        self, activities: list[Activity], co2e_for: Co2eCalculator
+    ) -> dict[UUID, OwnedWriteResult]:
+        """Set the CO2e of many activities in one statement.
+
+        Runs the ``update_activity_co2e`` function, an UPDATE joined
+        against the unnested arrays of IDs and the type, value and date
+        each CO2e was computed from. Rows the function reports as changed
+        since are computed again from the current values it returns.
+
+        Args:
+            activities: Activities as read
+            co2e_for: Computes the current CO2e of activities
+
+        Returns:
+            WRITE_OK outcome per activity updated
+
+        Raises:
+            RuntimeError: If rows keep changing between computation and update
+        """
+        if not activities:
+            return {}
+        outcomes: dict[UUID, OwnedWriteResult] = {}
+        pending = activities
+        pool = await self._pool.get()
+        for _ in range(_STALE_ATTEMPTS):
+            co2e = await co2e_for(pending)
+            rows = await pool.fetch(
+                "SELECT id, status, previous, activity FROM update_activity_co2e("
+                "$1::uuid[], $2::varchar[], $3::numeric[], $4::date[], $5::numeric[])",
+                [a.id for a in pending],
+                [a.type for a in pending],
+                [_numeric(a.value) for a in pending],
+                [a.date for a in pending],
+                [_numeric(c) for c in co2e],
+            )
+            outcomes.update(
+                (row["id"], self._write_result(row))
+                for row in rows
+                if row["status"] != _STALE
+            )
+            pending = [
+                self._row_to_entity(row["previous"])
+                for row in rows
+                if row["status"] == _STALE
+            ]
+            if not pending:
+                break
+        else:
+            raise RuntimeError("Activities kept changing during the CO2e update")
+        return outcomes
+
+    async def list_owner_totals(
+        self, start_date: date, end_date: date
+    ) -> list[OwnerCategoryTotal]:
+        """Sum CO2e per owner and category across all owners.
+
+        Aggregation runs in the database (``activity_owner_totals`` function)
+        so only one row per owner and category is transferred.
+
+        Args:
+            start_date: Start of date range (inclusive)
+            end_date: End of date range (inclusive)
+
+        Returns:
+            One total per (owner, category) pair with activities in range
+        """
+        pool = await self._pool.get()
+        rows = await pool.fetch(
+            "SELECT user_id, session_id, category, co2e_kg "
+            "FROM activity_owner_totals($1, $2)",
+            start_date,
+            end_date,
+        )
+        return [
+            OwnerCategoryTotal(
+                user_id=row["user_id"],
+                session_id=row["session_id"],
+                category=row["category"],
+                co2e_kg=float(row["co2e_kg"]),
+            )
+            for row in rows
+        ]
+
+    def _write_result(self, row: Mapping[str, Any]) -> OwnedWriteResult:
+        """Convert a row of an ownership-checked write function."""
+        return OwnedWriteResult(
+            status=row["status"],
+            activity=self._row_to_entity(row["activity"]) if row["activity"] else None,
+            previous=self._row_to_entity(row["previous"]) if row["previous"] else None,
+        )
+
+    @staticmethod
+    def _entity_to_params(activity: Activity) -> tuple[Any, ...]:
+        """Convert domain entity to INSERT parameters.
+
+        Args:
+            activity: Activity entity
+
+        Returns:
+            Parameters in _INSERT column order (created_at is set by the
+            database)
+        """
+        return (
+            activity.id,
+            activity.user_id,
+            activity.session_id,
+            activity.category,
+            activity.type,
+            _numeric(activity.value),
+            _numeric(activity.co2e_kg),
+            activity.date,
+            activity.notes,
+            activity.metadata,
+        )
+
+    @staticmethod
+    def _row_to_entity(row: Mapping[str, Any]) -> Activity:
+        """Convert a database row to domain entity.
+
+        Args:
+            row: Record from asyncpg, or a row decoded from JSONB (as
+                returned by the write functions)
+
+        Returns:
+            Activity domain entity
+        """
+        user_id = row["user_id"]
+        updated_at = row.get("updated_at")
+        return Activity(
+            id=row["id"] if isinstance(row["id"], UUID) else UUID(row["id"]),
+            category=row["category"],
+            type=row["type"],
+            value=float(row["value"]),
+            co2e_kg=float(row["co2e_kg"]),
+            date=date.fromisoformat(row["date"])
+            if isinstance(row["date"], str)
+            else row["date"],
+            notes=row["notes"],
+            metadata=row["metadata"],
+            user_id=UUID(user_id) if isinstance(user_id, str) else user_id,
+            session_id=row["session_id"],
+            created_at=datetime.fromisoformat(row["created_at"])
+            if isinstance(row["created_at"], str)
+            else row["created_at"],
+            updated_at=datetime.fromisoformat(updated_at)
+            if isinstance(updated_at, str)
+            else updated_at,
+        )
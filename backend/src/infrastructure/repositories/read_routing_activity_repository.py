@@ -0,0 +1,267 @@
+"""Activity repository routing reads to a replica and writes to the primary."""
+
+from datetime import date
+from uuid import UUID
+
+from domain.entities.activity import Activity
+from domain.ports.activity_repository import (
+    ActivityRepository,
+    ActivitySelection,
+    Co2eCalculator,
+    OwnedWriteResult,
+    OwnerCategoryTotal,
+)
+from domain.ports.cache_backend import CacheBackend
+from domain.services.owner_key import owner_key
+
+
+class ReadRoutingActivityRepository(ActivityRepository):
+    """Activity repository reading from a replica of the primary database.
+
+    Writes go to the primary. Reads go to the replica, except for owners
+    (and activities) written within the last window_seconds: replicas
+    lag behind, so an owner's reads stay on the primary right after
+    their own write and they see what they just logged.
+
+    Recent writes are marked in a cache backend with the window as
+    expiry, so with a shared backend (Redis) every worker honors them.
+    A read by ID the replica does not have yet is retried on the
+    primary. Listings of all owners feeding the recalculation job stay
+    on the primary, since the job writes back what it reads.
+    """
+
+    def __init__(
+        self,
+        primary: ActivityRepository,
+        replica: ActivityRepository,
+        recent_writes: CacheBackend,
+        window_seconds: int = 10,
+        namespace: str = "recent_write",
+    ) -> None:
+        """Initialize repository over both databases.
+
+        Args:
+            primary: Repository on the primary (all writes)
+            replica: Repository on the read replica
+            recent_writes: Backend holding the recent write marks
+            window_seconds: Seconds reads stay on the primary after a write
+            namespace: Key prefix separating the marks from other users
+                of the backend
+        """
+        self._primary = primary
+        self._replica = replica
+        self._recent_writes = recent_writes
+        self._window_seconds = window_seconds
+        self._prefix = namespace
+
+    async def save(self, activity: Activity) -> Activity:
+        """Save on the primary."""
+        saved = await self._primary.save(activity)
+        await self._mark(saved.user_id, saved.session_id, [saved.id])
+        return saved
+
+    async def save_many(self, activities: list[Activity]) -> list[Activity]:
+        """Save on the primary."""
+        saved: list[Activity] = await self._primary.save_many(activities)
+        for user_id, session_id in {(a.user_id, a.session_id) for a in saved}:
+            await self._mark(user_id, session_id)
+        return saved
+
+    async def get_by_id(self, activity_id: UUID) -> Activity | None:
+        """Get an activity by ID, from the primary if recently written."""
+        if await self._is_recent(f"activity:{activity_id}"):
+            return await self._primary.get_by_id(activity_id)
+        activity = await self._replica.get_by_id(activity_id)
+        if activity is None:
+            return await self._primary.get_by_id(activity_id)
+        return activity
+
+    async def list_by_user(
+        self, user_id: UUID, limit: int = 100, offset: int = 0
+    ) -> list[Activity]:
+        """List a user's activities, most recent first."""
+        repo = await self._reader(user_id, None)
+        activities: list[Activity] = await repo.list_by_user(user_id, limit, offset)
+        return activities
+
+    async def list_by_session(
+        self, session_id: str, limit: int = 100, offset: int = 0
+    ) -> list[Activity]:
+        """List a session's activities, most recent first."""
+        repo = await self._reader(None, session_id)
+        activities: list[Activity] = await repo.list_by_session(
+            session_id, limit, offset
+        )
+        return activities
+
+    async def migrate_session_to_user(self, user_id: UUID, session_id: str) -> int:
+        """Migrate a session's activities on the primary."""
+        migrated: int = await self._primary.migrate_session_to_user(user_id, session_id)
+        await self._mark(user_id, None)
+        await self._mark(None, session_id)
+        return migrated
+
+    async def list_by_date_range(
+        self,
+        user_id: UUID | None,
+        session_id: str | None,
+        start_date: date,
+        end_date: date,
+    ) -> list[Activity]:
+        """List an owner's activities within a date range."""
+        repo = await self._reader(user_id, session_id)
+        activities: list[Activity] = await repo.list_by_date_range(
+            user_id, session_id, start_date, end_date
+        )
+        return activities
+
+    async def update(self, activity: Activity) -> Activity:
+        """Update an activity on the primary."""
+        updated = await self._primary.update(activity)
+        await self._mark(updated.user_id, updated.session_id, [updated.id])
+        return updated
+
+    async def delete(self, activity_id: UUID) -> bool:
+        """Delete an activity on the primary."""
+        deleted: bool = await self._primary.delete(activity_id)
+        await self._mark_key(f"activity:{activity_id}")
+        return deleted
+
+    async def update_owned(
+        self,
+        activity_id: UUID,
+        user_id: UUID | None,
+        session_id: str | None,
+        category: str,
+        activity_type: str,
+        value: float,
+        co2e_kg: float,
+        activity_date: date,
+        notes: str | None,
+    ) -> OwnedWriteResult:
+        """Update an activity of the given owner on the primary."""
+        result = await self._primary.update_owned(
+            activity_id,
+            user_id,
+            session_id,
+            category,
+            activity_type,
+            value,
+            co2e_kg,
+            activity_date,
+            notes,
+        )
+        await self._mark(user_id, session_id, [activity_id])
+        return result
+
+    async def delete_owned(
+        self, activity_id: UUID, user_id: UUID | None, session_id: str | None
+    ) -> OwnedWriteResult:
+        """Delete an activity of the given owner on the primary."""
+        result = await self._primary.delete_owned(activity_id, user_id, session_id)
+        await self._mark(user_id, session_id, [activity_id])
+        return result
+
+    async def delete_many_owned(
+        self,
+        user_id: UUID | None,
+        session_id: str | None,
+        selection: ActivitySelection,
+    ) -> dict[UUID, OwnedWriteResult]:
+        """Delete selected activities of an owner on the primary."""
+        results: dict[UUID, OwnedWriteResult] = await self._primary.delete_many_owned(
+            user_id, session_id, selection
+        )
+        await self._mark(user_id, session_id)
+        return results
+
+    async def update_type_many_owned(
+        self,
+        user_id: UUID | None,
+        session_id: str | None,
+        selection: ActivitySelection,
+        category: str,
+        activity_type: str,
+        co2e_for: Co2eCalculator,
+    ) -> dict[UUID, OwnedWriteResult]:
+        """Change the type of selected activities of an owner on the primary."""
+        results: dict[UUID, OwnedWriteResult]
+        results = await self._primary.update_type_many_owned(
+            user_id, session_id, selection, category, activity_type, co2e_for
+        )
+        await self._mark(user_id, session_id)
+        return results
+
+    async def list_after_id(
+        self,
+        after_id: UUID | None,
+        limit: int,
+        activity_types: tuple[str, ...] | None = None,
+        before_id: UUID | None = None,
+    ) -> list[Activity]:
+        """List activities of all owners in ID order, from the primary."""
+        activities: list[Activity] = await self._primary.list_after_id(
+            after_id, limit, activity_types, before_id
+        )
+        return activities
+
+    async def list_owned_after_id(
+        self,
+        user_id: UUID | None,
+        session_id: str | None,
+        after_id: UUID | None,
+        limit: int,
+    ) -> list[Activity]:
+        """List one owner's activities in ID order."""
+        repo = await self._reader(user_id, session_id)
+        activities: list[Activity] = await repo.list_owned_after_id(
+            user_id, session_id, after_id, limit
+        )
+        return activities
+
+    async def update_co2e_many(
+        self, activities: list[Activity], co2e_for: Co2eCalculator
+    ) -> dict[UUID, OwnedWriteResult]:
+        """Set the CO2e of activities on the primary."""
+        results: dict[UUID, OwnedWriteResult] = await self._primary.update_co2e_many(
+            activities, co2e_for
+        )
+        return results
+
+    async def list_owner_totals(
+        self, start_date: date, end_date: date
+    ) -> list[OwnerCategoryTotal]:
+        """Sum CO2e per owner and category on the replica."""
+        totals: list[OwnerCategoryTotal] = await self._replica.list_owner_totals(
+            start_date, end_date
+        )
+        return totals
+
+    async def _reader(
+        self, user_id: UUID | None, session_id: str | None
+    ) -> ActivityRepository:
+        """Repository serving an owner's reads."""
+        if await self._is_recent(owner_key(user_id, session_id)):
+            return self._primary
+        return self._replica
+
+    async def _mark(
+        self,
+        user_id: UUID | None,
+        session_id: str | None,
+        activity_ids: list[UUID] | None = None,
+    ) -> None:
+        """Keep an owner's (and activities') reads on the primary for a while."""
+        await self._mark_key(owner_key(user_id, session_id))
+        for activity_id in activity_ids or []:
+            await self._mark_key(f"activity:{activity_id}")
+
+    async def _mark_key(self, key: str) -> None:
+        """Mark one key as recently written."""
+        await self._recent_writes.set(
+            f"{self._prefix}:{key}", b"1", self._window_seconds
+        )
+
+    async def _is_recent(self, key: str) -> bool:
+        """Whether a key was written within the window."""
+        return await self._recent_writes.get(f"{self._prefix}:{key}") is not None
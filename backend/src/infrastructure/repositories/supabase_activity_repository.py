@@ -1,13 +1,34 @@
 """Supabase implementation of ActivityRepository port."""
 
+from dataclasses import replace
 from datetime import date, datetime, timezone
-from typing import Any
+from typing import Any, cast
 from uuid import UUID
 
 from supabase import Client
 
 from domain.entities.activity import Activity
-from domain.ports.activity_repository import ActivityRepository
+from domain.ports.activity_repository import (
+    WRITE_FORBIDDEN,
+    WRITE_NOT_FOUND,
+    WRITE_OK,
+    ActivityRepository,
+    ActivitySelection,
+    Co2eCalculator,
+    OwnedWriteResult,
+    OwnerCategoryTotal,
+)
+from domain.services.owner_key import require_owner
+
+# Status of bulk_update_activity_type rows changed since they were read
+_STALE = "stale"
+# Reads and updates of changed rows before a bulk update gives up
+_STALE_ATTEMPTS = 3
+
+
+def _rpc_rows(data: Any) -> list[dict[str, Any]]:
+    """Rows returned by a set-returning RPC (a JSON array of objects)."""
+    return cast(list[dict[str, Any]], data or [])
 
 
 class SupabaseActivityRepository(ActivityRepository):
@@ -35,21 +56,31 @@ class SupabaseActivityRepository(ActivityRepository):
         Returns:
             Activity with values from database
         """
-        row = {
-            "id": str(activity.id),
-            "category": activity.category,
-            "type": activity.type,
-            "value": activity.value,
-            "co2e_kg": activity.co2e_kg,
-            "date": activity.date.isoformat(),
-            "notes": activity.notes,
-            "metadata": activity.metadata,
-            "user_id": str(activity.user_id) if activity.user_id else None,
-            "session_id": activity.session_id,
-        }
-        result = self._client.table(self.TABLE).insert(row).execute()
+        result = (
+            self._client.table(self.TABLE)
+            .insert(self._entity_to_row(activity))
+            .execute()
+        )
         return self._row_to_entity(result.data[0])
 
+    async def save_many(self, activities: list[Activity]) -> list[Activity]:
+        """Persist several activities with one multi-row INSERT.
+
+        Args:
+            activities: Activity entities to save
+
+        Returns:
+            Saved activities with values from database, in input order
+        """
+        if not activities:
+            return []
+        result = (
+            self._client.table(self.TABLE)
+            .insert([self._entity_to_row(a) for a in activities])
+            .execute()
+        )
+        return [self._row_to_entity(row) for row in result.data]
+
     async def get_by_id(self, activity_id: UUID) -> Activity | None:
         """Retrieve activity by ID.
 
@@ -215,6 +246,453 @@ class SupabaseActivityRepository(ActivityRepository):
         )
         return len(result.data) > 0
 
+    async def update_owned(
+        self,
+        activity_id: UUID,
+        user_id: UUID | None,
+        session_id: str | None,
+        category: str,
+        activity_type: str,
+        value: float,
+        co2e_kg: float,
+        activity_date: date,
+        notes: str | None,
+    ) -> OwnedWriteResult:
+        """Update an activity only if it belongs to the given owner.
+
+        Runs the ``update_owned_activity`` function, which locks the row,
+        checks owner and category and applies the update in one round trip.
+
+        Args:
+            activity_id: Activity identifier
+            user_id: User ID if authenticated
+            session_id: Session ID for anonymous users
+            category: Category the new type belongs to (must match the row)
+            activity_type: Updated activity type
+            value: Updated activity amount
+            co2e_kg: Recalculated CO2e in kilograms
+            activity_date: Updated date when activity occurred
+            notes: Updated optional user notes
+
+        Returns:
+            Write outcome with the activity before and after the update
+        """
+        require_owner(user_id, session_id)
+        result = self._client.rpc(
+            "update_owned_activity",
+            {
+                "p_id": str(activity_id),
+                "p_user_id": str(user_id) if user_id else None,
+                "p_session_id": session_id,
+                "p_category": category,
+                "p_type": activity_type,
+                "p_value": value,
+                "p_co2e_kg": co2e_kg,
+                "p_date": activity_date.isoformat(),
+                "p_notes": notes,
+            },
+        ).execute()
+        rows = _rpc_rows(result.data)
+        if not rows:
+            return OwnedWriteResult(status=WRITE_NOT_FOUND)
+
+        row = rows[0]
+        return OwnedWriteResult(
+            status=row["status"],
+            activity=self._row_to_entity(row["activity"])
+            if row.get("activity")
+            else None,
+            previous=self._row_to_entity(row["previous"])
+            if row.get("previous")
+            else None,
+        )
+
+    async def delete_owned(
+        self, activity_id: UUID, user_id: UUID | None, session_id: str | None
+    ) -> OwnedWriteResult:
+        """Delete an activity only if it belongs to the given owner.
+
+        The owner filter is part of the DELETE. The row is looked up only
+        when nothing was deleted, to tell a missing row from a foreign one.
+
+        Args:
+            activity_id: Activity identifier
+            user_id: User ID if authenticated
+            session_id: Session ID for anonymous users
+
+        Returns:
+            Write outcome with the deleted activity as previous
+        """
+        require_owner(user_id, session_id)
+        query = self._client.table(self.TABLE).delete().eq("id", str(activity_id))
+        result = self._filter_owner(query, user_id, session_id).execute()
+
+        if result.data:
+            return OwnedWriteResult(
+                status=WRITE_OK, previous=self._row_to_entity(result.data[0])
+            )
+        if await self.get_by_id(activity_id) is None:
+            return OwnedWriteResult(status=WRITE_NOT_FOUND)
+        return OwnedWriteResult(status=WRITE_FORBIDDEN)
+
+    async def delete_many_owned(
+        self,
+        user_id: UUID | None,
+        session_id: str | None,
+        selection: ActivitySelection,
+    ) -> dict[UUID, OwnedWriteResult]:
+        """Delete the selected activities of an owner in one statement.
+
+        Owner and selection are filters of a single DELETE. When selecting
+        by IDs, IDs that were not deleted are looked up in one query to
+        tell missing rows from foreign ones.
+
+        Args:
+            user_id: User ID if authenticated
+            session_id: Session ID for anonymous users
+            selection: Activities to delete
+
+        Returns:
+            Outcome per activity: every requested ID when selecting by
+            IDs, otherwise only the deleted activities
+        """
+        require_owner(user_id, session_id)
+        query = self._client.table(self.TABLE).delete()
+        query = self._filter_selection(
+            self._filter_owner(query, user_id, session_id), selection
+        )
+        deleted = {
+            UUID(row["id"]): OwnedWriteResult(
+                status=WRITE_OK, previous=self._row_to_entity(row)
+            )
+            for row in query.execute().data
+        }
+        if selection.ids is None:
+            return deleted
+
+        missing = [i for i in selection.ids if i not in deleted]
+        foreign: set[UUID] = set()
+        if missing:
+            lookup = self._client.table(self.TABLE).select("id")
+            lookup = self._filter_selection(
+                lookup,
+                ActivitySelection(
+                    ids=tuple(missing),
+                    start_date=selection.start_date,
+                    end_date=selection.end_date,
+                    activity_type=selection.activity_type,
+                ),
+            )
+            foreign = {UUID(row["id"]) for row in lookup.execute().data}
+
+        return {
+            i: deleted.get(i)
+            or OwnedWriteResult(
+                status=WRITE_FORBIDDEN if i in foreign else WRITE_NOT_FOUND
+            )
+            for i in selection.ids
+        }
+
+    async def update_type_many_owned(
+        self,
+        user_id: UUID | None,
+        session_id: str | None,
+        selection: ActivitySelection,
+        category: str,
+        activity_type: str,
+        co2e_for: Co2eCalculator,
+    ) -> dict[UUID, OwnedWriteResult]:
+        """Change the type of the selected activities in one statement.
+
+        Reads the owned rows in the category, computes their CO2e and runs
+        the ``bulk_update_activity_type`` function, which updates the rows
+        still holding the value and date their CO2e was computed from and
+        classifies the others in one round trip. Rows changed in between
+        are read and computed again.
+
+        Args:
+            user_id: User ID if authenticated
+            session_id: Session ID for anonymous users
+            selection: Activities to update
+            category: Category of the new type
+            activity_type: New activity type
+            co2e_for: Computes the CO2e of activities as the new type
+
+        Returns:
+            Outcome per activity: every requested ID when selecting by
+            IDs, otherwise every owned activity matching the filter
+
+        Raises:
+            RuntimeError: If rows keep changing between read and update
+        """
+        require_owner(user_id, session_id)
+        outcomes: dict[UUID, OwnedWriteResult] = {}
+        pending = selection
+        for _ in range(_STALE_ATTEMPTS):
+            query = self._client.table(self.TABLE).select("*").eq("category", category)
+            query = self._filter_selection(
+                self._filter_owner(query, user_id, session_id), pending
+            )
+            current = [self._row_to_entity(row) for row in query.execute().data]
+            co2e = await co2e_for(current) if current else []
+
+            result = self._client.rpc(
+                "bulk_update_activity_type",
+                {
+                    "p_user_id": str(user_id) if user_id else None,
+                    "p_session_id": session_id,
+                    "p_ids": [str(i) for i in pending.ids]
+                    if pending.ids is not None
+                    else None,
+                    "p_start_date": pending.start_date.isoformat()
+                    if pending.start_date
+                    else None,
+                    "p_end_date": pending.end_date.isoformat()
+                    if pending.end_date
+                    else None,
+                    "p_type_filter": pending.activity_type,
+                    "p_category": category,
+                    "p_type": activity_type,
+                    "p_co2e_ids": [str(a.id) for a in current],
+                    "p_values": [a.value for a in current],
+                    "p_dates": [a.date.isoformat() for a in current],
+                    "p_co2e_kg": co2e,
+                },
+            ).execute()
+
+            stale = []
+            for row in _rpc_rows(result.data):
+                if row["status"] == _STALE:
+                    stale.append(UUID(row["id"]))
+                    continue
+                outcomes[UUID(row["id"])] = OwnedWriteResult(
+                    status=row["status"],
+                    activity=self._row_to_entity(row["activity"])
+                    if row.get("activity")
+                    else None,
+                    previous=self._row_to_entity(row["previous"])
+                    if row.get("previous")
+                    else None,
+                )
+            if not stale:
+                break
+            pending = replace(selection, ids=tuple(stale))
+        else:
+            raise RuntimeError("Activities kept changing during the bulk update")
+
+        if selection.ids is None:
+            return outcomes
+        return {
+            i: outcomes.get(i, OwnedWriteResult(status=WRITE_NOT_FOUND))
+            for i in selection.ids
+        }
+
+    async def list_after_id(
+        self,
+        after_id: UUID | None,
+        limit: int,
+        activity_types: tuple[str, ...] | None = None,
+        before_id: UUID | None = None,
+    ) -> list[Activity]:
+        """List activities of all owners in ID order (keyset pagination).
+
+        Args:
+            after_id: Return activities with a greater ID (None from the start)
+            limit: Maximum number of activities
+            activity_types: Only activities of these types (None for all)
+            before_id: Return activities with a smaller ID (None to the end)
+
+        Returns:
+            Activities ordered by ID ascending
+        """
+        query = self._client.table(self.TABLE).select("*")
+        if after_id is not None:
+            query = query.gt("id", str(after_id))
+        if before_id is not None:
+            query = query.lt("id", str(before_id))
+        if activity_types is not None:
+            query = query.in_("type", list(activity_types))
+        result = query.order("id").limit(limit).execute()
+        return [self._row_to_entity(row) for row in result.data]
+
+    async def list_owned_after_id(
+        self,
+        user_id: UUID | None,
+        session_id: str | None,
+        after_id: UUID | None,
+        limit: int,
+    ) -> list[Activity]:
+        """List one owner's activities in ID order (keyset pagination).
+
+        Each page is a range scan of the (owner, id) index from after_id,
+        so deep pages cost the same as the first one, unlike offset paging.
+
+        Args:
+            user_id: User ID if authenticated
+            session_id: Session ID for anonymous users
+            after_id: Return activities with a greater ID (None from the start)
+            limit: Maximum number of activities
+
+        Returns:
+            Activities ordered by ID ascending
+        """
+        query = self._filter_owner(
+            self._client.table(self.TABLE).select("*"), user_id, session_id
+        )
+        if after_id is not None:
+            query = query.gt("id", str(after_id))
+        result = query.order("id").limit(limit).execute()
+        return [self._row_to_entity(row) for row in result.data]
+
+    async def update_co2e_many(
+        self, activities: list[Activity], co2e_for: Co2eCalculator
+    ) -> dict[UUID, OwnedWriteResult]:
+        """Set the CO2e of many activities in one statement.
+
+        Runs the ``update_activity_co2e`` function, an UPDATE joined
+        against the unnested arrays of IDs and the type, value and date
+        each CO2e was computed from. Rows the function reports as changed
+        since are computed again from the current values it returns.
+
+        Args:
+            activities: Activities as read
+            co2e_for: Computes the current CO2e of activities
+
+        Returns:
+            WRITE_OK outcome per activity updated
+
+        Raises:
+            RuntimeError: If rows keep changing between computation and update
+        """
+        if not activities:
+            return {}
+        outcomes: dict[UUID, OwnedWriteResult] = {}
+        pending = activities
+        for _ in range(_STALE_ATTEMPTS):
+            co2e = await co2e_for(pending)
+            result = self._client.rpc(
+                "update_activity_co2e",
+                {
+                    "p_ids": [str(a.id) for a in pending],
+                    "p_types": [a.type for a in pending],
+                    "p_values": [a.value for a in pending],
+                    "p_dates": [a.date.isoformat() for a in pending],
+                    "p_co2e_kg": co2e,
+                },
+            ).execute()
+
+            pending = []
+            for row in _rpc_rows(result.data):
+                if row["status"] == _STALE:
+                    pending.append(self._row_to_entity(row["previous"]))
+                    continue
+                outcomes[UUID(row["id"])] = OwnedWriteResult(
+                    status=row["status"],
+                    activity=self._row_to_entity(row["activity"]),
+                    previous=self._row_to_entity(row["previous"]),
+                )
+            if not pending:
+                break
+        else:
+            raise RuntimeError("Activities kept changing during the CO2e update")
+        return outcomes
+
+    async def list_owner_totals(
+        self, start_date: date, end_date: date
+    ) -> list[OwnerCategoryTotal]:
+        """Sum CO2e per owner and category across all owners.
+
+        Aggregation runs in the database (``activity_owner_totals`` function)
+        so only one row per owner and category is transferred.
+
+        Args:
+            start_date: Start of date range (inclusive)
+            end_date: End of date range (inclusive)
+
+        Returns:
+            One total per (owner, category) pair with activities in range
+        """
+        result = self._client.rpc(
+            "activity_owner_totals",
+            {
+                "p_start_date": start_date.isoformat(),
+                "p_end_date": end_date.isoformat(),
+            },
+        ).execute()
+        return [
+            OwnerCategoryTotal(
+                user_id=UUID(row["user_id"]) if row.get("user_id") else None,
+                session_id=row.get("session_id"),
+                category=row["category"],
+                co2e_kg=float(row["co2e_kg"]),
+            )
+            for row in _rpc_rows(result.data)
+        ]
+
+    @staticmethod
+    def _filter_owner(query: Any, user_id: UUID | None, session_id: str | None) -> Any:
+        """Restrict a query to one owner's activities.
+
+        Args:
+            query: PostgREST filter builder
+            user_id: User ID if authenticated
+            session_id: Session ID for anonymous users
+
+        Returns:
+            Filtered query builder
+
+        Raises:
+            ValueError: If neither user_id nor session_id is provided
+        """
+        require_owner(user_id, session_id)
+        if user_id:
+            return query.eq("user_id", str(user_id))
+        return query.eq("session_id", session_id)
+
+    @staticmethod
+    def _filter_selection(query: Any, selection: ActivitySelection) -> Any:
+        """Restrict a query to the selected activities.
+
+        Args:
+            query: PostgREST filter builder
+            selection: IDs and filters to apply
+
+        Returns:
+            Filtered query builder
+        """
+        if selection.ids is not None:
+            query = query.in_("id", [str(i) for i in selection.ids])
+        if selection.start_date is not None:
+            query = query.gte("date", selection.start_date.isoformat())
+        if selection.end_date is not None:
+            query = query.lte("date", selection.end_date.isoformat())
+        if selection.activity_type is not None:
+            query = query.eq("type", selection.activity_type)
+        return query
+
+    @staticmethod
+    def _entity_to_row(activity: Activity) -> dict[str, Any]:
+        """Convert domain entity to an insertable Supabase row.
+
+        Args:
+            activity: Activity entity
+
+        Returns:
+            Row dictionary (created_at is set by the database)
+        """
+        return {
+            "id": str(activity.id),
+            "category": activity.category,
+            "type": activity.type,
+            "value": activity.value,
+            "co2e_kg": activity.co2e_kg,
+            "date": activity.date.isoformat(),
+            "notes": activity.notes,
+            "metadata": activity.metadata,
+            "user_id": str(activity.user_id) if activity.user_id else None,
+            "session_id": activity.session_id,
+        }
+
     def _row_to_entity(self, row: Any) -> Activity:
         """Convert Supabase row to domain entity.
 
@@ -1,12 +1,13 @@
 """Supabase implementation of EmissionFactorRepository port."""
 
-from datetime import datetime
+from datetime import date, datetime
 from typing import Any
 
 from supabase import Client
 
 from domain.entities.emission_factor import EmissionFactor
 from domain.ports.emission_factor_repository import EmissionFactorRepository
+from domain.services.emission_factor_index import EmissionFactorIndex
 
 
 class SupabaseEmissionFactorRepository(EmissionFactorRepository):
@@ -26,24 +27,47 @@ class SupabaseEmissionFactorRepository(EmissionFactorRepository):
         self._client = client
 
     async def get_by_type(self, activity_type: str) -> EmissionFactor | None:
-        """Retrieve emission factor by activity type.
+        """Retrieve the most recent emission factor of an activity type.
 
         Args:
             activity_type: Activity type (e.g., "car_petrol")
 
         Returns:
-            Emission factor if found, None otherwise
+            Latest emission factor if found, None otherwise
         """
         result = (
             self._client.table(self.TABLE)
             .select("*")
             .eq("type", activity_type)
+            .order("source_year", desc=True)
+            .limit(1)
             .execute()
         )
         if not result.data:
             return None
         return self._row_to_entity(result.data[0])
 
+    async def get_by_type_on(
+        self, activity_type: str, on: date
+    ) -> EmissionFactor | None:
+        """Retrieve the emission factor of an activity type valid on a date.
+
+        Args:
+            activity_type: Activity type (e.g., "car_petrol")
+            on: Date the activity took place
+
+        Returns:
+            Emission factor in effect on that date, None if the type is unknown
+        """
+        result = (
+            self._client.table(self.TABLE)
+            .select("*")
+            .eq("type", activity_type)
+            .execute()
+        )
+        index = EmissionFactorIndex(self._row_to_entity(row) for row in result.data)
+        return index.on(activity_type, on)
+
     async def list_by_category(self, category: str) -> list[EmissionFactor]:
         """List all emission factors for a category.
 
@@ -58,6 +82,7 @@ class SupabaseEmissionFactorRepository(EmissionFactorRepository):
             .select("*")
             .eq("category", category)
             .order("type")
+            .order("source_year")
             .execute()
         )
         return [self._row_to_entity(row) for row in result.data]
@@ -66,13 +91,15 @@ class SupabaseEmissionFactorRepository(EmissionFactorRepository):
         """Retrieve all emission factors.
 
         Returns:
-            List of all emission factors ordered by category, then type
+            List of all emission factors ordered by category, type, then
+            source year
         """
         result = (
             self._client.table(self.TABLE)
             .select("*")
             .order("category")
             .order("type")
+            .order("source_year")
             .execute()
         )
         return [self._row_to_entity(row) for row in result.data]
@@ -97,4 +124,5 @@ class SupabaseEmissionFactorRepository(EmissionFactorRepository):
             created_at=datetime.fromisoformat(row["created_at"])
             if isinstance(row["created_at"], str)
             else row["created_at"],
+            source_year=row.get("source_year"),
         )
@@ -0,0 +1,85 @@
+"""Supabase implementation of RecalculationCheckpointStore port."""
+
+from typing import Any
+from uuid import UUID
+
+from supabase import Client
+
+from domain.ports.recalculation_checkpoint_store import (
+    RecalculationCheckpoint,
+    RecalculationCheckpointStore,
+)
+
+
+class SupabaseRecalculationCheckpointStore(RecalculationCheckpointStore):
+    """Checkpoints kept in the recalculation_checkpoints table.
+
+    Shared by every process, so a job can be resumed from the CLI or
+    the admin API regardless of where it was started.
+    """
+
+    TABLE = "recalculation_checkpoints"
+
+    def __init__(self, client: Client):
+        """Initialize store with Supabase client.
+
+        Args:
+            client: Supabase client instance
+        """
+        self._client = client
+
+    async def load(self, job_id: str) -> RecalculationCheckpoint | None:
+        """Load a job's checkpoint.
+
+        Args:
+            job_id: Job identifier
+
+        Returns:
+            Last saved checkpoint, or None for a new job
+        """
+        result = (
+            self._client.table(self.TABLE).select("*").eq("job_id", job_id).execute()
+        )
+        if not result.data:
+            return None
+        return self._row_to_checkpoint(result.data[0])
+
+    async def save(self, checkpoint: RecalculationCheckpoint) -> None:
+        """Save a job's checkpoint, replacing the previous one.
+
+        Args:
+            checkpoint: Progress to persist
+        """
+        row = {
+            "job_id": checkpoint.job_id,
+            "activity_types": list(checkpoint.activity_types)
+            if checkpoint.activity_types is not None
+            else None,
+            "last_id": str(checkpoint.last_id) if checkpoint.last_id else None,
+            "scanned": checkpoint.scanned,
+            "updated": checkpoint.updated,
+            "skipped": checkpoint.skipped,
+            "completed": checkpoint.completed,
+        }
+        self._client.table(self.TABLE).upsert(row, on_conflict="job_id").execute()
+
+    def _row_to_checkpoint(self, row: Any) -> RecalculationCheckpoint:
+        """Convert Supabase row to checkpoint.
+
+        Args:
+            row: Dictionary from Supabase response
+
+        Returns:
+            RecalculationCheckpoint value
+        """
+        return RecalculationCheckpoint(
+            job_id=row["job_id"],
+            activity_types=tuple(row["activity_types"])
+            if row.get("activity_types") is not None
+            else None,
+            last_id=UUID(row["last_id"]) if row.get("last_id") else None,
+            scanned=int(row["scanned"]),
+            updated=int(row["updated"]),
+            skipped=int(row["skipped"]),
+            completed=bool(row["completed"]),
+        )
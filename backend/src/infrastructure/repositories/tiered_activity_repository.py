@@ -0,0 +1,256 @@
+"""Activity repository over a hot repository and an archive."""
+
+from datetime import date, timedelta
+from uuid import UUID
+
+from domain.entities.activity import Activity
+from domain.ports.activity_archive import ActivityArchive
+from domain.ports.activity_repository import (
+    ActivityRepository,
+    ActivitySelection,
+    Co2eCalculator,
+    OwnedWriteResult,
+    OwnerCategoryTotal,
+)
+
+
+def _merge(hot: list[Activity], archived: list[Activity]) -> list[Activity]:
+    """Union of both tiers; the hot copy wins if a row is in both."""
+    hot_ids = {activity.id for activity in hot}
+    return hot + [activity for activity in archived if activity.id not in hot_ids]
+
+
+class TieredActivityRepository(ActivityRepository):
+    """Activity repository reading through to archived activities.
+
+    Activities older than the archival horizon are moved to an archive
+    (scripts/archive_activities.py). Date ranges reaching past the
+    horizon (e.g. period=all) and exports union both tiers, so callers
+    see one history; everything else only touches the hot repository.
+    Archived activities are read-only: they are not found by ID, not
+    listed in the newest-first pages and not recalculated. Population
+    totals count them through the rollups the archival job keeps.
+    """
+
+    def __init__(
+        self,
+        hot: ActivityRepository,
+        archive: ActivityArchive,
+        horizon_days: int,
+    ) -> None:
+        """Initialize repository with both tiers.
+
+        Args:
+            hot: Repository of recent activities
+            archive: Archive of activities past the horizon
+            horizon_days: Age in days past which activities may be archived
+        """
+        self._hot = hot
+        self._archive = archive
+        self._horizon = timedelta(days=horizon_days)
+
+    async def save(self, activity: Activity) -> Activity:
+        """Save to the hot repository."""
+        return await self._hot.save(activity)
+
+    async def save_many(self, activities: list[Activity]) -> list[Activity]:
+        """Save to the hot repository."""
+        saved: list[Activity] = await self._hot.save_many(activities)
+        return saved
+
+    async def get_by_id(self, activity_id: UUID) -> Activity | None:
+        """Get a hot activity by ID."""
+        return await self._hot.get_by_id(activity_id)
+
+    async def list_by_user(
+        self, user_id: UUID, limit: int = 100, offset: int = 0
+    ) -> list[Activity]:
+        """List a user's hot activities, most recent first."""
+        activities: list[Activity] = await self._hot.list_by_user(
+            user_id, limit, offset
+        )
+        return activities
+
+    async def list_by_session(
+        self, session_id: str, limit: int = 100, offset: int = 0
+    ) -> list[Activity]:
+        """List a session's hot activities, most recent first."""
+        activities: list[Activity] = await self._hot.list_by_session(
+            session_id, limit, offset
+        )
+        return activities
+
+    async def migrate_session_to_user(self, user_id: UUID, session_id: str) -> int:
+        """Migrate a session's activities in both tiers.
+
+        Args:
+            user_id: Authenticated user's ID
+            session_id: Anonymous session identifier
+
+        Returns:
+            Count of activities migrated
+        """
+        migrated: int = await self._hot.migrate_session_to_user(user_id, session_id)
+        archived: int = await self._archive.migrate_session_to_user(user_id, session_id)
+        return migrated + archived
+
+    async def list_by_date_range(
+        self,
+        user_id: UUID | None,
+        session_id: str | None,
+        start_date: date,
+        end_date: date,
+    ) -> list[Activity]:
+        """List activities of both tiers within a date range.
+
+        The archive is only read when the range starts past the horizon.
+
+        Args:
+            user_id: User ID if authenticated
+            session_id: Session ID for anonymous users
+            start_date: Start of date range (inclusive)
+            end_date: End of date range (inclusive)
+
+        Returns:
+            List of activities ordered by date ascending
+        """
+        hot: list[Activity] = await self._hot.list_by_date_range(
+            user_id, session_id, start_date, end_date
+        )
+        if start_date >= date.today() - self._horizon:
+            return hot
+        archived = await self._archive.list_by_date_range(
+            user_id, session_id, start_date, end_date
+        )
+        if not archived:
+            return hot
+        return sorted(_merge(hot, archived), key=lambda a: (a.date, a.created_at))
+
+    async def update(self, activity: Activity) -> Activity:
+        """Update a hot activity."""
+        return await self._hot.update(activity)
+
+    async def delete(self, activity_id: UUID) -> bool:
+        """Delete a hot activity."""
+        deleted: bool = await self._hot.delete(activity_id)
+        return deleted
+
+    async def update_owned(
+        self,
+        activity_id: UUID,
+        user_id: UUID | None,
+        session_id: str | None,
+        category: str,
+        activity_type: str,
+        value: float,
+        co2e_kg: float,
+        activity_date: date,
+        notes: str | None,
+    ) -> OwnedWriteResult:
+        """Update a hot activity of the given owner."""
+        return await self._hot.update_owned(
+            activity_id,
+            user_id,
+            session_id,
+            category,
+            activity_type,
+            value,
+            co2e_kg,
+            activity_date,
+            notes,
+        )
+
+    async def delete_owned(
+        self, activity_id: UUID, user_id: UUID | None, session_id: str | None
+    ) -> OwnedWriteResult:
+        """Delete a hot activity of the given owner."""
+        return await self._hot.delete_owned(activity_id, user_id, session_id)
+
+    async def delete_many_owned(
+        self,
+        user_id: UUID | None,
+        session_id: str | None,
+        selection: ActivitySelection,
+    ) -> dict[UUID, OwnedWriteResult]:
+        """Delete selected hot activities of an owner."""
+        results: dict[UUID, OwnedWriteResult] = await self._hot.delete_many_owned(
+            user_id, session_id, selection
+        )
+        return results
+
+    async def update_type_many_owned(
+        self,
+        user_id: UUID | None,
+        session_id: str | None,
+        selection: ActivitySelection,
+        category: str,
+        activity_type: str,
+        co2e_for: Co2eCalculator,
+    ) -> dict[UUID, OwnedWriteResult]:
+        """Change the type of selected hot activities of an owner."""
+        results: dict[UUID, OwnedWriteResult] = await self._hot.update_type_many_owned(
+            user_id, session_id, selection, category, activity_type, co2e_for
+        )
+        return results
+
+    async def list_after_id(
+        self,
+        after_id: UUID | None,
+        limit: int,
+        activity_types: tuple[str, ...] | None = None,
+        before_id: UUID | None = None,
+    ) -> list[Activity]:
+        """List hot activities of all owners in ID order."""
+        activities: list[Activity] = await self._hot.list_after_id(
+            after_id, limit, activity_types, before_id
+        )
+        return activities
+
+    async def list_owned_after_id(
+        self,
+        user_id: UUID | None,
+        session_id: str | None,
+        after_id: UUID | None,
+        limit: int,
+    ) -> list[Activity]:
+        """List one owner's activities of both tiers in ID order.
+
+        Each tier returns its next page; the first `limit` of their
+        union is the next page of the whole history.
+
+        Args:
+            user_id: User ID if authenticated
+            session_id: Session ID for anonymous users
+            after_id: Return activities with a greater ID (None from the start)
+            limit: Maximum number of activities
+
+        Returns:
+            Activities ordered by ID ascending
+        """
+        hot: list[Activity] = await self._hot.list_owned_after_id(
+            user_id, session_id, after_id, limit
+        )
+        archived = await self._archive.list_owned_after_id(
+            user_id, session_id, after_id, limit
+        )
+        if not archived:
+            return hot
+        return sorted(_merge(hot, archived), key=lambda a: a.id.int)[:limit]
+
+    async def update_co2e_many(
+        self, activities: list[Activity], co2e_for: Co2eCalculator
+    ) -> dict[UUID, OwnedWriteResult]:
+        """Set the CO2e of hot activities."""
+        results: dict[UUID, OwnedWriteResult] = await self._hot.update_co2e_many(
+            activities, co2e_for
+        )
+        return results
+
+    async def list_owner_totals(
+        self, start_date: date, end_date: date
+    ) -> list[OwnerCategoryTotal]:
+        """Sum CO2e per owner and category (archived rows through rollups)."""
+        totals: list[OwnerCategoryTotal] = await self._hot.list_owner_totals(
+            start_date, end_date
+        )
+        return totals
@@ -0,0 +1,14 @@
+"""Background job scheduling."""
+
+from .asyncio_job_scheduler import AsyncioJobScheduler, InProcessJobCoordinator
+from .postgres_job_coordinator import PostgresJobCoordinator
+from .schedules import CronSchedule, IntervalSchedule, parse_schedule
+
+__all__ = [
+    "AsyncioJobScheduler",
+    "CronSchedule",
+    "InProcessJobCoordinator",
+    "IntervalSchedule",
+    "PostgresJobCoordinator",
+    "parse_schedule",
+]
@@ -0,0 +1,190 @@
+"""Job scheduler running jobs as asyncio tasks of the API process."""
+
+import asyncio
+import logging
+import random
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from typing import Any
+
+from domain.ports.job_scheduler import JobCoordinator, JobScheduler, ScheduledJobStats
+
+from .schedules import Schedule, parse_schedule
+
+logger = logging.getLogger(__name__)
+
+
+class InProcessJobCoordinator(JobCoordinator):
+    """Coordinator for a single replica: every due run is claimed.
+
+    Each job has one scheduling task, so runs of a job never overlap
+    within a process.
+    """
+
+    async def try_acquire(self, job: str, slot: datetime) -> bool:
+        """Claim every due run."""
+        return True
+
+    async def release(self, job: str) -> None:
+        """Nothing to release."""
+
+
+@dataclass
+class _Job:
+    """A registered job and its counters."""
+
+    name: str
+    spec: str
+    schedule: Schedule
+    run: Callable[[], Awaitable[Any]]
+    runs: int = 0
+    failed: int = 0
+    skipped: int = 0
+    running: bool = False
+    last_run_ms: float = 0.0
+    last_started_at: datetime | None = None
+    last_slot: datetime | None = None
+    next_run_at: datetime | None = None
+
+
+class AsyncioJobScheduler(JobScheduler):
+    """Run registered jobs on cron or interval schedules in the event loop.
+
+    Each job gets a task that sleeps until its next due time plus a
+    random jitter, asks the coordinator whether this replica runs it,
+    and records the outcome. Jitter spreads replicas (and jobs due at
+    the same minute) so they do not hit the database at once; the
+    coordinator makes sure only one of them runs each due time. Due
+    times passing while a run is still going are not made up.
+    """
+
+    def __init__(
+        self,
+        coordinator: JobCoordinator | None = None,
+        jitter_seconds: float = 0.0,
+        now: Callable[[], datetime] = lambda: datetime.now(UTC),
+        clock: Callable[[], float] = time.perf_counter,
+        sleep: Callable[[float], Awaitable[None]] = asyncio.sleep,
+    ) -> None:
+        """Initialize a stopped scheduler.
+
+        Args:
+            coordinator: Replica election (default: in-process only)
+            jitter_seconds: Random delay added to each due time at most
+            now: Wall clock deciding due times
+            clock: Time source in seconds used for run durations
+            sleep: Coroutine function waiting a number of seconds
+        """
+        self._coordinator = coordinator or InProcessJobCoordinator()
+        self._jitter_seconds = jitter_seconds
+        self._now = now
+        self._clock = clock
+        self._sleep = sleep
+        self._jobs: dict[str, _Job] = {}
+        self._tasks: list[asyncio.Task[None]] = []
+
+    def add(
+        self,
+        name: str,
+        schedule: str,
+        job: Callable[[], Awaitable[Any]],
+    ) -> None:
+        """Register a job.
+
+        Args:
+            name: Unique job name
+            schedule: Cron expression, alias or "@every <n><s|m|h|d>"
+            job: Coroutine function performing one run
+
+        Raises:
+            ValueError: If the name is taken or the schedule is invalid
+        """
+        if name in self._jobs:
+            raise ValueError(f"Job {name} is already scheduled")
+        self._jobs[name] = _Job(name, schedule, parse_schedule(schedule), job)
+
+    def start(self) -> None:
+        """Start one scheduling task per registered job.
+
+        Raises:
+            RuntimeError: If the scheduler is already running
+        """
+        if self._tasks:
+            raise RuntimeError("Scheduler is already running")
+        self._tasks = [
+            asyncio.create_task(self._loop(job), name=f"scheduler:{job.name}")
+            for job in self._jobs.values()
+        ]
+
+    async def close(self) -> None:
+        """Stop scheduling and cancel running jobs."""
+        tasks, self._tasks = self._tasks, []
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    def stats(self) -> list[ScheduledJobStats]:
+        """Get counters of every registered job.
+
+        Returns:
+            Snapshot per job, in registration order
+        """
+        return [
+            ScheduledJobStats(
+                name=job.name,
+                schedule=job.spec,
+                runs=job.runs,
+                failed=job.failed,
+                skipped=job.skipped,
+                running=job.running,
+                last_run_ms=job.last_run_ms,
+                last_started_at=job.last_started_at,
+                next_run_at=job.next_run_at,
+            )
+            for job in self._jobs.values()
+        ]
+
+    async def _loop(self, job: _Job) -> None:
+        """Wait for each due time of a job and fire it."""
+        while True:
+            now = self._now()
+            # An early wake-up must not fire the same due time twice
+            after = max(now, job.last_slot) if job.last_slot else now
+            slot = job.schedule.next_after(after)
+            job.next_run_at = slot
+            delay = (slot - now).total_seconds()
+            await self._sleep(delay + random.uniform(0, self._jitter_seconds))
+            job.last_slot = slot
+            await self._fire(job, slot)
+
+    async def _fire(self, job: _Job, slot: datetime) -> None:
+        """Run one due time of a job if this replica claims it."""
+        try:
+            claimed = await self._coordinator.try_acquire(job.name, slot)
+        except Exception:
+            job.failed += 1
+            logger.exception("Failed to claim scheduled job %s", job.name)
+            return
+        if not claimed:
+            job.skipped += 1
+            return
+
+        job.running = True
+        job.last_started_at = self._now()
+        started = self._clock()
+        try:
+            await job.run()
+        except Exception:
+            job.failed += 1
+            logger.exception("Scheduled job %s failed", job.name)
+        else:
+            job.runs += 1
+        finally:
+            job.running = False
+            job.last_run_ms = (self._clock() - started) * 1000
+            try:
+                await self._coordinator.release(job.name)
+            except Exception:
+                logger.exception("Failed to release scheduled job %s", job.name)
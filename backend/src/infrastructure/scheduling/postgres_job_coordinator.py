@@ -0,0 +1,105 @@
+"""Job coordination across replicas through Postgres."""
+
+import hashlib
+from datetime import datetime
+
+import asyncpg
+
+from domain.ports.job_scheduler import JobCoordinator
+from infrastructure.config.postgres import PostgresPool
+
+# Record the due time as run, unless it (or a later one) already was
+_CLAIM = """
+INSERT INTO scheduled_job_runs (job, slot, started_at)
+VALUES ($1, $2, NOW())
+ON CONFLICT (job) DO UPDATE
+SET slot = EXCLUDED.slot, started_at = EXCLUDED.started_at
+WHERE scheduled_job_runs.slot < EXCLUDED.slot
+RETURNING slot
+"""
+
+
+def advisory_lock_key(job: str) -> int:
+    """Signed 64-bit advisory lock key of a job name."""
+    digest = hashlib.sha256(f"scheduled_job:{job}".encode()).digest()
+    return int.from_bytes(digest[:8], "big", signed=True)
+
+
+class PostgresJobCoordinator(JobCoordinator):
+    """Elect the replica running a job with an advisory lock and a claim.
+
+    A replica runs a due time when it gets the job's session advisory
+    lock (so runs never overlap across replicas) and then records the
+    due time in scheduled_job_runs (so a replica waking up after the run
+    finished does not repeat it). The lock is held on a pooled
+    connection for the whole run and released with it; if the process
+    dies, Postgres drops the lock with the connection.
+
+    Jobs started on demand (e.g., recalculations) only take the lock,
+    through try_lock().
+    """
+
+    def __init__(self, pool: PostgresPool) -> None:
+        """Initialize coordinator.
+
+        Args:
+            pool: Postgres pool providing the lock connections
+        """
+        self._pool = pool
+        self._held: dict[str, asyncpg.Connection] = {}
+
+    async def try_acquire(self, job: str, slot: datetime) -> bool:
+        """Lock the job and claim its due time.
+
+        Args:
+            job: Job name
+            slot: Due time of the run, identical on every replica
+
+        Returns:
+            True if this replica runs it; release() must follow
+        """
+        return await self._lock(job, slot)
+
+    async def try_lock(self, job: str) -> bool:
+        """Lock a job started on demand, without claiming a due time.
+
+        Args:
+            job: Job name
+
+        Returns:
+            True if no other process runs it; release() must follow
+        """
+        return await self._lock(job, None)
+
+    async def _lock(self, job: str, slot: datetime | None) -> bool:
+        """Take the job's advisory lock and claim the due time, if any."""
+        pool = await self._pool.get()
+        conn = await pool.acquire()
+        try:
+            claimed = await conn.fetchval(
+                "SELECT pg_try_advisory_lock($1)", advisory_lock_key(job)
+            ) and (slot is None or await conn.fetchval(_CLAIM, job, slot) is not None)
+        except BaseException:
+            await pool.release(conn)
+            raise
+        if not claimed:
+            # The pool resets released connections, dropping their locks
+            await pool.release(conn)
+            return False
+        self._held[job] = conn
+        return True
+
+    async def release(self, job: str) -> None:
+        """Unlock the job after a claimed run.
+
+        Args:
+            job: Job name
+        """
+        conn = self._held.pop(job, None)
+        if conn is None:
+            return
+        pool = await self._pool.get()
+        try:
+            await conn.execute("SELECT pg_advisory_unlock($1)", advisory_lock_key(job))
+        finally:
+            await pool.release(conn)
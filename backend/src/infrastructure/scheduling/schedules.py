@@ -0,0 +1,165 @@
+"""Cron and interval schedules computing the due times of a job."""
+
+from abc import ABC, abstractmethod
+from datetime import UTC, date, datetime, time, timedelta
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=UTC)
+
+_UNITS = {"s": 1, "m": 60, "h": 3600, "d": 86400}
+
+_ALIASES = {
+    "@hourly": "0 * * * *",
+    "@daily": "0 0 * * *",
+    "@weekly": "0 0 * * 0",
+    "@monthly": "0 0 1 * *",
+}
+
+# Days searched for the next match; covers Feb 29 in leap years
+_MAX_DAYS = 8 * 366
+
+
+class Schedule(ABC):
+    """Due times of a job, in UTC."""
+
+    @abstractmethod
+    def next_after(self, after: datetime) -> datetime:
+        """Get the first due time strictly after a time.
+
+        Args:
+            after: Timezone-aware time
+
+        Returns:
+            Next due time (UTC)
+        """
+
+
+class IntervalSchedule(Schedule):
+    """Due every fixed interval, aligned to the Unix epoch.
+
+    Alignment gives every replica the same due times whenever it starts.
+    """
+
+    def __init__(self, seconds: int) -> None:
+        """Initialize schedule.
+
+        Args:
+            seconds: Interval length
+
+        Raises:
+            ValueError: If the interval is not positive
+        """
+        if seconds <= 0:
+            raise ValueError("Schedule interval must be positive")
+        self._interval = timedelta(seconds=seconds)
+
+    def next_after(self, after: datetime) -> datetime:
+        """Get the next multiple of the interval after a time."""
+        elapsed = after.astimezone(UTC) - _EPOCH
+        return _EPOCH + (elapsed // self._interval + 1) * self._interval
+
+
+def _parse_field(text: str, low: int, high: int) -> set[int]:
+    """Values of one cron field: *, n, a-b, lists and /step."""
+    values: set[int] = set()
+    for part in text.split(","):
+        base, _, step_text = part.partition("/")
+        step = int(step_text) if step_text else 1
+        if base == "*":
+            first, last = low, high
+        elif "-" in base:
+            first_text, last_text = base.split("-", 1)
+            first, last = int(first_text), int(last_text)
+        else:
+            first = int(base)
+            last = high if step_text else first
+        if not low <= first <= last <= high or step <= 0:
+            raise ValueError(f"Invalid cron field: {text}")
+        values.update(range(first, last + 1, step))
+    return values
+
+
+class CronSchedule(Schedule):
+    """Due at the minutes matching a five-field cron expression (UTC).
+
+    Fields are minute, hour, day of month, month and day of week
+    (0 or 7 is Sunday). When both day fields are restricted, a day
+    matching either one is due, as in cron.
+    """
+
+    def __init__(self, expression: str) -> None:
+        """Initialize schedule.
+
+        Args:
+            expression: Cron expression, e.g. "30 3 * * 1-5"
+
+        Raises:
+            ValueError: If the expression is invalid
+        """
+        fields = expression.split()
+        if len(fields) != 5:
+            raise ValueError(f"Cron expression needs 5 fields: {expression}")
+        try:
+            self._minutes = sorted(_parse_field(fields[0], 0, 59))
+            self._hours = sorted(_parse_field(fields[1], 0, 23))
+            self._days = _parse_field(fields[2], 1, 31)
+            self._months = _parse_field(fields[3], 1, 12)
+            self._weekdays = {d % 7 for d in _parse_field(fields[4], 0, 7)}
+        except ValueError as e:
+            raise ValueError(f"Invalid cron expression {expression}: {e}") from e
+        self._any_day = fields[2].startswith("*")
+        self._any_weekday = fields[4].startswith("*")
+
+    def next_after(self, after: datetime) -> datetime:
+        """Get the first matching minute after a time.
+
+        Raises:
+            ValueError: If no date ever matches (e.g. February 30)
+        """
+        start = after.astimezone(UTC).replace(second=0, microsecond=0) + timedelta(
+            minutes=1
+        )
+        day = start.date()
+        for _ in range(_MAX_DAYS):
+            if self._day_matches(day):
+                earliest = (start.hour, start.minute) if day == start.date() else (0, 0)
+                for hour in self._hours:
+                    for minute in self._minutes:
+                        if (hour, minute) >= earliest:
+                            return datetime.combine(day, time(hour, minute), tzinfo=UTC)
+            day += timedelta(days=1)
+        raise ValueError("Cron expression never matches")
+
+    def _day_matches(self, day: date) -> bool:
+        """Whether a date matches the month and day fields."""
+        if day.month not in self._months:
+            return False
+        in_days = day.day in self._days
+        in_weekdays = day.isoweekday() % 7 in self._weekdays
+        if self._any_day:
+            return in_weekdays
+        if self._any_weekday:
+            return in_days
+        return in_days or in_weekdays
+
+
+def parse_schedule(spec: str) -> Schedule:
+    """Parse a schedule specification.
+
+    Args:
+        spec: Cron expression ("0 3 * * *"), alias ("@daily") or
+            interval ("@every 90s", "@every 15m", "@every 6h", "@every 1d")
+
+    Returns:
+        Parsed schedule
+
+    Raises:
+        ValueError: If the specification is invalid
+    """
+    spec = spec.strip()
+    if spec.startswith("@every "):
+        amount = spec.removeprefix("@every ").strip()
+        unit = _UNITS.get(amount[-1:])
+        if unit is None or not amount[:-1].isdigit():
+            raise ValueError(f"Invalid interval: {spec}")
+        return IntervalSchedule(int(amount[:-1]) * unit)
+    return CronSchedule(_ALIASES.get(spec, spec))
@@ -9,8 +9,12 @@ import pytest
 
 sys.path.insert(0, str(Path(__file__).resolve().parents[3] / "src"))
 
+from datetime import UTC
+
+from api.dependencies.container import AppContainer
 from api.dependencies.database import get_supabase
 from api.main import app
+from infrastructure.config.settings import get_settings
 
 
 def _make_mock_supabase(tables: dict | None = None) -> MagicMock:
@@ -41,12 +45,15 @@ def _make_mock_supabase(tables: dict | None = None) -> MagicMock:
             def _execute():
                 from datetime import datetime, timezone
 
-                row = deepcopy(data)
-                if "created_at" not in row or row["created_at"] is None:
-                    row["created_at"] = datetime.now(timezone.utc).isoformat()
-                rows.append(row)
+                inserted = (
+                    deepcopy(data) if isinstance(data, list) else [deepcopy(data)]
+                )
+                for row in inserted:
+                    if "created_at" not in row or row["created_at"] is None:
+                        row["created_at"] = datetime.now(timezone.utc).isoformat()
+                    rows.append(row)
                 result = MagicMock()
-                result.data = [row]
+                result.data = inserted
                 return result
 
             insert_mock.execute = _execute
@@ -54,6 +61,32 @@ def _make_mock_supabase(tables: dict | None = None) -> MagicMock:
 
         table_mock.insert = _insert
 
+        # --- UPSERT ---
+        def _upsert(data, on_conflict="id"):
+            upsert_mock = MagicMock()
+
+            def _execute():
+                upserted = (
+                    deepcopy(data) if isinstance(data, list) else [deepcopy(data)]
+                )
+                for row in upserted:
+                    existing = next(
+                        (r for r in rows if r.get(on_conflict) == row[on_conflict]),
+                        None,
+                    )
+                    if existing is None:
+                        rows.append(row)
+                    else:
+                        existing.update(row)
+                result = MagicMock()
+                result.data = upserted
+                return result
+
+            upsert_mock.execute = _execute
+            return upsert_mock
+
+        table_mock.upsert = _upsert
+
         # --- SELECT ---
         def _select(columns="*"):
             class QueryBuilder:
@@ -61,9 +94,13 @@ def _make_mock_supabase(tables: dict | None = None) -> MagicMock:
                     self._filters = []
                     self._gte_filters = []
                     self._lte_filters = []
+                    self._in_filters = []
+                    self._gt_filters = []
+                    self._lt_filters = []
                     self._orders = []
                     self._range_start = None
                     self._range_end = None
+                    self._limit = None
 
                 def eq(self, col, val):
                     self._filters.append((col, val))
@@ -77,6 +114,18 @@ def _make_mock_supabase(tables: dict | None = None) -> MagicMock:
                     self._lte_filters.append((col, val))
                     return self
 
+                def gt(self, col, val):
+                    self._gt_filters.append((col, val))
+                    return self
+
+                def lt(self, col, val):
+                    self._lt_filters.append((col, val))
+                    return self
+
+                def in_(self, col, vals):
+                    self._in_filters.append((col, vals))
+                    return self
+
                 def is_(self, col, val):
                     self._filters.append((col, val))
                     return self
@@ -90,6 +139,10 @@ def _make_mock_supabase(tables: dict | None = None) -> MagicMock:
                     self._range_end = end
                     return self
 
+                def limit(self, count):
+                    self._limit = count
+                    return self
+
                 def execute(self):
                     filtered = list(rows)
                     for col, val in self._filters:
@@ -102,6 +155,17 @@ def _make_mock_supabase(tables: dict | None = None) -> MagicMock:
                         filtered = [
                             r for r in filtered if str(r.get(col, "")) <= str(val)
                         ]
+                    for col, val in self._gt_filters:
+                        filtered = [
+                            r for r in filtered if str(r.get(col, "")) > str(val)
+                        ]
+                    for col, val in self._lt_filters:
+                        filtered = [
+                            r for r in filtered if str(r.get(col, "")) < str(val)
+                        ]
+                    for col, vals in self._in_filters:
+                        allowed = {str(v) for v in vals}
+                        filtered = [r for r in filtered if str(r.get(col)) in allowed]
                     for col, desc in reversed(self._orders):
                         filtered.sort(
                             key=lambda r, _col=col: r.get(_col, ""),
@@ -109,6 +173,8 @@ def _make_mock_supabase(tables: dict | None = None) -> MagicMock:
                         )
                     if self._range_start is not None:
                         filtered = filtered[self._range_start : self._range_end + 1]
+                    if self._limit is not None:
+                        filtered = filtered[: self._limit]
                     result = MagicMock()
                     result.data = filtered
                     return result
@@ -122,16 +188,32 @@ def _make_mock_supabase(tables: dict | None = None) -> MagicMock:
             class DeleteBuilder:
                 def __init__(self):
                     self._filters = []
+                    self._predicates = []
 
                 def eq(self, col, val):
                     self._filters.append((col, val))
                     return self
 
+                def gte(self, col, val):
+                    self._predicates.append(lambda r: str(r.get(col, "")) >= str(val))
+                    return self
+
+                def lte(self, col, val):
+                    self._predicates.append(lambda r: str(r.get(col, "")) <= str(val))
+                    return self
+
+                def in_(self, col, vals):
+                    allowed = {str(v) for v in vals}
+                    self._predicates.append(lambda r: str(r.get(col)) in allowed)
+                    return self
+
                 def execute(self):
                     deleted = []
                     remaining = []
                     for r in rows:
-                        match = all(str(r.get(c)) == str(v) for c, v in self._filters)
+                        match = all(
+                            str(r.get(c)) == str(v) for c, v in self._filters
+                        ) and all(p(r) for p in self._predicates)
                         if match:
                             deleted.append(r)
                         else:
@@ -180,6 +262,181 @@ def _make_mock_supabase(tables: dict | None = None) -> MagicMock:
         return table_mock
 
     mock_client.table = _table
+
+    # --- RPC ---
+    def _update_owned_activity(params):
+        from datetime import datetime
+
+        rows = tables.setdefault("activities", [])
+        row = next((r for r in rows if str(r.get("id")) == params["p_id"]), None)
+        if row is None:
+            return [{"status": "not_found", "previous": None, "activity": None}]
+        if params["p_user_id"] is not None:
+            owned = str(row.get("user_id")) == params["p_user_id"]
+        else:
+            owned = row.get("session_id") == params["p_session_id"]
+        if not owned:
+            return [{"status": "forbidden", "previous": None, "activity": None}]
+        if row["category"] != params["p_category"]:
+            return [
+                {
+                    "status": "category_mismatch",
+                    "previous": deepcopy(row),
+                    "activity": None,
+                }
+            ]
+        previous = deepcopy(row)
+        row.update(
+            {
+                "type": params["p_type"],
+                "value": params["p_value"],
+                "co2e_kg": params["p_co2e_kg"],
+                "date": params["p_date"],
+                "notes": params["p_notes"],
+                "updated_at": datetime.now(UTC).isoformat(),
+            }
+        )
+        return [{"status": "ok", "previous": previous, "activity": deepcopy(row)}]
+
+    def _bulk_update_activity_type(params):
+        from datetime import datetime
+
+        def owned(r):
+            if params["p_user_id"] is not None:
+                return str(r.get("user_id")) == params["p_user_id"]
+            return r.get("session_id") == params["p_session_id"]
+
+        def selected(r):
+            if params["p_ids"] is not None:
+                if str(r.get("id")) not in params["p_ids"]:
+                    return False
+            elif not owned(r):
+                return False
+            if params["p_start_date"] and str(r["date"]) < params["p_start_date"]:
+                return False
+            if params["p_end_date"] and str(r["date"]) > params["p_end_date"]:
+                return False
+            return not params["p_type_filter"] or r["type"] == params["p_type_filter"]
+
+        computed = {
+            i: (float(value), str(day), co2e)
+            for i, value, day, co2e in zip(
+                params["p_co2e_ids"],
+                params["p_values"],
+                params["p_dates"],
+                params["p_co2e_kg"],
+                strict=True,
+            )
+        }
+
+        out = []
+        for r in tables.setdefault("activities", []):
+            if not selected(r):
+                continue
+            if not owned(r):
+                out.append(
+                    {
+                        "id": r["id"],
+                        "status": "forbidden",
+                        "previous": None,
+                        "activity": None,
+                    }
+                )
+            elif r["category"] != params["p_category"]:
+                out.append(
+                    {
+                        "id": r["id"],
+                        "status": "category_mismatch",
+                        "previous": deepcopy(r),
+                        "activity": None,
+                    }
+                )
+            elif computed.get(str(r["id"]), (None,))[:2] != (
+                float(r["value"]),
+                str(r["date"]),
+            ):
+                out.append(
+                    {
+                        "id": r["id"],
+                        "status": "stale",
+                        "previous": deepcopy(r),
+                        "activity": None,
+                    }
+                )
+            else:
+                previous = deepcopy(r)
+                r["type"] = params["p_type"]
+                r["co2e_kg"] = computed[str(r["id"])][2]
+                r["updated_at"] = datetime.now(UTC).isoformat()
+                out.append(
+                    {
+                        "id": r["id"],
+                        "status": "ok",
+                        "previous": previous,
+                        "activity": deepcopy(r),
+                    }
+                )
+        return out
+
+    def _update_activity_co2e(params):
+        computed = {
+            i: (activity_type, float(value), str(day), co2e)
+            for i, activity_type, value, day, co2e in zip(
+                params["p_ids"],
+                params["p_types"],
+                params["p_values"],
+                params["p_dates"],
+                params["p_co2e_kg"],
+                strict=True,
+            )
+        }
+        out = []
+        for r in tables.setdefault("activities", []):
+            if str(r.get("id")) not in computed:
+                continue
+            expected = computed[str(r["id"])]
+            if expected[:3] != (r["type"], float(r["value"]), str(r["date"])):
+                out.append(
+                    {
+                        "id": r["id"],
+                        "status": "stale",
+                        "previous": deepcopy(r),
+                        "activity": None,
+                    }
+                )
+                continue
+            previous = deepcopy(r)
+            r["co2e_kg"] = expected[3]
+            out.append(
+                {
+                    "id": r["id"],
+                    "status": "ok",
+                    "previous": previous,
+                    "activity": deepcopy(r),
+                }
+            )
+        return out
+
+    rpc_handlers = {
+        "update_owned_activity": _update_owned_activity,
+        "bulk_update_activity_type": _bulk_update_activity_type,
+        "update_activity_co2e": _update_activity_co2e,
+    }
+
+    def _rpc(name: str, params: dict):
+        if name not in rpc_handlers:
+            return MagicMock()
+        rpc_mock = MagicMock()
+
+        def _execute():
+            result = MagicMock()
+            result.data = rpc_handlers[name](params)
+            return result
+
+        rpc_mock.execute = _execute
+        return rpc_mock
+
+    mock_client.rpc = _rpc
     return mock_client
 
 
@@ -195,3 +452,10 @@ def override_supabase(mock_supabase):
     app.dependency_overrides[get_supabase] = lambda: mock_supabase
     yield mock_supabase
     app.dependency_overrides.clear()
+
+
+@pytest.fixture(autouse=True)
+def reset_app_caches():
+    """Start every test with a fresh application container."""
+    app.state.container = AppContainer(get_settings())
+    yield
@@ -1,13 +1,20 @@
 """Integration tests for activities endpoints."""
 
+import asyncio
+import csv
+import io
+import json
 from datetime import datetime, timezone
+from unittest.mock import MagicMock
 
 import pytest
 from httpx import ASGITransport, AsyncClient
 
+from api.dependencies.container import AppContainer
 from api.dependencies.database import get_supabase
 from api.main import app
 from conftest import _make_mock_supabase
+from infrastructure.config.settings import get_settings
 
 EMISSION_FACTORS = [
     {
@@ -565,3 +572,541 @@ async def test_delete_activity_requires_session_or_auth(supabase_with_factors):
 
     assert response.status_code == 400
     assert "X-Session-ID" in response.json()["detail"]
+
+
+def _activities_calls(mock) -> int:
+    """Count queries issued against the activities table."""
+    return sum(1 for c in mock.table.call_args_list if c.args == ("activities",))
+
+
+@pytest.mark.asyncio
+async def test_update_activity_is_single_write(supabase_with_factors):
+    """Test update checks ownership inside the write, without a lookup."""
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        create_response = await client.post(
+            "/api/v1/activities",
+            json={
+                "category": "transport",
+                "type": "car_petrol",
+                "value": 25.0,
+                "date": "2024-01-15",
+            },
+            headers={"X-Session-ID": "test-session-123"},
+        )
+        activity_id = create_response.json()["id"]
+
+        supabase_with_factors.table = MagicMock(side_effect=supabase_with_factors.table)
+        rpc = supabase_with_factors.rpc
+        supabase_with_factors.rpc = MagicMock(side_effect=rpc)
+        update_response = await client.put(
+            f"/api/v1/activities/{activity_id}",
+            json={"type": "bus", "value": 30.0, "date": "2024-01-16"},
+            headers={"X-Session-ID": "test-session-123"},
+        )
+
+    assert update_response.status_code == 200
+    assert _activities_calls(supabase_with_factors) == 0
+    supabase_with_factors.rpc.assert_called_once()
+    assert supabase_with_factors.rpc.call_args.args[0] == "update_owned_activity"
+
+
+@pytest.mark.asyncio
+async def test_update_activity_to_other_category_rejected(supabase_with_factors):
+    """Test update returns 404 when the new type is in another category."""
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        create_response = await client.post(
+            "/api/v1/activities",
+            json={
+                "category": "transport",
+                "type": "car_petrol",
+                "value": 25.0,
+                "date": "2024-01-15",
+            },
+            headers={"X-Session-ID": "test-session-123"},
+        )
+        activity_id = create_response.json()["id"]
+
+        update_response = await client.put(
+            f"/api/v1/activities/{activity_id}",
+            json={"type": "electricity", "value": 30.0, "date": "2024-01-16"},
+            headers={"X-Session-ID": "test-session-123"},
+        )
+
+    assert update_response.status_code == 404
+    assert (
+        "does not belong to category 'transport'" in (update_response.json()["detail"])
+    )
+
+
+@pytest.mark.asyncio
+async def test_delete_activity_is_single_write(supabase_with_factors):
+    """Test delete filters on the owner in the DELETE itself."""
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        create_response = await client.post(
+            "/api/v1/activities",
+            json={
+                "category": "transport",
+                "type": "car_petrol",
+                "value": 25.0,
+                "date": "2024-01-15",
+            },
+            headers={"X-Session-ID": "test-session-123"},
+        )
+        activity_id = create_response.json()["id"]
+
+        supabase_with_factors.table = MagicMock(side_effect=supabase_with_factors.table)
+        delete_response = await client.delete(
+            f"/api/v1/activities/{activity_id}",
+            headers={"X-Session-ID": "test-session-123"},
+        )
+
+    assert delete_response.status_code == 204
+    assert _activities_calls(supabase_with_factors) == 1
+
+
+async def _create(client, type_, value, date_, session_id="test-session-123"):
+    """Create an activity and return its ID."""
+    category = "energy" if type_ == "electricity" else "transport"
+    response = await client.post(
+        "/api/v1/activities",
+        json={"category": category, "type": type_, "value": value, "date": date_},
+        headers={"X-Session-ID": session_id},
+    )
+    return response.json()["id"]
+
+
+@pytest.mark.asyncio
+async def test_bulk_delete_by_ids_reports_each_id(supabase_with_factors):
+    """Test bulk delete removes owned rows and classifies the others."""
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        mine = await _create(client, "car_petrol", 10.0, "2024-01-15")
+        theirs = await _create(client, "car_petrol", 10.0, "2024-01-15", "other")
+        missing = "00000000-0000-0000-0000-000000000000"
+
+        response = await client.post(
+            "/api/v1/activities/bulk-delete",
+            json={"ids": [mine, theirs, missing]},
+            headers={"X-Session-ID": "test-session-123"},
+        )
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["succeeded"] == 1
+    assert [(r["id"], r["status"]) for r in data["results"]] == [
+        (mine, "ok"),
+        (theirs, "forbidden"),
+        (missing, "not_found"),
+    ]
+    remaining = {
+        r["id"]
+        for r in supabase_with_factors.table("activities").select().execute().data
+    }
+    assert remaining == {theirs}
+
+
+@pytest.mark.asyncio
+async def test_bulk_delete_by_filter(supabase_with_factors):
+    """Test bulk delete by date range only touches the caller's rows."""
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        in_week = await _create(client, "car_petrol", 10.0, "2024-01-16")
+        await _create(client, "car_petrol", 10.0, "2024-01-25")
+        await _create(client, "car_petrol", 10.0, "2024-01-16", "other")
+
+        supabase_with_factors.table = MagicMock(side_effect=supabase_with_factors.table)
+        response = await client.post(
+            "/api/v1/activities/bulk-delete",
+            json={"filter": {"start_date": "2024-01-15", "end_date": "2024-01-21"}},
+            headers={"X-Session-ID": "test-session-123"},
+        )
+
+    assert response.status_code == 200
+    assert response.json()["results"] == [
+        {"id": in_week, "status": "ok", "co2e_kg": None}
+    ]
+    assert _activities_calls(supabase_with_factors) == 1
+
+
+@pytest.mark.asyncio
+async def test_bulk_delete_requires_selection(supabase_with_factors):
+    """Test bulk delete without IDs or filter is rejected."""
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        response = await client.post(
+            "/api/v1/activities/bulk-delete",
+            json={"filter": {}},
+            headers={"X-Session-ID": "test-session-123"},
+        )
+
+    assert response.status_code == 422
+
+
+@pytest.mark.asyncio
+async def test_bulk_update_changes_type_and_recalculates(supabase_with_factors):
+    """Test bulk type change recomputes CO2e with the new factor."""
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        first = await _create(client, "car_petrol", 100.0, "2024-01-15")
+        second = await _create(client, "car_petrol", 50.0, "2024-01-16")
+        await _create(client, "bus", 10.0, "2024-01-16")
+        meter = await _create(client, "electricity", 10.0, "2024-01-16")
+
+        supabase_with_factors.table = MagicMock(side_effect=supabase_with_factors.table)
+        response = await client.post(
+            "/api/v1/activities/bulk-update",
+            json={"filter": {"type": "car_petrol"}, "type": "bus"},
+            headers={"X-Session-ID": "test-session-123"},
+        )
+        mismatch = await client.post(
+            "/api/v1/activities/bulk-update",
+            json={"ids": [meter], "type": "bus"},
+            headers={"X-Session-ID": "test-session-123"},
+        )
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["succeeded"] == 2
+    results = {r["id"]: r for r in data["results"]}
+    assert set(results) == {first, second}
+    # 100 km * 0.089 and 50 km * 0.089
+    assert results[first]["co2e_kg"] == pytest.approx(8.9)
+    assert results[second]["co2e_kg"] == pytest.approx(4.45)
+    # One read of the rows to compute per request, then one function call
+    assert _activities_calls(supabase_with_factors) == 2
+
+    assert mismatch.json()["results"] == [
+        {"id": meter, "status": "category_mismatch", "co2e_kg": None}
+    ]
+
+
+@pytest.mark.asyncio
+async def test_bulk_update_unknown_type(supabase_with_factors):
+    """Test bulk update to an unknown type returns 400."""
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        response = await client.post(
+            "/api/v1/activities/bulk-update",
+            json={"ids": ["00000000-0000-0000-0000-000000000000"], "type": "rocket"},
+            headers={"X-Session-ID": "test-session-123"},
+        )
+
+    assert response.status_code == 400
+
+
+def _queued_container(**overrides) -> AppContainer:
+    """Run the app with write-behind ingestion of new activities."""
+    settings = get_settings().model_copy(
+        update={
+            "activity_ingestion_mode": "queue",
+            "ingestion_queue_max_size": 3,
+            **overrides,
+        }
+    )
+    app.state.container = AppContainer(settings)
+    return app.state.container
+
+
+@pytest.fixture
+def queued_ingestion():
+    """Queue flushing whatever arrived every 5 ms."""
+    return _queued_container(ingestion_flush_interval_ms=5)
+
+
+@pytest.fixture
+def batched_ingestion():
+    """Queue flushing only full batches of 3 (or on shutdown)."""
+    return _queued_container(ingestion_batch_size=3, ingestion_flush_interval_ms=60_000)
+
+
+@pytest.mark.asyncio
+async def test_create_activity_queued_is_batched(
+    supabase_with_factors, batched_ingestion
+):
+    """Test queued creates return 201 and are written in one multi-row insert."""
+    supabase_with_factors.table = MagicMock(side_effect=supabase_with_factors.table)
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        responses = [
+            await client.post(
+                "/api/v1/activities",
+                json={
+                    "category": "transport",
+                    "type": "car_petrol",
+                    "value": 10.0 * (i + 1),
+                    "date": "2024-01-15",
+                },
+                headers={"X-Session-ID": "test-session-123"},
+            )
+            for i in range(3)
+        ]
+        await batched_ingestion.aclose()
+        metrics = await client.get("/api/v1/health/metrics")
+
+    assert [r.status_code for r in responses] == [201, 201, 201]
+    assert responses[0].json()["co2e_kg"] == pytest.approx(2.3)
+    stored = supabase_with_factors.table("activities").select().execute().data
+    assert {row["id"] for row in stored} == {r.json()["id"] for r in responses}
+    assert _activities_calls(supabase_with_factors) == 2  # one insert + lookup
+
+    ingestion = metrics.json()["ingestion"]
+    assert ingestion["submitted"] == 3
+    assert ingestion["flushed"] == 3
+    assert ingestion["depth"] == 0
+    assert ingestion["flushes"] == 1
+
+
+@pytest.mark.asyncio
+async def test_create_activity_queue_full_returns_503(
+    supabase_with_factors, queued_ingestion
+):
+    """Test a saturated queue sheds load with 503 and Retry-After."""
+    blocked = asyncio.Event()
+
+    async def stalled_flush(batch):
+        await blocked.wait()
+
+    queued_ingestion.ingestion_queue._flush = stalled_flush
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        statuses = []
+        for _ in range(5):
+            response = await client.post(
+                "/api/v1/activities",
+                json={
+                    "category": "transport",
+                    "type": "car_petrol",
+                    "value": 10.0,
+                    "date": "2024-01-15",
+                },
+                headers={"X-Session-ID": "test-session-123"},
+            )
+            statuses.append(response.status_code)
+            await asyncio.sleep(0.01)
+        blocked.set()
+
+    # One batch is in flight, three wait in the queue, the fifth is refused
+    assert statuses == [201, 201, 201, 201, 503]
+    assert response.headers["retry-after"] == "1"
+    await queued_ingestion.aclose()
+
+
+def _stored_activity(n: int, session_id: str = "test-session-123") -> dict:
+    """Build a stored activity row whose ID sorts by n."""
+    return {
+        "id": f"00000000-0000-0000-0000-{n:012d}",
+        "user_id": None,
+        "session_id": session_id,
+        "category": "transport",
+        "type": "car_petrol",
+        "value": float(n),
+        "co2e_kg": round(n * 0.23, 2),
+        "date": f"2024-01-{n:02d}",
+        "notes": "with, comma" if n == 1 else None,
+        "metadata": {"trip": n} if n == 2 else None,
+        "created_at": "2024-01-15T10:00:00+00:00",
+        "updated_at": None,
+    }
+
+
+@pytest.fixture
+def supabase_with_history():
+    """Create mock Supabase with five activities of one session and one other."""
+    rows = [_stored_activity(n) for n in (5, 1, 3, 2, 4)]
+    rows.append(_stored_activity(6, session_id="other-session"))
+    mock = _make_mock_supabase({"activities": rows})
+    mock.table = MagicMock(side_effect=mock.table)
+    app.dependency_overrides[get_supabase] = lambda: mock
+    app.state.container = AppContainer(
+        get_settings().model_copy(update={"export_chunk_size": 2})
+    )
+    yield mock
+    app.dependency_overrides.clear()
+
+
+@pytest.mark.asyncio
+async def test_export_activities_ndjson(supabase_with_history):
+    """Test NDJSON export streams every activity of the owner in ID order."""
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        response = await client.get(
+            "/api/v1/activities/export",
+            headers={"X-Session-ID": "test-session-123"},
+        )
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    assert "activities.ndjson" in response.headers["content-disposition"]
+    lines = [json.loads(line) for line in response.text.splitlines()]
+    assert [line["value"] for line in lines] == [1.0, 2.0, 3.0, 4.0, 5.0]
+    assert lines[1]["metadata"] == {"trip": 2}
+    # Keyset chunks of two: 2 + 2 + 1 rows
+    assert _activities_calls(supabase_with_history) == 3
+
+
+@pytest.mark.asyncio
+async def test_export_activities_csv(supabase_with_history):
+    """Test CSV export has a header and one quoted row per activity."""
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        response = await client.get(
+            "/api/v1/activities/export",
+            params={"format": "csv"},
+            headers={"X-Session-ID": "test-session-123"},
+        )
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/csv")
+    rows = list(csv.DictReader(io.StringIO(response.text)))
+    assert [row["date"] for row in rows] == [f"2024-01-0{n}" for n in range(1, 6)]
+    assert rows[0]["notes"] == "with, comma"
+    assert json.loads(rows[1]["metadata"]) == {"trip": 2}
+    assert rows[0]["updated_at"] == ""
+
+
+@pytest.mark.asyncio
+async def test_export_activities_empty_history(override_supabase):
+    """Test an owner without activities gets an empty export."""
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        ndjson = await client.get(
+            "/api/v1/activities/export",
+            headers={"X-Session-ID": "test-session-123"},
+        )
+        csv_response = await client.get(
+            "/api/v1/activities/export",
+            params={"format": "csv"},
+            headers={"X-Session-ID": "test-session-123"},
+        )
+
+    assert ndjson.status_code == 200
+    assert ndjson.text == ""
+    assert csv_response.text.strip() == ",".join(
+        ["id", "date", "category", "type", "value", "co2e_kg"]
+        + ["notes", "metadata", "created_at", "updated_at"]
+    )
+
+
+@pytest.mark.asyncio
+async def test_export_activities_requires_session_or_auth(override_supabase):
+    """Test export requires X-Session-ID or Authorization."""
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        response = await client.get("/api/v1/activities/export")
+        bad_format = await client.get(
+            "/api/v1/activities/export",
+            params={"format": "xml"},
+            headers={"X-Session-ID": "test-session-123"},
+        )
+
+    assert response.status_code == 400
+    assert bad_format.status_code == 422
+
+
+@pytest.mark.asyncio
+async def test_import_activities_csv(supabase_with_factors):
+    """Test a CSV upload is imported in multi-row inserts with a report."""
+    app.state.container = AppContainer(
+        get_settings().model_copy(update={"import_batch_size": 2})
+    )
+    supabase_with_factors.table = MagicMock(side_effect=supabase_with_factors.table)
+    content = (
+        "﻿Date,Category,Type,Value,Notes,Extra\n"
+        "2024-01-15,transport,car_petrol,10,commute,x\n"
+        "2024-01-16,energy,electricity,100,,\n"
+        "2024-01-17,transport,rocket,5,,\n"
+        '2024-01-18,,bus,20,"with, comma",\n'
+        "not-a-date,transport,bus,20,,\n"
+    )
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        response = await client.post(
+            "/api/v1/activities/import",
+            files={"file": ("history.csv", content.encode(), "text/csv")},
+            headers={"X-Session-ID": "test-session-123"},
+        )
+        listed = await client.get(
+            "/api/v1/activities", headers={"X-Session-ID": "test-session-123"}
+        )
+
+    assert response.status_code == 200
+    report = response.json()
+    assert report["imported"] == 3
+    assert report["rejected"] == 2
+    assert [r["line"] for r in report["rejected_rows"]] == [4, 6]
+    assert "Unknown activity type: rocket" in report["rejected_rows"][0]["reason"]
+    activities = {a["type"]: a for a in listed.json()}
+    assert activities["bus"]["co2e_kg"] == pytest.approx(1.78)
+    assert activities["bus"]["category"] == "transport"
+    assert activities["bus"]["notes"] == "with, comma"
+    # Two batched inserts for three valid rows, then the list query
+    assert _activities_calls(supabase_with_factors) == 3
+
+
+@pytest.mark.asyncio
+async def test_import_activities_missing_columns(supabase_with_factors):
+    """Test a header without the required columns is rejected up front."""
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        response = await client.post(
+            "/api/v1/activities/import",
+            files={"file": ("history.csv", b"date,kind\n2024-01-15,bus\n", "text/csv")},
+            headers={"X-Session-ID": "test-session-123"},
+        )
+
+    assert response.status_code == 400
+    assert "type, value" in response.json()["detail"]
+
+
+@pytest.mark.asyncio
+async def test_import_activities_unreadable_file(supabase_with_factors):
+    """Test invalid UTF-8 stops the import and is reported as a rejected line."""
+    # The broken byte lies past the first decoded chunk
+    content = (
+        b"date,type,value\n" + b"2024-01-15,bus,10\n" * 1000 + b"2024-01-16,b\xffs,10\n"
+    )
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        response = await client.post(
+            "/api/v1/activities/import",
+            files={"file": ("history.csv", content, "text/csv")},
+            headers={"X-Session-ID": "test-session-123"},
+        )
+
+    assert response.status_code == 200
+    report = response.json()
+    # Rows decoded before the broken chunk are kept
+    assert 0 < report["imported"] < 1000
+    assert report["rejected"] == 1
+    assert "Unreadable file" in report["rejected_rows"][0]["reason"]
+
+
+@pytest.mark.asyncio
+async def test_import_activities_not_utf8(supabase_with_factors):
+    """Test a file that cannot be decoded at all is rejected up front."""
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        response = await client.post(
+            "/api/v1/activities/import",
+            files={"file": ("history.csv", b"d\xffte,type,value\n", "text/csv")},
+            headers={"X-Session-ID": "test-session-123"},
+        )
+
+    assert response.status_code == 400
+    assert "could not be read" in response.json()["detail"]
+
+
+@pytest.mark.asyncio
+async def test_import_activities_requires_session_or_auth(supabase_with_factors):
+    """Test import requires X-Session-ID or Authorization."""
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        response = await client.post(
+            "/api/v1/activities/import",
+            files={"file": ("history.csv", b"date,type,value\n", "text/csv")},
+        )
+
+    assert response.status_code == 400
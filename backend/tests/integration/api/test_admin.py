@@ -0,0 +1,187 @@
+"""Integration tests for administration endpoints."""
+
+import asyncio
+from datetime import UTC, datetime
+
+import pytest
+from conftest import _make_mock_supabase
+from httpx import ASGITransport, AsyncClient
+
+from api.dependencies.container import AppContainer
+from api.dependencies.database import get_supabase
+from api.main import app
+from infrastructure.config.settings import get_settings
+
+ADMIN_KEY = "test-admin-key"
+
+EMISSION_FACTORS = [
+    {
+        "id": 1,
+        "category": "transport",
+        "type": "car_petrol",
+        "factor": 0.2,
+        "unit": "km",
+        "source": "DEFRA 2024",
+        "notes": None,
+        "created_at": datetime.now(UTC).isoformat(),
+    },
+    {
+        "id": 2,
+        "category": "transport",
+        "type": "bus",
+        "factor": 0.089,
+        "unit": "km",
+        "source": "DEFRA 2023",
+        "notes": None,
+        "created_at": datetime.now(UTC).isoformat(),
+    },
+]
+
+
+def _activity(n: int, activity_type: str, value: float, co2e_kg: float) -> dict:
+    return {
+        "id": f"00000000-0000-0000-0000-{n:012d}",
+        "category": "transport",
+        "type": activity_type,
+        "value": value,
+        "co2e_kg": co2e_kg,
+        "date": "2024-01-15",
+        "notes": None,
+        "metadata": None,
+        "user_id": None,
+        "session_id": "test-session-123",
+        "created_at": "2024-01-15T10:00:00+00:00",
+    }
+
+
+@pytest.fixture
+def admin_app():
+    """Run the app with an admin key and a small recalculation batch."""
+    settings = get_settings().model_copy(
+        update={"admin_api_key": ADMIN_KEY, "recalculation_batch_size": 2}
+    )
+    app.dependency_overrides[get_settings] = lambda: settings
+    app.state.container = AppContainer(settings)
+    yield app.state.container
+    app.dependency_overrides.clear()
+
+
+@pytest.fixture
+def supabase_with_activities():
+    """Create mock Supabase client with stale petrol trips."""
+    tables = {
+        "emission_factors": list(EMISSION_FACTORS),
+        "activities": [
+            _activity(1, "car_petrol", 100.0, 23.0),
+            _activity(2, "bus", 10.0, 0.89),
+            _activity(3, "car_petrol", 50.0, 11.5),
+        ],
+    }
+    mock = _make_mock_supabase(tables)
+    app.dependency_overrides[get_supabase] = lambda: mock
+    yield tables
+    app.dependency_overrides.clear()
+
+
+async def _wait_for_job(container: AppContainer, job_id: str) -> None:
+    while container.job_running(job_id):
+        await asyncio.sleep(0.01)
+
+
+@pytest.mark.asyncio
+async def test_recalculation_rewrites_stale_co2e(admin_app, supabase_with_activities):
+    """Test a recalculation job rewrites CO2e with the current factors."""
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        started = await client.post(
+            "/api/v1/admin/recalculations",
+            json={"job_id": "defra-2024"},
+            headers={"X-Admin-Key": ADMIN_KEY},
+        )
+        await _wait_for_job(admin_app, "defra-2024")
+        progress = await client.get(
+            "/api/v1/admin/recalculations/defra-2024",
+            headers={"X-Admin-Key": ADMIN_KEY},
+        )
+
+    assert started.status_code == 202
+    assert started.json()["running"] is True
+    assert progress.status_code == 200
+    data = progress.json()
+    assert data["completed"] is True
+    assert data["running"] is False
+    assert (data["scanned"], data["updated"], data["skipped"]) == (3, 2, 0)
+    co2e = [a["co2e_kg"] for a in supabase_with_activities["activities"]]
+    assert co2e == [20.0, 0.89, 10.0]
+
+
+@pytest.mark.asyncio
+async def test_recalculation_of_completed_job_is_not_restarted(
+    admin_app, supabase_with_activities
+):
+    """Test posting a finished job returns its result without running it."""
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        await client.post(
+            "/api/v1/admin/recalculations",
+            json={"job_id": "defra-2024", "activity_types": ["car_petrol"]},
+            headers={"X-Admin-Key": ADMIN_KEY},
+        )
+        await _wait_for_job(admin_app, "defra-2024")
+        again = await client.post(
+            "/api/v1/admin/recalculations",
+            json={"job_id": "defra-2024", "activity_types": ["car_petrol"]},
+            headers={"X-Admin-Key": ADMIN_KEY},
+        )
+        other_types = await client.post(
+            "/api/v1/admin/recalculations",
+            json={"job_id": "defra-2024", "activity_types": ["bus"]},
+            headers={"X-Admin-Key": ADMIN_KEY},
+        )
+
+    assert again.status_code == 202
+    assert again.json()["running"] is False
+    assert again.json()["completed"] is True
+    assert again.json()["updated"] == 2
+    assert other_types.status_code == 409
+
+
+@pytest.mark.asyncio
+async def test_recalculation_unknown_job(admin_app, supabase_with_activities):
+    """Test progress of an unknown job returns 404."""
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        response = await client.get(
+            "/api/v1/admin/recalculations/missing",
+            headers={"X-Admin-Key": ADMIN_KEY},
+        )
+
+    assert response.status_code == 404
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("headers", [{}, {"X-Admin-Key": "wrong"}])
+async def test_recalculation_requires_admin_key(
+    admin_app, supabase_with_activities, headers
+):
+    """Test admin endpoints reject missing or wrong keys."""
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        response = await client.post(
+            "/api/v1/admin/recalculations", json={}, headers=headers
+        )
+
+    assert response.status_code == 403
+
+
+@pytest.mark.asyncio
+async def test_admin_endpoints_disabled_without_key(override_supabase):
+    """Test admin endpoints are closed when no admin key is configured."""
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        response = await client.get(
+            "/api/v1/admin/recalculations/any",
+            headers={"X-Admin-Key": ""},
+        )
+
+    assert response.status_code == 403
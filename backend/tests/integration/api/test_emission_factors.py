@@ -1,6 +1,7 @@
 """Integration tests for emission factors endpoints."""
 
 from datetime import datetime, timezone
+from unittest.mock import MagicMock
 
 import pytest
 from httpx import ASGITransport, AsyncClient
@@ -119,3 +120,51 @@ async def test_list_emission_factors_empty_category(override_supabase):
 
     assert response.status_code == 200
     assert response.json() == []
+
+
+@pytest.mark.asyncio
+async def test_list_emission_factors_returns_validators(supabase_with_factors):
+    """Test responses carry an ETag and a public Cache-Control."""
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        response = await client.get("/api/v1/emission-factors")
+
+    assert response.status_code == 200
+    assert response.headers["etag"].startswith('W/"')
+    assert response.headers["cache-control"] == "public, max-age=3600"
+
+
+@pytest.mark.asyncio
+async def test_list_emission_factors_not_modified(supabase_with_factors):
+    """Test a matching If-None-Match returns 304 without querying Supabase."""
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        first = await client.get("/api/v1/emission-factors?category=transport")
+        etag = first.headers["etag"]
+
+        table = supabase_with_factors.table
+        supabase_with_factors.table = MagicMock(side_effect=table)
+        second = await client.get(
+            "/api/v1/emission-factors?category=transport",
+            headers={"If-None-Match": etag},
+        )
+
+    assert second.status_code == 304
+    assert second.content == b""
+    assert second.headers["etag"] == etag
+    supabase_with_factors.table.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_list_emission_factors_etag_depends_on_category(supabase_with_factors):
+    """Test filtered and unfiltered lists have different ETags."""
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        all_factors = await client.get("/api/v1/emission-factors")
+        transport_only = await client.get(
+            "/api/v1/emission-factors?category=transport",
+            headers={"If-None-Match": all_factors.headers["etag"]},
+        )
+
+    assert transport_only.status_code == 200
+    assert transport_only.headers["etag"] != all_factors.headers["etag"]
@@ -1,12 +1,18 @@
 """Integration tests for flight and airport endpoints."""
 
 import json
+from datetime import UTC, datetime
 from pathlib import Path
 
 import pytest
+from conftest import _make_mock_supabase
 from httpx import ASGITransport, AsyncClient
 
+from api.dependencies.database import get_supabase
+from api.dependencies.use_cases import get_airport_repository
 from api.main import app
+from domain.services.flight_distance_service import FlightDistanceService
+from domain.use_cases.calculate_flight import CalculateFlightUseCase
 from infrastructure.repositories.json_airport_repository import JSONAirportRepository
 
 SAMPLE_AIRPORTS = [
@@ -125,6 +131,44 @@ async def test_search_airports_query_too_short(override_airport_deps):
     assert response.status_code == 422
 
 
+@pytest.mark.asyncio
+async def test_search_airports_not_modified(override_airport_deps):
+    """Test a matching If-None-Match on airport search returns 304."""
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        first = await client.get("/api/v1/airports/search", params={"q": "jfk"})
+        second = await client.get(
+            "/api/v1/airports/search",
+            params={"q": "JFK"},
+            headers={"If-None-Match": first.headers["etag"]},
+        )
+    assert first.status_code == 200
+    assert first.headers["cache-control"] == "public, max-age=3600"
+    assert second.status_code == 304
+    assert second.content == b""
+
+
+@pytest.mark.asyncio
+async def test_search_airports_etag_follows_data_file(
+    override_airport_deps, airports_json_file
+):
+    """Test the airport ETag changes when the data file changes."""
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        first = await client.get("/api/v1/airports/search", params={"q": "JFK"})
+
+        airports_json_file.write_text(json.dumps(SAMPLE_AIRPORTS[:1]), encoding="utf-8")
+        reloaded = JSONAirportRepository(airports_json_file)
+        app.dependency_overrides[get_airport_repository] = lambda: reloaded
+        second = await client.get(
+            "/api/v1/airports/search",
+            params={"q": "JFK"},
+            headers={"If-None-Match": first.headers["etag"]},
+        )
+    assert second.status_code == 200
+    assert second.headers["etag"] != first.headers["etag"]
+
+
 @pytest.mark.asyncio
 async def test_calculate_flight_success(override_airport_deps):
     """Test POST /api/v1/flights/calculate returns correct calculation."""
@@ -187,3 +231,138 @@ async def test_calculate_flight_case_insensitive(override_airport_deps):
     data = response.json()
     assert data["origin_iata"] == "JFK"
     assert data["destination_iata"] == "LAX"
+
+
+@pytest.fixture
+def supabase_with_flight_factors(mock_airport_repo):
+    """Mock Supabase with flight factors, and the sample airports in the app."""
+    factors = [
+        {
+            "id": i,
+            "category": "transport",
+            "type": flight_type,
+            "factor": factor,
+            "unit": "km",
+            "source": "DEFRA 2023",
+            "notes": None,
+            "created_at": datetime.now(UTC).isoformat(),
+        }
+        for i, (flight_type, factor) in enumerate(
+            [("flight_domestic_medium", 0.15), ("flight_international_long", 0.2)],
+            start=1,
+        )
+    ]
+    mock = _make_mock_supabase({"emission_factors": factors})
+    app.state.container.calculate_flight = CalculateFlightUseCase(
+        airport_repo=mock_airport_repo,
+        distance_service=FlightDistanceService(),
+    )
+    app.dependency_overrides[get_supabase] = lambda: mock
+    yield mock
+    app.dependency_overrides.clear()
+
+
+@pytest.mark.asyncio
+async def test_log_flight_from_airport_codes(supabase_with_flight_factors):
+    """Test POST /api/v1/activities computes a flight from its airports."""
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        response = await client.post(
+            "/api/v1/activities",
+            json={
+                "category": "transport",
+                "type": "flight",
+                "date": "2024-03-01",
+                "metadata": {
+                    "origin_iata": "jfk",
+                    "destination_iata": "LAX",
+                    "origin_city": "New York",
+                },
+            },
+            headers={"X-Session-ID": "test-session-123"},
+        )
+
+    assert response.status_code == 201
+    data = response.json()
+    assert data["type"] == "flight_domestic_medium"
+    assert data["value"] > 3900
+    assert data["co2e_kg"] == round(data["value"] * 0.15, 2)
+    assert data["metadata"]["origin_iata"] == "JFK"
+    assert data["metadata"]["origin_city"] == "New York"
+    assert data["metadata"]["is_domestic"] is True
+
+
+@pytest.mark.asyncio
+async def test_log_flight_overrides_client_distance(supabase_with_flight_factors):
+    """Test a client-computed type and distance are replaced by the server's."""
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        response = await client.post(
+            "/api/v1/activities",
+            json={
+                "category": "transport",
+                "type": "flight_domestic_medium",
+                "value": 10.0,
+                "date": "2024-03-01",
+                "metadata": {"origin_iata": "JFK", "destination_iata": "LHR"},
+            },
+            headers={"X-Session-ID": "test-session-123"},
+        )
+
+    assert response.status_code == 201
+    data = response.json()
+    assert data["type"] == "flight_international_long"
+    assert data["value"] > 5000
+
+
+@pytest.mark.asyncio
+async def test_log_flight_unknown_airport_400(supabase_with_flight_factors):
+    """Test an unknown airport code returns 400."""
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        response = await client.post(
+            "/api/v1/activities",
+            json={
+                "category": "transport",
+                "type": "flight",
+                "date": "2024-03-01",
+                "metadata": {"origin_iata": "XXX", "destination_iata": "LAX"},
+            },
+            headers={"X-Session-ID": "test-session-123"},
+        )
+
+    assert response.status_code == 400
+    assert "Airport not found" in response.json()["detail"]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "payload",
+    [
+        # Not a flight route, so value is required
+        {"category": "transport", "type": "flight"},
+        # Flights are transport
+        {
+            "category": "energy",
+            "type": "flight",
+            "metadata": {"origin_iata": "JFK", "destination_iata": "LAX"},
+        },
+        # Codes must look like IATA codes
+        {
+            "category": "transport",
+            "type": "flight",
+            "metadata": {"origin_iata": "JFK1", "destination_iata": "LAX"},
+        },
+    ],
+)
+async def test_log_flight_invalid_input_422(supabase_with_flight_factors, payload):
+    """Test flights without a usable route are rejected."""
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        response = await client.post(
+            "/api/v1/activities",
+            json={**payload, "date": "2024-03-01"},
+            headers={"X-Session-ID": "test-session-123"},
+        )
+
+    assert response.status_code == 422
@@ -1,6 +1,7 @@
 """Integration tests for footprint endpoints (summary, breakdown, trend)."""
 
 from datetime import datetime, timezone
+from unittest.mock import MagicMock
 from uuid import uuid4
 
 import pytest
@@ -213,3 +214,89 @@ async def test_summary_filters_by_session_id(supabase_with_activities):
     data = response.json()
     assert data["total_co2e_kg"] == pytest.approx(0.0, abs=1e-9)
     assert data["activity_count"] == 0
+
+
+# --- Conditional requests ---
+
+SUMMARY_PARAMS = {
+    "period": "month",
+    "start_date": "2026-02-01",
+    "end_date": "2026-02-28",
+}
+
+
+@pytest.mark.asyncio
+async def test_summary_not_modified_skips_repository(supabase_with_activities):
+    """Test a matching If-None-Match returns 304 without querying activities."""
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        first = await client.get(
+            "/api/v1/footprint/summary",
+            params=SUMMARY_PARAMS,
+            headers={"X-Session-ID": SESSION_ID},
+        )
+
+        table = supabase_with_activities.table
+        supabase_with_activities.table = MagicMock(side_effect=table)
+        second = await client.get(
+            "/api/v1/footprint/summary",
+            params=SUMMARY_PARAMS,
+            headers={
+                "X-Session-ID": SESSION_ID,
+                "If-None-Match": first.headers["etag"],
+            },
+        )
+
+    assert first.headers["cache-control"] == "private, no-cache"
+    assert "X-Session-ID" in first.headers["vary"]
+    assert second.status_code == 304
+    assert second.content == b""
+    supabase_with_activities.table.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_footprint_etag_changes_after_write(supabase_with_activities):
+    """Test an activity write invalidates previously issued ETags."""
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        first = await client.get(
+            "/api/v1/footprint/breakdown",
+            params=SUMMARY_PARAMS,
+            headers={"X-Session-ID": SESSION_ID},
+        )
+
+        await app.state.container.footprint_cache.invalidate(f"session:{SESSION_ID}")
+        second = await client.get(
+            "/api/v1/footprint/breakdown",
+            params=SUMMARY_PARAMS,
+            headers={
+                "X-Session-ID": SESSION_ID,
+                "If-None-Match": first.headers["etag"],
+            },
+        )
+
+    assert second.status_code == 200
+    assert second.headers["etag"] != first.headers["etag"]
+
+
+@pytest.mark.asyncio
+async def test_footprint_etag_is_per_owner(supabase_with_activities):
+    """Test another owner's ETag never matches."""
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        first = await client.get(
+            "/api/v1/footprint/trend",
+            params=SUMMARY_PARAMS,
+            headers={"X-Session-ID": SESSION_ID},
+        )
+        other = await client.get(
+            "/api/v1/footprint/trend",
+            params=SUMMARY_PARAMS,
+            headers={
+                "X-Session-ID": "other-session",
+                "If-None-Match": first.headers["etag"],
+            },
+        )
+
+    assert other.status_code == 200
+    assert other.headers["etag"] != first.headers["etag"]
@@ -0,0 +1,39 @@
+"""Throwaway copies of scripts/schema.sql for Postgres-backed tests."""
+
+from pathlib import Path
+
+import asyncpg
+
+SCHEMA_FILE = Path(__file__).resolve().parents[3] / "scripts" / "schema.sql"
+
+# Stand-ins for objects Supabase provides, created only where missing
+SUPABASE_STUBS = """
+CREATE SCHEMA IF NOT EXISTS auth;
+DO $$
+BEGIN
+    IF to_regprocedure('auth.uid()') IS NULL THEN
+        CREATE FUNCTION auth.uid() RETURNS UUID LANGUAGE sql AS 'SELECT NULL::UUID';
+    END IF;
+END
+$$;
+CREATE FUNCTION uuid_generate_v4() RETURNS UUID
+    LANGUAGE sql AS 'SELECT gen_random_uuid()';
+"""
+
+
+async def create_schema(conn: asyncpg.Connection, schema: str) -> None:
+    """Apply schema.sql in a new schema and point the connection at it."""
+    await conn.execute(f"CREATE SCHEMA {schema}")
+    await conn.execute(f"SET search_path TO {schema}, public")
+    await conn.execute(SUPABASE_STUBS)
+    await conn.execute(
+        SCHEMA_FILE.read_text().replace(
+            'CREATE EXTENSION IF NOT EXISTS "uuid-ossp";', ""
+        )
+    )
+
+
+def schema_dsn(dsn: str, schema: str) -> str:
+    """DSN whose connections use the given schema first."""
+    separator = "&" if "?" in dsn else "?"
+    return f"{dsn}{separator}search_path={schema},public"
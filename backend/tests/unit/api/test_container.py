@@ -0,0 +1,470 @@
+"""Unit tests for the application dependency container."""
+
+from datetime import UTC, date, datetime
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import httpx
+import pytest
+from supabase import create_client
+
+from api.dependencies.container import AppContainer
+from domain.entities.activity import Activity
+from infrastructure.config import supabase as supabase_config
+from infrastructure.config.settings import Settings
+from infrastructure.maintenance.postgres_session_cleaner import PostgresSessionCleaner
+from infrastructure.repositories.in_memory_activity_repository import (
+    InMemoryActivityRepository,
+)
+from infrastructure.repositories.postgres_activity_repository import (
+    PostgresActivityRepository,
+)
+from infrastructure.repositories.read_routing_activity_repository import (
+    ReadRoutingActivityRepository,
+)
+from infrastructure.repositories.supabase_activity_repository import (
+    SupabaseActivityRepository,
+)
+from infrastructure.repositories.tiered_activity_repository import (
+    TieredActivityRepository,
+)
+from infrastructure.scheduling.postgres_job_coordinator import PostgresJobCoordinator
+
+
+@pytest.fixture
+def container() -> AppContainer:
+    """Container with default settings."""
+    return AppContainer(Settings())  # type: ignore[call-arg]
+
+
+def test_bind_reuses_graph_for_same_client(container: AppContainer) -> None:
+    """Repeated binds with one client return the same objects."""
+    client = MagicMock()
+
+    first = container.bind(client)
+    second = container.bind(client)
+
+    assert first is second
+    assert first.log_activity is second.log_activity
+
+
+def test_bind_rebuilds_graph_for_new_client(container: AppContainer) -> None:
+    """A different client gets its own repositories."""
+    first = container.bind(MagicMock())
+    second = container.bind(MagicMock())
+
+    assert first is not second
+    assert first.activity_repository is not second.activity_repository
+
+
+def test_process_wide_components_are_shared(container: AppContainer) -> None:
+    """Use cases of every graph share caches, indexes and services."""
+    first = container.bind(MagicMock())
+    second = container.bind(MagicMock())
+
+    assert first.footprint_summary._footprint_cache is container.footprint_cache
+    assert second.footprint_summary._footprint_cache is container.footprint_cache
+    assert first.log_activity._percentile_index is container.percentile_index
+    assert (
+        first.footprint_trend._aggregation_service
+        is second.footprint_trend._aggregation_service
+    )
+
+
+def test_memory_cache_refused_with_several_workers() -> None:
+    """Per-process versions would let other workers serve stale results."""
+    container = AppContainer(
+        Settings(cache_backend="memory", web_concurrency=4)  # type: ignore[call-arg]
+    )
+
+    with pytest.raises(ValueError):
+        _ = container.cache_backend
+
+
+def test_unknown_cache_backend_raises() -> None:
+    """A misconfigured backend fails on first use."""
+    container = AppContainer(Settings(cache_backend="memcached"))  # type: ignore[call-arg]
+
+    with pytest.raises(ValueError):
+        _ = container.cache_backend
+
+
+@pytest.mark.asyncio
+async def test_aclose_only_closes_created_backend(container: AppContainer) -> None:
+    """Shutdown does not create a backend that was never used."""
+    await container.aclose()
+    assert "cache_backend" not in container.__dict__
+
+    backend = AsyncMock()
+    container.__dict__["cache_backend"] = backend
+    await container.aclose()
+    backend.close.assert_awaited_once()
+
+
+def test_ingestion_queue_disabled_by_default(container: AppContainer) -> None:
+    """Sync mode saves activities directly."""
+    assert container.ingestion_queue is None
+    assert container.bind(MagicMock()).log_activity._ingestion_queue is None
+
+
+def test_ingestion_queue_enabled_in_queue_mode() -> None:
+    """Queue mode hands the shared queue to the log use case."""
+    container = AppContainer(Settings(activity_ingestion_mode="queue"))  # type: ignore[call-arg]
+
+    graph = container.bind(MagicMock())
+
+    assert container.ingestion_queue is not None
+    assert graph.log_activity._ingestion_queue is container.ingestion_queue
+
+
+@pytest.mark.asyncio
+async def test_queued_batch_survives_derived_state_failure(caplog) -> None:
+    """A committed batch is not raised back to the queue for a retry."""
+    container = AppContainer(
+        Settings(activity_repository_backend="memory")  # type: ignore[call-arg]
+    )
+    graph = container.bind(MagicMock())
+    graph.log_activity.record_saved = AsyncMock(side_effect=ConnectionError)
+    activity = Activity(
+        id=uuid4(),
+        category="transport",
+        type="car_petrol",
+        value=10.0,
+        co2e_kg=1.7,
+        date=date(2024, 1, 15),
+        notes=None,
+        metadata=None,
+        user_id=None,
+        session_id="session-1",
+        created_at=datetime(2024, 1, 15, tzinfo=UTC),
+    )
+
+    await container._write_ingested([activity])
+
+    assert await graph.activity_repository.get_by_id(activity.id) is not None
+    assert "Derived state not updated for 1 queued activities" in caplog.text
+
+
+def test_unknown_ingestion_mode_raises() -> None:
+    """A misconfigured ingestion mode fails on first use."""
+    container = AppContainer(Settings(activity_ingestion_mode="kafka"))  # type: ignore[call-arg]
+
+    with pytest.raises(ValueError):
+        _ = container.ingestion_queue
+
+
+def test_supabase_activity_repository_by_default(container: AppContainer) -> None:
+    """Activities go through PostgREST unless configured otherwise."""
+    graph = container.bind(MagicMock())
+
+    assert isinstance(graph.activity_repository, SupabaseActivityRepository)
+
+
+def test_postgres_activity_repository_is_shared() -> None:
+    """The Postgres backend serves every client from one lazily opened pool."""
+    container = AppContainer(
+        Settings(  # type: ignore[call-arg]
+            activity_repository_backend="postgres",
+            database_url="postgresql://localhost/test",
+        )
+    )
+
+    first = container.bind(MagicMock())
+    second = container.bind(MagicMock())
+
+    assert isinstance(first.activity_repository, PostgresActivityRepository)
+    assert first.activity_repository is second.activity_repository
+    assert first.log_activity._activity_repo is first.activity_repository
+
+
+def test_memory_activity_repository_is_shared() -> None:
+    """The memory backend keeps one store for every client."""
+    container = AppContainer(
+        Settings(activity_repository_backend="memory")  # type: ignore[call-arg]
+    )
+
+    first = container.bind(MagicMock())
+    second = container.bind(MagicMock())
+
+    assert isinstance(first.activity_repository, InMemoryActivityRepository)
+    assert first.activity_repository is second.activity_repository
+
+
+def test_postgres_read_replica_routes_reads() -> None:
+    """A replica DSN routes reads to its own pool, with marks in the cache."""
+    container = AppContainer(
+        Settings(  # type: ignore[call-arg]
+            activity_repository_backend="postgres",
+            database_url="postgresql://localhost/test",
+            database_read_replica_url="postgresql://replica/test",
+            read_your_writes_seconds=5,
+        )
+    )
+
+    repo = container.bind(MagicMock()).activity_repository
+
+    assert isinstance(repo, ReadRoutingActivityRepository)
+    assert repo._primary is container.postgres_activity_repository
+    assert repo._replica is container.postgres_replica_activity_repository
+    assert repo._recent_writes is container.cache_backend
+    assert repo._window_seconds == 5
+
+
+def test_supabase_read_replica_routes_reads() -> None:
+    """A replica API URL gets its own client; requests keep theirs for writes."""
+    container = AppContainer(
+        Settings(  # type: ignore[call-arg]
+            supabase_read_replica_url="https://test-project-rr.supabase.co"
+        )
+    )
+    client = MagicMock()
+
+    repo = container.bind(client).activity_repository
+
+    assert isinstance(repo, ReadRoutingActivityRepository)
+    assert repo._primary._client is client
+    assert repo._replica._client is container.supabase_replica_client
+
+
+@pytest.mark.asyncio
+async def test_supabase_replica_keeps_primary_requests(monkeypatch) -> None:
+    """Building the replica client does not redirect primary writes."""
+    hosts: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        hosts.append(request.url.host)
+        return httpx.Response(200, json=[])
+
+    transport = httpx.MockTransport(handler)
+    monkeypatch.setattr(supabase_config, "get_supabase_transport", lambda: transport)
+    settings = Settings(  # type: ignore[call-arg]
+        supabase_url="https://primary.supabase.co",
+        supabase_read_replica_url="https://replica.supabase.co",
+    )
+    primary = create_client(
+        settings.supabase_url,
+        settings.supabase_publishable_key,
+        supabase_config.supabase_client_options(),
+    )
+    repo = AppContainer(settings).bind(primary).activity_repository
+
+    await repo.list_by_user(uuid4())
+    activity = Activity(
+        id=uuid4(),
+        category="transport",
+        type="car_petrol",
+        value=10.0,
+        co2e_kg=1.7,
+        date=date(2024, 1, 15),
+        notes=None,
+        metadata=None,
+        user_id=None,
+        session_id="session-1",
+        created_at=datetime(2024, 1, 15, tzinfo=UTC),
+    )
+    await repo.update_co2e_many([activity], AsyncMock(return_value=[2.0]))
+
+    assert hosts == ["replica.supabase.co", "primary.supabase.co"]
+
+
+def test_no_read_replica_by_default(container: AppContainer) -> None:
+    """Without a replica there is no routing and no replica pool."""
+    assert container.supabase_replica_client is None
+    assert container.postgres_replica_pool is None
+
+
+@pytest.mark.asyncio
+async def test_aclose_closes_replica_pool() -> None:
+    """Shutdown closes the read replica pool once it was created."""
+    container = AppContainer(
+        Settings(  # type: ignore[call-arg]
+            database_read_replica_url="postgresql://replica/test"
+        )
+    )
+    pool = AsyncMock()
+    container.__dict__["postgres_replica_pool"] = pool
+
+    await container.aclose()
+
+    pool.close.assert_awaited_once()
+
+
+def test_archive_wraps_activity_repository(tmp_path) -> None:
+    """A configured archive puts a tiered repository over the backend."""
+    container = AppContainer(
+        Settings(  # type: ignore[call-arg]
+            activity_repository_backend="memory",
+            activity_archive_uri=str(tmp_path),
+        )
+    )
+
+    graph = container.bind(MagicMock())
+
+    assert isinstance(graph.activity_repository, TieredActivityRepository)
+    assert graph.activity_repository._hot is container.in_memory_activity_repository
+    assert graph.activity_repository._archive is container.activity_archive
+    assert AppContainer(Settings()).activity_archive is None  # type: ignore[call-arg]
+
+
+def test_session_cleaner_needs_database_url(container: AppContainer) -> None:
+    """Without a direct connection there is no session cleaner."""
+    assert container.session_cleaner is None
+
+
+def test_session_cleaner_modes(tmp_path) -> None:
+    """Archive mode moves stale sessions through the archiver."""
+    dsn = "postgresql://localhost/test"
+    deleting = AppContainer(Settings(database_url=dsn))  # type: ignore[call-arg]
+    archiving = AppContainer(
+        Settings(  # type: ignore[call-arg]
+            database_url=dsn,
+            activity_archive_uri=str(tmp_path),
+            session_cleanup_mode="archive",
+        )
+    )
+
+    assert isinstance(deleting.session_cleaner, PostgresSessionCleaner)
+    assert deleting.session_cleaner._archiver is None
+    assert isinstance(archiving.session_cleaner, PostgresSessionCleaner)
+    assert archiving.session_cleaner._archiver is not None
+
+
+@pytest.mark.parametrize(
+    "settings",
+    [
+        {"session_cleanup_mode": "archive"},
+        {"session_cleanup_mode": "truncate"},
+    ],
+)
+def test_misconfigured_session_cleaner_raises(settings) -> None:
+    """Archiving without an archive or an unknown mode fails on first use."""
+    container = AppContainer(
+        Settings(database_url="postgresql://localhost/test", **settings)  # type: ignore[call-arg]
+    )
+
+    with pytest.raises(ValueError):
+        _ = container.session_cleaner
+
+
+def test_scheduler_disabled_by_default(container: AppContainer) -> None:
+    """No jobs are scheduled unless enabled."""
+    assert container.scheduler is None
+
+
+def test_scheduler_registers_configured_jobs(tmp_path) -> None:
+    """Jobs are scheduled when their stores are configured."""
+    in_process = AppContainer(Settings(scheduler_enabled=True))  # type: ignore[call-arg]
+    replicated = AppContainer(
+        Settings(  # type: ignore[call-arg]
+            scheduler_enabled=True,
+            database_url="postgresql://localhost/test",
+            activity_archive_uri=str(tmp_path),
+            activity_archive_schedule="@every 6h",
+        )
+    )
+
+    assert in_process.scheduler is not None
+    assert in_process.scheduler.stats() == []
+    assert replicated.scheduler is not None
+    assert [(job.name, job.schedule) for job in replicated.scheduler.stats()] == [
+        ("session_cleanup", "30 3 * * *"),
+        ("activity_archive", "@every 6h"),
+    ]
+    assert isinstance(replicated.scheduler._coordinator, PostgresJobCoordinator)
+
+
+def test_invalid_schedule_raises() -> None:
+    """A malformed schedule fails on first use."""
+    container = AppContainer(
+        Settings(  # type: ignore[call-arg]
+            scheduler_enabled=True,
+            database_url="postgresql://localhost/test",
+            session_cleanup_schedule="daily",
+        )
+    )
+
+    with pytest.raises(ValueError):
+        _ = container.scheduler
+
+
+@pytest.mark.asyncio
+async def test_background_job_holds_lock_while_running() -> None:
+    """A job locked by another process is refused; ours unlocks when done."""
+    container = AppContainer(
+        Settings(database_url="postgresql://localhost/test")  # type: ignore[call-arg]
+    )
+    coordinator = AsyncMock()
+    coordinator.try_lock.side_effect = [False, True]
+    container.__dict__["job_coordinator"] = coordinator
+    job = AsyncMock(return_value=None)
+
+    refused = job()
+    with pytest.raises(ValueError, match="another process"):
+        await container.start_job("recalc-1", refused)
+    assert refused.cr_frame is None
+
+    await container.start_job("recalc-1", job())
+    await container._jobs["recalc-1"]
+
+    coordinator.release.assert_awaited_once_with("recalc-1")
+    assert not container.job_running("recalc-1")
+
+
+def test_scripts_need_shared_cache(container: AppContainer) -> None:
+    """Scripts refuse the per-process cache, whose invalidations stay local."""
+    with pytest.raises(ValueError, match="redis"):
+        container.shared_footprint_cache()
+
+    shared = AppContainer(
+        Settings(cache_backend="redis", redis_url="redis://localhost:6379/0")  # type: ignore[call-arg]
+    )
+    assert shared.shared_footprint_cache() is shared.footprint_cache
+
+
+def test_job_coordinator_needs_database_url(container: AppContainer) -> None:
+    """Without database_url, background jobs are only deduplicated locally."""
+    assert container.job_coordinator is None
+
+
+@pytest.mark.asyncio
+async def test_aclose_stops_scheduler() -> None:
+    """Shutdown stops the scheduler once it was created."""
+    container = AppContainer(Settings(scheduler_enabled=True))  # type: ignore[call-arg]
+    scheduler = AsyncMock()
+    container.__dict__["scheduler"] = scheduler
+
+    await container.aclose()
+
+    scheduler.close.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_aclose_closes_postgres_pool() -> None:
+    """Shutdown closes the Postgres pool once it was configured."""
+    container = AppContainer(
+        Settings(  # type: ignore[call-arg]
+            activity_repository_backend="postgres",
+            database_url="postgresql://localhost/test",
+        )
+    )
+    pool = AsyncMock()
+    container.__dict__["postgres_pool"] = pool
+
+    await container.aclose()
+
+    pool.close.assert_awaited_once()
+
+
+@pytest.mark.parametrize(
+    "settings",
+    [
+        {"activity_repository_backend": "postgres", "database_url": None},
+        {"activity_repository_backend": "mysql"},
+    ],
+)
+def test_misconfigured_activity_repository_raises(settings) -> None:
+    """An unknown backend or a missing DSN fails when the graph is built."""
+    container = AppContainer(Settings(**settings))  # type: ignore[call-arg]
+
+    with pytest.raises(ValueError):
+        container.bind(MagicMock())
@@ -0,0 +1,33 @@
+"""Unit tests for HTTP conditional request helpers."""
+
+import pytest
+
+from api.dependencies.http_cache import etag_matches, make_etag
+
+
+def test_make_etag_is_deterministic_and_weak():
+    """Same inputs give the same weak ETag."""
+    assert make_etag("v1", "JFK", 10) == make_etag("v1", "JFK", 10)
+    assert make_etag("v1", "JFK", 10).startswith('W/"')
+
+
+def test_make_etag_separates_parts():
+    """Part boundaries are part of the tag."""
+    assert make_etag("ab", "c") != make_etag("a", "bc")
+
+
+@pytest.mark.parametrize(
+    ("header", "expected"),
+    [
+        (None, False),
+        ("", False),
+        ("*", True),
+        ('W/"abc"', True),
+        ('"abc"', True),
+        ('"zzz", W/"abc"', True),
+        ('"zzz"', False),
+    ],
+)
+def test_etag_matches(header, expected):
+    """If-None-Match uses weak comparison over a list of tags."""
+    assert etag_matches(header, 'W/"abc"') is expected
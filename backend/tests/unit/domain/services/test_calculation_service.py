@@ -5,6 +5,8 @@ from datetime import datetime
 from pathlib import Path
 
 import pytest
+from hypothesis import given
+from hypothesis import strategies as st
 
 # Add src to path
 sys.path.insert(0, str(Path(__file__).resolve().parents[4] / "src"))
@@ -12,6 +14,32 @@ sys.path.insert(0, str(Path(__file__).resolve().parents[4] / "src"))
 from domain.entities.emission_factor import EmissionFactor  # noqa: E402
 from domain.services.calculation_service import CalculationService  # noqa: E402
 
+# Activity amounts as entered (whole, decimal, and arbitrary floats) and
+# factors spanning the seeded range, including half-cent ties
+_VALUES = st.one_of(
+    st.integers(min_value=0, max_value=100_000).map(float),
+    st.decimals(min_value=0, max_value=100_000, places=3).map(float),
+    st.floats(min_value=0, max_value=1e12, allow_nan=False),
+)
+_FACTORS = st.one_of(
+    st.sampled_from([0.0, 0.005, 0.089, 0.17099, 0.20705, 0.23, 0.5, 27.0]),
+    st.floats(min_value=0, max_value=100, allow_nan=False),
+)
+
+
+def _factor(factor: float) -> EmissionFactor:
+    """Create an emission factor with the given value."""
+    return EmissionFactor(
+        id=1,
+        category="transport",
+        type="car_petrol",
+        factor=factor,
+        unit="km",
+        source="DEFRA 2023",
+        notes=None,
+        created_at=datetime.now(),
+    )
+
 
 class TestCalculationService:
     """Test CO2e calculation service."""
@@ -94,3 +122,101 @@ class TestCalculationService:
         result = service.calculate_co2e(10.0, factor)
 
         assert result == 0.0
+
+    def test_calculate_co2e_many_matches_single_calculation(self):
+        """Test batch calculation equals calculating each value on its own."""
+        service = CalculationService()
+
+        factor = EmissionFactor(
+            id=1,
+            category="transport",
+            type="car_petrol",
+            factor=0.089,
+            unit="km",
+            source="DEFRA 2023",
+            notes=None,
+            created_at=datetime.now(),
+        )
+        values = [0.0, 15.0, 100.0, 12.345]
+
+        result = service.calculate_co2e_many(values, factor)
+
+        assert result == [service.calculate_co2e(v, factor) for v in values]
+
+    def test_calculate_co2e_many_rejects_negative_value(self):
+        """Test that one negative value rejects the whole batch."""
+        service = CalculationService()
+
+        factor = EmissionFactor(
+            id=1,
+            category="transport",
+            type="car_petrol",
+            factor=0.23,
+            unit="km",
+            source="DEFRA 2023",
+            notes=None,
+            created_at=datetime.now(),
+        )
+
+        with pytest.raises(ValueError, match="Activity value cannot be negative"):
+            service.calculate_co2e_many([1.0, -10.0], factor)
+
+    def test_calculate_co2e_many_with_factor_per_value(self):
+        """Test each value can use its own emission factor."""
+        service = CalculationService()
+
+        factors = [_factor(0.23), _factor(0.089), _factor(0.0)]
+
+        result = service.calculate_co2e_many([10.0, 15.0, 5.0], factors)
+
+        assert result == [2.3, 1.33, 0.0]
+
+    def test_calculate_co2e_many_rejects_mismatched_factors(self):
+        """Test the number of factors must match the number of values."""
+        service = CalculationService()
+
+        with pytest.raises(ValueError, match="Expected 2 emission factors, got 1"):
+            service.calculate_co2e_many([1.0, 2.0], [_factor(0.23)])
+
+    def test_calculate_co2e_many_with_no_values(self):
+        """Test an empty batch returns an empty list."""
+        assert CalculationService().calculate_co2e_many([], _factor(0.23)) == []
+
+    @given(
+        values=st.lists(_VALUES, max_size=200),
+        factor=_FACTORS,
+    )
+    def test_calculate_co2e_many_matches_scalar_with_shared_factor(
+        self, values, factor
+    ):
+        """Property: batch results equal the scalar path bit for bit."""
+        service = CalculationService()
+        emission_factor = _factor(factor)
+
+        result = service.calculate_co2e_many(values, emission_factor)
+
+        assert result == [service.calculate_co2e(v, emission_factor) for v in values]
+
+    @given(pairs=st.lists(st.tuples(_VALUES, _FACTORS), max_size=200))
+    def test_calculate_co2e_many_matches_scalar_with_factor_per_value(self, pairs):
+        """Property: per-value factors give the scalar results as well."""
+        service = CalculationService()
+        values = [value for value, _ in pairs]
+        factors = [_factor(factor) for _, factor in pairs]
+
+        result = service.calculate_co2e_many(values, factors)
+
+        assert result == [
+            service.calculate_co2e(v, f) for v, f in zip(values, factors, strict=True)
+        ]
+
+    @given(values=st.lists(_VALUES, min_size=1, max_size=20), data=st.data())
+    def test_calculate_co2e_many_rejects_any_negative_value(self, values, data):
+        """Property: a negative value anywhere rejects the batch."""
+        position = data.draw(st.integers(0, len(values) - 1))
+        values[position] = -data.draw(
+            st.floats(min_value=1e-9, max_value=1e6, allow_nan=False)
+        )
+
+        with pytest.raises(ValueError, match="Activity value cannot be negative"):
+            CalculationService().calculate_co2e_many(values, _factor(0.23))
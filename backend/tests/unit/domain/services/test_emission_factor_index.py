@@ -0,0 +1,93 @@
+"""Tests for EmissionFactorIndex."""
+
+import sys
+from datetime import UTC, date, datetime
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[4] / "src"))
+
+from domain.entities.emission_factor import EmissionFactor
+from domain.services.emission_factor_index import (
+    EmissionFactorIndex,
+    effective_from,
+)
+
+
+def _factor(type_: str, factor: float, year: int | None) -> EmissionFactor:
+    return EmissionFactor(
+        id=1,
+        category="transport",
+        type=type_,
+        factor=factor,
+        unit="km",
+        source="DEFRA",
+        notes=None,
+        created_at=datetime(2026, 1, 1, tzinfo=UTC),
+        source_year=year,
+    )
+
+
+@pytest.fixture
+def index():
+    """Index with three petrol versions (out of order) and one bus factor."""
+    return EmissionFactorIndex(
+        [
+            _factor("car_petrol", 0.19, 2022),
+            _factor("car_petrol", 0.17, 2024),
+            _factor("bus", 0.089, None),
+            _factor("car_petrol", 0.18, 2023),
+        ]
+    )
+
+
+class TestEmissionFactorIndex:
+    """Test date-effective emission factor lookup."""
+
+    @pytest.mark.parametrize(
+        "on,expected",
+        [
+            (date(2022, 1, 1), 0.19),
+            (date(2022, 12, 31), 0.19),
+            (date(2023, 1, 1), 0.18),
+            (date(2023, 7, 15), 0.18),
+            (date(2024, 1, 1), 0.17),
+            (date(2030, 1, 1), 0.17),
+        ],
+    )
+    def test_on_returns_version_in_effect(self, index, on, expected):
+        """Test each date maps to the version whose period contains it."""
+        assert index.on("car_petrol", on).factor == expected
+
+    def test_on_before_first_version_uses_oldest(self, index):
+        """Test dates before the first source year use the oldest version."""
+        assert index.on("car_petrol", date(2019, 5, 1)).factor == 0.19
+
+    def test_unversioned_factor_applies_to_all_dates(self, index):
+        """Test a factor without source year is valid for any date."""
+        assert index.on("bus", date(1990, 1, 1)).factor == 0.089
+        assert index.latest("bus").factor == 0.089
+
+    def test_latest_returns_newest_version(self, index):
+        """Test latest ignores the load order."""
+        assert index.latest("car_petrol").factor == 0.17
+
+    def test_unknown_type(self, index):
+        """Test unknown types return None."""
+        assert index.on("rocket", date(2024, 1, 1)) is None
+        assert index.latest("rocket") is None
+        assert len(index) == 2
+
+    def test_duplicate_start_keeps_last(self):
+        """Test the later of two factors with the same year wins."""
+        index = EmissionFactorIndex(
+            [_factor("bus", 0.08, 2024), _factor("bus", 0.09, 2024)]
+        )
+
+        assert index.on("bus", date(2024, 6, 1)).factor == 0.09
+
+    def test_effective_from(self):
+        """Test versions start on January 1 of their source year."""
+        assert effective_from(_factor("bus", 0.1, 2023)) == date(2023, 1, 1)
+        assert effective_from(_factor("bus", 0.1, None)) == date.min
@@ -0,0 +1,101 @@
+"""Tests for PopulationPercentileIndex."""
+
+from datetime import UTC, date, datetime, timedelta
+
+from domain.services.percentile_index import (
+    TOTAL_CATEGORY,
+    PopulationPercentileIndex,
+)
+
+TODAY = date(2026, 6, 30)
+
+
+def _loaded_index(owner_count: int = 100) -> PopulationPercentileIndex:
+    """Create an index with owners emitting 100, 200, ... kg of transport."""
+    index = PopulationPercentileIndex(min_population=10)
+    index.load(
+        (f"user:{i}", "transport", float((i + 1) * 100)) for i in range(owner_count)
+    )
+    return index
+
+
+class TestPopulationPercentileIndex:
+    """Tests for PopulationPercentileIndex."""
+
+    def test_percentile_ranks_against_population(self) -> None:
+        """Test that the percentile reflects the owner's rank."""
+        index = _loaded_index()
+        assert index.percentile("world", TOTAL_CATEGORY, 5000.0) in range(48, 53)
+        assert index.percentile("world", "transport", 9000.0) in range(88, 93)
+
+    def test_percentile_none_below_min_population(self) -> None:
+        """Test that small populations fall back to None."""
+        index = _loaded_index(owner_count=5)
+        assert index.percentile("world", TOTAL_CATEGORY, 300.0) is None
+
+    def test_percentile_none_for_unknown_region(self) -> None:
+        """Test that regions without owners return None."""
+        assert _loaded_index().percentile("eu", TOTAL_CATEGORY, 300.0) is None
+
+    def test_assign_region_builds_regional_population(self) -> None:
+        """Test that owners join the population of their region."""
+        index = _loaded_index()
+        for i in range(50):
+            index.assign_region(f"user:{i}", "EU")
+
+        # Owners 0-49 emit 100-5000 kg, so 2500 kg is mid-table in the EU
+        assert index.percentile("eu", TOTAL_CATEGORY, 2500.0) in range(45, 55)
+
+    def test_record_adds_new_owner(self) -> None:
+        """Test that a first write adds the owner to the population."""
+        index = _loaded_index()
+        index.record("session:new", "food", 50.0, TODAY, today=TODAY)
+        assert index.population == 101
+
+    def test_record_ignores_activities_outside_window(self) -> None:
+        """Test that writes outside the trailing window are ignored."""
+        index = _loaded_index()
+        index.record(
+            "session:old", "food", 50.0, TODAY - timedelta(days=400), today=TODAY
+        )
+        assert index.population == 100
+
+    def test_record_updates_existing_owner(self) -> None:
+        """Test that changes to existing owners move their rank."""
+        index = _loaded_index(owner_count=20)
+        for _ in range(10):
+            index.record("user:0", "transport", 1000.0, TODAY, today=TODAY)
+
+        # user:0 now emits 10,100 kg, more than anyone else
+        assert index.percentile("world", TOTAL_CATEGORY, 10100.0) == 100
+
+    def test_merge_owner_combines_totals(self) -> None:
+        """Test that session migration folds totals into the user."""
+        index = _loaded_index()
+        index.record("session:abc", "food", 50.0, TODAY, today=TODAY)
+        index.merge_owner("session:abc", "user:0")
+        assert index.population == 100
+
+    def test_remove_owner_leaves_population(self) -> None:
+        """Test that a reclaimed session no longer counts."""
+        index = _loaded_index()
+        index.record("session:abc", "food", 50.0, TODAY, today=TODAY)
+        index.assign_region("session:abc", "EU")
+
+        index.remove_owner("session:abc")
+        index.remove_owner("session:unknown")
+
+        assert index.population == 100
+        assert index.percentile("eu", TOTAL_CATEGORY, 50.0) is None
+
+    def test_claim_rebuild_only_once_per_interval(self) -> None:
+        """Test that only one caller claims a due rebuild."""
+        index = PopulationPercentileIndex(rebuild_interval=timedelta(hours=1))
+        now = datetime(2026, 6, 30, 12, tzinfo=UTC)
+
+        assert index.claim_rebuild(now) is True
+        assert index.claim_rebuild(now + timedelta(minutes=5)) is False
+
+        index.load([], now=now)
+        assert index.claim_rebuild(now + timedelta(minutes=30)) is False
+        assert index.claim_rebuild(now + timedelta(hours=2)) is True
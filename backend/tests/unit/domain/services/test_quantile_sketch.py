@@ -0,0 +1,91 @@
+"""Tests for the TDigest quantile sketch."""
+
+import random
+
+import pytest
+
+from domain.services.quantile_sketch import TDigest
+
+
+def _lognormal_values(count: int, seed: int = 42) -> list[float]:
+    """Generate a skewed, footprint-like sample."""
+    rng = random.Random(seed)
+    return [rng.lognormvariate(8.5, 0.6) for _ in range(count)]
+
+
+class TestTDigest:
+    """Tests for TDigest."""
+
+    def test_empty_digest_cdf_is_zero(self) -> None:
+        """Test that an empty digest ranks everything at zero."""
+        assert TDigest().cdf(100.0) == 0.0
+
+    def test_empty_digest_quantile_raises(self) -> None:
+        """Test that quantiles of an empty digest are rejected."""
+        with pytest.raises(ValueError):
+            TDigest().quantile(0.5)
+
+    def test_invalid_compression_raises(self) -> None:
+        """Test that non-positive compression is rejected."""
+        with pytest.raises(ValueError, match="Compression must be positive"):
+            TDigest(compression=0)
+
+    def test_invalid_weight_raises(self) -> None:
+        """Test that non-positive weights are rejected."""
+        with pytest.raises(ValueError, match="Weight must be positive"):
+            TDigest().add(1.0, weight=0)
+
+    def test_cdf_bounds(self) -> None:
+        """Test that values outside the observed range clamp to 0 and 1."""
+        digest = TDigest()
+        for value in range(1, 101):
+            digest.add(float(value))
+        assert digest.cdf(0.0) == 0.0
+        assert digest.cdf(1000.0) == 1.0
+
+    def test_cdf_matches_exact_ranks(self) -> None:
+        """Test that estimated ranks stay close to exact ranks."""
+        values = _lognormal_values(20000)
+        digest = TDigest()
+        for value in values:
+            digest.add(value)
+
+        ordered = sorted(values)
+        for q in (0.01, 0.1, 0.25, 0.5, 0.75, 0.9, 0.99):
+            value = ordered[int(q * len(ordered))]
+            assert digest.cdf(value) == pytest.approx(q, abs=0.01)
+
+    def test_quantile_matches_exact_values(self) -> None:
+        """Test that estimated quantiles stay close to exact values."""
+        values = _lognormal_values(20000)
+        digest = TDigest()
+        for value in values:
+            digest.add(value)
+
+        ordered = sorted(values)
+        for q in (0.1, 0.5, 0.9):
+            assert digest.quantile(q) == pytest.approx(
+                ordered[int(q * len(ordered))], rel=0.02
+            )
+
+    def test_centroid_count_is_bounded(self) -> None:
+        """Test that the digest stays small regardless of input size."""
+        digest = TDigest(compression=100)
+        for value in _lognormal_values(50000):
+            digest.add(value)
+        assert digest.count == 50000
+        assert digest.centroid_count < 1000
+
+    def test_merge_equals_single_digest(self) -> None:
+        """Test that merging shards gives the same ranks as one digest."""
+        values = _lognormal_values(20000)
+        left, right, whole = TDigest(), TDigest(), TDigest()
+        for index, value in enumerate(values):
+            (left if index % 2 else right).add(value)
+            whole.add(value)
+
+        left.merge(right)
+
+        assert left.count == whole.count
+        median = sorted(values)[len(values) // 2]
+        assert left.cdf(median) == pytest.approx(whole.cdf(median), abs=0.01)
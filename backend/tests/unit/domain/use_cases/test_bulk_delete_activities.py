@@ -0,0 +1,120 @@
+"""Unit tests for BulkDeleteActivitiesUseCase."""
+
+import sys
+from datetime import UTC, date, datetime
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[4] / "src"))
+
+from domain.entities.activity import Activity
+from domain.ports.activity_repository import (
+    WRITE_FORBIDDEN,
+    WRITE_NOT_FOUND,
+    WRITE_OK,
+    ActivitySelection,
+    OwnedWriteResult,
+)
+from domain.use_cases.bulk_delete_activities import BulkDeleteActivitiesUseCase
+
+
+def _activity(co2e_kg: float, day: int) -> Activity:
+    return Activity(
+        id=uuid4(),
+        category="transport",
+        type="car_petrol",
+        value=10.0,
+        co2e_kg=co2e_kg,
+        date=date(2024, 1, day),
+        notes=None,
+        metadata=None,
+        user_id=None,
+        session_id="test-session-123",
+        created_at=datetime(2024, 1, day, 10, 0, tzinfo=UTC),
+    )
+
+
+@pytest.fixture
+def mock_activity_repo():
+    """Create mock activity repository."""
+    return AsyncMock()
+
+
+@pytest.mark.asyncio
+async def test_bulk_delete_reports_each_id(mock_activity_repo):
+    """Test results are passed through per activity."""
+    mine = _activity(2.3, 15)
+    missing, foreign = uuid4(), uuid4()
+    results = {
+        mine.id: OwnedWriteResult(status=WRITE_OK, previous=mine),
+        missing: OwnedWriteResult(status=WRITE_NOT_FOUND),
+        foreign: OwnedWriteResult(status=WRITE_FORBIDDEN),
+    }
+    mock_activity_repo.delete_many_owned.return_value = results
+    use_case = BulkDeleteActivitiesUseCase(activity_repo=mock_activity_repo)
+    selection = ActivitySelection(ids=(mine.id, missing, foreign))
+
+    assert await use_case.execute(None, "test-session-123", selection) == results
+    mock_activity_repo.delete_many_owned.assert_called_once_with(
+        None, "test-session-123", selection
+    )
+
+
+@pytest.mark.asyncio
+async def test_bulk_delete_updates_index_and_cache_once(mock_activity_repo):
+    """Test every deleted row leaves the index and the cache is invalidated once."""
+    first, second = _activity(2.3, 15), _activity(1.1, 16)
+    mock_activity_repo.delete_many_owned.return_value = {
+        first.id: OwnedWriteResult(status=WRITE_OK, previous=first),
+        second.id: OwnedWriteResult(status=WRITE_OK, previous=second),
+    }
+    percentile_index = MagicMock()
+    footprint_cache = AsyncMock()
+    use_case = BulkDeleteActivitiesUseCase(
+        activity_repo=mock_activity_repo,
+        percentile_index=percentile_index,
+        footprint_cache=footprint_cache,
+    )
+
+    await use_case.execute(
+        None,
+        "test-session-123",
+        ActivitySelection(start_date=date(2024, 1, 15), end_date=date(2024, 1, 21)),
+    )
+
+    owner = "session:test-session-123"
+    footprint_cache.invalidate.assert_called_once_with(owner)
+    assert [c.args for c in percentile_index.record.call_args_list] == [
+        (owner, "transport", -2.3, date(2024, 1, 15)),
+        (owner, "transport", -1.1, date(2024, 1, 16)),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_bulk_delete_nothing_deleted_keeps_cache(mock_activity_repo):
+    """Test the cache is left alone when nothing was deleted."""
+    mock_activity_repo.delete_many_owned.return_value = {
+        uuid4(): OwnedWriteResult(status=WRITE_FORBIDDEN)
+    }
+    footprint_cache = AsyncMock()
+    use_case = BulkDeleteActivitiesUseCase(
+        activity_repo=mock_activity_repo, footprint_cache=footprint_cache
+    )
+
+    await use_case.execute(None, "test-session-123", ActivitySelection(ids=(uuid4(),)))
+
+    footprint_cache.invalidate.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_bulk_delete_rejects_empty_selection(mock_activity_repo):
+    """Test a selection without IDs or filters is rejected."""
+    use_case = BulkDeleteActivitiesUseCase(activity_repo=mock_activity_repo)
+
+    with pytest.raises(ValueError, match="at least one filter"):
+        await use_case.execute(None, "test-session-123", ActivitySelection())
+
+    mock_activity_repo.delete_many_owned.assert_not_called()
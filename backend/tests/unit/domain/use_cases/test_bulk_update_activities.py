@@ -0,0 +1,186 @@
+"""Unit tests for BulkUpdateActivitiesUseCase."""
+
+import sys
+from dataclasses import replace
+from datetime import UTC, date, datetime
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[4] / "src"))
+
+from domain.entities.activity import Activity
+from domain.entities.emission_factor import EmissionFactor
+from domain.ports.activity_repository import (
+    WRITE_CATEGORY_MISMATCH,
+    WRITE_OK,
+    ActivitySelection,
+    OwnedWriteResult,
+)
+from domain.services.calculation_service import CalculationService
+from domain.use_cases.bulk_update_activities import BulkUpdateActivitiesUseCase
+
+
+@pytest.fixture
+def mock_activity_repo():
+    """Create mock activity repository."""
+    return AsyncMock()
+
+
+@pytest.fixture
+def mock_emission_factor_repo():
+    """Create mock emission factor repository with a diesel factor."""
+    repo = AsyncMock()
+    repo.get_by_type.return_value = EmissionFactor(
+        id=4,
+        category="transport",
+        type="car_diesel",
+        factor=0.17,
+        unit="km",
+        source="DEFRA 2023",
+        notes=None,
+        created_at=datetime.now(UTC),
+    )
+    return repo
+
+
+@pytest.fixture
+def petrol_trip():
+    """Create a petrol car trip."""
+    return Activity(
+        id=uuid4(),
+        category="transport",
+        type="car_petrol",
+        value=100.0,
+        co2e_kg=23.0,
+        date=date(2024, 1, 15),
+        notes=None,
+        metadata=None,
+        user_id=None,
+        session_id="test-session-123",
+        created_at=datetime(2024, 1, 15, 10, 0, tzinfo=UTC),
+    )
+
+
+def _diesel(factor: float, source_year: int) -> EmissionFactor:
+    """Diesel car factor of one source year."""
+    return EmissionFactor(
+        id=source_year,
+        category="transport",
+        type="car_diesel",
+        factor=factor,
+        unit="km",
+        source=f"DEFRA {source_year}",
+        notes=None,
+        created_at=datetime.now(UTC),
+        source_year=source_year,
+    )
+
+
+@pytest.mark.asyncio
+async def test_bulk_update_computes_co2e_with_each_dates_factor(
+    mock_activity_repo, mock_emission_factor_repo, petrol_trip
+):
+    """Test CO2e uses the factor in effect on each activity's date."""
+    factors = {2023: _diesel(0.17, 2023), 2024: _diesel(0.2, 2024)}
+    mock_activity_repo.update_type_many_owned.return_value = {}
+    mock_emission_factor_repo.get_by_type_on.side_effect = lambda activity_type, on: (
+        factors[on.year]
+    )
+    use_case = BulkUpdateActivitiesUseCase(
+        activity_repo=mock_activity_repo,
+        emission_factor_repo=mock_emission_factor_repo,
+        calculation_service=CalculationService(),
+    )
+    selection = ActivitySelection(activity_type="car_petrol")
+
+    await use_case.execute(None, "test-session-123", selection, "car_diesel")
+
+    call = mock_activity_repo.update_type_many_owned.call_args.kwargs
+    assert call["selection"] == selection
+    assert call["category"] == "transport"
+    assert call["activity_type"] == "car_diesel"
+    old_trip = replace(petrol_trip, id=uuid4(), value=10.0, date=date(2023, 6, 1))
+    assert await call["co2e_for"]([petrol_trip, old_trip, petrol_trip]) == [
+        20.0,
+        1.7,
+        20.0,
+    ]
+    assert mock_emission_factor_repo.get_by_type_on.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_bulk_update_records_percentile_deltas(
+    mock_activity_repo, mock_emission_factor_repo, petrol_trip
+):
+    """Test updated rows move in the index and mismatches are skipped."""
+    diesel_trip = replace(petrol_trip, type="car_diesel", co2e_kg=17.0)
+    meal = replace(petrol_trip, id=uuid4(), category="food", type="meal_vegan")
+    mock_activity_repo.update_type_many_owned.return_value = {
+        petrol_trip.id: OwnedWriteResult(
+            status=WRITE_OK, activity=diesel_trip, previous=petrol_trip
+        ),
+        meal.id: OwnedWriteResult(status=WRITE_CATEGORY_MISMATCH, previous=meal),
+    }
+    percentile_index = MagicMock()
+    footprint_cache = AsyncMock()
+    use_case = BulkUpdateActivitiesUseCase(
+        activity_repo=mock_activity_repo,
+        emission_factor_repo=mock_emission_factor_repo,
+        calculation_service=CalculationService(),
+        percentile_index=percentile_index,
+        footprint_cache=footprint_cache,
+    )
+
+    await use_case.execute(
+        None,
+        "test-session-123",
+        ActivitySelection(ids=(petrol_trip.id, meal.id)),
+        "car_diesel",
+    )
+
+    owner = "session:test-session-123"
+    footprint_cache.invalidate.assert_called_once_with(owner)
+    assert [c.args for c in percentile_index.record.call_args_list] == [
+        (owner, "transport", -23.0, date(2024, 1, 15)),
+        (owner, "transport", 17.0, date(2024, 1, 15)),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_bulk_update_unknown_type(mock_activity_repo, mock_emission_factor_repo):
+    """Test an unknown target type is rejected before writing."""
+    mock_emission_factor_repo.get_by_type.return_value = None
+    use_case = BulkUpdateActivitiesUseCase(
+        activity_repo=mock_activity_repo,
+        emission_factor_repo=mock_emission_factor_repo,
+        calculation_service=CalculationService(),
+    )
+
+    with pytest.raises(ValueError, match="Unknown activity type"):
+        await use_case.execute(
+            None, "test-session-123", ActivitySelection(ids=(uuid4(),)), "rocket"
+        )
+
+    mock_activity_repo.update_type_many_owned.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_bulk_update_rejects_empty_selection(
+    mock_activity_repo, mock_emission_factor_repo
+):
+    """Test a selection without IDs or filters is rejected."""
+    use_case = BulkUpdateActivitiesUseCase(
+        activity_repo=mock_activity_repo,
+        emission_factor_repo=mock_emission_factor_repo,
+        calculation_service=CalculationService(),
+    )
+
+    with pytest.raises(ValueError, match="at least one filter"):
+        await use_case.execute(
+            None, "test-session-123", ActivitySelection(), "car_diesel"
+        )
+
+    mock_emission_factor_repo.get_by_type.assert_not_called()
@@ -0,0 +1,107 @@
+"""Unit tests for CompareToRegionUseCase."""
+
+from datetime import UTC, date, datetime
+from unittest.mock import AsyncMock
+from uuid import uuid4
+
+import pytest
+
+from domain.entities.activity import Activity
+from domain.entities.region import RegionalAverage
+from domain.services.aggregation_service import AggregationService
+from domain.services.comparison_service import ComparisonService
+from domain.services.percentile_index import PopulationPercentileIndex
+from domain.use_cases.compare_to_region import (
+    CompareToRegionInput,
+    CompareToRegionUseCase,
+)
+from infrastructure.cache.in_memory_cache_backend import InMemoryCacheBackend
+from infrastructure.cache.versioned_footprint_cache import VersionedFootprintCache
+
+REGION = RegionalAverage(
+    code="world",
+    name="World",
+    average_annual_co2e_kg=4000.0,
+    breakdown={"transport": 1000.0},
+    source="test",
+)
+INPUT = CompareToRegionInput(
+    user_id=None, session_id="s1", region_code="world", period="month"
+)
+
+
+def _population(co2e_kg: float) -> list[tuple[str, str, float]]:
+    """Twenty owners all emitting the same amount of transport."""
+    return [(f"user:{i}", "transport", co2e_kg) for i in range(20)]
+
+
+@pytest.fixture
+def activity_repo() -> AsyncMock:
+    """Repository holding one activity of session s1 today."""
+    repo = AsyncMock()
+    repo.list_by_date_range.return_value = [
+        Activity(
+            id=uuid4(),
+            category="transport",
+            type="car_petrol",
+            value=500.0,
+            co2e_kg=100.0,
+            date=date.today(),
+            notes=None,
+            metadata=None,
+            user_id=None,
+            session_id="s1",
+            created_at=datetime.now(UTC),
+        )
+    ]
+    return repo
+
+
+@pytest.fixture
+def index() -> PopulationPercentileIndex:
+    """Index whose population emits far less than session s1."""
+    index = PopulationPercentileIndex(min_population=10)
+    index.load(_population(1.0))
+    return index
+
+
+@pytest.fixture
+def use_case(activity_repo, index) -> CompareToRegionUseCase:
+    """Use case with a footprint cache."""
+    region_provider = AsyncMock()
+    region_provider.get_by_code.return_value = REGION
+    return CompareToRegionUseCase(
+        activity_repo,
+        region_provider,
+        AggregationService(),
+        ComparisonService(),
+        percentile_index=index,
+        footprint_cache=VersionedFootprintCache(InMemoryCacheBackend()),
+    )
+
+
+@pytest.mark.asyncio
+async def test_cached_totals_get_a_fresh_percentile(
+    use_case, activity_repo, index
+) -> None:
+    """Test index rebuilds show up even while the owner's totals are cached."""
+    first = await use_case.execute(INPUT)
+    index.load(_population(1e9))
+    second = await use_case.execute(INPUT)
+
+    activity_repo.list_by_date_range.assert_awaited_once()
+    assert second.user_footprint == first.user_footprint
+    assert first.comparison["percentile"] == 100
+    assert second.comparison["percentile"] == 0
+
+
+@pytest.mark.asyncio
+async def test_cache_hit_still_assigns_region(use_case, index) -> None:
+    """Test the owner joins the regional population on every comparison."""
+    await use_case.execute(INPUT)
+    calls: list[tuple[str, str]] = []
+    index.assign_region = lambda owner, region: calls.append((owner, region))
+
+    await use_case.execute(INPUT)
+
+    assert calls == [("session:s1", "world")]
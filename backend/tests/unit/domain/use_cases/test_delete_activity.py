@@ -3,7 +3,7 @@
 import sys
 from datetime import date, datetime, timezone
 from pathlib import Path
-from unittest.mock import AsyncMock
+from unittest.mock import AsyncMock, MagicMock
 from uuid import uuid4
 
 import pytest
@@ -11,6 +11,12 @@ import pytest
 sys.path.insert(0, str(Path(__file__).resolve().parents[4] / "src"))
 
 from domain.entities.activity import Activity
+from domain.ports.activity_repository import (
+    WRITE_FORBIDDEN,
+    WRITE_NOT_FOUND,
+    WRITE_OK,
+    OwnedWriteResult,
+)
 from domain.use_cases.delete_activity import DeleteActivityUseCase
 
 
@@ -46,12 +52,11 @@ def use_case(mock_activity_repo):
 
 
 @pytest.mark.asyncio
-async def test_delete_activity_success(
-    use_case, mock_activity_repo, existing_activity
-):
-    """Test successful activity deletion."""
-    mock_activity_repo.get_by_id.return_value = existing_activity
-    mock_activity_repo.delete.return_value = True
+async def test_delete_activity_success(use_case, mock_activity_repo, existing_activity):
+    """Test successful activity deletion in a single owner-filtered write."""
+    mock_activity_repo.delete_owned.return_value = OwnedWriteResult(
+        status=WRITE_OK, previous=existing_activity
+    )
 
     await use_case.execute(
         activity_id=existing_activity.id,
@@ -59,14 +64,19 @@ async def test_delete_activity_success(
         session_id="test-session-123",
     )
 
-    mock_activity_repo.get_by_id.assert_called_once_with(existing_activity.id)
-    mock_activity_repo.delete.assert_called_once_with(existing_activity.id)
+    mock_activity_repo.delete_owned.assert_called_once_with(
+        existing_activity.id, None, "test-session-123"
+    )
+    mock_activity_repo.get_by_id.assert_not_called()
+    mock_activity_repo.delete.assert_not_called()
 
 
 @pytest.mark.asyncio
 async def test_delete_activity_not_found(use_case, mock_activity_repo):
     """Test delete raises ValueError when activity not found."""
-    mock_activity_repo.get_by_id.return_value = None
+    mock_activity_repo.delete_owned.return_value = OwnedWriteResult(
+        status=WRITE_NOT_FOUND
+    )
     activity_id = uuid4()
 
     with pytest.raises(ValueError, match="Activity not found"):
@@ -76,15 +86,15 @@ async def test_delete_activity_not_found(use_case, mock_activity_repo):
             session_id="test-session-123",
         )
 
-    mock_activity_repo.delete.assert_not_called()
-
 
 @pytest.mark.asyncio
 async def test_delete_activity_unauthorized_session(
     use_case, mock_activity_repo, existing_activity
 ):
     """Test delete raises PermissionError for different session."""
-    mock_activity_repo.get_by_id.return_value = existing_activity
+    mock_activity_repo.delete_owned.return_value = OwnedWriteResult(
+        status=WRITE_FORBIDDEN
+    )
 
     with pytest.raises(PermissionError, match="Not authorized to delete"):
         await use_case.execute(
@@ -93,7 +103,9 @@ async def test_delete_activity_unauthorized_session(
             session_id="different-session",
         )
 
-    mock_activity_repo.delete.assert_not_called()
+    mock_activity_repo.delete_owned.assert_called_once_with(
+        existing_activity.id, None, "different-session"
+    )
 
 
 @pytest.mark.asyncio
@@ -102,20 +114,9 @@ async def test_delete_activity_unauthorized_user(
 ):
     """Test delete raises PermissionError for different user."""
     user_id = uuid4()
-    activity_with_user = Activity(
-        id=existing_activity.id,
-        category=existing_activity.category,
-        type=existing_activity.type,
-        value=existing_activity.value,
-        co2e_kg=existing_activity.co2e_kg,
-        date=existing_activity.date,
-        notes=existing_activity.notes,
-        metadata=existing_activity.metadata,
-        user_id=uuid4(),  # Different user
-        session_id=None,
-        created_at=existing_activity.created_at,
+    mock_activity_repo.delete_owned.return_value = OwnedWriteResult(
+        status=WRITE_FORBIDDEN
     )
-    mock_activity_repo.get_by_id.return_value = activity_with_user
 
     with pytest.raises(PermissionError, match="Not authorized to delete"):
         await use_case.execute(
@@ -124,13 +125,13 @@ async def test_delete_activity_unauthorized_user(
             session_id=None,
         )
 
-    mock_activity_repo.delete.assert_not_called()
+    mock_activity_repo.delete_owned.assert_called_once_with(
+        existing_activity.id, user_id, None
+    )
 
 
 @pytest.mark.asyncio
-async def test_delete_activity_authorized_user(
-    use_case, mock_activity_repo
-):
+async def test_delete_activity_authorized_user(use_case, mock_activity_repo):
     """Test delete succeeds for authorized user."""
     user_id = uuid4()
     activity_with_user = Activity(
@@ -146,8 +147,9 @@ async def test_delete_activity_authorized_user(
         session_id=None,
         created_at=datetime(2024, 1, 15, 10, 0, tzinfo=timezone.utc),
     )
-    mock_activity_repo.get_by_id.return_value = activity_with_user
-    mock_activity_repo.delete.return_value = True
+    mock_activity_repo.delete_owned.return_value = OwnedWriteResult(
+        status=WRITE_OK, previous=activity_with_user
+    )
 
     await use_case.execute(
         activity_id=activity_with_user.id,
@@ -155,16 +157,43 @@ async def test_delete_activity_authorized_user(
         session_id=None,
     )
 
-    mock_activity_repo.delete.assert_called_once_with(activity_with_user.id)
+    mock_activity_repo.delete_owned.assert_called_once_with(
+        activity_with_user.id, user_id, None
+    )
 
 
 @pytest.mark.asyncio
-async def test_delete_activity_failed(
-    use_case, mock_activity_repo, existing_activity
+async def test_delete_activity_updates_percentile_index(
+    mock_activity_repo, existing_activity
 ):
+    """Test the deleted row's CO2e is removed from the percentile index."""
+    percentile_index = MagicMock()
+    footprint_cache = AsyncMock()
+    use_case = DeleteActivityUseCase(
+        activity_repo=mock_activity_repo,
+        percentile_index=percentile_index,
+        footprint_cache=footprint_cache,
+    )
+    mock_activity_repo.delete_owned.return_value = OwnedWriteResult(
+        status=WRITE_OK, previous=existing_activity
+    )
+
+    await use_case.execute(
+        activity_id=existing_activity.id,
+        user_id=None,
+        session_id="test-session-123",
+    )
+
+    percentile_index.record.assert_called_once_with(
+        "session:test-session-123", "transport", -5.75, date(2024, 1, 15)
+    )
+    footprint_cache.invalidate.assert_called_once_with("session:test-session-123")
+
+
+@pytest.mark.asyncio
+async def test_delete_activity_failed(use_case, mock_activity_repo, existing_activity):
     """Test delete raises ValueError when deletion fails."""
-    mock_activity_repo.get_by_id.return_value = existing_activity
-    mock_activity_repo.delete.return_value = False
+    mock_activity_repo.delete_owned.return_value = OwnedWriteResult(status=WRITE_OK)
 
     with pytest.raises(ValueError, match="Failed to delete activity"):
         await use_case.execute(
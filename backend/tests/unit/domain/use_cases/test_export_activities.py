@@ -0,0 +1,91 @@
+"""Unit tests for ExportActivitiesUseCase."""
+
+from datetime import UTC, date, datetime
+from unittest.mock import AsyncMock
+from uuid import UUID
+
+import pytest
+
+from domain.entities.activity import Activity
+from domain.use_cases.export_activities import ExportActivitiesUseCase
+
+
+def _activity(n: int) -> Activity:
+    """Create an activity whose ID sorts by n."""
+    return Activity(
+        id=UUID(int=n),
+        category="transport",
+        type="car_petrol",
+        value=float(n),
+        co2e_kg=round(n * 0.23, 2),
+        date=date(2024, 1, n),
+        notes=None,
+        metadata=None,
+        user_id=None,
+        session_id="session-123",
+        created_at=datetime(2024, 1, 15, tzinfo=UTC),
+    )
+
+
+def _repo_with(count: int) -> AsyncMock:
+    """Create a repository paging over count activities."""
+    activities = [_activity(n) for n in range(1, count + 1)]
+
+    async def list_owned_after_id(user_id, session_id, after_id, limit):
+        return [a for a in activities if after_id is None or a.id > after_id][:limit]
+
+    repo = AsyncMock()
+    repo.list_owned_after_id.side_effect = list_owned_after_id
+    return repo
+
+
+async def _collect(use_case, user_id=None, session_id="session-123"):
+    return [chunk async for chunk in use_case.execute(user_id, session_id)]
+
+
+@pytest.mark.asyncio
+async def test_export_pages_by_id():
+    """Test chunks follow the keyset from the last ID of the previous chunk."""
+    repo = _repo_with(5)
+    use_case = ExportActivitiesUseCase(activity_repo=repo, chunk_size=2)
+
+    chunks = await _collect(use_case)
+
+    assert [[a.id.int for a in chunk] for chunk in chunks] == [[1, 2], [3, 4], [5]]
+    after_ids = [c.args[2] for c in repo.list_owned_after_id.call_args_list]
+    assert after_ids == [None, UUID(int=2), UUID(int=4)]
+
+
+@pytest.mark.asyncio
+async def test_export_exact_multiple_ends_with_empty_read():
+    """Test a full last chunk needs one more read to detect the end."""
+    repo = _repo_with(4)
+    use_case = ExportActivitiesUseCase(activity_repo=repo, chunk_size=2)
+
+    chunks = await _collect(use_case)
+
+    assert [len(chunk) for chunk in chunks] == [2, 2]
+    assert repo.list_owned_after_id.call_count == 3
+
+
+@pytest.mark.asyncio
+async def test_export_reads_lazily():
+    """Test nothing is read before the first chunk is requested."""
+    repo = _repo_with(5)
+    use_case = ExportActivitiesUseCase(activity_repo=repo, chunk_size=2)
+
+    chunks = use_case.execute(None, "session-123")
+    repo.list_owned_after_id.assert_not_called()
+
+    first = await anext(chunks)
+
+    assert len(first) == 2
+    repo.list_owned_after_id.assert_called_once()
+
+
+def test_export_requires_owner():
+    """Test an owner must be given."""
+    use_case = ExportActivitiesUseCase(activity_repo=AsyncMock())
+
+    with pytest.raises(ValueError, match="user_id or session_id"):
+        use_case.execute(None, None)
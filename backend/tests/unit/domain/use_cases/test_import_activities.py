@@ -0,0 +1,163 @@
+"""Unit tests for ImportActivitiesUseCase."""
+
+from datetime import UTC, date, datetime
+from unittest.mock import AsyncMock
+
+import pytest
+
+from domain.entities.emission_factor import EmissionFactor
+from domain.services.calculation_service import CalculationService
+from domain.use_cases.import_activities import (
+    ImportActivitiesUseCase,
+    ImportRow,
+    RejectedRow,
+)
+
+
+def _factor(type_: str, category: str, factor: float) -> EmissionFactor:
+    return EmissionFactor(
+        id=1,
+        category=category,
+        type=type_,
+        factor=factor,
+        unit="km",
+        source="DEFRA 2023",
+        notes=None,
+        created_at=datetime.now(UTC),
+    )
+
+
+FACTORS = {
+    "car_petrol": _factor("car_petrol", "transport", 0.23),
+    "electricity": _factor("electricity", "energy", 0.2),
+}
+
+
+def _row(line: int, **fields: str) -> ImportRow:
+    return ImportRow(
+        line=line,
+        fields={"date": "2024-01-15", "type": "car_petrol", "value": "10", **fields},
+    )
+
+
+@pytest.fixture
+def mock_activity_repo():
+    """Create a repository whose multi-row save echoes its input."""
+    repo = AsyncMock()
+    repo.save_many.side_effect = lambda activities: activities
+    return repo
+
+
+@pytest.fixture
+def mock_emission_factor_repo():
+    """Create a factor repository with petrol and electricity."""
+    repo = AsyncMock()
+    repo.get_by_type_on.side_effect = lambda type_, on: FACTORS.get(type_)
+    return repo
+
+
+@pytest.fixture
+def mock_log_activity():
+    """Create a log activity use case to receive record_saved()."""
+    return AsyncMock()
+
+
+@pytest.fixture
+def use_case(mock_activity_repo, mock_emission_factor_repo, mock_log_activity):
+    """Create the use case with batches of two."""
+    return ImportActivitiesUseCase(
+        activity_repo=mock_activity_repo,
+        emission_factor_repo=mock_emission_factor_repo,
+        calculation_service=CalculationService(),
+        log_activity=mock_log_activity,
+        batch_size=2,
+        max_reported_rejections=2,
+    )
+
+
+@pytest.mark.asyncio
+async def test_import_saves_in_batches(use_case, mock_activity_repo, mock_log_activity):
+    """Test valid rows are calculated and saved in multi-row batches."""
+    rows = [
+        _row(2),
+        _row(3, type="electricity", value="100", category="energy"),
+        _row(4, value="2", notes=" commute "),
+    ]
+
+    report = await use_case.execute(rows, None, "session-123")
+
+    assert (report.imported, report.rejected) == (3, 0)
+    batches = [c.args[0] for c in mock_activity_repo.save_many.call_args_list]
+    assert [len(batch) for batch in batches] == [2, 1]
+    saved = [a for batch in batches for a in batch]
+    assert [a.co2e_kg for a in saved] == [2.3, 20.0, 0.46]
+    assert [a.category for a in saved] == ["transport", "energy", "transport"]
+    assert saved[2].notes == "commute"
+    assert saved[2].session_id == "session-123"
+    assert mock_log_activity.record_saved.call_count == 2
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "fields,reason",
+    [
+        ({"date": ""}, "Missing date"),
+        ({"date": "15/01/2024"}, "Invalid date: 15/01/2024"),
+        ({"value": "ten"}, "Invalid value: ten"),
+        ({"value": "0"}, "Value must be greater than 0"),
+        ({"value": "nan"}, "Value must be greater than 0"),
+        ({"value": "100001"}, "Value must be greater than 0"),
+        ({"type": "rocket"}, "Unknown activity type: rocket"),
+        ({"category": "food"}, "does not belong to category 'food'"),
+        ({"notes": "x" * 501}, "Notes longer than 500 characters"),
+    ],
+)
+async def test_import_rejects_invalid_rows(
+    use_case, mock_activity_repo, fields, reason
+):
+    """Test each kind of invalid row is rejected with its line number."""
+    report = await use_case.execute([_row(7, **fields)], None, "session-123")
+
+    assert (report.imported, report.rejected) == (0, 1)
+    assert report.rejected_rows[0].line == 7
+    assert reason in report.rejected_rows[0].reason
+    mock_activity_repo.save_many.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_import_continues_after_rejections(use_case):
+    """Test invalid rows are counted past the report cap while valid rows load."""
+    rows = [_row(2, value="-1"), _row(3), _row(4, type="x"), _row(5, type="y")]
+
+    report = await use_case.execute(rows, None, "session-123")
+
+    assert (report.imported, report.rejected) == (1, 3)
+    assert [r.line for r in report.rejected_rows] == [2, 4]
+
+
+@pytest.mark.asyncio
+async def test_import_reports_unreadable_row(use_case):
+    """Test a row the reader could not parse is reported with its error."""
+    rows = [_row(2), ImportRow(line=3, fields={}, error="Unreadable file")]
+
+    report = await use_case.execute(rows, None, "session-123")
+
+    assert report.imported == 1
+    assert report.rejected_rows == [RejectedRow(line=3, reason="Unreadable file")]
+
+
+@pytest.mark.asyncio
+async def test_import_uses_factor_of_row_date(use_case, mock_emission_factor_repo):
+    """Test factors are resolved for each row's own date."""
+    await use_case.execute([_row(2, date="2023-06-01")], None, "session-123")
+
+    mock_emission_factor_repo.get_by_type_on.assert_called_once_with(
+        "car_petrol", date(2023, 6, 1)
+    )
+
+
+@pytest.mark.asyncio
+async def test_import_requires_owner(use_case):
+    """Test an owner must be given."""
+    with pytest.raises(ValueError, match="user_id or session_id"):
+        await use_case.execute([], None, None)
@@ -1,7 +1,7 @@
 """Unit tests for LogActivityUseCase."""
 
 import sys
-from datetime import date, datetime, timezone
+from datetime import UTC, date, datetime, timezone
 from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock
 from uuid import uuid4
@@ -68,7 +68,7 @@ async def test_execute_creates_activity_with_correct_co2e(
     use_case, mock_emission_factor_repo, mock_calculation_service, car_petrol_factor
 ):
     """Test that execute creates activity with calculated CO2e."""
-    mock_emission_factor_repo.get_by_type.return_value = car_petrol_factor
+    mock_emission_factor_repo.get_by_type_on.return_value = car_petrol_factor
     mock_calculation_service.calculate_co2e.return_value = 5.75
 
     session_id = "test-session-123"
@@ -96,8 +96,8 @@ async def test_execute_creates_activity_with_correct_co2e(
 async def test_execute_calls_emission_factor_repo(
     use_case, mock_emission_factor_repo, car_petrol_factor
 ):
-    """Test that execute retrieves emission factor from repository."""
-    mock_emission_factor_repo.get_by_type.return_value = car_petrol_factor
+    """Test that execute retrieves the factor in effect on the activity date."""
+    mock_emission_factor_repo.get_by_type_on.return_value = car_petrol_factor
 
     await use_case.execute(
         category="transport",
@@ -109,7 +109,9 @@ async def test_execute_calls_emission_factor_repo(
         session_id="session-123",
     )
 
-    mock_emission_factor_repo.get_by_type.assert_called_once_with("car_petrol")
+    mock_emission_factor_repo.get_by_type_on.assert_called_once_with(
+        "car_petrol", date(2024, 1, 15)
+    )
 
 
 @pytest.mark.asyncio
@@ -117,7 +119,7 @@ async def test_execute_calls_calculation_service(
     use_case, mock_emission_factor_repo, mock_calculation_service, car_petrol_factor
 ):
     """Test that execute uses calculation service with correct parameters."""
-    mock_emission_factor_repo.get_by_type.return_value = car_petrol_factor
+    mock_emission_factor_repo.get_by_type_on.return_value = car_petrol_factor
 
     await use_case.execute(
         category="transport",
@@ -139,7 +141,7 @@ async def test_execute_saves_activity_to_repository(
     use_case, mock_activity_repo, mock_emission_factor_repo, car_petrol_factor
 ):
     """Test that execute saves activity to repository."""
-    mock_emission_factor_repo.get_by_type.return_value = car_petrol_factor
+    mock_emission_factor_repo.get_by_type_on.return_value = car_petrol_factor
 
     await use_case.execute(
         category="transport",
@@ -161,7 +163,7 @@ async def test_execute_raises_error_for_unknown_activity_type(
     use_case, mock_emission_factor_repo
 ):
     """Test that execute raises ValueError for unknown activity type."""
-    mock_emission_factor_repo.get_by_type.return_value = None
+    mock_emission_factor_repo.get_by_type_on.return_value = None
 
     with pytest.raises(ValueError, match="Unknown activity type"):
         await use_case.execute(
@@ -180,7 +182,7 @@ async def test_execute_raises_error_without_user_or_session(
     use_case, mock_emission_factor_repo, car_petrol_factor
 ):
     """Test that execute raises ValueError when neither user_id nor session_id provided."""
-    mock_emission_factor_repo.get_by_type.return_value = car_petrol_factor
+    mock_emission_factor_repo.get_by_type_on.return_value = car_petrol_factor
 
     with pytest.raises(
         ValueError, match="Either user_id or session_id must be provided"
@@ -201,7 +203,7 @@ async def test_execute_with_authenticated_user(
     use_case, mock_emission_factor_repo, car_petrol_factor
 ):
     """Test that execute works with authenticated user."""
-    mock_emission_factor_repo.get_by_type.return_value = car_petrol_factor
+    mock_emission_factor_repo.get_by_type_on.return_value = car_petrol_factor
     user_id = uuid4()
 
     activity = await use_case.execute(
@@ -216,3 +218,80 @@ async def test_execute_with_authenticated_user(
 
     assert activity.user_id == user_id
     assert activity.session_id is None
+
+
+@pytest.mark.asyncio
+async def test_execute_with_queue_defers_write(
+    mock_activity_repo,
+    mock_emission_factor_repo,
+    mock_calculation_service,
+    car_petrol_factor,
+):
+    """Test queued ingestion submits the computed activity instead of saving."""
+    mock_emission_factor_repo.get_by_type_on.return_value = car_petrol_factor
+    queue = AsyncMock()
+    footprint_cache = AsyncMock()
+    use_case = LogActivityUseCase(
+        activity_repo=mock_activity_repo,
+        emission_factor_repo=mock_emission_factor_repo,
+        calculation_service=mock_calculation_service,
+        footprint_cache=footprint_cache,
+        ingestion_queue=queue,
+    )
+
+    activity = await use_case.execute(
+        category="transport",
+        activity_type="car_petrol",
+        value=25.0,
+        activity_date=date(2024, 1, 15),
+        notes=None,
+        user_id=None,
+        session_id="test-session-123",
+    )
+
+    queue.submit.assert_called_once_with(activity)
+    assert activity.co2e_kg == 5.75
+    mock_activity_repo.save.assert_not_called()
+    # Cache is invalidated when the batch is written, not on submit
+    footprint_cache.invalidate.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_record_saved_invalidates_each_owner_once(
+    mock_activity_repo, mock_emission_factor_repo, mock_calculation_service
+):
+    """Test a written batch updates the index per activity and cache per owner."""
+    percentile_index = MagicMock()
+    footprint_cache = AsyncMock()
+    use_case = LogActivityUseCase(
+        activity_repo=mock_activity_repo,
+        emission_factor_repo=mock_emission_factor_repo,
+        calculation_service=mock_calculation_service,
+        percentile_index=percentile_index,
+        footprint_cache=footprint_cache,
+    )
+    user_id = uuid4()
+
+    def make(session_id, owner_user_id=None):
+        return Activity(
+            id=uuid4(),
+            category="transport",
+            type="car_petrol",
+            value=10.0,
+            co2e_kg=2.3,
+            date=date(2024, 1, 15),
+            notes=None,
+            metadata=None,
+            user_id=owner_user_id,
+            session_id=session_id,
+            created_at=datetime(2024, 1, 15, 10, 0, tzinfo=UTC),
+        )
+
+    await use_case.record_saved([make("a"), make("a"), make(None, user_id), make("b")])
+
+    assert percentile_index.record.call_count == 4
+    assert [c.args[0] for c in footprint_cache.invalidate.call_args_list] == [
+        "session:a",
+        f"user:{user_id}",
+        "session:b",
+    ]
@@ -0,0 +1,99 @@
+"""Unit tests for LogFlightUseCase."""
+
+from datetime import date
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from domain.use_cases.calculate_flight import CalculateFlightInput, FlightCalculation
+from domain.use_cases.log_flight import LogFlightUseCase
+
+
+@pytest.fixture
+def mock_calculate_flight():
+    """Create a flight calculation returning a domestic medium-haul flight."""
+    use_case = AsyncMock()
+    use_case.execute.return_value = FlightCalculation(
+        origin_iata="JFK",
+        destination_iata="LAX",
+        distance_km=3983.0,
+        flight_type="flight_domestic_medium",
+        is_domestic=True,
+        haul_type="medium",
+    )
+    return use_case
+
+
+@pytest.fixture
+def mock_log_activity():
+    """Create a log activity use case returning a sentinel activity."""
+    use_case = AsyncMock()
+    use_case.execute.return_value = MagicMock()
+    return use_case
+
+
+@pytest.fixture
+def use_case(mock_calculate_flight, mock_log_activity):
+    """Create LogFlightUseCase with mocked dependencies."""
+    return LogFlightUseCase(
+        calculate_flight=mock_calculate_flight,
+        log_activity=mock_log_activity,
+    )
+
+
+@pytest.mark.asyncio
+async def test_log_flight_uses_computed_type_and_distance(
+    use_case, mock_calculate_flight, mock_log_activity
+):
+    """Test the flight is logged with the computed type, distance and details."""
+    result = await use_case.execute(
+        origin_iata="jfk",
+        destination_iata="lax",
+        activity_date=date(2024, 3, 1),
+        notes="Conference",
+        user_id=None,
+        session_id="session-123",
+        metadata={"origin_city": "New York", "distance_km": 1.0},
+    )
+
+    assert result is mock_log_activity.execute.return_value
+    mock_calculate_flight.execute.assert_called_once_with(
+        CalculateFlightInput(origin_iata="JFK", destination_iata="LAX")
+    )
+    mock_log_activity.execute.assert_called_once_with(
+        category="transport",
+        activity_type="flight_domestic_medium",
+        value=3983.0,
+        activity_date=date(2024, 3, 1),
+        notes="Conference",
+        user_id=None,
+        session_id="session-123",
+        metadata={
+            "origin_city": "New York",
+            "origin_iata": "JFK",
+            "destination_iata": "LAX",
+            "distance_km": 3983.0,
+            "flight_type": "flight_domestic_medium",
+            "is_domestic": True,
+        },
+    )
+
+
+@pytest.mark.asyncio
+async def test_log_flight_unknown_airport_is_not_logged(
+    use_case, mock_calculate_flight, mock_log_activity
+):
+    """Test an unknown airport raises before anything is logged."""
+    mock_calculate_flight.execute.side_effect = ValueError("Airport not found: XXX")
+
+    with pytest.raises(ValueError, match="Airport not found"):
+        await use_case.execute(
+            origin_iata="XXX",
+            destination_iata="LAX",
+            activity_date=date(2024, 3, 1),
+            notes=None,
+            user_id=None,
+            session_id="session-123",
+        )
+
+    mock_log_activity.execute.assert_not_called()
@@ -0,0 +1,326 @@
+"""Unit tests for RecalculateEmissionsUseCase."""
+
+import sys
+from dataclasses import replace
+from datetime import UTC, date, datetime
+from itertools import pairwise
+from pathlib import Path
+from unittest.mock import AsyncMock
+from uuid import UUID
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[4] / "src"))
+
+from domain.entities.activity import Activity
+from domain.entities.emission_factor import EmissionFactor
+from domain.ports.activity_repository import WRITE_OK, OwnedWriteResult
+from domain.ports.recalculation_checkpoint_store import (
+    RecalculationCheckpoint,
+    RecalculationCheckpointStore,
+)
+from domain.services.calculation_service import CalculationService
+from domain.use_cases.recalculate_emissions import (
+    RecalculateEmissionsUseCase,
+    shard_bounds,
+)
+
+
+class DictCheckpointStore(RecalculationCheckpointStore):
+    """Checkpoint store keeping every saved checkpoint in memory."""
+
+    def __init__(self) -> None:
+        self.saved: list[RecalculationCheckpoint] = []
+
+    async def load(self, job_id: str) -> RecalculationCheckpoint | None:
+        matching = [c for c in self.saved if c.job_id == job_id]
+        return matching[-1] if matching else None
+
+    async def save(self, checkpoint: RecalculationCheckpoint) -> None:
+        self.saved.append(checkpoint)
+
+
+def _activity(n: int, activity_type: str, value: float, co2e_kg: float) -> Activity:
+    """Create an activity whose ID sorts by n."""
+    return Activity(
+        id=UUID(int=n),
+        category="transport",
+        type=activity_type,
+        value=value,
+        co2e_kg=co2e_kg,
+        date=date(2024, 1, 15),
+        notes=None,
+        metadata=None,
+        user_id=None,
+        session_id=f"session-{n % 2}",
+        created_at=datetime(2024, 1, 15, 10, 0, tzinfo=UTC),
+    )
+
+
+def _factor(activity_type: str, factor: float, year: int = 2024) -> EmissionFactor:
+    return EmissionFactor(
+        id=1,
+        category="transport",
+        type=activity_type,
+        factor=factor,
+        unit="km",
+        source=f"DEFRA {year}",
+        notes=None,
+        created_at=datetime.now(UTC),
+        source_year=year,
+    )
+
+
+@pytest.fixture
+def activities():
+    """Five trips: petrol trips are stale, the diesel trip is current."""
+    return [
+        _activity(1, "car_petrol", 100.0, 17.10),
+        _activity(2, "car_diesel", 100.0, 15.06),
+        _activity(3, "car_petrol", 50.0, 8.55),
+        _activity(4, "rocket", 1.0, 99.0),
+        _activity(5, "car_petrol", 10.0, 1.71),
+    ]
+
+
+@pytest.fixture
+def mock_activity_repo(activities):
+    """Create a repository paging over the activities in ID order."""
+    repo = AsyncMock()
+
+    async def list_after_id(after_id, limit, activity_types=None, before_id=None):
+        page = [
+            a
+            for a in activities
+            if (after_id is None or a.id > after_id)
+            and (before_id is None or a.id < before_id)
+            and (activity_types is None or a.type in activity_types)
+        ]
+        return page[:limit]
+
+    async def update_co2e_many(changed, co2e_for):
+        # Rows edited since the read are computed from their current values
+        current = [repo.edits.get(a.id, a) for a in changed]
+        results = {}
+        for old, co2e_kg in zip(current, await co2e_for(current), strict=True):
+            new = replace(old, co2e_kg=co2e_kg)
+            results[old.id] = OwnedWriteResult(
+                status=WRITE_OK, activity=new, previous=old
+            )
+            repo.written[old.id] = co2e_kg
+        return results
+
+    repo.list_after_id.side_effect = list_after_id
+    repo.update_co2e_many.side_effect = update_co2e_many
+    repo.edits = {}
+    repo.written = {}
+    return repo
+
+
+@pytest.fixture
+def mock_emission_factor_repo():
+    """Create a factor repository with a revised petrol factor."""
+    repo = AsyncMock()
+    repo.get_all.return_value = [
+        _factor("car_diesel", 0.1506),
+        _factor("car_petrol", 0.2),
+    ]
+    return repo
+
+
+@pytest.fixture
+def checkpoint_store():
+    """Create an in-memory checkpoint store."""
+    return DictCheckpointStore()
+
+
+@pytest.fixture
+def use_case(mock_activity_repo, mock_emission_factor_repo, checkpoint_store):
+    """Create the use case with a batch size of two."""
+    return RecalculateEmissionsUseCase(
+        activity_repo=mock_activity_repo,
+        emission_factor_repo=mock_emission_factor_repo,
+        calculation_service=CalculationService(),
+        checkpoint_store=checkpoint_store,
+        batch_size=2,
+    )
+
+
+@pytest.mark.asyncio
+async def test_recalculate_writes_only_changed_values(
+    use_case, mock_activity_repo, mock_emission_factor_repo
+):
+    """Test stale rows are rewritten, current and factorless rows are not."""
+    checkpoint = await use_case.execute("job-1")
+
+    assert checkpoint.completed is True
+    assert checkpoint.last_id == UUID(int=5)
+    assert (checkpoint.scanned, checkpoint.updated, checkpoint.skipped) == (5, 3, 1)
+
+    assert mock_activity_repo.written == {
+        UUID(int=1): 20.0,
+        UUID(int=3): 10.0,
+        UUID(int=5): 2.0,
+    }
+    # Factors are read once per run
+    mock_emission_factor_repo.get_all.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_recalculate_applies_factor_of_activity_date(
+    use_case, mock_emission_factor_repo, mock_activity_repo, activities
+):
+    """Test each activity is recalculated with the version valid on its date."""
+    mock_emission_factor_repo.get_all.return_value = [
+        _factor("car_petrol", 0.171, year=2023),
+        _factor("car_petrol", 0.2, year=2024),
+    ]
+    activities[0] = replace(activities[0], date=date(2023, 6, 1))
+    activities[2] = replace(activities[2], date=date(2024, 6, 1))
+
+    await use_case.execute("job-1", activity_types=("car_petrol",))
+
+    # 100 km in 2023 already matches the 2023 factor
+    assert mock_activity_repo.written == {UUID(int=3): 10.0, UUID(int=5): 2.0}
+
+
+@pytest.mark.asyncio
+async def test_recalculate_computes_edited_rows_again(
+    use_case, mock_activity_repo, activities
+):
+    """Test rows edited after the read get the CO2e of their current values."""
+    mock_activity_repo.edits = {
+        UUID(int=1): replace(activities[0], value=200.0, co2e_kg=34.2),
+        UUID(int=3): replace(activities[2], type="rocket"),
+    }
+
+    checkpoint = await use_case.execute("job-1")
+
+    # 200 km with the revised factor; the rocket trip keeps its CO2e
+    assert mock_activity_repo.written == {
+        UUID(int=1): 40.0,
+        UUID(int=3): 8.55,
+        UUID(int=5): 2.0,
+    }
+    assert checkpoint.updated == 3
+
+
+@pytest.mark.asyncio
+async def test_recalculate_checkpoints_every_batch(use_case, checkpoint_store):
+    """Test progress is saved after the start and after each batch."""
+    await use_case.execute("job-1")
+
+    assert [c.last_id for c in checkpoint_store.saved] == [
+        None,
+        UUID(int=2),
+        UUID(int=4),
+        UUID(int=5),
+    ]
+    assert [c.completed for c in checkpoint_store.saved] == [
+        False,
+        False,
+        False,
+        True,
+    ]
+
+
+@pytest.mark.asyncio
+async def test_recalculate_resumes_from_checkpoint(use_case, mock_activity_repo):
+    """Test an interrupted job continues after its last processed ID."""
+    first = await use_case.execute("job-1", max_batches=1)
+    assert first.completed is False
+    assert first.last_id == UUID(int=2)
+
+    resumed = await use_case.execute("job-1")
+
+    assert resumed.completed is True
+    assert resumed.scanned == 5
+    after_ids = [c.args[0] for c in mock_activity_repo.list_after_id.call_args_list]
+    assert after_ids == [None, UUID(int=2), UUID(int=4)]
+
+
+@pytest.mark.asyncio
+async def test_recalculate_completed_job_is_not_rerun(use_case, mock_activity_repo):
+    """Test rerunning a finished job reads nothing."""
+    await use_case.execute("job-1")
+    mock_activity_repo.list_after_id.reset_mock()
+
+    checkpoint = await use_case.execute("job-1")
+
+    assert checkpoint.completed is True
+    mock_activity_repo.list_after_id.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_recalculate_resume_with_other_types_raises(use_case):
+    """Test a job cannot be resumed for a different type filter."""
+    await use_case.execute("job-1", activity_types=("car_petrol",), max_batches=1)
+
+    with pytest.raises(ValueError, match="job-1"):
+        await use_case.execute("job-1", activity_types=("car_diesel",))
+
+
+@pytest.mark.asyncio
+async def test_recalculate_filters_types_and_bounds(use_case, mock_activity_repo):
+    """Test the type filter and shard bounds reach the repository."""
+    checkpoint = await use_case.execute(
+        "job-1",
+        activity_types=("car_petrol",),
+        after_id=UUID(int=1),
+        before_id=UUID(int=5),
+    )
+
+    assert checkpoint.scanned == 1
+    assert checkpoint.updated == 1
+    call = mock_activity_repo.list_after_id.call_args_list[0]
+    assert call.args == (UUID(int=1), 2)
+    assert call.kwargs == {"activity_types": ("car_petrol",), "before_id": UUID(int=5)}
+
+
+@pytest.mark.asyncio
+async def test_recalculate_invalidates_footprints_and_percentiles(
+    mock_activity_repo, mock_emission_factor_repo, checkpoint_store
+):
+    """Test each changed owner is invalidated once and deltas are recorded."""
+    footprint_cache = AsyncMock()
+    percentile_index = AsyncMock()
+    percentile_index.record = lambda *args: recorded.append(args)
+    recorded: list[tuple] = []
+    use_case = RecalculateEmissionsUseCase(
+        activity_repo=mock_activity_repo,
+        emission_factor_repo=mock_emission_factor_repo,
+        calculation_service=CalculationService(),
+        checkpoint_store=checkpoint_store,
+        batch_size=10,
+        percentile_index=percentile_index,
+        footprint_cache=footprint_cache,
+    )
+
+    await use_case.execute("job-1")
+
+    invalidated = [c.args[0] for c in footprint_cache.invalidate.call_args_list]
+    assert sorted(invalidated) == ["session:session-1"]
+    assert [round(r[2], 2) for r in recorded] == [2.9, 1.45, 0.29]
+
+
+def test_shard_bounds_cover_the_id_space():
+    """Test shards are contiguous, disjoint and open at both ends."""
+    bounds = [shard_bounds(i, 4) for i in range(4)]
+
+    assert bounds[0][0] is None
+    assert bounds[-1][1] is None
+    for (_, before), (after, _) in pairwise(bounds):
+        # Shard i ends right where shard i+1 starts
+        assert after.int + 1 == before.int
+
+
+def test_shard_bounds_single_shard_is_unbounded():
+    """Test one shard covers everything."""
+    assert shard_bounds(0, 1) == (None, None)
+
+
+@pytest.mark.parametrize("index,count", [(-1, 2), (2, 2), (0, 0)])
+def test_shard_bounds_rejects_invalid_shards(index, count):
+    """Test out-of-range shards are rejected."""
+    with pytest.raises(ValueError):
+        shard_bounds(index, count)
@@ -12,6 +12,13 @@ sys.path.insert(0, str(Path(__file__).resolve().parents[4] / "src"))
 
 from domain.entities.activity import Activity
 from domain.entities.emission_factor import EmissionFactor
+from domain.ports.activity_repository import (
+    WRITE_CATEGORY_MISMATCH,
+    WRITE_FORBIDDEN,
+    WRITE_NOT_FOUND,
+    WRITE_OK,
+    OwnedWriteResult,
+)
 from domain.use_cases.update_activity import UpdateActivityUseCase
 
 
@@ -90,8 +97,7 @@ async def test_update_activity_success(
     bus_factor,
 ):
     """Test successful activity update with CO2e recalculation."""
-    mock_activity_repo.get_by_id.return_value = existing_activity
-    mock_emission_factor_repo.get_by_type.return_value = bus_factor
+    mock_emission_factor_repo.get_by_type_on.return_value = bus_factor
     mock_calculation_service.calculate_co2e.return_value = 6.9
 
     updated_activity = Activity(
@@ -107,7 +113,9 @@ async def test_update_activity_success(
         session_id="test-session-123",
         created_at=existing_activity.created_at,
     )
-    mock_activity_repo.update.return_value = updated_activity
+    mock_activity_repo.update_owned.return_value = OwnedWriteResult(
+        status=WRITE_OK, activity=updated_activity, previous=existing_activity
+    )
 
     result = await use_case.execute(
         activity_id=existing_activity.id,
@@ -123,18 +131,39 @@ async def test_update_activity_success(
     assert result.value == 30.0
     assert result.co2e_kg == 6.9
     assert result.notes == "Updated notes"
-    mock_activity_repo.get_by_id.assert_called_once_with(existing_activity.id)
-    mock_emission_factor_repo.get_by_type.assert_called_once_with("bus")
+    mock_emission_factor_repo.get_by_type_on.assert_called_once_with(
+        "bus", date(2024, 1, 16)
+    )
     mock_calculation_service.calculate_co2e.assert_called_once_with(30.0, bus_factor)
-    mock_activity_repo.update.assert_called_once()
+    mock_activity_repo.update_owned.assert_called_once_with(
+        activity_id=existing_activity.id,
+        user_id=None,
+        session_id="test-session-123",
+        category="transport",
+        activity_type="bus",
+        value=30.0,
+        co2e_kg=6.9,
+        activity_date=date(2024, 1, 16),
+        notes="Updated notes",
+    )
+    # Ownership is checked by the write itself
+    mock_activity_repo.get_by_id.assert_not_called()
+    mock_activity_repo.update.assert_not_called()
 
 
 @pytest.mark.asyncio
 async def test_update_activity_not_found(
-    use_case, mock_activity_repo, existing_activity
+    use_case,
+    mock_activity_repo,
+    mock_emission_factor_repo,
+    existing_activity,
+    bus_factor,
 ):
     """Test update raises ValueError when activity not found."""
-    mock_activity_repo.get_by_id.return_value = None
+    mock_emission_factor_repo.get_by_type_on.return_value = bus_factor
+    mock_activity_repo.update_owned.return_value = OwnedWriteResult(
+        status=WRITE_NOT_FOUND
+    )
 
     with pytest.raises(ValueError, match="Activity not found"):
         await use_case.execute(
@@ -150,10 +179,17 @@ async def test_update_activity_not_found(
 
 @pytest.mark.asyncio
 async def test_update_activity_unauthorized_session(
-    use_case, mock_activity_repo, existing_activity
+    use_case,
+    mock_activity_repo,
+    mock_emission_factor_repo,
+    existing_activity,
+    bus_factor,
 ):
     """Test update raises PermissionError for different session."""
-    mock_activity_repo.get_by_id.return_value = existing_activity
+    mock_emission_factor_repo.get_by_type_on.return_value = bus_factor
+    mock_activity_repo.update_owned.return_value = OwnedWriteResult(
+        status=WRITE_FORBIDDEN
+    )
 
     with pytest.raises(PermissionError, match="Not authorized to update"):
         await use_case.execute(
@@ -166,27 +202,25 @@ async def test_update_activity_unauthorized_session(
             notes="Updated notes",
         )
 
+    call = mock_activity_repo.update_owned.call_args.kwargs
+    assert call["user_id"] is None
+    assert call["session_id"] == "different-session"
+
 
 @pytest.mark.asyncio
 async def test_update_activity_unauthorized_user(
-    use_case, mock_activity_repo, existing_activity
+    use_case,
+    mock_activity_repo,
+    mock_emission_factor_repo,
+    existing_activity,
+    bus_factor,
 ):
     """Test update raises PermissionError for different user."""
     user_id = uuid4()
-    activity_with_user = Activity(
-        id=existing_activity.id,
-        category=existing_activity.category,
-        type=existing_activity.type,
-        value=existing_activity.value,
-        co2e_kg=existing_activity.co2e_kg,
-        date=existing_activity.date,
-        notes=existing_activity.notes,
-        metadata=existing_activity.metadata,
-        user_id=uuid4(),  # Different user
-        session_id=None,
-        created_at=existing_activity.created_at,
+    mock_emission_factor_repo.get_by_type_on.return_value = bus_factor
+    mock_activity_repo.update_owned.return_value = OwnedWriteResult(
+        status=WRITE_FORBIDDEN
     )
-    mock_activity_repo.get_by_id.return_value = activity_with_user
 
     with pytest.raises(PermissionError, match="Not authorized to update"):
         await use_case.execute(
@@ -199,14 +233,15 @@ async def test_update_activity_unauthorized_user(
             notes="Updated notes",
         )
 
+    assert mock_activity_repo.update_owned.call_args.kwargs["user_id"] == user_id
+
 
 @pytest.mark.asyncio
 async def test_update_activity_unknown_type(
     use_case, mock_activity_repo, mock_emission_factor_repo, existing_activity
 ):
     """Test update raises ValueError for unknown activity type."""
-    mock_activity_repo.get_by_id.return_value = existing_activity
-    mock_emission_factor_repo.get_by_type.return_value = None
+    mock_emission_factor_repo.get_by_type_on.return_value = None
 
     with pytest.raises(ValueError, match="Unknown activity type"):
         await use_case.execute(
@@ -219,6 +254,8 @@ async def test_update_activity_unknown_type(
             notes="Updated notes",
         )
 
+    mock_activity_repo.update_owned.assert_not_called()
+
 
 @pytest.mark.asyncio
 async def test_update_activity_wrong_category(
@@ -228,8 +265,6 @@ async def test_update_activity_wrong_category(
     existing_activity,
 ):
     """Test update raises ValueError when changing category."""
-    mock_activity_repo.get_by_id.return_value = existing_activity
-
     # Energy type doesn't match transport category
     energy_factor = EmissionFactor(
         id=3,
@@ -241,9 +276,12 @@ async def test_update_activity_wrong_category(
         notes=None,
         created_at=datetime.now(timezone.utc),
     )
-    mock_emission_factor_repo.get_by_type.return_value = energy_factor
+    mock_emission_factor_repo.get_by_type_on.return_value = energy_factor
+    mock_activity_repo.update_owned.return_value = OwnedWriteResult(
+        status=WRITE_CATEGORY_MISMATCH, previous=existing_activity
+    )
 
-    with pytest.raises(ValueError, match="does not belong to category"):
+    with pytest.raises(ValueError, match="does not belong to category 'transport'"):
         await use_case.execute(
             activity_id=existing_activity.id,
             user_id=None,
@@ -254,6 +292,8 @@ async def test_update_activity_wrong_category(
             notes="Updated notes",
         )
 
+    assert mock_activity_repo.update_owned.call_args.kwargs["category"] == "energy"
+
 
 @pytest.mark.asyncio
 async def test_update_preserves_metadata(
@@ -263,7 +303,7 @@ async def test_update_preserves_metadata(
     mock_calculation_service,
     bus_factor,
 ):
-    """Test that update preserves original metadata."""
+    """Test that update does not overwrite original metadata."""
     activity_with_metadata = Activity(
         id=uuid4(),
         category="transport",
@@ -278,8 +318,7 @@ async def test_update_preserves_metadata(
         created_at=datetime(2024, 1, 15, 10, 0, tzinfo=timezone.utc),
     )
 
-    mock_activity_repo.get_by_id.return_value = activity_with_metadata
-    mock_emission_factor_repo.get_by_type.return_value = bus_factor
+    mock_emission_factor_repo.get_by_type_on.return_value = bus_factor
 
     updated = Activity(
         id=activity_with_metadata.id,
@@ -294,9 +333,11 @@ async def test_update_preserves_metadata(
         session_id="test-session-123",
         created_at=activity_with_metadata.created_at,
     )
-    mock_activity_repo.update.return_value = updated
+    mock_activity_repo.update_owned.return_value = OwnedWriteResult(
+        status=WRITE_OK, activity=updated, previous=activity_with_metadata
+    )
 
-    await use_case.execute(
+    result = await use_case.execute(
         activity_id=activity_with_metadata.id,
         user_id=None,
         session_id="test-session-123",
@@ -306,6 +347,60 @@ async def test_update_preserves_metadata(
         notes="Updated notes",
     )
 
-    # Verify metadata was preserved in the update call
-    update_call_args = mock_activity_repo.update.call_args[0][0]
-    assert update_call_args.metadata == {"origin": "JFK", "destination": "LAX"}
+    # Metadata is not part of the update, so the stored value is kept
+    assert "metadata" not in mock_activity_repo.update_owned.call_args.kwargs
+    assert result.metadata == {"origin": "JFK", "destination": "LAX"}
+
+
+@pytest.mark.asyncio
+async def test_update_activity_records_percentile_deltas(
+    mock_activity_repo,
+    mock_emission_factor_repo,
+    mock_calculation_service,
+    existing_activity,
+    bus_factor,
+):
+    """Test the old CO2e is replaced by the new one in the percentile index."""
+    percentile_index = MagicMock()
+    footprint_cache = AsyncMock()
+    use_case = UpdateActivityUseCase(
+        activity_repo=mock_activity_repo,
+        emission_factor_repo=mock_emission_factor_repo,
+        calculation_service=mock_calculation_service,
+        percentile_index=percentile_index,
+        footprint_cache=footprint_cache,
+    )
+    mock_emission_factor_repo.get_by_type_on.return_value = bus_factor
+    updated = Activity(
+        id=existing_activity.id,
+        category="transport",
+        type="bus",
+        value=30.0,
+        co2e_kg=6.9,
+        date=date(2024, 1, 16),
+        notes=None,
+        metadata=None,
+        user_id=None,
+        session_id="test-session-123",
+        created_at=existing_activity.created_at,
+    )
+    mock_activity_repo.update_owned.return_value = OwnedWriteResult(
+        status=WRITE_OK, activity=updated, previous=existing_activity
+    )
+
+    await use_case.execute(
+        activity_id=existing_activity.id,
+        user_id=None,
+        session_id="test-session-123",
+        activity_type="bus",
+        value=30.0,
+        activity_date=date(2024, 1, 16),
+        notes=None,
+    )
+
+    owner = "session:test-session-123"
+    assert [c.args for c in percentile_index.record.call_args_list] == [
+        (owner, "transport", -5.75, date(2024, 1, 15)),
+        (owner, "transport", 6.9, date(2024, 1, 16)),
+    ]
+    footprint_cache.invalidate.assert_called_once_with(owner)
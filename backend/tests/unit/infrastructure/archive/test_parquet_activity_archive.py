@@ -0,0 +1,135 @@
+"""Unit tests for ParquetActivityArchive on a local directory."""
+
+from datetime import UTC, date, datetime
+from uuid import UUID, uuid4
+
+import pytest
+
+pq = pytest.importorskip("pyarrow.parquet")
+
+from domain.entities.activity import Activity
+from infrastructure.archive import parquet_activity_archive
+from infrastructure.archive.parquet_activity_archive import (
+    ParquetActivityArchive,
+    _to_entity,
+    owner_directory,
+)
+
+USER_ID = UUID("11111111-1111-1111-1111-111111111111")
+CREATED_AT = datetime(2022, 6, 1, 12, 30, tzinfo=UTC)
+
+
+def _activity(
+    activity_date: date = date(2022, 1, 15),
+    user_id: UUID | None = None,
+    session_id: str | None = "session/1",
+    metadata: dict | None = None,
+) -> Activity:
+    """Create an activity entity."""
+    return Activity(
+        id=uuid4(),
+        category="transport",
+        type="car_petrol",
+        value=12.5,
+        co2e_kg=2.14,
+        date=activity_date,
+        notes="commute",
+        metadata=metadata,
+        user_id=user_id,
+        session_id=session_id,
+        created_at=CREATED_AT,
+    )
+
+
+@pytest.fixture
+def archive(tmp_path) -> ParquetActivityArchive:
+    """Archive in a temporary directory."""
+    return ParquetActivityArchive(str(tmp_path))
+
+
+@pytest.mark.asyncio
+async def test_round_trip_per_owner(archive, tmp_path):
+    """Test activities come back unchanged, each from its owner's files."""
+    mine = _activity(metadata={"origin": "LHR", "passengers": 2})
+    theirs = _activity(user_id=USER_ID, session_id=None)
+
+    assert await archive.write([mine, theirs], "batch-1") == 2
+
+    assert await archive.list_owned_after_id(None, "session/1", None, 10) == [mine]
+    assert await archive.list_owned_after_id(USER_ID, None, None, 10) == [theirs]
+    assert await archive.list_owned_after_id(None, "unknown", None, 10) == []
+    files = sorted(p.relative_to(tmp_path).as_posix() for p in tmp_path.rglob("*"))
+    assert f"{owner_directory(USER_ID, None)}/batch-1.parquet" in files
+    assert not any(name.endswith(".tmp") for name in files)
+
+
+@pytest.mark.asyncio
+async def test_date_range_across_batches(archive):
+    """Test ranges read every batch, in date order, without duplicates."""
+    january, march = _activity(date(2022, 1, 10)), _activity(date(2022, 3, 1))
+    await archive.write([march, january], "batch-1")
+    # A rerun after an interrupted commit archives a row again
+    await archive.write([_activity(date(2022, 5, 1)), january], "batch-2")
+
+    in_range = await archive.list_by_date_range(
+        None, "session/1", date(2022, 1, 1), date(2022, 3, 31)
+    )
+
+    assert [a.id for a in in_range] == [january.id, march.id]
+
+
+@pytest.mark.asyncio
+async def test_owned_pages_in_id_order(archive):
+    """Test keyset pages over the archive."""
+    activities = [_activity() for _ in range(5)]
+    await archive.write(activities, "batch-1")
+    ids = sorted((a.id for a in activities), key=lambda i: i.int)
+
+    first = await archive.list_owned_after_id(None, "session/1", None, 2)
+    rest = await archive.list_owned_after_id(None, "session/1", ids[1], 10)
+
+    assert [a.id for a in first] == ids[:2]
+    assert [a.id for a in rest] == ids[2:]
+
+
+@pytest.mark.asyncio
+async def test_owned_pages_read_only_past_the_cursor(archive, tmp_path, monkeypatch):
+    """Test pages merge batches and convert at most `limit` rows per file."""
+    activities = [_activity() for _ in range(12)]
+    await archive.write(activities[:6], "batch-1")
+    await archive.write([*activities[6:], activities[0]], "batch-2")
+    ids = sorted((a.id for a in activities), key=lambda i: i.int)
+    converted = []
+    monkeypatch.setattr(
+        parquet_activity_archive,
+        "_to_entity",
+        lambda record: converted.append(record) or _to_entity(record),
+    )
+
+    pages, conversions, after_id = [], [], None
+    while page := await archive.list_owned_after_id(None, "session/1", after_id, 5):
+        pages.append([a.id for a in page])
+        conversions.append(len(converted))
+        converted.clear()
+        after_id = page[-1].id
+
+    assert pages == [ids[:5], ids[5:10], ids[10:]]
+    # Two files, so at most twice the page size per page
+    assert max(conversions) <= 10
+    stored = pq.read_table(
+        tmp_path / owner_directory(None, "session/1") / "batch-2.parquet"
+    )
+    assert stored["id"].to_pylist() == sorted(stored["id"].to_pylist())
+
+
+@pytest.mark.asyncio
+async def test_migrate_session_to_user(archive):
+    """Test a session's archive moves to the user once."""
+    await archive.write([_activity(), _activity()], "batch-1")
+
+    assert await archive.migrate_session_to_user(USER_ID, "session/1") == 2
+    assert await archive.migrate_session_to_user(USER_ID, "session/1") == 0
+
+    migrated = await archive.list_owned_after_id(USER_ID, None, None, 10)
+    assert [a.user_id for a in migrated] == [USER_ID, USER_ID]
+    assert await archive.list_owned_after_id(None, "session/1", None, 10) == []
@@ -0,0 +1,138 @@
+"""Fixtures for cache backend tests."""
+
+import asyncio
+import time
+
+import pytest_asyncio
+
+from infrastructure.cache.redis_cache_backend import RedisCacheBackend
+
+
+class FakeRedisServer:
+    """Minimal in-process server speaking the Redis protocol (RESP2).
+
+    Supports the commands used by RedisCacheBackend plus the handshake
+    commands sent by redis-py, so the real client can be exercised
+    without a Redis installation.
+    """
+
+    def __init__(self) -> None:
+        self.data: dict[bytes, tuple[bytes, float | None]] = {}
+        self.commands: list[list[bytes]] = []
+        self._server: asyncio.AbstractServer | None = None
+
+    @property
+    def url(self) -> str:
+        """Redis URL of the running server."""
+        assert self._server is not None
+        host, port = self._server.sockets[0].getsockname()[:2]
+        return f"redis://{host}:{port}/0"
+
+    async def start(self) -> None:
+        """Listen on a free local port."""
+        self._server = await asyncio.start_server(self._serve, "127.0.0.1", 0)
+
+    async def stop(self) -> None:
+        """Stop listening and close the server."""
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+
+    async def _serve(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        """Answer commands on one client connection."""
+        try:
+            while True:
+                command = await self._read_command(reader)
+                if command is None:
+                    break
+                self.commands.append(command)
+                writer.write(self._execute(command))
+                await writer.drain()
+        finally:
+            writer.close()
+
+    @staticmethod
+    async def _read_command(reader: asyncio.StreamReader) -> list[bytes] | None:
+        """Read one RESP array of bulk strings."""
+        header = await reader.readline()
+        if not header:
+            return None
+        assert header.startswith(b"*"), header
+        args = []
+        for _ in range(int(header[1:])):
+            length = int((await reader.readline())[1:])
+            args.append((await reader.readexactly(length + 2))[:-2])
+        return args
+
+    def _execute(self, command: list[bytes]) -> bytes:
+        """Run a command and encode its reply."""
+        name, args = command[0].upper(), command[1:]
+        if name == b"PING":
+            return b"+PONG\r\n"
+        if name in (b"CLIENT", b"SELECT"):
+            return b"+OK\r\n"
+        if name == b"GET":
+            value = self._lookup(args[0])
+            return _bulk(value)
+        if name == b"SET":
+            ttl = None
+            options = [a.upper() for a in args[2:]]
+            if b"EX" in options:
+                ttl = float(args[2 + options.index(b"EX") + 1])
+            if b"PX" in options:
+                ttl = float(args[2 + options.index(b"PX") + 1]) / 1000
+            expires_at = time.monotonic() + ttl if ttl is not None else None
+            if b"NX" in options and self._lookup(args[0]) is not None:
+                return b"$-1\r\n"
+            self.data[args[0]] = (args[1], expires_at)
+            return b"+OK\r\n"
+        if name == b"DEL":
+            removed = sum(1 for key in args if self.data.pop(key, None) is not None)
+            return b":%d\r\n" % removed
+        if name in (b"INCR", b"INCRBY"):
+            current = self._lookup(args[0])
+            amount = int(args[1]) if name == b"INCRBY" else 1
+            try:
+                value = int(current or b"0") + amount
+            except ValueError:
+                return b"-ERR value is not an integer or out of range\r\n"
+            self.data[args[0]] = (str(value).encode(), None)
+            return b":%d\r\n" % value
+        return b"-ERR unknown command '%s'\r\n" % name
+
+    def _lookup(self, key: bytes) -> bytes | None:
+        """Get a live value, dropping it if expired."""
+        entry = self.data.get(key)
+        if entry is None:
+            return None
+        value, expires_at = entry
+        if expires_at is not None and expires_at <= time.monotonic():
+            del self.data[key]
+            return None
+        return value
+
+
+def _bulk(value: bytes | None) -> bytes:
+    """Encode a RESP bulk string reply."""
+    if value is None:
+        return b"$-1\r\n"
+    return b"$%d\r\n%s\r\n" % (len(value), value)
+
+
+@pytest_asyncio.fixture
+async def redis_server():
+    """Start a fake Redis server for the duration of a test."""
+    server = FakeRedisServer()
+    await server.start()
+    yield server
+    await server.stop()
+
+
+@pytest_asyncio.fixture
+async def redis_backend(redis_server):
+    """RedisCacheBackend connected to the fake server."""
+    backend = RedisCacheBackend.from_url(redis_server.url)
+    yield backend
+    await backend.close()
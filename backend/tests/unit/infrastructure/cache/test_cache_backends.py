@@ -0,0 +1,135 @@
+"""Unit tests for CacheBackend implementations."""
+
+import pytest
+import pytest_asyncio
+
+from infrastructure.cache.in_memory_cache_backend import InMemoryCacheBackend
+from infrastructure.cache.redis_cache_backend import RedisCacheBackend
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest_asyncio.fixture(params=["memory", "redis"])
+async def backend(request, redis_server):
+    """Each backend implementation, exercised through the same tests."""
+    if request.param == "memory":
+        yield InMemoryCacheBackend(max_entries=10)
+        return
+
+    redis_backend = RedisCacheBackend.from_url(redis_server.url)
+    yield redis_backend
+    await redis_backend.close()
+
+
+@pytest.mark.asyncio
+async def test_set_and_get_round_trip(backend):
+    """Stored bytes are returned unchanged."""
+    await backend.set("key", b"\x00value\xff", ttl_seconds=60)
+
+    assert await backend.get("key") == b"\x00value\xff"
+
+
+@pytest.mark.asyncio
+async def test_get_missing_returns_none(backend):
+    """Unknown keys return None."""
+    assert await backend.get("missing") is None
+
+
+@pytest.mark.asyncio
+async def test_delete_removes_value(backend):
+    """Deleted keys are no longer returned."""
+    await backend.set("key", b"value")
+    await backend.delete("key")
+    await backend.delete("never-set")
+
+    assert await backend.get("key") is None
+
+
+@pytest.mark.asyncio
+async def test_incr_counts_from_zero(backend):
+    """Counters start at 1 and are readable with get()."""
+    assert await backend.incr("counter") == 1
+    assert await backend.incr("counter") == 2
+    assert await backend.get("counter") == b"2"
+
+
+@pytest.mark.asyncio
+async def test_set_if_absent_keeps_existing_value(backend):
+    """Only a missing key is written; the held value is returned."""
+    assert await backend.set_if_absent("key", b"first", ttl_seconds=60) == b"first"
+    assert await backend.set_if_absent("key", b"second", ttl_seconds=60) == b"first"
+    await backend.incr("counter")
+    assert await backend.set_if_absent("counter", b"9") == b"1"
+
+    assert await backend.get("key") == b"first"
+
+
+@pytest.mark.asyncio
+async def test_redis_backend_prefixes_keys(redis_server, redis_backend):
+    """Keys are namespaced on the shared server."""
+    await redis_backend.set("key", b"value")
+
+    assert b"carbon:key" in redis_server.data
+
+
+@pytest.mark.asyncio
+async def test_redis_backend_sends_expiry(redis_server, redis_backend):
+    """TTLs are passed to the server."""
+    await redis_backend.set("key", b"value", ttl_seconds=30)
+
+    set_command = next(c for c in redis_server.commands if c[0].upper() == b"SET")
+    assert [a.upper() for a in set_command[3:]] == [b"EX", b"30"]
+
+
+@pytest.mark.asyncio
+async def test_memory_backend_expires_values():
+    """Values are not returned after their TTL."""
+    clock = FakeClock()
+    backend = InMemoryCacheBackend(max_entries=10, clock=clock)
+    await backend.set("short", b"1", ttl_seconds=10)
+    await backend.set("forever", b"2")
+
+    clock.now += 11
+
+    assert await backend.get("short") is None
+    assert await backend.get("forever") == b"2"
+
+
+@pytest.mark.asyncio
+async def test_memory_backend_evicts_least_recently_used():
+    """Values beyond max_entries are evicted in LRU order."""
+    backend = InMemoryCacheBackend(max_entries=2)
+    await backend.set("a", b"1")
+    await backend.set("b", b"2")
+    await backend.get("a")
+    await backend.set("c", b"3")
+
+    assert await backend.get("b") is None
+    assert await backend.get("a") == b"1"
+    assert backend.usage().evictions == 1
+    assert backend.usage().entries == 2
+
+
+@pytest.mark.asyncio
+async def test_memory_backend_never_evicts_counters():
+    """Counters survive LRU pressure."""
+    backend = InMemoryCacheBackend(max_entries=1)
+    await backend.incr("seq")
+    await backend.set("a", b"1")
+    await backend.set("b", b"2")
+
+    assert await backend.incr("seq") == 2
+
+
+def test_memory_backend_rejects_invalid_bound():
+    """Non-positive bounds are rejected."""
+    with pytest.raises(ValueError):
+        InMemoryCacheBackend(max_entries=0)
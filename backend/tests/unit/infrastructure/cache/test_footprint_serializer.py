@@ -0,0 +1,88 @@
+"""Unit tests for footprint result serialization."""
+
+from datetime import date
+
+import pytest
+
+from domain.use_cases.compare_to_region import OwnerPeriodTotals
+from domain.use_cases.get_footprint_breakdown import (
+    CategoryBreakdownItem,
+    FootprintBreakdown,
+)
+from domain.use_cases.get_footprint_summary import FootprintSummary
+from domain.use_cases.get_footprint_trend import FootprintTrend, TrendDataPoint
+from infrastructure.cache import footprint_serializer
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        FootprintSummary(
+            period="month",
+            start_date=date(2026, 1, 1),
+            end_date=date(2026, 1, 31),
+            total_co2e_kg=123.456789,
+            activity_count=7,
+            previous_period_co2e_kg=0.1,
+            change_percentage=-12.5,
+            average_daily_co2e_kg=3.98,
+        ),
+        FootprintBreakdown(
+            period="year",
+            breakdown=[
+                CategoryBreakdownItem(
+                    category="transport",
+                    co2e_kg=80.0,
+                    percentage=80.0,
+                    activity_count=3,
+                ),
+                CategoryBreakdownItem(
+                    category="food", co2e_kg=20.0, percentage=20.0, activity_count=1
+                ),
+            ],
+            total_co2e_kg=100.0,
+        ),
+        FootprintTrend(
+            period="week",
+            granularity="daily",
+            data_points=[
+                TrendDataPoint(date=date(2026, 1, 5), co2e_kg=1.5, activity_count=1)
+            ],
+            total_co2e_kg=1.5,
+            average_co2e_kg=1.5,
+        ),
+        OwnerPeriodTotals(
+            total_co2e_kg=12.5,
+            by_category={"transport": 10.0, "food": 2.5},
+            activity_count=3,
+        ),
+    ],
+    ids=["summary", "breakdown", "trend", "comparison"],
+)
+def test_round_trip(value):
+    """Footprint results survive serialization unchanged."""
+    restored = footprint_serializer.loads(footprint_serializer.dumps(value))
+
+    assert restored == value
+    assert type(restored) is type(value)
+
+
+def test_dumps_rejects_unregistered_types():
+    """Arbitrary objects are not serialized."""
+    with pytest.raises(TypeError):
+        footprint_serializer.dumps(object())
+
+
+@pytest.mark.parametrize(
+    "payload",
+    [
+        b'{"__type__":"Popen","fields":{}}',
+        b'{"__type__":"FootprintSummary","fields":{"period":"month"}}',
+        b'{"__type__":"date"}',
+    ],
+    ids=["unknown-type", "missing-fields", "missing-value"],
+)
+def test_loads_rejects_invalid_payloads(payload):
+    """Malformed or foreign payloads raise ValueError."""
+    with pytest.raises(ValueError):
+        footprint_serializer.loads(payload)
@@ -0,0 +1,124 @@
+"""Unit tests for VersionedFootprintCache."""
+
+import pytest
+
+from infrastructure.cache.in_memory_cache_backend import InMemoryCacheBackend
+from infrastructure.cache.versioned_footprint_cache import VersionedFootprintCache
+
+OWNER = "session:test-session"
+
+
+@pytest.mark.asyncio
+async def test_get_or_compute_caches_result():
+    """Second lookup is served from the cache without recomputing."""
+    cache = VersionedFootprintCache(InMemoryCacheBackend())
+    calls = []
+
+    async def compute():
+        calls.append(1)
+        return {"total": 12.5}
+
+    first = await cache.get_or_compute(OWNER, "summary:month", compute)
+    second = await cache.get_or_compute(OWNER, "summary:month", compute)
+
+    assert first == second == {"total": 12.5}
+    assert len(calls) == 1
+    stats = cache.stats()
+    # The result and the owner version it was seeded with
+    assert (stats.hits, stats.misses, stats.entries) == (1, 1, 2)
+    assert stats.hit_ratio == 0.5
+
+
+@pytest.mark.asyncio
+async def test_invalidate_hides_stale_entries():
+    """Entries computed before a write are never served after it."""
+    cache = VersionedFootprintCache(InMemoryCacheBackend())
+    version = await cache.version(OWNER)
+    await cache.set(OWNER, version, "summary:month", "old")
+
+    await cache.invalidate(OWNER)
+
+    new_version = await cache.version(OWNER)
+    assert new_version != version
+    assert await cache.get(OWNER, new_version, "summary:month") is None
+
+
+@pytest.mark.asyncio
+async def test_invalidate_is_scoped_to_owner():
+    """A write by one owner leaves other owners' entries intact."""
+    cache = VersionedFootprintCache(InMemoryCacheBackend())
+    other = "session:other"
+    await cache.invalidate(other)
+    await cache.set(other, await cache.version(other), "summary:month", "kept")
+
+    await cache.invalidate(OWNER)
+
+    assert await cache.get(other, await cache.version(other), "summary:month") == "kept"
+
+
+@pytest.mark.asyncio
+async def test_lost_owner_version_never_reuses_old_entries():
+    """Losing an owner's version key must not resurrect older entries."""
+    backend = InMemoryCacheBackend()
+    cache = VersionedFootprintCache(backend)
+    stale_version = await cache.version(OWNER)
+    await cache.set(OWNER, stale_version, "summary:month", "stale")
+    await cache.invalidate(OWNER)
+
+    await backend.delete(f"footprint:v1:version:{OWNER}")
+
+    assert await cache.get(OWNER, await cache.version(OWNER), "summary:month") is None
+
+
+@pytest.mark.asyncio
+async def test_lost_owner_version_ignores_other_owners_writes(redis_backend):
+    """A re-seeded owner version does not move with other owners' writes."""
+    cache = VersionedFootprintCache(redis_backend)
+    await cache.invalidate(OWNER)
+    await redis_backend.delete(f"footprint:v1:version:{OWNER}")
+
+    version = await cache.version(OWNER)
+    await cache.set(OWNER, version, "summary:month", "kept")
+    await cache.invalidate("session:other")
+
+    assert await cache.version(OWNER) == version
+    assert await cache.get(OWNER, version, "summary:month") == "kept"
+
+
+@pytest.mark.asyncio
+async def test_workers_sharing_a_backend_see_invalidations(redis_backend):
+    """An invalidation by one worker hides entries cached by another."""
+    worker_a = VersionedFootprintCache(redis_backend)
+    worker_b = VersionedFootprintCache(redis_backend)
+
+    async def compute():
+        return {"total": 1.0}
+
+    await worker_a.get_or_compute(OWNER, "summary:month", compute)
+    assert await worker_b.get(OWNER, await worker_b.version(OWNER), "summary:month")
+
+    await worker_b.invalidate(OWNER)
+
+    assert (
+        await worker_a.get(OWNER, await worker_a.version(OWNER), "summary:month")
+        is None
+    )
+
+
+@pytest.mark.asyncio
+async def test_undecodable_entry_is_a_miss():
+    """Entries written in another format are dropped instead of served."""
+    backend = InMemoryCacheBackend()
+    cache = VersionedFootprintCache(backend)
+    key = f"footprint:v1:entry:{OWNER}:0:summary:month"
+    await backend.set(key, b'{"__type__":"Unknown","fields":{}}')
+
+    assert await cache.get(OWNER, 0, "summary:month") is None
+    assert await backend.get(key) is None
+    assert cache.stats().misses == 1
+
+
+def test_invalid_ttl_raises():
+    """Non-positive TTLs are rejected."""
+    with pytest.raises(ValueError):
+        VersionedFootprintCache(InMemoryCacheBackend(), ttl_seconds=0)
@@ -0,0 +1,115 @@
+"""Unit tests for the shared Supabase HTTP connection pool."""
+
+import httpx
+import pytest
+from supabase import create_client
+
+from infrastructure.config import supabase
+from infrastructure.config.settings import Settings
+
+
+@pytest.fixture(autouse=True)
+def fresh_pool():
+    """Start and end each test without a shared pool."""
+    supabase.close_supabase_http_client()
+    yield
+    supabase.close_supabase_http_client()
+
+
+def test_http_client_is_tuned_from_settings() -> None:
+    """Limits, keep-alive and timeouts come from settings."""
+    settings = Settings(  # type: ignore[call-arg]
+        supabase_max_connections=7,
+        supabase_max_keepalive_connections=3,
+        supabase_timeout_seconds=4.0,
+        supabase_connect_timeout_seconds=1.5,
+    )
+
+    client = supabase.create_http_client(settings)
+
+    pool = client._transport._pool  # type: ignore[attr-defined]
+    assert pool._http2
+    assert (pool._max_connections, pool._max_keepalive_connections) == (7, 3)
+    assert client.timeout == httpx.Timeout(4.0, connect=1.5)
+    client.close()
+
+
+def test_clients_share_the_pool() -> None:
+    """Data and auth calls of the Supabase client use the shared pool."""
+    client = supabase.get_supabase_client()
+    transport = supabase.get_supabase_transport()
+
+    assert client.postgrest.session._transport is transport
+    assert client.auth._http_client._transport is transport
+
+
+def test_clients_send_to_their_own_url(monkeypatch) -> None:
+    """Building a client does not redirect the requests of another one."""
+    hosts: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        hosts.append(request.url.host)
+        return httpx.Response(200, json=[])
+
+    transport = httpx.MockTransport(handler)
+    monkeypatch.setattr(supabase, "get_supabase_transport", lambda: transport)
+    key = "test-publishable-key"
+    primary = create_client(
+        "https://primary.supabase.co", key, supabase.supabase_client_options()
+    )
+    primary.table("activities").select("*").execute()
+    replica = create_client(
+        "https://replica.supabase.co", key, supabase.supabase_client_options()
+    )
+    replica.table("activities").select("*").execute()
+    primary.table("activities").select("*").execute()
+    primary.rpc("update_activity_co2e", {}).execute()
+
+    assert primary.postgrest.session is not replica.postgrest.session
+    assert hosts == [
+        "primary.supabase.co",
+        "replica.supabase.co",
+        "primary.supabase.co",
+        "primary.supabase.co",
+    ]
+
+
+def test_close_releases_pool_and_client() -> None:
+    """Closing drops the pool; the next client opens a new one."""
+    first = supabase.get_supabase_client()
+    transport = supabase.get_supabase_transport()
+
+    supabase.close_supabase_http_client()
+
+    assert transport._pool.connections == []  # type: ignore[attr-defined]
+    assert supabase.get_supabase_client() is not first
+    assert supabase.get_supabase_transport() is not transport
+
+
+@pytest.mark.asyncio
+async def test_warmup_opens_connections(monkeypatch) -> None:
+    """Warmup pings the auth health endpoint once per connection."""
+    paths: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        paths.append(request.url.path)
+        return httpx.Response(200, json={})
+
+    http_client = httpx.Client(transport=httpx.MockTransport(handler))
+    monkeypatch.setattr(supabase, "get_supabase_http_client", lambda: http_client)
+
+    assert await supabase.warm_up_supabase_http_client() == 2
+    assert paths == ["/auth/v1/health"] * 2
+
+
+@pytest.mark.asyncio
+async def test_warmup_failure_does_not_raise(monkeypatch) -> None:
+    """An unreachable Supabase is logged, not fatal to startup."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        raise httpx.ConnectError("unreachable", request=request)
+
+    http_client = httpx.Client(transport=httpx.MockTransport(handler))
+    monkeypatch.setattr(supabase, "get_supabase_http_client", lambda: http_client)
+
+    assert await supabase.warm_up_supabase_http_client() == 0
@@ -0,0 +1,254 @@
+"""Unit tests for BatchingActivityQueue."""
+
+import asyncio
+from datetime import UTC, date, datetime
+from uuid import uuid4
+
+import pytest
+
+from domain.entities.activity import Activity
+from domain.ports.activity_ingestion_queue import IngestionQueueFullError
+from infrastructure.ingestion.batching_activity_queue import BatchingActivityQueue
+
+
+def _activity() -> Activity:
+    return Activity(
+        id=uuid4(),
+        category="transport",
+        type="car_petrol",
+        value=10.0,
+        co2e_kg=2.3,
+        date=date(2024, 1, 15),
+        notes=None,
+        metadata=None,
+        user_id=None,
+        session_id="test-session-123",
+        created_at=datetime(2024, 1, 15, 10, 0, tzinfo=UTC),
+    )
+
+
+class RecordingSink:
+    """Flush target that records batches and can be blocked or failed."""
+
+    def __init__(self) -> None:
+        self.batches: list[list[Activity]] = []
+        self.gate = asyncio.Event()
+        self.gate.set()
+        self.fail = False
+
+    async def __call__(self, batch: list[Activity]) -> None:
+        await self.gate.wait()
+        if self.fail:
+            raise RuntimeError("database unavailable")
+        self.batches.append(batch)
+
+
+@pytest.mark.asyncio
+async def test_full_batch_is_flushed_without_waiting_for_interval() -> None:
+    """Reaching max_batch_size writes immediately."""
+    sink = RecordingSink()
+    queue = BatchingActivityQueue(sink, max_batch_size=3, flush_interval_seconds=60)
+
+    activities = [_activity() for _ in range(3)]
+    for activity in activities:
+        await queue.submit(activity)
+    await asyncio.wait_for(queue._queue.join(), timeout=1)
+
+    assert sink.batches == [activities]
+    await queue.close()
+
+
+@pytest.mark.asyncio
+async def test_partial_batch_is_flushed_after_interval() -> None:
+    """A batch below max size is written once the interval elapses."""
+    sink = RecordingSink()
+    queue = BatchingActivityQueue(sink, max_batch_size=100, flush_interval_seconds=0.01)
+
+    await queue.submit(_activity())
+    await queue.submit(_activity())
+    await asyncio.wait_for(queue._queue.join(), timeout=1)
+
+    assert [len(b) for b in sink.batches] == [2]
+    await queue.close()
+
+
+@pytest.mark.asyncio
+async def test_full_queue_rejects_submissions() -> None:
+    """Backpressure: a full queue raises instead of growing."""
+    sink = RecordingSink()
+    sink.gate.clear()
+    queue = BatchingActivityQueue(
+        sink, max_batch_size=1, flush_interval_seconds=0, max_queue_size=2
+    )
+
+    await queue.submit(_activity())
+    await asyncio.sleep(0)  # flusher takes the first activity and blocks
+    await queue.submit(_activity())
+    await queue.submit(_activity())
+    with pytest.raises(IngestionQueueFullError):
+        await queue.submit(_activity())
+
+    stats = queue.stats()
+    assert stats.depth == 2
+    assert stats.submitted == 3
+    assert stats.rejected == 1
+
+    sink.gate.set()
+    await queue.close()
+    assert queue.stats().flushed == 3
+
+
+@pytest.mark.asyncio
+async def test_close_writes_everything_queued() -> None:
+    """Shutdown drains the queue before returning and refuses new work."""
+    sink = RecordingSink()
+    queue = BatchingActivityQueue(sink, max_batch_size=10, flush_interval_seconds=60)
+
+    for _ in range(25):
+        await queue.submit(_activity())
+    await queue.close()
+
+    assert sum(len(b) for b in sink.batches) == 25
+    assert queue.stats().depth == 0
+    with pytest.raises(IngestionQueueFullError, match="shutting down"):
+        await queue.submit(_activity())
+
+
+@pytest.mark.asyncio
+async def test_close_without_submissions_is_noop() -> None:
+    """Closing an idle queue returns immediately."""
+    queue = BatchingActivityQueue(RecordingSink())
+
+    await queue.close()
+
+    assert queue.stats().flushes == 0
+
+
+async def _no_wait(seconds: float) -> None:
+    """Retry backoff replacement that returns immediately."""
+
+
+@pytest.mark.asyncio
+async def test_failed_batch_is_retried_with_backoff() -> None:
+    """A write failing briefly succeeds on retry, after doubling waits."""
+    attempts = 0
+    waits: list[float] = []
+
+    async def flaky(batch: list[Activity]) -> None:
+        nonlocal attempts
+        attempts += 1
+        if attempts < 3:
+            raise RuntimeError("database unavailable")
+
+    async def record_wait(seconds: float) -> None:
+        waits.append(seconds)
+
+    queue = BatchingActivityQueue(
+        flaky,
+        max_batch_size=2,
+        flush_interval_seconds=60,
+        retry_backoff_seconds=0.1,
+        sleep=record_wait,
+    )
+    await queue.submit(_activity())
+    await queue.submit(_activity())
+    await queue.close()
+
+    stats = queue.stats()
+    assert waits == [0.1, 0.2]
+    assert stats.retries == 2
+    assert stats.flushed == 2
+    assert stats.failed == 0
+    assert stats.flushes == 3
+
+
+@pytest.mark.asyncio
+async def test_rejected_activity_does_not_sink_its_batch() -> None:
+    """After retries, rows are written one by one and only the bad one fails."""
+    bad = _activity()
+    written: list[Activity] = []
+    dead: list[Activity] = []
+
+    async def reject_bad(batch: list[Activity]) -> None:
+        if bad in batch:
+            raise ValueError("violates check constraint")
+        written.extend(batch)
+
+    async def dead_letter(activities: list[Activity]) -> None:
+        dead.extend(activities)
+
+    queue = BatchingActivityQueue(
+        reject_bad,
+        max_batch_size=3,
+        flush_interval_seconds=60,
+        max_retries=1,
+        dead_letter=dead_letter,
+        sleep=_no_wait,
+    )
+    good = [_activity(), _activity()]
+    for activity in [good[0], bad, good[1]]:
+        await queue.submit(activity)
+    await queue.close()
+
+    assert written == good
+    assert dead == [bad]
+    stats = queue.stats()
+    assert stats.flushed == 2
+    assert stats.failed == 1
+
+
+@pytest.mark.asyncio
+async def test_failed_activities_are_dead_lettered_and_queue_keeps_running() -> None:
+    """Activities that keep failing are dead-lettered; later batches still flush."""
+    sink = RecordingSink()
+    sink.fail = True
+    dead: list[Activity] = []
+
+    async def dead_letter(activities: list[Activity]) -> None:
+        dead.extend(activities)
+
+    queue = BatchingActivityQueue(
+        sink,
+        max_batch_size=2,
+        flush_interval_seconds=60,
+        max_retries=2,
+        dead_letter=dead_letter,
+        sleep=_no_wait,
+    )
+
+    failing = [_activity(), _activity()]
+    for activity in failing:
+        await queue.submit(activity)
+    await asyncio.wait_for(queue._queue.join(), timeout=1)
+    sink.fail = False
+    await queue.submit(_activity())
+    await queue.close()
+
+    assert dead == failing
+    stats = queue.stats()
+    assert stats.retries == 2
+    assert stats.failed == 2
+    assert stats.flushed == 1
+    assert stats.flushes == 6
+
+
+@pytest.mark.asyncio
+async def test_flush_latency_is_measured() -> None:
+    """Flush durations are taken from the clock around each write."""
+    ticks = iter([0.0, 0.004, 1.0, 1.010])
+    queue = BatchingActivityQueue(
+        RecordingSink(),
+        max_batch_size=1,
+        flush_interval_seconds=0,
+        clock=lambda: next(ticks),
+    )
+
+    await queue.submit(_activity())
+    await asyncio.wait_for(queue._queue.join(), timeout=1)
+    await queue.submit(_activity())
+    await queue.close()
+
+    stats = queue.stats()
+    assert stats.last_flush_ms == pytest.approx(10.0)
+    assert stats.max_flush_ms == pytest.approx(10.0)
+    assert stats.mean_flush_ms == pytest.approx(7.0)
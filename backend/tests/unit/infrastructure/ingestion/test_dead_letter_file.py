@@ -0,0 +1,59 @@
+"""Unit tests for DeadLetterFile."""
+
+from datetime import UTC, date, datetime
+from uuid import uuid4
+
+import pytest
+
+from domain.entities.activity import Activity
+from infrastructure.ingestion.dead_letter_file import DeadLetterFile
+
+
+def _activity(**overrides) -> Activity:
+    fields = {
+        "id": uuid4(),
+        "category": "transport",
+        "type": "car_petrol",
+        "value": 10.0,
+        "co2e_kg": 2.3,
+        "date": date(2024, 1, 15),
+        "notes": None,
+        "metadata": None,
+        "user_id": None,
+        "session_id": "test-session-123",
+        "created_at": datetime(2024, 1, 15, 10, 0, tzinfo=UTC),
+    }
+    return Activity(**(fields | overrides))
+
+
+@pytest.mark.asyncio
+async def test_written_activities_are_read_back(tmp_path) -> None:
+    """Appended activities round-trip with every field, across writes."""
+    dead_letters = DeadLetterFile(tmp_path / "nested" / "dead.jsonl")
+    first = _activity()
+    second = _activity(
+        user_id=uuid4(),
+        session_id=None,
+        notes="commute",
+        metadata={"passengers": 2},
+        updated_at=datetime(2024, 1, 16, 8, 30, tzinfo=UTC),
+    )
+
+    await dead_letters.write([first])
+    await dead_letters.write([second])
+
+    assert dead_letters.read() == [first, second]
+
+
+def test_missing_file_reads_empty(tmp_path) -> None:
+    """Nothing was dead-lettered yet."""
+    assert DeadLetterFile(tmp_path / "dead.jsonl").read() == []
+
+
+def test_invalid_line_is_reported(tmp_path) -> None:
+    """A corrupt line names its position instead of being skipped."""
+    path = tmp_path / "dead.jsonl"
+    path.write_text('{"id": "not-a-uuid"}\n')
+
+    with pytest.raises(ValueError, match="line 1"):
+        DeadLetterFile(path).read()
@@ -0,0 +1,188 @@
+"""Unit tests for the Postgres COPY loader."""
+
+from datetime import UTC, date, datetime
+from decimal import Decimal
+from unittest.mock import AsyncMock
+from uuid import UUID
+
+import pytest
+
+from domain.entities.emission_factor import EmissionFactor
+from domain.services.calculation_service import CalculationService
+from domain.services.emission_factor_index import EmissionFactorIndex
+from domain.use_cases.import_activities import ImportRow
+from infrastructure.ingestion.postgres_copy_loader import (
+    ACTIVITY_COPY_COLUMNS,
+    PostgresCopyLoader,
+    prepare_copy_records,
+)
+
+CREATED_AT = datetime(2024, 3, 1, tzinfo=UTC)
+USER_ID = UUID("11111111-1111-1111-1111-111111111111")
+
+
+def _factor(factor: float, year: int) -> EmissionFactor:
+    return EmissionFactor(
+        id=year,
+        category="transport",
+        type="car_petrol",
+        factor=factor,
+        unit="km",
+        source=f"DEFRA {year}",
+        notes=None,
+        created_at=CREATED_AT,
+        source_year=year,
+    )
+
+
+FACTORS = EmissionFactorIndex([_factor(0.17, 2023), _factor(0.2, 2024)])
+
+
+def _row(line: int, **fields: str) -> ImportRow:
+    return ImportRow(
+        line=line,
+        fields={"date": "2024-01-15", "type": "car_petrol", "value": "10", **fields},
+    )
+
+
+def _prepare(rows, **kwargs):
+    return prepare_copy_records(
+        rows, FACTORS, CalculationService(), created_at=CREATED_AT, **kwargs
+    )
+
+
+def test_prepare_builds_records_in_column_order():
+    """Test valid rows become COPY records with exact decimal values."""
+    chunk = _prepare([_row(2, notes="commute")], default_session_id="tenant-1")
+
+    assert chunk.rejected == []
+    record = dict(zip(ACTIVITY_COPY_COLUMNS, chunk.records[0], strict=True))
+    assert isinstance(record.pop("id"), UUID)
+    assert record == {
+        "user_id": None,
+        "session_id": "tenant-1",
+        "category": "transport",
+        "type": "car_petrol",
+        "value": Decimal("10.0"),
+        "co2e_kg": Decimal("2.0"),
+        "date": date(2024, 1, 15),
+        "notes": "commute",
+        "created_at": CREATED_AT,
+    }
+
+
+def test_prepare_applies_factor_of_row_date():
+    """Test each row is calculated with the factor version of its date."""
+    chunk = _prepare(
+        [_row(2, date="2023-06-01"), _row(3, date="2024-06-01")],
+        default_user_id=USER_ID,
+    )
+
+    assert [r[6] for r in chunk.records] == [Decimal("1.7"), Decimal("2.0")]
+
+
+def test_prepare_uses_owner_columns():
+    """Test owner columns take precedence over the default owner."""
+    chunk = _prepare(
+        [
+            _row(2, user_id=str(USER_ID)),
+            _row(3, session_id="other"),
+            _row(4, user_id="", session_id=""),
+        ],
+        default_session_id="tenant-1",
+    )
+
+    assert [(r[1], r[2]) for r in chunk.records] == [
+        (USER_ID, None),
+        (None, "other"),
+        (None, "tenant-1"),
+    ]
+
+
+@pytest.mark.parametrize(
+    "fields,reason",
+    [
+        ({"user_id": "nope"}, "Invalid user_id: nope"),
+        ({"session_id": "s" * 256}, "session_id longer than 255"),
+        ({"type": "rocket"}, "Unknown activity type: rocket"),
+        ({"value": "-1"}, "Value must be greater than 0"),
+    ],
+)
+def test_prepare_rejects_invalid_rows(fields, reason):
+    """Test invalid rows are rejected with their line numbers."""
+    chunk = _prepare([_row(2), _row(3, **fields)], default_session_id="tenant-1")
+
+    assert len(chunk.records) == 1
+    assert chunk.rejected[0].line == 3
+    assert reason in chunk.rejected[0].reason
+
+
+def test_prepare_rejects_rows_without_owner():
+    """Test rows need an owner when no default is given."""
+    chunk = _prepare([_row(2)])
+
+    assert chunk.records == []
+    assert chunk.rejected[0].reason == "Missing user_id or session_id"
+
+
+@pytest.mark.asyncio
+async def test_copy_streams_records():
+    """Test records are copied into activities and the count is parsed."""
+    conn = AsyncMock()
+    conn.copy_records_to_table.return_value = "COPY 2"
+    loader = PostgresCopyLoader(conn)
+    records = _prepare([_row(2), _row(3)], default_session_id="tenant-1").records
+
+    copied = await loader.copy(records)
+
+    assert copied == 2
+    conn.copy_records_to_table.assert_called_once_with(
+        "activities", records=records, columns=ACTIVITY_COPY_COLUMNS
+    )
+
+
+@pytest.mark.asyncio
+async def test_copy_skips_empty_chunks():
+    """Test an empty chunk does not start a COPY."""
+    conn = AsyncMock()
+
+    assert await PostgresCopyLoader(conn).copy([]) == 0
+    conn.copy_records_to_table.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_deferred_indexes_are_dropped_and_rebuilt():
+    """Test secondary indexes are dropped for the load and recreated after."""
+    conn = AsyncMock()
+    conn.fetch.return_value = [
+        {
+            "name": "idx_activities_date",
+            "definition": "CREATE INDEX idx_activities_date ON activities (date)",
+        }
+    ]
+    loader = PostgresCopyLoader(conn)
+
+    async with loader.deferred_indexes() as dropped:
+        assert dropped == ["idx_activities_date"]
+        assert [c.args[0] for c in conn.execute.call_args_list] == [
+            "DROP INDEX idx_activities_date"
+        ]
+
+    assert conn.execute.call_args_list[-1].args[0] == (
+        "CREATE INDEX idx_activities_date ON activities (date)"
+    )
+
+
+@pytest.mark.asyncio
+async def test_deferred_indexes_left_to_rollback_on_error():
+    """Test a failed load does not rebuild indexes in the aborted transaction."""
+    conn = AsyncMock()
+    conn.fetch.return_value = [
+        {"name": "idx_a", "definition": "CREATE INDEX idx_a ON activities (type)"}
+    ]
+
+    with pytest.raises(RuntimeError):
+        async with PostgresCopyLoader(conn).deferred_indexes():
+            raise RuntimeError("copy failed")
+
+    assert [c.args[0] for c in conn.execute.call_args_list] == ["DROP INDEX idx_a"]
@@ -0,0 +1,117 @@
+"""Unit tests for CachedEmissionFactorRepository."""
+
+from dataclasses import replace
+from datetime import UTC, date, datetime
+from unittest.mock import AsyncMock
+
+import pytest
+
+from domain.entities.emission_factor import EmissionFactor
+from domain.ports.emission_factor_repository import EmissionFactorRepository
+from infrastructure.repositories.cached_emission_factor_repository import (
+    CachedEmissionFactorRepository,
+    EmissionFactorCatalog,
+)
+
+
+def _factor(id_: int, category: str, type_: str, factor: float) -> EmissionFactor:
+    """Create an emission factor entity."""
+    return EmissionFactor(
+        id=id_,
+        category=category,
+        type=type_,
+        factor=factor,
+        unit="km",
+        source="DEFRA 2023",
+        notes=None,
+        created_at=datetime(2026, 1, 1, tzinfo=UTC),
+    )
+
+
+FACTORS = [
+    _factor(1, "energy", "electricity", 0.2),
+    _factor(2, "transport", "bus", 0.089),
+    _factor(3, "transport", "car_petrol", 0.23),
+]
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def source():
+    """Source repository returning FACTORS."""
+    repo = AsyncMock(spec=EmissionFactorRepository)
+    repo.get_all.return_value = list(FACTORS)
+    return repo
+
+
+@pytest.mark.asyncio
+async def test_reads_are_served_from_one_load(source):
+    """All lookups share a single load of the source."""
+    repo = CachedEmissionFactorRepository(source, EmissionFactorCatalog())
+
+    assert (await repo.get_by_type("bus")).factor == 0.089
+    assert [f.type for f in await repo.list_by_category("transport")] == [
+        "bus",
+        "car_petrol",
+    ]
+    assert len(await repo.get_all()) == 3
+    assert await repo.get_by_type("unknown") is None
+    source.get_all.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_snapshot_reloads_after_ttl(source):
+    """The snapshot is refreshed once the TTL has elapsed."""
+    clock = FakeClock()
+    catalog = EmissionFactorCatalog(ttl_seconds=60, clock=clock)
+    repo = CachedEmissionFactorRepository(source, catalog)
+    await repo.get_all()
+
+    clock.now += 61
+    await repo.get_all()
+
+    assert source.get_all.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_data_version_follows_content(source):
+    """The content hash changes only when factor values change."""
+    catalog = EmissionFactorCatalog()
+    repo = CachedEmissionFactorRepository(source, catalog)
+    first = await repo.data_version()
+
+    catalog.invalidate()
+    assert await repo.data_version() == first
+
+    source.get_all.return_value = [
+        *FACTORS[:2],
+        _factor(3, "transport", "car_petrol", 0.25),
+    ]
+    catalog.invalidate()
+    assert await repo.data_version() != first
+
+
+@pytest.mark.asyncio
+async def test_versioned_lookup_uses_factor_of_activity_date(source):
+    """Dated lookups pick the version in effect without querying again."""
+    source.get_all.return_value = [
+        *FACTORS[:2],
+        replace(FACTORS[2], source_year=2023),
+        replace(FACTORS[2], id=4, factor=0.2, source_year=2024),
+    ]
+    repo = CachedEmissionFactorRepository(source, EmissionFactorCatalog())
+
+    assert (await repo.get_by_type("car_petrol")).factor == 0.2
+    assert (await repo.get_by_type_on("car_petrol", date(2023, 12, 31))).factor == 0.23
+    assert (await repo.get_by_type_on("car_petrol", date(2024, 1, 1))).factor == 0.2
+    assert await repo.get_by_type_on("unknown", date(2024, 1, 1)) is None
+    source.get_all.assert_awaited_once()
@@ -0,0 +1,332 @@
+"""Unit tests for InMemoryActivityRepository."""
+
+from dataclasses import replace
+from datetime import UTC, date, datetime, timedelta
+from uuid import UUID, uuid4
+
+import pytest
+
+from domain.entities.activity import Activity
+from domain.ports.activity_repository import (
+    WRITE_CATEGORY_MISMATCH,
+    WRITE_FORBIDDEN,
+    WRITE_NOT_FOUND,
+    WRITE_OK,
+    ActivitySelection,
+)
+from infrastructure.repositories.in_memory_activity_repository import (
+    InMemoryActivityRepository,
+)
+
+USER_ID = UUID("11111111-1111-1111-1111-111111111111")
+CREATED_AT = datetime(2024, 6, 1, tzinfo=UTC)
+
+
+def _activity(
+    activity_date: date = date(2024, 1, 15),
+    user_id: UUID | None = None,
+    session_id: str | None = "session-1",
+    activity_type: str = "car_petrol",
+    category: str = "transport",
+    value: float = 10.0,
+    created_at: datetime = CREATED_AT,
+) -> Activity:
+    """Create an activity entity."""
+    return Activity(
+        id=uuid4(),
+        category=category,
+        type=activity_type,
+        value=value,
+        co2e_kg=round(value * 0.23, 2),
+        date=activity_date,
+        notes=None,
+        metadata=None,
+        user_id=user_id,
+        session_id=session_id,
+        created_at=created_at,
+    )
+
+
+@pytest.fixture
+def repo() -> InMemoryActivityRepository:
+    """Empty repository."""
+    return InMemoryActivityRepository()
+
+
+@pytest.mark.asyncio
+async def test_save_and_get(repo):
+    """Test saved activities are found by ID and IDs are unique."""
+    activity = _activity()
+
+    assert await repo.save(activity) is activity
+    assert await repo.get_by_id(activity.id) is activity
+    assert await repo.get_by_id(uuid4()) is None
+    with pytest.raises(ValueError):
+        await repo.save(activity)
+    with pytest.raises(ValueError):
+        await repo.save_many([_activity(), activity])
+    assert len(repo) == 1
+
+
+@pytest.mark.asyncio
+async def test_owner_listings_are_ordered(repo):
+    """Test owner lists are newest first and date ranges oldest first."""
+    days = [5, 1, 3, 2, 4]
+    await repo.save_many(
+        [_activity(date(2024, 1, d), user_id=USER_ID, session_id=None) for d in days]
+    )
+    # Same day: the later creation comes first in newest-first listings
+    late = await repo.save(
+        _activity(
+            date(2024, 1, 5),
+            user_id=USER_ID,
+            session_id=None,
+            created_at=CREATED_AT + timedelta(hours=1),
+        )
+    )
+
+    newest = await repo.list_by_user(USER_ID, limit=3)
+    page = await repo.list_by_user(USER_ID, limit=2, offset=4)
+    in_range = await repo.list_by_date_range(
+        USER_ID, None, date(2024, 1, 2), date(2024, 1, 4)
+    )
+
+    assert newest[0] is late
+    assert [a.date.day for a in newest] == [5, 5, 4]
+    assert [a.date.day for a in page] == [2, 1]
+    assert await repo.list_by_user(USER_ID, offset=10) == []
+    assert [a.date.day for a in in_range] == [2, 3, 4]
+    assert await repo.list_by_session("unknown") == []
+
+
+@pytest.mark.asyncio
+async def test_large_batches_and_single_saves_keep_order(repo):
+    """Test indexes stay sorted whether rows are re-sorted or inserted."""
+    start = date(2024, 1, 1)
+    await repo.save_many([_activity(start + timedelta(days=i)) for i in range(200)])
+    for i in (150, 0, 199):
+        await repo.save(_activity(start + timedelta(days=i)))
+
+    listed = await repo.list_by_date_range(None, "session-1", start, date(2024, 12, 31))
+
+    assert len(listed) == 203
+    assert [a.date for a in listed] == sorted(a.date for a in listed)
+
+
+@pytest.mark.asyncio
+async def test_migrate_session_to_user(repo):
+    """Test only anonymous activities move and stay listed by session."""
+    anonymous = await repo.save_many([_activity(), _activity()])
+    await repo.save(_activity(user_id=uuid4(), session_id="session-1"))
+
+    assert await repo.migrate_session_to_user(USER_ID, "session-1") == 2
+    assert await repo.migrate_session_to_user(USER_ID, "session-1") == 0
+    assert {a.id for a in await repo.list_by_user(USER_ID)} == {a.id for a in anonymous}
+    assert len(await repo.list_by_session("session-1")) == 3
+
+
+@pytest.mark.asyncio
+async def test_update_reindexes_date(repo):
+    """Test updates keep the owner and move the activity in date order."""
+    activity = await repo.save(_activity(date(2024, 1, 1)))
+    other = await repo.save(_activity(date(2024, 1, 2)))
+
+    updated = await repo.update(
+        Activity(**{**activity.__dict__, "date": date(2024, 1, 3), "value": 20.0})
+    )
+
+    assert updated.value == 20.0
+    assert updated.updated_at is not None
+    listed = await repo.list_by_session("session-1")
+    assert [a.id for a in listed] == [activity.id, other.id]
+    with pytest.raises(ValueError):
+        await repo.update(_activity())
+
+
+@pytest.mark.asyncio
+async def test_delete(repo):
+    """Test deletes remove the activity from every listing."""
+    activity = await repo.save(_activity())
+
+    assert await repo.delete(activity.id) is True
+    assert await repo.delete(activity.id) is False
+    assert await repo.list_by_session("session-1") == []
+    assert await repo.list_after_id(None, 10) == []
+
+
+@pytest.mark.asyncio
+async def test_update_owned_outcomes(repo):
+    """Test ownership-checked updates report each outcome."""
+    activity = await repo.save(_activity())
+
+    async def update(activity_id, session_id, category="transport"):
+        return await repo.update_owned(
+            activity_id,
+            None,
+            session_id,
+            category,
+            "bus",
+            30.0,
+            2.67,
+            date(2024, 2, 1),
+            "note",
+        )
+
+    assert (await update(uuid4(), "session-1")).status == WRITE_NOT_FOUND
+    assert (await update(activity.id, "intruder")).status == WRITE_FORBIDDEN
+    mismatch = await update(activity.id, "session-1", category="food")
+    assert mismatch.status == WRITE_CATEGORY_MISMATCH
+    assert mismatch.previous is activity
+
+    ok = await update(activity.id, "session-1")
+    assert ok.status == WRITE_OK
+    assert ok.previous is activity
+    assert (ok.activity.type, ok.activity.date) == ("bus", date(2024, 2, 1))
+    assert await repo.get_by_id(activity.id) is ok.activity
+
+
+@pytest.mark.asyncio
+async def test_user_owner_is_matched_on_user_id(repo):
+    """Test authenticated owners are matched on user_id, not session."""
+    activity = await repo.save(_activity(user_id=USER_ID, session_id="session-1"))
+
+    foreign = await repo.delete_owned(activity.id, uuid4(), "session-1")
+    deleted = await repo.delete_owned(activity.id, USER_ID, None)
+
+    assert foreign.status == WRITE_FORBIDDEN
+    assert deleted.status == WRITE_OK
+    assert (await repo.delete_owned(activity.id, USER_ID, None)).status == (
+        WRITE_NOT_FOUND
+    )
+
+
+@pytest.mark.asyncio
+async def test_ownerless_writes_are_refused(repo):
+    """Test owned writes without user or session raise instead of matching."""
+    activity = await repo.save(_activity(user_id=USER_ID, session_id=None))
+
+    with pytest.raises(ValueError):
+        await repo.delete_owned(activity.id, None, None)
+    with pytest.raises(ValueError):
+        await repo.delete_many_owned(None, None, ActivitySelection())
+    assert await repo.get_by_id(activity.id) == activity
+
+
+@pytest.mark.asyncio
+async def test_delete_many_owned(repo):
+    """Test bulk deletes by IDs and by filter."""
+    mine = await repo.save_many([_activity(date(2024, 1, d)) for d in (1, 2, 3)])
+    foreign = await repo.save(_activity(session_id="other"))
+    missing = uuid4()
+
+    by_ids = await repo.delete_many_owned(
+        None,
+        "session-1",
+        ActivitySelection(
+            ids=(mine[0].id, mine[1].id, foreign.id, missing),
+            end_date=date(2024, 1, 1),
+        ),
+    )
+    by_filter = await repo.delete_many_owned(
+        None, "session-1", ActivitySelection(start_date=date(2024, 1, 3))
+    )
+
+    assert {k: v.status for k, v in by_ids.items()} == {
+        mine[0].id: WRITE_OK,
+        mine[1].id: WRITE_NOT_FOUND,
+        foreign.id: WRITE_NOT_FOUND,
+        missing: WRITE_NOT_FOUND,
+    }
+    assert list(by_filter) == [mine[2].id]
+    assert [a.id for a in await repo.list_by_session("session-1")] == [mine[1].id]
+
+
+@pytest.mark.asyncio
+async def test_update_type_many_owned(repo):
+    """Test bulk type changes recompute CO2e and report mismatches."""
+    car = await repo.save(_activity(value=100.0))
+    food = await repo.save(_activity(category="food", activity_type="beef"))
+    foreign = await repo.save(_activity(session_id="other"))
+
+    computed = []
+
+    async def co2e_for(activities):
+        computed.extend(activities)
+        return [round(a.value * 0.089, 2) for a in activities]
+
+    outcomes = await repo.update_type_many_owned(
+        None,
+        "session-1",
+        ActivitySelection(ids=(car.id, food.id, foreign.id)),
+        "transport",
+        "bus",
+        co2e_for,
+    )
+
+    assert computed == [car]
+    assert outcomes[car.id].status == WRITE_OK
+    assert outcomes[car.id].activity.co2e_kg == 8.9
+    assert outcomes[food.id].status == WRITE_CATEGORY_MISMATCH
+    assert outcomes[foreign.id].status == WRITE_FORBIDDEN
+    assert (await repo.get_by_id(car.id)).type == "bus"
+
+
+@pytest.mark.asyncio
+async def test_keyset_pages(repo):
+    """Test ID-ordered pages with bounds and type filters."""
+    saved = await repo.save_many(
+        [_activity(activity_type="bus" if i % 2 else "car_petrol") for i in range(6)]
+    )
+    foreign = await repo.save(_activity(session_id="other"))
+    ids = sorted(a.id for a in saved)
+    all_ids = sorted([*ids, foreign.id])
+    bus = sorted(a.id for a in saved if a.type == "bus")
+
+    first = await repo.list_after_id(None, 2)
+    bounded = await repo.list_after_id(all_ids[0], 10, before_id=all_ids[3])
+    only_bus = await repo.list_after_id(None, 2, activity_types=("bus",))
+    owned = await repo.list_owned_after_id(None, "session-1", ids[3], 10)
+
+    assert [a.id for a in first] == all_ids[:2]
+    assert [a.id for a in bounded] == all_ids[1:3]
+    assert [a.id for a in only_bus] == bus[:2]
+    assert [a.id for a in owned] == ids[4:]
+
+
+@pytest.mark.asyncio
+async def test_update_co2e_many(repo):
+    """Test CO2e rewrites use current values and skip unknown activities."""
+    activity = await repo.save(_activity())
+    await repo.update(replace(activity, value=20.0))
+
+    async def co2e_for(activities):
+        return [a.value * 0.2 for a in activities]
+
+    outcomes = await repo.update_co2e_many([activity, _activity()], co2e_for)
+
+    assert list(outcomes) == [activity.id]
+    assert outcomes[activity.id].status == WRITE_OK
+    assert (await repo.get_by_id(activity.id)).co2e_kg == 4.0
+    assert await repo.update_co2e_many([], co2e_for) == {}
+
+
+@pytest.mark.asyncio
+async def test_list_owner_totals(repo):
+    """Test totals per owner and category within the date range."""
+    await repo.save_many(
+        [
+            _activity(value=10.0),
+            _activity(value=20.0),
+            _activity(category="food", activity_type="beef", value=1.0),
+            _activity(user_id=USER_ID, session_id="ignored", value=10.0),
+            _activity(date(2024, 2, 1), value=10.0),
+        ]
+    )
+
+    totals = await repo.list_owner_totals(date(2024, 1, 1), date(2024, 1, 31))
+
+    assert {(t.user_id, t.session_id, t.category): t.co2e_kg for t in totals} == {
+        (None, "session-1", "transport"): 6.9,
+        (None, "session-1", "food"): 0.23,
+        (USER_ID, None, "transport"): 2.3,
+    }
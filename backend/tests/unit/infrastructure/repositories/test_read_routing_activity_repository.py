@@ -0,0 +1,146 @@
+"""Unit tests for ReadRoutingActivityRepository."""
+
+from datetime import UTC, date, datetime
+from uuid import UUID, uuid4
+
+import pytest
+
+from domain.entities.activity import Activity
+from infrastructure.cache.in_memory_cache_backend import InMemoryCacheBackend
+from infrastructure.repositories.in_memory_activity_repository import (
+    InMemoryActivityRepository,
+)
+from infrastructure.repositories.read_routing_activity_repository import (
+    ReadRoutingActivityRepository,
+)
+
+USER_ID = UUID("11111111-1111-1111-1111-111111111111")
+DAY = date(2024, 5, 1)
+
+
+class FakeClock:
+    """Monotonic clock moved by hand."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _activity(user_id: UUID | None = None, session_id: str | None = "s1") -> Activity:
+    """Create an activity entity."""
+    return Activity(
+        id=uuid4(),
+        category="transport",
+        type="car_petrol",
+        value=10.0,
+        co2e_kg=1.71,
+        date=DAY,
+        notes=None,
+        metadata=None,
+        user_id=user_id,
+        session_id=session_id,
+        created_at=datetime(2024, 5, 1, tzinfo=UTC),
+    )
+
+
+@pytest.fixture
+def primary() -> InMemoryActivityRepository:
+    """Primary database."""
+    return InMemoryActivityRepository()
+
+
+@pytest.fixture
+def replica() -> InMemoryActivityRepository:
+    """Replica that has not caught up with the primary."""
+    return InMemoryActivityRepository()
+
+
+@pytest.fixture
+def clock() -> FakeClock:
+    """Clock of the recent write marks."""
+    return FakeClock()
+
+
+@pytest.fixture
+def repo(primary, replica, clock) -> ReadRoutingActivityRepository:
+    """Router with a 10 second read-your-writes window."""
+    return ReadRoutingActivityRepository(
+        primary, replica, InMemoryCacheBackend(clock=clock), window_seconds=10
+    )
+
+
+@pytest.mark.asyncio
+async def test_writes_go_to_primary(repo, primary, replica) -> None:
+    """Test saves never reach the replica."""
+    await repo.save(_activity())
+    await repo.save_many([_activity(USER_ID, None), _activity(session_id="s2")])
+
+    assert len(await primary.list_by_session("s1")) == 1
+    assert len(await primary.list_by_user(USER_ID)) == 1
+    assert await replica.list_by_session("s1") == []
+
+
+@pytest.mark.asyncio
+async def test_reads_go_to_replica(repo, replica) -> None:
+    """Test owners without recent writes read from the replica."""
+    stored = await replica.save(_activity(USER_ID))
+
+    assert await repo.list_by_user(USER_ID) == [stored]
+    assert await repo.list_by_date_range(USER_ID, None, DAY, DAY) == [stored]
+    assert await repo.list_owned_after_id(USER_ID, None, None, 10) == [stored]
+    assert await repo.get_by_id(stored.id) == stored
+    assert len(await repo.list_owner_totals(DAY, DAY)) == 1
+
+
+@pytest.mark.asyncio
+async def test_owner_reads_own_writes_within_window(repo, clock) -> None:
+    """Test an owner's reads follow their write to the primary for a while."""
+    saved = await repo.save(_activity())
+
+    assert await repo.list_by_session("s1") == [saved]
+    assert await repo.get_by_id(saved.id) == saved
+    # Other owners still read from the replica
+    await repo.save(_activity(session_id="s2"))
+    assert await repo.list_by_user(USER_ID) == []
+
+    clock.now += 11
+    assert await repo.list_by_session("s1") == []
+
+
+@pytest.mark.asyncio
+async def test_owned_writes_mark_owner(repo, primary, replica) -> None:
+    """Test deletes and migrations keep the owner on the primary."""
+    stored = await primary.save(_activity())
+    await replica.save(stored)
+    await repo.delete_owned(stored.id, None, "s1")
+    assert await repo.list_by_session("s1") == []
+
+    await primary.save(_activity(session_id="s2"))
+    await repo.migrate_session_to_user(USER_ID, "s2")
+    assert len(await repo.list_by_user(USER_ID)) == 1
+
+
+@pytest.mark.asyncio
+async def test_get_by_id_falls_back_to_primary(repo, primary) -> None:
+    """Test an activity missing on the replica is looked up on the primary."""
+    stored = await primary.save(_activity())
+
+    assert await repo.get_by_id(stored.id) == stored
+    assert await repo.get_by_id(uuid4()) is None
+
+
+@pytest.mark.asyncio
+async def test_recalculation_reads_primary(repo, primary, replica) -> None:
+    """Test the all-owners scan feeding recalculation writes uses the primary."""
+    stored = await primary.save(_activity())
+    await replica.save(_activity(USER_ID))
+
+    assert await repo.list_after_id(None, 10) == [stored]
+
+    async def co2e_for(activities):
+        return [2.0] * len(activities)
+
+    assert list(await repo.update_co2e_many([stored], co2e_for)) == [stored.id]
+    assert (await primary.get_by_id(stored.id)).co2e_kg == 2.0
@@ -0,0 +1,86 @@
+"""Unit tests for SupabaseActivityRepository."""
+
+from datetime import date
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+
+from domain.ports.activity_repository import WRITE_OK, ActivitySelection
+from infrastructure.repositories.supabase_activity_repository import (
+    SupabaseActivityRepository,
+)
+
+
+@pytest.mark.asyncio
+async def test_ownerless_writes_are_refused() -> None:
+    """Test owned writes without user or session never reach PostgREST."""
+    client = MagicMock()
+    repo = SupabaseActivityRepository(client)
+
+    with pytest.raises(ValueError):
+        await repo.delete_owned(uuid4(), None, None)
+    with pytest.raises(ValueError):
+        await repo.delete_many_owned(None, None, ActivitySelection())
+    with pytest.raises(ValueError):
+        await repo.update_owned(
+            uuid4(), None, None, "transport", "bus", 1.0, 0.1, date(2024, 5, 1), None
+        )
+    with pytest.raises(ValueError):
+        await repo.update_type_many_owned(
+            None, None, ActivitySelection(), "transport", "bus", AsyncMock()
+        )
+
+    client.table.assert_not_called()
+    client.rpc.assert_not_called()
+
+
+def _row(activity_id, value: float, **fields) -> dict:
+    """Activities table row of session s1."""
+    return {
+        "id": str(activity_id),
+        "category": "transport",
+        "type": "car_petrol",
+        "value": value,
+        "co2e_kg": 1.0,
+        "date": "2024-05-01",
+        "session_id": "s1",
+        "created_at": "2024-05-01T10:00:00+00:00",
+        **fields,
+    }
+
+
+@pytest.mark.asyncio
+async def test_bulk_type_update_recomputes_rows_changed_meanwhile() -> None:
+    """Test rows whose value changed after the read are computed again."""
+    activity_id = uuid4()
+    query = MagicMock()
+    for method in ("select", "eq", "in_", "gte", "lte"):
+        getattr(query, method).return_value = query
+    query.execute.side_effect = [
+        MagicMock(data=[_row(activity_id, 10.0)]),
+        MagicMock(data=[_row(activity_id, 20.0)]),
+    ]
+    client = MagicMock()
+    client.table.return_value = query
+    updated = _row(activity_id, 20.0, type="bus", co2e_kg=2.0)
+    client.rpc.return_value.execute.side_effect = [
+        MagicMock(data=[{"id": str(activity_id), "status": "stale"}]),
+        MagicMock(data=[{"id": str(activity_id), "status": "ok", "activity": updated}]),
+    ]
+    co2e_for = AsyncMock(side_effect=lambda rows: [a.value / 10 for a in rows])
+
+    outcomes = await SupabaseActivityRepository(client).update_type_many_owned(
+        None,
+        "s1",
+        ActivitySelection(activity_type="car_petrol"),
+        "transport",
+        "bus",
+        co2e_for,
+    )
+
+    assert outcomes[activity_id].status == WRITE_OK
+    retry = client.rpc.call_args_list[1].args[1]
+    assert retry["p_ids"] == [str(activity_id)]
+    assert retry["p_values"] == [20.0]
+    assert retry["p_co2e_kg"] == [2.0]
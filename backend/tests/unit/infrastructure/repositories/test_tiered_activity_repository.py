@@ -0,0 +1,167 @@
+"""Unit tests for TieredActivityRepository."""
+
+from datetime import UTC, date, datetime, timedelta
+from uuid import UUID, uuid4
+
+import pytest
+
+from domain.entities.activity import Activity
+from domain.ports.activity_archive import ActivityArchive
+from infrastructure.repositories.in_memory_activity_repository import (
+    InMemoryActivityRepository,
+)
+from infrastructure.repositories.tiered_activity_repository import (
+    TieredActivityRepository,
+)
+
+USER_ID = UUID("11111111-1111-1111-1111-111111111111")
+TODAY = date.today()
+OLD = TODAY - timedelta(days=400)
+
+
+def _activity(
+    activity_date: date, user_id: UUID | None = None, session_id: str | None = "s1"
+) -> Activity:
+    """Create an activity entity."""
+    return Activity(
+        id=uuid4(),
+        category="transport",
+        type="car_petrol",
+        value=10.0,
+        co2e_kg=1.71,
+        date=activity_date,
+        notes=None,
+        metadata=None,
+        user_id=user_id,
+        session_id=session_id,
+        created_at=datetime(2024, 1, 1, tzinfo=UTC),
+    )
+
+
+class _ListArchive(ActivityArchive):
+    """Archive kept in a list, counting reads."""
+
+    def __init__(self) -> None:
+        self.activities: list[Activity] = []
+        self.reads = 0
+
+    async def write(self, activities: list[Activity], batch: str) -> int:
+        self.activities.extend(activities)
+        return len(activities)
+
+    def _owned(self, user_id: UUID | None, session_id: str | None) -> list[Activity]:
+        self.reads += 1
+        if user_id is not None:
+            return [a for a in self.activities if a.user_id == user_id]
+        return [
+            a
+            for a in self.activities
+            if a.user_id is None and a.session_id == session_id
+        ]
+
+    async def list_by_date_range(self, user_id, session_id, start_date, end_date):
+        return sorted(
+            (
+                a
+                for a in self._owned(user_id, session_id)
+                if start_date <= a.date <= end_date
+            ),
+            key=lambda a: a.date,
+        )
+
+    async def list_owned_after_id(self, user_id, session_id, after_id, limit):
+        after = after_id.int if after_id else -1
+        owned = [a for a in self._owned(user_id, session_id) if a.id.int > after]
+        return sorted(owned, key=lambda a: a.id.int)[:limit]
+
+    async def migrate_session_to_user(self, user_id, session_id):
+        moved = self._owned(None, session_id)
+        self.activities = [a for a in self.activities if a not in moved] + [
+            Activity(**{**a.__dict__, "user_id": user_id}) for a in moved
+        ]
+        return len(moved)
+
+
+@pytest.fixture
+def hot() -> InMemoryActivityRepository:
+    """Hot repository."""
+    return InMemoryActivityRepository()
+
+
+@pytest.fixture
+def archive() -> _ListArchive:
+    """Archive holding two old activities of session s1."""
+    archive = _ListArchive()
+    archive.activities = [_activity(OLD), _activity(OLD + timedelta(days=1))]
+    return archive
+
+
+@pytest.fixture
+def repo(hot, archive) -> TieredActivityRepository:
+    """Repository over both tiers with a one-year horizon."""
+    return TieredActivityRepository(hot, archive, horizon_days=365)
+
+
+@pytest.mark.asyncio
+async def test_recent_ranges_skip_the_archive(repo, hot, archive):
+    """Test ranges inside the horizon only read the hot tier."""
+    recent = await hot.save(_activity(TODAY))
+
+    listed = await repo.list_by_date_range(None, "s1", TODAY - timedelta(30), TODAY)
+
+    assert listed == [recent]
+    assert archive.reads == 0
+
+
+@pytest.mark.asyncio
+async def test_old_ranges_union_both_tiers(repo, hot, archive):
+    """Test period=all style ranges list archived and hot rows by date."""
+    recent = await hot.save(_activity(TODAY))
+    # Still hot after an interrupted archival: listed once
+    await hot.save(archive.activities[0])
+
+    listed = await repo.list_by_date_range(None, "s1", date(2020, 1, 1), TODAY)
+
+    assert [a.date for a in listed] == [OLD, OLD + timedelta(days=1), TODAY]
+    assert listed[-1] == recent
+
+
+@pytest.mark.asyncio
+async def test_export_pages_cover_both_tiers(repo, hot, archive):
+    """Test keyset pages merge both tiers in ID order."""
+    await hot.save_many([_activity(TODAY) for _ in range(3)])
+    expected = sorted(
+        [a.id for a in archive.activities]
+        + [a.id for a in await hot.list_by_session("s1")],
+        key=lambda i: i.int,
+    )
+
+    pages, after_id = [], None
+    while page := await repo.list_owned_after_id(None, "s1", after_id, 2):
+        pages.append(page)
+        after_id = page[-1].id
+
+    assert [a.id for page in pages for a in page] == expected
+    assert [len(page) for page in pages] == [2, 2, 1]
+
+
+@pytest.mark.asyncio
+async def test_migration_covers_both_tiers(repo, hot, archive):
+    """Test session migration counts hot and archived activities."""
+    await hot.save(_activity(TODAY))
+
+    assert await repo.migrate_session_to_user(USER_ID, "s1") == 3
+    listed = await repo.list_by_date_range(USER_ID, None, date(2020, 1, 1), TODAY)
+    assert len(listed) == 3
+
+
+@pytest.mark.asyncio
+async def test_writes_go_to_the_hot_tier(repo, hot, archive):
+    """Test writes and lookups by ID only touch the hot repository."""
+    saved = await repo.save(_activity(TODAY))
+
+    assert await repo.get_by_id(saved.id) is saved
+    assert await repo.get_by_id(archive.activities[0].id) is None
+    assert await repo.delete(saved.id) is True
+    assert len(hot) == 0
+    assert archive.reads == 0
@@ -0,0 +1,184 @@
+"""Unit tests for AsyncioJobScheduler."""
+
+import asyncio
+from datetime import UTC, datetime, timedelta
+
+import pytest
+
+from domain.ports.job_scheduler import JobCoordinator
+from infrastructure.scheduling.asyncio_job_scheduler import AsyncioJobScheduler
+
+START = datetime(2024, 5, 1, 10, 0, 30, tzinfo=UTC)
+
+
+class FakeTime:
+    """Wall clock advanced by sleeps; parks after a number of sleeps."""
+
+    def __init__(self, sleeps_allowed: int) -> None:
+        self.now = START
+        self.sleeps: list[float] = []
+        self._allowed = sleeps_allowed
+
+    async def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        if len(self.sleeps) > self._allowed:
+            await asyncio.Event().wait()
+        self.now += timedelta(seconds=seconds)
+
+
+class RecordingCoordinator(JobCoordinator):
+    """Coordinator that records calls and claims as configured."""
+
+    def __init__(self, claim: bool = True) -> None:
+        self.claim = claim
+        self.acquired: list[tuple[str, datetime]] = []
+        self.released: list[str] = []
+
+    async def try_acquire(self, job: str, slot: datetime) -> bool:
+        self.acquired.append((job, slot))
+        return self.claim
+
+    async def release(self, job: str) -> None:
+        self.released.append(job)
+
+
+async def _settle() -> None:
+    """Let the scheduling tasks run until they park."""
+    for _ in range(20):
+        await asyncio.sleep(0)
+
+
+def _scheduler(
+    time: FakeTime, coordinator: JobCoordinator | None = None
+) -> AsyncioJobScheduler:
+    return AsyncioJobScheduler(coordinator, now=lambda: time.now, sleep=time.sleep)
+
+
+@pytest.mark.asyncio
+async def test_runs_job_at_each_due_time() -> None:
+    """A job sleeps until each due time and runs once per due time."""
+    time = FakeTime(sleeps_allowed=2)
+    coordinator = RecordingCoordinator()
+    runs: list[datetime] = []
+
+    async def job() -> None:
+        runs.append(time.now)
+
+    scheduler = _scheduler(time, coordinator)
+    scheduler.add("cleanup", "@every 60s", job)
+    scheduler.start()
+    await _settle()
+    await scheduler.close()
+
+    minute = datetime(2024, 5, 1, 10, 1, tzinfo=UTC)
+    assert time.sleeps[:2] == [30, 60]
+    assert runs == [minute, minute + timedelta(minutes=1)]
+    assert [slot for _, slot in coordinator.acquired] == runs
+    assert coordinator.released == ["cleanup", "cleanup"]
+    [stats] = scheduler.stats()
+    assert (stats.name, stats.schedule, stats.runs, stats.failed) == (
+        "cleanup",
+        "@every 60s",
+        2,
+        0,
+    )
+    assert stats.next_run_at == minute + timedelta(minutes=2)
+    assert stats.last_started_at == runs[-1]
+
+
+@pytest.mark.asyncio
+async def test_due_times_claimed_elsewhere_are_skipped() -> None:
+    """Another replica's due times are counted, not run."""
+    time = FakeTime(sleeps_allowed=2)
+    runs: list[datetime] = []
+
+    async def job() -> None:
+        runs.append(time.now)
+
+    scheduler = _scheduler(time, RecordingCoordinator(claim=False))
+    scheduler.add("cleanup", "@every 60s", job)
+    scheduler.start()
+    await _settle()
+    await scheduler.close()
+
+    assert runs == []
+    assert scheduler.stats()[0].skipped == 2
+
+
+@pytest.mark.asyncio
+async def test_failing_job_is_counted_and_released() -> None:
+    """A failure does not stop the schedule and releases the claim."""
+    time = FakeTime(sleeps_allowed=2)
+    coordinator = RecordingCoordinator()
+
+    async def job() -> None:
+        raise RuntimeError("boom")
+
+    scheduler = _scheduler(time, coordinator)
+    scheduler.add("cleanup", "@every 60s", job)
+    scheduler.start()
+    await _settle()
+    await scheduler.close()
+
+    stats = scheduler.stats()[0]
+    assert (stats.runs, stats.failed) == (0, 2)
+    assert coordinator.released == ["cleanup", "cleanup"]
+
+
+@pytest.mark.asyncio
+async def test_jitter_delays_due_times(monkeypatch) -> None:
+    """Each due time is delayed by up to the jitter."""
+    time = FakeTime(sleeps_allowed=1)
+    monkeypatch.setattr("random.uniform", lambda low, high: high)
+
+    async def job() -> None:
+        pass
+
+    scheduler = AsyncioJobScheduler(
+        jitter_seconds=10, now=lambda: time.now, sleep=time.sleep
+    )
+    scheduler.add("cleanup", "@every 60s", job)
+    scheduler.start()
+    await _settle()
+    await scheduler.close()
+
+    # 30 s to the due time plus 10 s, then 50 s to the next one plus 10 s
+    assert time.sleeps[:2] == [40, 60]
+
+
+@pytest.mark.asyncio
+async def test_close_cancels_running_job() -> None:
+    """Shutdown cancels a running job and still releases its claim."""
+    time = FakeTime(sleeps_allowed=1)
+    coordinator = RecordingCoordinator()
+    started = asyncio.Event()
+
+    async def job() -> None:
+        started.set()
+        await asyncio.Event().wait()
+
+    scheduler = _scheduler(time, coordinator)
+    scheduler.add("cleanup", "@every 60s", job)
+    scheduler.start()
+    await started.wait()
+    assert scheduler.stats()[0].running
+
+    await scheduler.close()
+
+    assert coordinator.released == ["cleanup"]
+    assert not scheduler.stats()[0].running
+
+
+def test_add_rejects_duplicates_and_invalid_schedules() -> None:
+    """Job names are unique and schedules are validated when added."""
+
+    async def job() -> None:
+        pass
+
+    scheduler = AsyncioJobScheduler()
+    scheduler.add("cleanup", "@daily", job)
+
+    with pytest.raises(ValueError):
+        scheduler.add("cleanup", "@daily", job)
+    with pytest.raises(ValueError):
+        scheduler.add("other", "every day", job)
@@ -0,0 +1,70 @@
+"""Unit tests for cron and interval schedules."""
+
+from datetime import UTC, datetime
+
+import pytest
+
+from infrastructure.scheduling.schedules import (
+    CronSchedule,
+    IntervalSchedule,
+    parse_schedule,
+)
+
+
+def _utc(*args: int) -> datetime:
+    return datetime(*args, tzinfo=UTC)
+
+
+def test_interval_is_aligned_to_epoch() -> None:
+    """Every replica gets the same due times whenever it starts."""
+    schedule = IntervalSchedule(15 * 60)
+
+    assert schedule.next_after(_utc(2024, 5, 1, 10, 7, 12)) == _utc(2024, 5, 1, 10, 15)
+    assert schedule.next_after(_utc(2024, 5, 1, 10, 15)) == _utc(2024, 5, 1, 10, 30)
+
+
+@pytest.mark.parametrize(
+    ("expression", "after", "expected"),
+    [
+        ("30 3 * * *", _utc(2024, 5, 1, 3, 30), _utc(2024, 5, 2, 3, 30)),
+        ("30 3 * * *", _utc(2024, 5, 1, 3, 29, 59), _utc(2024, 5, 1, 3, 30)),
+        ("*/20 * * * *", _utc(2024, 5, 1, 10, 41), _utc(2024, 5, 1, 11, 0)),
+        ("0 9-17/4 * * *", _utc(2024, 5, 1, 13, 1), _utc(2024, 5, 1, 17, 0)),
+        ("0 0 * * 7", _utc(2024, 5, 1), _utc(2024, 5, 5)),  # Sunday
+        ("0 0 1,15 * *", _utc(2024, 5, 2), _utc(2024, 5, 15)),
+        # Both day fields restricted: either matches (1st or Monday)
+        ("0 0 1 * 1", _utc(2024, 5, 2), _utc(2024, 5, 6)),
+        ("0 0 29 2 *", _utc(2024, 3, 1), _utc(2028, 2, 29)),
+    ],
+)
+def test_cron_next_after(expression, after, expected) -> None:
+    """Cron fields select the next matching minute."""
+    assert CronSchedule(expression).next_after(after) == expected
+
+
+@pytest.mark.parametrize(
+    "expression", ["* * * *", "60 * * * *", "0 0 * * mon", "5-1 * * * *", "*/0 * * * *"]
+)
+def test_invalid_cron_raises(expression) -> None:
+    """Malformed expressions are rejected when parsed."""
+    with pytest.raises(ValueError):
+        CronSchedule(expression)
+
+
+def test_impossible_cron_raises() -> None:
+    """A date that never exists has no next due time."""
+    with pytest.raises(ValueError):
+        CronSchedule("0 0 30 2 *").next_after(_utc(2024, 1, 1))
+
+
+def test_parse_schedule() -> None:
+    """Intervals, aliases and cron expressions are all accepted."""
+    after = _utc(2024, 5, 1, 10, 7)
+
+    assert parse_schedule("@every 90s").next_after(after) == _utc(2024, 5, 1, 10, 7, 30)
+    assert parse_schedule("@every 6h").next_after(after) == _utc(2024, 5, 1, 12)
+    assert parse_schedule("@daily").next_after(after) == _utc(2024, 5, 2)
+    assert parse_schedule(" 0 * * * * ").next_after(after) == _utc(2024, 5, 1, 11)
+    for spec in ("@every 10", "@every xm", "@every 0s", "@yearly"):
+        with pytest.raises(ValueError):
+            parse_schedule(spec)
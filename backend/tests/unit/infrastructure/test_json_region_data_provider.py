@@ -121,3 +121,17 @@ class TestJSONRegionDataProvider:
 
         with pytest.raises(json.JSONDecodeError):
             JSONRegionDataProvider(invalid_file)
+
+    @pytest.mark.asyncio
+    async def test_data_version_follows_file_content(
+        self, sample_regional_data: Path
+    ) -> None:
+        """Test that the data version is a content hash of the file."""
+        first = await JSONRegionDataProvider(sample_regional_data).data_version()
+        again = await JSONRegionDataProvider(sample_regional_data).data_version()
+
+        sample_regional_data.write_text("[]")
+        changed = await JSONRegionDataProvider(sample_regional_data).data_version()
+
+        assert first == again
+        assert changed != first
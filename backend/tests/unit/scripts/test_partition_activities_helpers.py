@@ -0,0 +1,51 @@
+"""Unit tests for the activity partitioning script."""
+
+import sys
+from datetime import date
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[3]))
+
+from scripts.partition_activities import (
+    ACTIVITY_IDS_SQL,
+    ENSURE_PARTITIONS_FUNCTION,
+    _add_months,
+    _policy_statement,
+)
+
+SCHEMA_FILE = Path(__file__).resolve().parents[3] / "scripts" / "schema.sql"
+
+
+def test_ensure_function_matches_schema():
+    """Test the script installs the same function as scripts/schema.sql."""
+    assert ENSURE_PARTITIONS_FUNCTION in SCHEMA_FILE.read_text()
+
+
+def test_activity_ids_guard_matches_schema():
+    """Test the script installs the same ID guard as scripts/schema.sql."""
+    assert ACTIVITY_IDS_SQL in SCHEMA_FILE.read_text()
+
+
+def test_add_months_crosses_years():
+    """Test month arithmetic lands on the first day of the month."""
+    assert _add_months(date(2024, 1, 31), 1) == date(2024, 2, 1)
+    assert _add_months(date(2024, 11, 15), 14) == date(2026, 1, 1)
+
+
+def test_policy_statement():
+    """Test policies are recreated with their roles and expressions."""
+    statement = _policy_statement(
+        {
+            "policyname": "Anyone can read activities",
+            "permissive": "PERMISSIVE",
+            "roles": ["public"],
+            "cmd": "SELECT",
+            "qual": "true",
+            "with_check": None,
+        }
+    )
+
+    assert statement == (
+        'CREATE POLICY "Anyone can read activities" ON activities '
+        "AS PERMISSIVE FOR SELECT TO PUBLIC USING (true)"
+    )
@@ -0,0 +1,54 @@
+"""Unit tests for the CO2e recalculation script."""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[3]))
+
+from domain.ports.recalculation_checkpoint_store import RecalculationCheckpoint
+from scripts import recalculate_emissions
+from scripts.recalculate_emissions import SHARD_COUNT, main, recalculate
+
+
+@pytest.fixture
+def shard_runs(monkeypatch) -> list[list[int]]:
+    """Shards passed to each run, recalculated without a database."""
+    runs: list[list[int]] = []
+
+    def run_shards(job_id, activity_types, indexes, batch_size):
+        runs.append(list(indexes))
+        return [
+            RecalculationCheckpoint(
+                job_id=recalculate_emissions.shard_job_id(job_id, i),
+                activity_types=activity_types,
+                last_id=None,
+            )
+            for i in indexes
+        ]
+
+    monkeypatch.setattr(recalculate_emissions, "run_shards", run_shards)
+    return runs
+
+
+def test_single_worker_runs_every_shard(shard_runs, capsys) -> None:
+    """Test one worker recalculates the same shards as a parallel run would."""
+    recalculate("defra-2024", None, 1, None)
+
+    assert shard_runs == [list(range(SHARD_COUNT))]
+    assert f"defra-2024:{SHARD_COUNT}/{SHARD_COUNT}" in capsys.readouterr().out
+
+
+def test_shard_ids_do_not_depend_on_workers() -> None:
+    """Test a job resumed with another worker count finds its checkpoints."""
+    assert recalculate_emissions.shard_job_id("defra-2024", 2) == (
+        f"defra-2024:3/{SHARD_COUNT}"
+    )
+
+
+@pytest.mark.parametrize("workers", ["0", str(SHARD_COUNT + 1)])
+def test_worker_count_is_bounded_by_shards(workers) -> None:
+    """Test more workers than shards are refused instead of idling."""
+    with pytest.raises(SystemExit):
+        main(["--job-id", "defra-2024", "--workers", workers])
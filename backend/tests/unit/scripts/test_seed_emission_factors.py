@@ -0,0 +1,89 @@
+"""Unit tests for the emission factor seed script."""
+
+import sys
+from pathlib import Path
+from unittest.mock import AsyncMock
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[3]))
+
+from scripts.seed_emission_factors import (
+    EMISSION_FACTORS,
+    REGIONAL_AVERAGES,
+    diff_table,
+    seed,
+)
+
+
+def _conn(existing: dict[str, list[dict]] | None = None) -> AsyncMock:
+    """Create a connection mock returning existing rows per table."""
+    conn = AsyncMock()
+
+    async def fetch(query):
+        table = query.rsplit(" ", 1)[-1]
+        return (existing or {}).get(table, [])
+
+    conn.fetch.side_effect = fetch
+    return conn
+
+
+@pytest.mark.asyncio
+async def test_seed_upserts_each_table_once():
+    """Test every row is written with a single upsert per table."""
+    conn = _conn()
+
+    timings = await seed(conn)
+
+    assert set(timings) == {"emission_factors", "regional_averages"}
+    factors, averages = conn.executemany.await_args_list
+    assert factors.args[0].startswith("INSERT INTO emission_factors")
+    assert "ON CONFLICT (category, type, source_year) DO UPDATE" in factors.args[0]
+    assert "factor = EXCLUDED.factor" in factors.args[0]
+    assert len(factors.args[1]) == len(EMISSION_FACTORS)
+    assert "ON CONFLICT (country_code) DO UPDATE" in averages.args[0]
+    assert len(averages.args[1]) == len(REGIONAL_AVERAGES)
+    conn.fetch.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_dry_run_reads_without_writing(capsys):
+    """Test a dry run diffs against current rows and writes nothing."""
+    stored = [
+        {**EMISSION_FACTORS[0], "id": "a", "factor": "0.17099"},
+        {**EMISSION_FACTORS[1], "id": "b", "factor": 0.2},
+    ]
+    conn = _conn({"emission_factors": stored})
+
+    await seed(conn, dry_run=True)
+
+    conn.executemany.assert_not_awaited()
+    output = capsys.readouterr().out
+    assert (
+        f"~ transport/car_diesel/2023 (factor: 0.2 → {EMISSION_FACTORS[1]['factor']})"
+        in output
+    )
+    assert (
+        f"emission_factors: {len(EMISSION_FACTORS) - 2} to add, 1 to change, "
+        "1 unchanged"
+    ) in output
+    assert f"regional_averages: {len(REGIONAL_AVERAGES)} to add" in output
+
+
+def test_diff_matches_rows_by_conflict_key():
+    """Test rows are matched by key and compared value by value."""
+    desired = [
+        {"country_code": "ES", "country_name": "Spain", "annual_average_kg": 5800},
+        {"country_code": "FR", "country_name": "France", "annual_average_kg": 4700},
+        {"country_code": "IT", "country_name": "Italy", "annual_average_kg": 5500},
+    ]
+    existing = [
+        {"country_code": "ES", "country_name": "Spain", "annual_average_kg": "5800.00"},
+        {"country_code": "FR", "country_name": "France", "annual_average_kg": 4600},
+    ]
+
+    diff = diff_table("regional_averages", desired, existing)
+
+    assert [row["country_code"] for row in diff.added] == ["IT"]
+    assert [row["country_code"] for _, row in diff.changed] == ["FR"]
+    assert diff.unchanged == 1